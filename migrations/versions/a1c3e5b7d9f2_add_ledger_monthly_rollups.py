@@ -0,0 +1,130 @@
+"""add ledger (guild_id, created_at) index and ledger_monthly_rollups table
+
+Revision ID: a1c3e5b7d9f2
+Revises: b2d4f6a8c1e3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import datetime as _dt
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5b7d9f2'
+down_revision: Union[str, Sequence[str], None] = 'b2d4f6a8c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index ledger_entries for month scans and add the monthly rollup table.
+
+    ledger_monthly_rollups holds one row per (guild, month, creditor, debtor)
+    with the summed amount and entry count.  Rows are written by the Budget
+    cog when a month closes; past months are read from here, so every month
+    completed before this upgrade is rolled up now.
+    """
+    op.create_index(
+        'ix_ledger_entries_guild_id_created_at',
+        'ledger_entries',
+        ['guild_id', 'created_at'],
+        unique=False,
+    )
+
+    op.create_table(
+        'ledger_monthly_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('creditor_id', sa.BigInteger(), nullable=False),
+        sa.Column('debtor_id', sa.BigInteger(), nullable=False),
+        sa.Column('amount_cents', sa.BigInteger(), nullable=False),
+        sa.Column('entry_count', sa.Integer(), nullable=False),
+        sa.Column('closed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'month', 'creditor_id', 'debtor_id'),
+    )
+    op.create_index(
+        op.f('ix_ledger_monthly_rollups_guild_id'),
+        'ledger_monthly_rollups',
+        ['guild_id'],
+        unique=False,
+    )
+    _backfill_rollups()
+
+
+def _month_after(month: _dt.date) -> _dt.date:
+    if month.month == 12:
+        return _dt.date(month.year + 1, 1, 1)
+    return _dt.date(month.year, month.month + 1, 1)
+
+
+def _backfill_rollups() -> None:
+    """Roll up each month from the first ledger entry up to the current one."""
+    bind = op.get_bind()
+    entries = sa.table(
+        'ledger_entries',
+        sa.column('id', sa.Integer()),
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('creditor_id', sa.BigInteger()),
+        sa.column('debtor_id', sa.BigInteger()),
+        sa.column('amount_cents', sa.BigInteger()),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+    )
+    rollups = sa.table(
+        'ledger_monthly_rollups',
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('month', sa.Date()),
+        sa.column('creditor_id', sa.BigInteger()),
+        sa.column('debtor_id', sa.BigInteger()),
+        sa.column('amount_cents', sa.BigInteger()),
+        sa.column('entry_count', sa.Integer()),
+        sa.column('closed_at', sa.DateTime(timezone=True)),
+    )
+    first = bind.scalar(sa.select(sa.func.min(entries.c.created_at)))
+    if first is None:
+        return
+    if isinstance(first, str):  # SQLite hands DateTime back as text in raw selects
+        first = _dt.datetime.fromisoformat(first)
+    if first.tzinfo is not None:
+        first = first.astimezone(_dt.timezone.utc)
+
+    utc = _dt.timezone.utc
+    now = _dt.datetime.now(utc)
+    this_month = now.date().replace(day=1)
+    month = first.date().replace(day=1)
+    while month < this_month:
+        nxt = _month_after(month)
+        start = _dt.datetime(month.year, month.month, 1, tzinfo=utc)
+        end = _dt.datetime(nxt.year, nxt.month, 1, tzinfo=utc)
+        bind.execute(
+            rollups.insert().from_select(
+                [
+                    'guild_id', 'month', 'creditor_id', 'debtor_id',
+                    'amount_cents', 'entry_count', 'closed_at',
+                ],
+                sa.select(
+                    entries.c.guild_id,
+                    sa.literal(month, sa.Date()),
+                    entries.c.creditor_id,
+                    entries.c.debtor_id,
+                    sa.func.sum(entries.c.amount_cents),
+                    sa.func.count(entries.c.id),
+                    sa.literal(now, sa.DateTime(timezone=True)),
+                )
+                .where(entries.c.created_at >= start, entries.c.created_at < end)
+                .group_by(entries.c.guild_id, entries.c.creditor_id, entries.c.debtor_id),
+            )
+        )
+        month = nxt
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_ledger_monthly_rollups_guild_id'), table_name='ledger_monthly_rollups'
+    )
+    op.drop_table('ledger_monthly_rollups')
+    op.drop_index('ix_ledger_entries_guild_id_created_at', table_name='ledger_entries')
@@ -0,0 +1,81 @@
+"""add checkin_bitmaps packed check-in archive
+
+Revision ID: a2c4e6f8b0d3
+Revises: f8b0d2e4a6c9
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c4e6f8b0d3'
+down_revision: Union[str, Sequence[str], None] = 'f8b0d2e4a6c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sizes for a leap year: 3 pillar bits and 1 checked bit per day
+PILLAR_BYTES = (366 * 3 + 7) // 8
+CHECKED_BYTES = (366 + 7) // 8
+
+
+def upgrade() -> None:
+    """Create checkin_bitmaps and pack every existing playoff_checkins row into it."""
+    bitmaps = op.create_table(
+        'checkin_bitmaps',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('pillars', sa.LargeBinary(), nullable=False),
+        sa.Column('checked', sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'user_id', 'year'),
+    )
+
+    checkins = sa.table(
+        'playoff_checkins',
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('user_id', sa.BigInteger()),
+        sa.column('checkin_date', sa.Date()),
+        sa.column('pillar1', sa.Boolean()),
+        sa.column('pillar2', sa.Boolean()),
+        sa.column('pillar3', sa.Boolean()),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            checkins.c.guild_id,
+            checkins.c.user_id,
+            checkins.c.checkin_date,
+            checkins.c.pillar1,
+            checkins.c.pillar2,
+            checkins.c.pillar3,
+        )
+    )
+    packed: dict[tuple[int, int, int], list[int]] = {}
+    for guild_id, user_id, day, p1, p2, p3 in rows:
+        index = day.timetuple().tm_yday - 1
+        bits = packed.setdefault((guild_id, user_id, day.year), [0, 0])
+        bits[0] |= (bool(p1) | bool(p2) << 1 | bool(p3) << 2) << (3 * index)
+        bits[1] |= 1 << index
+    if packed:
+        op.bulk_insert(
+            bitmaps,
+            [
+                {
+                    'guild_id': guild_id,
+                    'user_id': user_id,
+                    'year': year,
+                    'pillars': pillars.to_bytes(PILLAR_BYTES, 'little'),
+                    'checked': checked.to_bytes(CHECKED_BYTES, 'little'),
+                }
+                for (guild_id, user_id, year), (pillars, checked) in packed.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('checkin_bitmaps')
@@ -0,0 +1,45 @@
+"""add playoff_series.version and weekly_summaries render cache
+
+Revision ID: a8c0e2f4b6d9
+Revises: f7b9d1e3a5c8
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c0e2f4b6d9'
+down_revision: Union[str, Sequence[str], None] = 'f7b9d1e3a5c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the series data version and the table of rendered past weeks."""
+    with op.batch_alter_table('playoff_series') as batch:
+        batch.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='0'))
+    op.create_table(
+        'weekly_summaries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('embed', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'week_start'),
+    )
+    op.create_index(
+        op.f('ix_weekly_summaries_guild_id'), 'weekly_summaries', ['guild_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_weekly_summaries_guild_id'), table_name='weekly_summaries')
+    op.drop_table('weekly_summaries')
+    with op.batch_alter_table('playoff_series') as batch:
+        batch.drop_column('version')
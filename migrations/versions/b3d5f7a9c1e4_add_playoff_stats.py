@@ -0,0 +1,136 @@
+"""add playoff_stats running totals
+
+Revision ID: b3d5f7a9c1e4
+Revises: a2c4e6f8b0d3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import datetime as _dt
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c1e4'
+down_revision: Union[str, Sequence[str], None] = 'a2c4e6f8b0d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _runs(days):
+    """(current run length, last day of it, longest run) over sorted *days*."""
+    current = longest = 0
+    last = None
+    for d in days:
+        current = current + 1 if last is not None and d - last == _dt.timedelta(days=1) else 1
+        last = d
+        longest = max(longest, current)
+    return current, last, longest
+
+
+def _empty(guild_id, user_id):
+    return {
+        'guild_id': guild_id,
+        'user_id': user_id,
+        'current_streak': 0,
+        'longest_streak': 0,
+        'streak_through': None,
+        'series_won': 0,
+        'series_lost': 0,
+        'days_checked': 0,
+        'pillar1_done': 0,
+        'pillar2_done': 0,
+        'pillar3_done': 0,
+    }
+
+
+def upgrade() -> None:
+    """Create playoff_stats and fill it from check-ins, daily results and series."""
+    stats = op.create_table(
+        'playoff_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('current_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('longest_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('streak_through', sa.Date(), nullable=True),
+        sa.Column('series_won', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('series_lost', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('days_checked', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pillar1_done', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pillar2_done', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pillar3_done', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'user_id'),
+    )
+
+    bind = op.get_bind()
+    checkins = sa.table(
+        'playoff_checkins',
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('user_id', sa.BigInteger()),
+        sa.column('checkin_date', sa.Date()),
+        sa.column('pillar1', sa.Boolean()),
+        sa.column('pillar2', sa.Boolean()),
+        sa.column('pillar3', sa.Boolean()),
+    )
+    results = sa.table(
+        'daily_results',
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('result_date', sa.Date()),
+        sa.column('won', sa.Boolean()),
+    )
+    series = sa.table(
+        'playoff_series',
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('status', sa.String()),
+    )
+
+    rows: dict[tuple[int, int], dict] = {}
+    complete_days: dict[tuple[int, int], list] = {}
+    for guild_id, user_id, day, p1, p2, p3 in bind.execute(
+        sa.select(
+            checkins.c.guild_id,
+            checkins.c.user_id,
+            checkins.c.checkin_date,
+            checkins.c.pillar1,
+            checkins.c.pillar2,
+            checkins.c.pillar3,
+        ).order_by(checkins.c.checkin_date)
+    ):
+        row = rows.setdefault((guild_id, user_id), _empty(guild_id, user_id))
+        row['days_checked'] += 1
+        row['pillar1_done'] += bool(p1)
+        row['pillar2_done'] += bool(p2)
+        row['pillar3_done'] += bool(p3)
+        if p1 and p2 and p3:
+            complete_days.setdefault((guild_id, user_id), []).append(day)
+
+    for guild_id, day in bind.execute(
+        sa.select(results.c.guild_id, results.c.result_date)
+        .where(results.c.won.is_(True))
+        .order_by(results.c.result_date)
+    ):
+        rows.setdefault((guild_id, 0), _empty(guild_id, 0))
+        complete_days.setdefault((guild_id, 0), []).append(day)
+
+    for key, days in complete_days.items():
+        current, last, longest = _runs(days)
+        rows[key].update(current_streak=current, streak_through=last, longest_streak=longest)
+
+    for guild_id, status, count in bind.execute(
+        sa.select(series.c.guild_id, series.c.status, sa.func.count())
+        .where(series.c.status.in_(['won', 'lost']))
+        .group_by(series.c.guild_id, series.c.status)
+    ):
+        row = rows.setdefault((guild_id, 0), _empty(guild_id, 0))
+        row['series_won' if status == 'won' else 'series_lost'] = count
+
+    if rows:
+        op.bulk_insert(stats, list(rows.values()))
+
+
+def downgrade() -> None:
+    op.drop_table('playoff_stats')
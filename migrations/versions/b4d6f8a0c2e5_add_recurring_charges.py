@@ -0,0 +1,64 @@
+"""add recurring_charges table and ledger_entries.idempotency_key
+
+Revision ID: b4d6f8a0c2e5
+Revises: a1c3e5b7d9f2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d6f8a0c2e5'
+down_revision: Union[str, Sequence[str], None] = 'a1c3e5b7d9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create recurring_charges and add a unique idempotency key to ledger entries.
+
+    The key is NULL for manual entries.  Recurring postings set it to
+    "recurring:<charge_id>:<due_date>" so the unique index rejects a second
+    posting of the same charge for the same period.
+    """
+    op.add_column('ledger_entries', sa.Column('idempotency_key', sa.Text(), nullable=True))
+    op.create_index(
+        'ix_ledger_entries_idempotency_key',
+        'ledger_entries',
+        ['idempotency_key'],
+        unique=True,
+    )
+
+    op.create_table(
+        'recurring_charges',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('name', sa.Text(), nullable=False),
+        sa.Column('amount_cents', sa.Integer(), nullable=False),
+        sa.Column('split_ratio', sa.Text(), nullable=False, server_default='1/2'),
+        sa.Column('creditor_id', sa.BigInteger(), nullable=False),
+        sa.Column('debtor_id', sa.BigInteger(), nullable=False),
+        sa.Column('cadence', sa.Text(), nullable=False, server_default='monthly'),
+        sa.Column('next_due', sa.Date(), nullable=False),
+        sa.Column('active', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_recurring_charges_guild_id'), 'recurring_charges', ['guild_id'], unique=False
+    )
+    op.create_index(
+        op.f('ix_recurring_charges_next_due'), 'recurring_charges', ['next_due'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_recurring_charges_next_due'), table_name='recurring_charges')
+    op.drop_index(op.f('ix_recurring_charges_guild_id'), table_name='recurring_charges')
+    op.drop_table('recurring_charges')
+    op.drop_index('ix_ledger_entries_idempotency_key', table_name='ledger_entries')
+    op.drop_column('ledger_entries', 'idempotency_key')
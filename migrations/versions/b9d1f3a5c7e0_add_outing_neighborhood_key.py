@@ -0,0 +1,81 @@
+"""add outing_wishlist_items.neighborhood_key with match indexes
+
+Revision ID: b9d1f3a5c7e0
+Revises: c3a5e7f9b1d2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d1f3a5c7e0'
+down_revision: Union[str, Sequence[str], None] = 'c3a5e7f9b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalize(text: str) -> str:
+    # Same folding as src.text_match.normalize at the time of this revision
+    return " ".join(text.casefold().split())
+
+
+def upgrade() -> None:
+    """Add the normalized neighborhood, backfill it and index it for matching.
+
+    Postgres gets a pg_trgm GIN index for substring and similarity
+    matches; every backend gets a (guild_id, neighborhood_key) b-tree.
+    """
+    with op.batch_alter_table('outing_wishlist_items') as batch:
+        batch.add_column(
+            sa.Column('neighborhood_key', sa.Text(), nullable=False, server_default='')
+        )
+
+    bind = op.get_bind()
+    items = sa.table(
+        'outing_wishlist_items',
+        sa.column('id', sa.Integer()),
+        sa.column('neighborhood', sa.Text()),
+        sa.column('neighborhood_key', sa.Text()),
+    )
+    rows = bind.execute(
+        sa.select(items.c.id, items.c.neighborhood).where(items.c.neighborhood != '')
+    ).all()
+    for item_id, neighborhood in rows:
+        bind.execute(
+            items.update()
+            .where(items.c.id == item_id)
+            .values(neighborhood_key=_normalize(neighborhood))
+        )
+
+    op.create_index(
+        'ix_outing_wishlist_items_guild_id_neighborhood_key',
+        'outing_wishlist_items',
+        ['guild_id', 'neighborhood_key'],
+        unique=False,
+    )
+    if bind.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_outing_wishlist_items_neighborhood_key_trgm',
+            'outing_wishlist_items',
+            ['neighborhood_key'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'neighborhood_key': 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index(
+            'ix_outing_wishlist_items_neighborhood_key_trgm', table_name='outing_wishlist_items'
+        )
+    op.drop_index(
+        'ix_outing_wishlist_items_guild_id_neighborhood_key', table_name='outing_wishlist_items'
+    )
+    with op.batch_alter_table('outing_wishlist_items') as batch:
+        batch.drop_column('neighborhood_key')
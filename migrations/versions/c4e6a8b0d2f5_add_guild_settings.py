@@ -0,0 +1,35 @@
+"""add guild_settings with the check-in reminder channel
+
+Revision ID: c4e6a8b0d2f5
+Revises: b3d5f7a9c1e4
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e6a8b0d2f5'
+down_revision: Union[str, Sequence[str], None] = 'b3d5f7a9c1e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create guild_settings."""
+    op.create_table(
+        'guild_settings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('checkin_channel_id', sa.BigInteger(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_guild_settings_guild_id'), 'guild_settings', ['guild_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_guild_settings_guild_id'), table_name='guild_settings')
+    op.drop_table('guild_settings')
@@ -0,0 +1,69 @@
+"""add ledger_entries.category and ledger_category_monthly table
+
+Revision ID: c5e7a9b1d3f6
+Revises: b4d6f8a0c2e5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e7a9b1d3f6'
+down_revision: Union[str, Sequence[str], None] = 'b4d6f8a0c2e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a category to ledger entries and the per-month category aggregate.
+
+    Existing entries become uncategorized ('') and are backfilled into
+    ledger_category_monthly so /budget review covers history from day one.
+    """
+    op.add_column(
+        'ledger_entries',
+        sa.Column('category', sa.Text(), nullable=False, server_default=''),
+    )
+
+    op.create_table(
+        'ledger_category_monthly',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('category', sa.Text(), nullable=False),
+        sa.Column('amount_cents', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('entry_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'month', 'category'),
+    )
+    op.create_index(
+        op.f('ix_ledger_category_monthly_guild_id'),
+        'ledger_category_monthly',
+        ['guild_id'],
+        unique=False,
+    )
+
+    if op.get_bind().dialect.name == 'postgresql':
+        month_expr = "CAST(date_trunc('month', created_at) AS date)"
+    else:
+        month_expr = "date(created_at, 'start of month')"
+    op.execute(
+        f"""
+        INSERT INTO ledger_category_monthly (guild_id, month, category, amount_cents, entry_count)
+        SELECT guild_id, {month_expr}, category, SUM(ABS(amount_cents)), COUNT(*)
+        FROM ledger_entries
+        GROUP BY guild_id, {month_expr}, category
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_ledger_category_monthly_guild_id'), table_name='ledger_category_monthly'
+    )
+    op.drop_table('ledger_category_monthly')
+    op.drop_column('ledger_entries', 'category')
@@ -0,0 +1,170 @@
+"""add search_documents with full-text indexes and sync triggers
+
+Revision ID: d0f2b4c6e8a1
+Revises: a8c0e2f4b6d9, b9d1f3a5c7e0
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0f2b4c6e8a1'
+down_revision: Union[str, Sequence[str], None] = ('a8c0e2f4b6d9', 'b9d1f3a5c7e0')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# As in src.db.SEARCH_SOURCES at the time of this revision
+_SOURCES = (
+    ("shopping", "shopping_items", "{row}.name", "{row}.note || ' ' || COALESCE({row}.og_title, '')"),
+    ("watch", "watchlist_items", "{row}.title", "{row}.note"),
+    ("bucket", "bucket_list_items", "{row}.title", "{row}.note || ' ' || {row}.completed_notes"),
+    (
+        "outing",
+        "outing_wishlist_items",
+        "{row}.name",
+        "{row}.neighborhood || ' ' || {row}.note || ' ' || {row}.visited_notes",
+    ),
+    ("datenight", "datenight_wishlist", "{row}.name", "{row}.notes"),
+    ("datelog", "datenight_log", "{row}.place", "{row}.notes"),
+    ("special", "special_dates", "{row}.label", "{row}.gift_ideas"),
+    ("ledger", "ledger_entries", "{row}.note", "{row}.category"),
+)
+
+_VECTOR = (
+    "setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, body), 'B')"
+)
+
+
+def _postgres_ddl() -> list[str]:
+    statements = [
+        f"CREATE INDEX ix_search_documents_vector ON search_documents USING gin (({_VECTOR}))"
+    ]
+    for kind, table, title, body in _SOURCES:
+        new_title, new_body = title.format(row="NEW"), body.format(row="NEW")
+        statements += [
+            f"""
+            CREATE OR REPLACE FUNCTION search_sync_{table}() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    DELETE FROM search_documents WHERE kind = '{kind}' AND item_id = OLD.id;
+                    RETURN OLD;
+                END IF;
+                INSERT INTO search_documents (guild_id, kind, item_id, title, body)
+                VALUES (NEW.guild_id, '{kind}', NEW.id, {new_title}, TRIM({new_body}))
+                ON CONFLICT (kind, item_id)
+                DO UPDATE SET title = EXCLUDED.title, body = EXCLUDED.body;
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            f"""
+            CREATE TRIGGER search_sync_{table}
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION search_sync_{table}()
+            """,
+        ]
+    return statements
+
+
+def _sqlite_ddl() -> list[str]:
+    statements = [
+        """
+        CREATE VIRTUAL TABLE search_fts USING fts5(
+            title, body, content='search_documents', content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER search_fts_ai AFTER INSERT ON search_documents BEGIN
+            INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+        END
+        """,
+        """
+        CREATE TRIGGER search_fts_ad AFTER DELETE ON search_documents BEGIN
+            INSERT INTO search_fts (search_fts, rowid, title, body)
+            VALUES ('delete', OLD.id, OLD.title, OLD.body);
+        END
+        """,
+        """
+        CREATE TRIGGER search_fts_au AFTER UPDATE ON search_documents BEGIN
+            INSERT INTO search_fts (search_fts, rowid, title, body)
+            VALUES ('delete', OLD.id, OLD.title, OLD.body);
+            INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+        END
+        """,
+    ]
+    for kind, table, title, body in _SOURCES:
+        new_title, new_body = title.format(row="NEW"), body.format(row="NEW")
+        statements += [
+            f"""
+            CREATE TRIGGER search_{table}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO search_documents (guild_id, kind, item_id, title, body)
+                VALUES (NEW.guild_id, '{kind}', NEW.id, {new_title}, TRIM({new_body}));
+            END
+            """,
+            f"""
+            CREATE TRIGGER search_{table}_au AFTER UPDATE ON {table} BEGIN
+                UPDATE search_documents SET title = {new_title}, body = TRIM({new_body})
+                WHERE kind = '{kind}' AND item_id = NEW.id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER search_{table}_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM search_documents WHERE kind = '{kind}' AND item_id = OLD.id;
+            END
+            """,
+        ]
+    return statements
+
+
+def upgrade() -> None:
+    """Create search_documents, its full-text index and triggers, then backfill it."""
+    op.create_table(
+        'search_documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('kind', sa.Text(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.Text(), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'item_id'),
+    )
+    op.create_index(
+        op.f('ix_search_documents_guild_id'), 'search_documents', ['guild_id'], unique=False
+    )
+
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    for statement in _postgres_ddl() if postgres else _sqlite_ddl():
+        op.execute(statement)
+
+    # Existing rows; on SQLite the search_documents triggers fill search_fts
+    for kind, table, title, body in _SOURCES:
+        op.execute(
+            f"""
+            INSERT INTO search_documents (guild_id, kind, item_id, title, body)
+            SELECT guild_id, '{kind}', id, {title.format(row=table)},
+                   TRIM({body.format(row=table)})
+            FROM {table}
+            """
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for _, table, _, _ in _SOURCES:
+            op.execute(f"DROP TRIGGER IF EXISTS search_sync_{table} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS search_sync_{table}()")
+        op.execute("DROP INDEX IF EXISTS ix_search_documents_vector")
+    else:
+        for _, table, _, _ in _SOURCES:
+            for suffix in ("ai", "au", "ad"):
+                op.execute(f"DROP TRIGGER IF EXISTS search_{table}_{suffix}")
+        op.execute("DROP TABLE IF EXISTS search_fts")
+    op.drop_index(op.f('ix_search_documents_guild_id'), table_name='search_documents')
+    op.drop_table('search_documents')
@@ -0,0 +1,58 @@
+"""add time zone, job channels and local job times to guild_settings
+
+Revision ID: d5f7b9c1e3a6
+Revises: c4e6a8b0d2f5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f7b9c1e3a6'
+down_revision: Union[str, Sequence[str], None] = 'c4e6a8b0d2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add schedule columns; existing rows keep the old fixed ET schedule."""
+    with op.batch_alter_table('guild_settings') as batch:
+        batch.add_column(
+            sa.Column('timezone', sa.Text(), nullable=False, server_default='America/New_York')
+        )
+        batch.add_column(sa.Column('review_channel_id', sa.BigInteger(), nullable=True))
+        batch.add_column(sa.Column('supply_channel_id', sa.BigInteger(), nullable=True))
+        batch.add_column(
+            sa.Column('ping_time', sa.Time(), nullable=False, server_default='22:00:00')
+        )
+        batch.add_column(
+            sa.Column('review_weekday', sa.Integer(), nullable=False, server_default='6')
+        )
+        batch.add_column(
+            sa.Column('review_time', sa.Time(), nullable=False, server_default='10:00:00')
+        )
+        batch.add_column(
+            sa.Column('supply_weekday', sa.Integer(), nullable=False, server_default='6')
+        )
+        batch.add_column(
+            sa.Column('supply_time', sa.Time(), nullable=False, server_default='10:00:00')
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('guild_settings') as batch:
+        for column in (
+            'supply_time',
+            'supply_weekday',
+            'review_time',
+            'review_weekday',
+            'ping_time',
+            'supply_channel_id',
+            'review_channel_id',
+            'timezone',
+        ):
+            batch.drop_column(column)
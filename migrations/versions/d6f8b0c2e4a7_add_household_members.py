@@ -0,0 +1,102 @@
+"""add household_members table
+
+Revision ID: d6f8b0c2e4a7
+Revises: c5e7a9b1d3f6
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import logging
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f8b0c2e4a7'
+down_revision: Union[str, Sequence[str], None] = 'c5e7a9b1d3f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger('alembic.runtime.migration')
+
+# Tables whose guild_id shows which guilds the bot already serves
+_GUILD_TABLES = (
+    'ledger_entries',
+    'playoff_checkins',
+    'shopping_items',
+    'supply_items',
+    'datenight_planner',
+    'reminder_entries',
+)
+
+
+def upgrade() -> None:
+    """Create household_members, replacing the PARTNER_IDS env var.
+
+    When PARTNER_IDS is set, its members are added to every guild the bot
+    already has data for.  Otherwise everyone who appears on a guild's
+    ledger is, so existing couples keep resolving each other without
+    running /household add.
+    """
+    members = op.create_table(
+        'household_members',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column(
+            'added_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'user_id'),
+    )
+    op.create_index(
+        op.f('ix_household_members_guild_id'), 'household_members', ['guild_id'], unique=False
+    )
+
+    partner_ids = list(
+        dict.fromkeys(
+            int(x) for x in os.getenv('PARTNER_IDS', '').split(',') if x.strip().isdigit()
+        )
+    )
+    if not partner_ids:
+        op.execute(
+            """
+            INSERT INTO household_members (guild_id, user_id)
+            SELECT guild_id, creditor_id FROM ledger_entries WHERE guild_id <> 0
+            UNION
+            SELECT guild_id, debtor_id FROM ledger_entries WHERE guild_id <> 0
+            """
+        )
+        return
+
+    guild_ids = op.get_bind().execute(
+        sa.text(
+            ' UNION '.join(
+                f'SELECT guild_id FROM {name} WHERE guild_id <> 0' for name in _GUILD_TABLES
+            )
+        )
+    ).scalars().all()
+    if not guild_ids:
+        log.warning(
+            'PARTNER_IDS is set but no guild has data yet; add members with /household add'
+        )
+        return
+    # Listed order is join order, so the first partner in PARTNER_IDS joins first
+    op.bulk_insert(
+        members,
+        [
+            {'guild_id': guild_id, 'user_id': user_id}
+            for guild_id in sorted(guild_ids)
+            for user_id in partner_ids
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_household_members_guild_id'), table_name='household_members')
+    op.drop_table('household_members')
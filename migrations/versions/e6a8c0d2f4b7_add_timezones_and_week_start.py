@@ -0,0 +1,35 @@
+"""add member time zones and a configurable week start
+
+Revision ID: e6a8c0d2f4b7
+Revises: d5f7b9c1e3a6
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a8c0d2f4b7'
+down_revision: Union[str, Sequence[str], None] = 'd5f7b9c1e3a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Weeks keep starting on Sunday and members follow the household zone."""
+    with op.batch_alter_table('guild_settings') as batch:
+        batch.add_column(
+            sa.Column('week_start', sa.Integer(), nullable=False, server_default='6')
+        )
+    with op.batch_alter_table('household_members') as batch:
+        batch.add_column(sa.Column('timezone', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('household_members') as batch:
+        batch.drop_column('timezone')
+    with op.batch_alter_table('guild_settings') as batch:
+        batch.drop_column('week_start')
@@ -0,0 +1,180 @@
+"""add households and per-member watchlist ratings
+
+Revision ID: e7a9c1d3f5b8
+Revises: d6f8b0c2e4a7, e2a4c6d8f1b3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a9c1d3f5b8'
+down_revision: Union[str, Sequence[str], None] = ('d6f8b0c2e4a7', 'e2a4c6d8f1b3')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The two accounts that used to be hard-coded in src/utils.py
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+
+
+def upgrade() -> None:
+    """Make households the tenancy unit and move watch ratings to a child table.
+
+    Every guild with members gets a household.  Its owner is whoever was
+    credited for the first rent posting, falling back to David (who always
+    paid the rent) and then to the earliest member.
+    The david_/steph_ rating columns are copied into watchlist_ratings before
+    they are dropped.
+    """
+    op.create_table(
+        'households',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('owner_id', sa.BigInteger(), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.current_timestamp(),
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_households_guild_id'), 'households', ['guild_id'], unique=True)
+
+    op.execute(
+        "INSERT INTO households (guild_id) SELECT DISTINCT guild_id FROM household_members"
+    )
+    op.execute(
+        """
+        UPDATE households SET owner_id = (
+            SELECT CASE WHEN l.amount_cents > 0 THEN l.creditor_id ELSE l.debtor_id END
+            FROM ledger_entries l
+            WHERE l.guild_id = households.guild_id
+              -- Rows from before ledger categories carry /rent's note and an empty category
+              AND (l.note = 'rent' OR l.category = 'rent')
+            ORDER BY l.created_at, l.id
+            LIMIT 1
+        )
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE households SET owner_id = {DAVID_ID}
+        WHERE owner_id IS NULL AND EXISTS (
+            SELECT 1 FROM household_members m
+            WHERE m.guild_id = households.guild_id AND m.user_id = {DAVID_ID}
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE households SET owner_id = (
+            SELECT m.user_id FROM household_members m
+            WHERE m.guild_id = households.guild_id
+            ORDER BY m.added_at, m.id
+            LIMIT 1
+        )
+        WHERE owner_id IS NULL
+        """
+    )
+
+    op.add_column('household_members', sa.Column('household_id', sa.Integer(), nullable=True))
+    op.add_column(
+        'household_members',
+        sa.Column('display_name', sa.Text(), nullable=False, server_default=''),
+    )
+    op.execute(
+        """
+        UPDATE household_members SET household_id = (
+            SELECT h.id FROM households h WHERE h.guild_id = household_members.guild_id
+        )
+        """
+    )
+    op.execute(
+        f"UPDATE household_members SET display_name = 'David' WHERE user_id = {DAVID_ID}"
+    )
+    op.execute(
+        f"UPDATE household_members SET display_name = 'Steph' WHERE user_id = {STEPH_ID}"
+    )
+    with op.batch_alter_table('household_members') as batch:
+        batch.alter_column('household_id', existing_type=sa.Integer(), nullable=False)
+    op.create_index(
+        op.f('ix_household_members_household_id'),
+        'household_members',
+        ['household_id'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_household_members_user_id'), 'household_members', ['user_id'], unique=False
+    )
+
+    op.create_table(
+        'watchlist_ratings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('rating', sa.Integer(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=False, server_default=''),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('item_id', 'user_id'),
+    )
+    op.create_index(
+        op.f('ix_watchlist_ratings_item_id'), 'watchlist_ratings', ['item_id'], unique=False
+    )
+    for user_id, prefix in ((DAVID_ID, 'david'), (STEPH_ID, 'steph')):
+        op.execute(
+            f"""
+            INSERT INTO watchlist_ratings (item_id, user_id, rating, notes)
+            SELECT id, {user_id}, {prefix}_rating, COALESCE({prefix}_notes, '')
+            FROM watchlist_items
+            WHERE {prefix}_rating IS NOT NULL OR COALESCE({prefix}_notes, '') <> ''
+            """
+        )
+    with op.batch_alter_table('watchlist_items') as batch:
+        batch.drop_column('david_rating')
+        batch.drop_column('steph_rating')
+        batch.drop_column('david_notes')
+        batch.drop_column('steph_notes')
+
+
+def downgrade() -> None:
+    """Restore the two-person rating columns; ratings from anyone else are lost."""
+    with op.batch_alter_table('watchlist_items') as batch:
+        batch.add_column(sa.Column('david_rating', sa.Integer(), nullable=True))
+        batch.add_column(sa.Column('steph_rating', sa.Integer(), nullable=True))
+        batch.add_column(
+            sa.Column('david_notes', sa.Text(), nullable=False, server_default='')
+        )
+        batch.add_column(
+            sa.Column('steph_notes', sa.Text(), nullable=False, server_default='')
+        )
+    for user_id, prefix in ((DAVID_ID, 'david'), (STEPH_ID, 'steph')):
+        op.execute(
+            f"""
+            UPDATE watchlist_items SET
+                {prefix}_rating = (
+                    SELECT r.rating FROM watchlist_ratings r
+                    WHERE r.item_id = watchlist_items.id AND r.user_id = {user_id}
+                ),
+                {prefix}_notes = COALESCE((
+                    SELECT r.notes FROM watchlist_ratings r
+                    WHERE r.item_id = watchlist_items.id AND r.user_id = {user_id}
+                ), '')
+            """
+        )
+    op.drop_index(op.f('ix_watchlist_ratings_item_id'), table_name='watchlist_ratings')
+    op.drop_table('watchlist_ratings')
+
+    op.drop_index(op.f('ix_household_members_user_id'), table_name='household_members')
+    op.drop_index(op.f('ix_household_members_household_id'), table_name='household_members')
+    with op.batch_alter_table('household_members') as batch:
+        batch.drop_column('display_name')
+        batch.drop_column('household_id')
+
+    op.drop_index(op.f('ix_households_guild_id'), table_name='households')
+    op.drop_table('households')
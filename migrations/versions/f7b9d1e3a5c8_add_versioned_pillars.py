@@ -0,0 +1,112 @@
+"""add versioned pillar lists and a pillar bitmask on check-ins
+
+Revision ID: f7b9d1e3a5c8
+Revises: e6a8c0d2f4b7
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import datetime as _dt
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b9d1e3a5c8'
+down_revision: Union[str, Sequence[str], None] = 'e6a8c0d2f4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The lists that were hard-coded per user before pillars moved to the database
+_PRESETS = {
+    240608458888445953: (
+        "Write & reflect on daily priorities",
+        "10,000 steps",
+        "Max Claude usage or 30min on personal project",
+    ),
+    694650702466908160: (
+        "TikTok ≤ 90 minutes",
+        "Some form of movement",
+        "At least 15 min on a finite project",
+    ),
+}
+
+
+def upgrade() -> None:
+    """Create pillars, seed the old presets as version 1 and fill the bitmask."""
+    pillars = op.create_table(
+        'pillars',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('name', sa.Text(), nullable=False),
+        sa.Column('effective_from', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'user_id', 'version', 'position'),
+    )
+    op.create_index(op.f('ix_pillars_guild_id'), 'pillars', ['guild_id'], unique=False)
+    with op.batch_alter_table('playoff_checkins') as batch:
+        batch.add_column(
+            sa.Column('pillars_done', sa.Integer(), nullable=False, server_default='0')
+        )
+        batch.add_column(sa.Column('pillar_version', sa.Integer(), nullable=True))
+
+    bind = op.get_bind()
+    checkins = sa.table(
+        'playoff_checkins',
+        sa.column('guild_id', sa.BigInteger()),
+        sa.column('user_id', sa.BigInteger()),
+        sa.column('checkin_date', sa.Date()),
+        sa.column('pillar1', sa.Boolean()),
+        sa.column('pillar2', sa.Boolean()),
+        sa.column('pillar3', sa.Boolean()),
+        sa.column('pillars_done', sa.Integer()),
+        sa.column('pillar_version', sa.Integer()),
+    )
+    bind.execute(
+        checkins.update().values(
+            pillars_done=sa.case((checkins.c.pillar1, 1), else_=0)
+            + sa.case((checkins.c.pillar2, 2), else_=0)
+            + sa.case((checkins.c.pillar3, 4), else_=0)
+        )
+    )
+
+    first_days = bind.execute(
+        sa.select(checkins.c.guild_id, checkins.c.user_id, sa.func.min(checkins.c.checkin_date))
+        .where(checkins.c.user_id.in_(list(_PRESETS)))
+        .group_by(checkins.c.guild_id, checkins.c.user_id)
+    ).all()
+    now = _dt.datetime.now(_dt.timezone.utc)
+    rows = [
+        {
+            'guild_id': guild_id,
+            'user_id': user_id,
+            'version': 1,
+            'position': position,
+            'name': name,
+            'effective_from': first_day,
+            'created_at': now,
+        }
+        for guild_id, user_id, first_day in first_days
+        for position, name in enumerate(_PRESETS[user_id])
+    ]
+    if rows:
+        op.bulk_insert(pillars, rows)
+    bind.execute(
+        checkins.update()
+        .where(checkins.c.user_id.in_(list(_PRESETS)))
+        .values(pillar_version=1)
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('playoff_checkins') as batch:
+        batch.drop_column('pillar_version')
+        batch.drop_column('pillars_done')
+    op.drop_index(op.f('ix_pillars_guild_id'), table_name='pillars')
+    op.drop_table('pillars')
@@ -0,0 +1,73 @@
+"""add daily_result_members for N-member settlement
+
+Revision ID: f8b0d2e4a6c9
+Revises: e7a9c1d3f5b8
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b0d2e4a6c9'
+down_revision: Union[str, Sequence[str], None] = 'e7a9c1d3f5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The two players whose flags were stored as david_complete / steph_complete
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+
+
+def upgrade() -> None:
+    """Move per-player completion from fixed columns to one row per member.
+
+    Existing results are copied across for the two original players, then
+    the david_complete / steph_complete columns are dropped.
+    """
+    op.create_table(
+        'daily_result_members',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('guild_id', sa.BigInteger(), nullable=False),
+        sa.Column('result_date', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('complete', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('guild_id', 'result_date', 'user_id'),
+    )
+    for user_id, column in ((DAVID_ID, 'david_complete'), (STEPH_ID, 'steph_complete')):
+        op.execute(
+            f"""
+            INSERT INTO daily_result_members (guild_id, result_date, user_id, complete)
+            SELECT guild_id, result_date, {user_id}, {column} FROM daily_results
+            """
+        )
+    with op.batch_alter_table('daily_results') as batch:
+        batch.drop_column('david_complete')
+        batch.drop_column('steph_complete')
+
+
+def downgrade() -> None:
+    """Restore the two fixed columns; members beyond the original pair are lost."""
+    with op.batch_alter_table('daily_results') as batch:
+        batch.add_column(
+            sa.Column('david_complete', sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+        batch.add_column(
+            sa.Column('steph_complete', sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+    for user_id, column in ((DAVID_ID, 'david_complete'), (STEPH_ID, 'steph_complete')):
+        op.execute(
+            f"""
+            UPDATE daily_results SET {column} = COALESCE((
+                SELECT m.complete FROM daily_result_members m
+                WHERE m.guild_id = daily_results.guild_id
+                  AND m.result_date = daily_results.result_date
+                  AND m.user_id = {user_id}
+            ), {column})
+            """
+        )
+    op.drop_table('daily_result_members')
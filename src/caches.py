@@ -0,0 +1,61 @@
+"""Small in-process caches shared by the cogs.
+
+Each feature wraps these with its own key (and what makes a key stale);
+the eviction bookkeeping lives here once.
+"""
+from __future__ import annotations
+
+import time
+import typing as t
+from collections import OrderedDict
+
+
+class LRUCache[K, V]:
+    """At most *maxsize* entries; reading or writing one makes it the newest."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        return self._items.pop(key, None)
+
+    def __iter__(self) -> t.Iterator[K]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class TTLCache[K, V]:
+    """Entries trusted for *ttl* seconds of *clock* after they are written."""
+
+    def __init__(self, ttl: float, clock: t.Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._items: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if it is missing or expired."""
+        hit = self._items.get(key)
+        if hit is None or hit[0] <= self._clock():
+            return None
+        return hit[1]
+
+    def put(self, key: K, value: V) -> None:
+        self._items[key] = (self._clock() + self.ttl, value)
+
+    def invalidate(self, key: K) -> None:
+        self._items.pop(key, None)
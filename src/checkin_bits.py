@@ -0,0 +1,254 @@
+"""Packed per-year check-in history and the bit arithmetic that reads it.
+
+Each user-year is stored as two little-endian bit arrays (see
+``CheckinBitmap``): ``pillars`` with 3 bits per day and ``checked`` with 1.
+Loaded into Python ints, counts, streaks and heatmaps work on the whole
+range at once with masks, shifts and ``int.bit_count`` instead of looping
+over rows.
+"""
+from __future__ import annotations
+
+import calendar
+import datetime as _dt
+import typing as t
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import select
+
+from src.db import CheckinBitmap
+
+DAYS_PER_YEAR = 366
+PILLARS_PER_DAY = 3
+PILLAR_BYTES = (DAYS_PER_YEAR * PILLARS_PER_DAY + 7) // 8
+CHECKED_BYTES = (DAYS_PER_YEAR + 7) // 8
+
+
+@lru_cache(maxsize=64)
+def _stride_mask(days: int, stride: int) -> int:
+    """Lowest bit of each of *days* consecutive *stride*-bit groups."""
+    return ((1 << (stride * days)) - 1) // ((1 << stride) - 1)
+
+
+def day_of_year(day: _dt.date) -> int:
+    """Zero-based day index within its year."""
+    return day.timetuple().tm_yday - 1
+
+
+def year_length(year: int) -> int:
+    return 366 if calendar.isleap(year) else 365
+
+
+def pack(value: int, size: int) -> bytes:
+    return value.to_bytes(size, "little")
+
+
+def unpack(data: bytes) -> int:
+    return int.from_bytes(data, "little")
+
+
+def set_day(
+    pillars: int, checked: int, index: int, pillar1: bool, pillar2: bool, pillar3: bool
+) -> tuple[int, int]:
+    """Return (pillars, checked) with day *index* overwritten."""
+    shift = PILLARS_PER_DAY * index
+    value = int(pillar1) | int(pillar2) << 1 | int(pillar3) << 2
+    pillars = (pillars & ~(0b111 << shift)) | (value << shift)
+    return pillars, checked | (1 << index)
+
+
+@dataclass(frozen=True)
+class CheckinHistory:
+    """A contiguous run of *days* days from *start*, packed like one year."""
+
+    start: _dt.date
+    days: int
+    pillars: int = 0
+    checked: int = 0
+
+    @classmethod
+    def from_years(
+        cls, rows: t.Iterable[tuple[int, int, int]], first_year: int, last_year: int
+    ) -> CheckinHistory:
+        """Stitch (year, pillars, checked) rows into Jan 1 *first_year* – Dec 31 *last_year*.
+
+        Years without a row are empty.  Each year is shifted by the true
+        length of the years before it, so runs carry across New Year.
+        """
+        by_year = {year: (p, c) for year, p, c in rows}
+        pillars = checked = offset = 0
+        for year in range(first_year, last_year + 1):
+            p, c = by_year.get(year, (0, 0))
+            pillars |= p << (PILLARS_PER_DAY * offset)
+            checked |= c << offset
+            offset += year_length(year)
+        return cls(_dt.date(first_year, 1, 1), offset, pillars, checked)
+
+    def index_of(self, day: _dt.date) -> int:
+        return (day - self.start).days
+
+    def window(self, first: _dt.date, last: _dt.date) -> CheckinHistory:
+        """The days *first* through *last*; days outside this history are empty."""
+        days = (last - first).days + 1
+        offset = self.index_of(first)
+        pillars, checked = self.pillars, self.checked
+        if offset >= 0:
+            pillars >>= PILLARS_PER_DAY * offset
+            checked >>= offset
+        else:
+            pillars <<= PILLARS_PER_DAY * -offset
+            checked <<= -offset
+        return CheckinHistory(
+            first,
+            days,
+            pillars & ((1 << PILLARS_PER_DAY * days) - 1),
+            checked & ((1 << days) - 1),
+        )
+
+    def day_bits(self, pillar: int | None = None) -> int:
+        """One bit per day: *pillar* (0-based) done, or every pillar done when None."""
+        bits = self._complete() if pillar is None else self.pillars >> pillar
+        bits &= _stride_mask(self.days, PILLARS_PER_DAY)
+        digits = format(bits, f"0{PILLARS_PER_DAY * self.days}b")
+        # Most significant first, so the last bit of each 3-bit group is its day
+        return int(digits[PILLARS_PER_DAY - 1 :: PILLARS_PER_DAY] or "0", 2)
+
+    def days_checked(self) -> int:
+        return self.checked.bit_count()
+
+    def pillar_counts(self) -> tuple[int, int, int]:
+        """Days each pillar was completed."""
+        mask = _stride_mask(self.days, PILLARS_PER_DAY)
+        return tuple((self.pillars >> p & mask).bit_count() for p in range(PILLARS_PER_DAY))
+
+    def pillar_rates(self) -> tuple[float, float, float]:
+        """Share of checked-in days each pillar was completed (0 with no check-ins)."""
+        checked = self.days_checked()
+        return tuple(n / checked if checked else 0.0 for n in self.pillar_counts())
+
+    def _complete(self) -> int:
+        """Bit ``3 * day`` set where all three pillars were completed."""
+        p = self.pillars
+        return p & (p >> 1) & (p >> 2) & _stride_mask(self.days, PILLARS_PER_DAY)
+
+    def completed_on(self, day: _dt.date) -> bool:
+        """Whether all three pillars were done on *day*."""
+        index = self.index_of(day)
+        return 0 <= index < self.days and bool(self._complete() >> (PILLARS_PER_DAY * index) & 1)
+
+    def complete_days(self) -> int:
+        return self._complete().bit_count()
+
+    def longest_streak(self) -> int:
+        """Longest run of consecutive all-pillar days.
+
+        Each ``x &= x >> 3`` drops the last day of every run, so the number
+        of rounds until nothing is left is the longest run.
+        """
+        x, rounds = self._complete(), 0
+        while x:
+            x &= x >> PILLARS_PER_DAY
+            rounds += 1
+        return rounds
+
+    def current_streak(self, day: _dt.date) -> int:
+        """Run of all-pillar days ending on *day*, or the day before if *day* is not done yet."""
+        index = min(self.index_of(day), self.days - 1)
+        complete = self._complete()
+        if index >= 0 and not complete >> (PILLARS_PER_DAY * index) & 1:
+            index -= 1
+        if index < 0 or not complete >> (PILLARS_PER_DAY * index) & 1:
+            return 0
+        # Most recent not-complete day before index; every day after it counts
+        gaps = ~complete & _stride_mask(index, PILLARS_PER_DAY)
+        last_gap = (gaps.bit_length() - 1) // PILLARS_PER_DAY if gaps else -1
+        return index - last_gap
+
+    def heatmap(self) -> list[int | None]:
+        """Pillars done per day (0–3), or None where there was no check-in."""
+        mask = _stride_mask(self.days, PILLARS_PER_DAY)
+        p = self.pillars
+        # Group sums are at most 3, so they never carry into the next group
+        counts = (p & mask) + (p >> 1 & mask) + (p >> 2 & mask)
+        digits = format(counts, f"0{PILLARS_PER_DAY * self.days}b")[::-1]
+        seen = format(self.checked, f"0{self.days}b")[::-1]
+        return [
+            int(digits[PILLARS_PER_DAY * d + 1] + digits[PILLARS_PER_DAY * d], 2)
+            if seen[d] == "1"
+            else None
+            for d in range(self.days)
+        ]
+
+
+async def record_checkin_bits(
+    s,
+    guild_id: int,
+    user_id: int,
+    day: _dt.date,
+    pillar1: bool,
+    pillar2: bool,
+    pillar3: bool,
+) -> None:
+    """Fold one check-in into the user's bitmap for that year.  Caller commits."""
+    row = await s.scalar(
+        select(CheckinBitmap).where(
+            CheckinBitmap.guild_id == guild_id,
+            CheckinBitmap.user_id == user_id,
+            CheckinBitmap.year == day.year,
+        )
+    )
+    if row is None:
+        row = CheckinBitmap(
+            guild_id=guild_id,
+            user_id=user_id,
+            year=day.year,
+            pillars=bytes(PILLAR_BYTES),
+            checked=bytes(CHECKED_BYTES),
+        )
+        s.add(row)
+    pillars, checked = set_day(
+        unpack(row.pillars), unpack(row.checked), day_of_year(day), pillar1, pillar2, pillar3
+    )
+    row.pillars = pack(pillars, PILLAR_BYTES)
+    row.checked = pack(checked, CHECKED_BYTES)
+
+
+async def load_histories(
+    s, guild_id: int, user_ids: t.Iterable[int], first_year: int, last_year: int
+) -> dict[int, CheckinHistory]:
+    """Packed histories of several users for the given years, in one query."""
+    rows: dict[int, list[tuple[int, int, int]]] = {user_id: [] for user_id in user_ids}
+    for r in await s.execute(
+        select(
+            CheckinBitmap.user_id, CheckinBitmap.year, CheckinBitmap.pillars, CheckinBitmap.checked
+        ).where(
+            CheckinBitmap.guild_id == guild_id,
+            CheckinBitmap.user_id.in_(list(rows)),
+            CheckinBitmap.year >= first_year,
+            CheckinBitmap.year <= last_year,
+        )
+    ):
+        rows[r.user_id].append((r.year, unpack(r.pillars), unpack(r.checked)))
+    return {
+        user_id: CheckinHistory.from_years(years, first_year, last_year)
+        for user_id, years in rows.items()
+    }
+
+
+async def load_history(
+    s, guild_id: int, user_id: int, first_year: int, last_year: int
+) -> CheckinHistory:
+    """One user's packed history for the given years, in one query."""
+    rows = (
+        await s.execute(
+            select(CheckinBitmap.year, CheckinBitmap.pillars, CheckinBitmap.checked).where(
+                CheckinBitmap.guild_id == guild_id,
+                CheckinBitmap.user_id == user_id,
+                CheckinBitmap.year >= first_year,
+                CheckinBitmap.year <= last_year,
+            )
+        )
+    ).all()
+    return CheckinHistory.from_years(
+        ((r.year, unpack(r.pillars), unpack(r.checked)) for r in rows), first_year, last_year
+    )
@@ -0,0 +1,122 @@
+"""Local time per household and member: "today", week starts and UTC day bounds.
+
+A guild's ``guild_settings`` row sets the household time zone and the
+weekday its weeks start on; a member can override the time zone on their
+``household_members`` row.  ``ClockCache`` keeps each guild's clocks so the
+hot paths (every ``/checkin``) do not re-read them, and nothing here
+depends on the host's own time zone.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import time
+import typing as t
+from dataclasses import dataclass, field
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+
+from src.caches import TTLCache
+from src.db import GuildSettings, HouseholdMember
+from src.scheduler import DEFAULT_TIMEZONE, zone
+
+CLOCK_TTL = 300.0
+
+# date.weekday() of the default first day of the week
+SUNDAY = 6
+
+
+def week_start_for(day: _dt.date, week_start: int = SUNDAY) -> _dt.date:
+    """The first day of the week containing *day* (weeks start on *week_start*)."""
+    return day - _dt.timedelta(days=(day.weekday() - week_start) % 7)
+
+
+@dataclass(frozen=True)
+class LocalClock:
+    """One time zone and week-start weekday."""
+
+    tz: ZoneInfo = field(default_factory=lambda: ZoneInfo(DEFAULT_TIMEZONE))
+    week_start: int = SUNDAY
+
+    def today(self, now: _dt.datetime | None = None) -> _dt.date:
+        now = now or _dt.datetime.now(_dt.timezone.utc)
+        return now.astimezone(self.tz).date()
+
+    def week_start_for(self, day: _dt.date) -> _dt.date:
+        return week_start_for(day, self.week_start)
+
+    def day_bounds(self, day: _dt.date) -> tuple[_dt.datetime, _dt.datetime]:
+        """The [start, end) UTC instants of local *day*."""
+        return self.range_bounds(day, day)
+
+    def range_bounds(
+        self, first: _dt.date, last: _dt.date
+    ) -> tuple[_dt.datetime, _dt.datetime]:
+        """The [start, end) UTC instants covering local days *first* through *last*.
+
+        Compare timestamp columns against these instead of converting the
+        column to a local date, so the column's index still applies.
+        """
+        utc = _dt.timezone.utc
+        start = _dt.datetime.combine(first, _dt.time.min, tzinfo=self.tz).astimezone(utc)
+        end_day = last + _dt.timedelta(days=1)
+        end = _dt.datetime.combine(end_day, _dt.time.min, tzinfo=self.tz).astimezone(utc)
+        return start, end
+
+
+@dataclass(frozen=True)
+class GuildClocks:
+    """The household clock plus members' own time zones, for one guild."""
+
+    household: LocalClock = field(default_factory=LocalClock)
+    member_zones: t.Mapping[int, ZoneInfo] = field(default_factory=dict)
+
+    def for_user(self, user_id: int | None) -> LocalClock:
+        """*user_id*'s clock: their own time zone, the household's week start."""
+        tz = self.member_zones.get(user_id) if user_id is not None else None
+        if tz is None:
+            return self.household
+        return LocalClock(tz, self.household.week_start)
+
+
+class ClockCache(TTLCache[int, GuildClocks]):
+    """In-memory ``GuildClocks`` per guild, with a TTL."""
+
+    def __init__(
+        self, ttl: float = CLOCK_TTL, clock: t.Callable[[], float] = time.monotonic
+    ) -> None:
+        super().__init__(ttl, clock)
+
+
+clocks = ClockCache()
+
+
+async def load_clocks(s, guild_id: int) -> GuildClocks:
+    """Read the guild's time zone, week start and member time zones."""
+    settings = await s.scalar(select(GuildSettings).where(GuildSettings.guild_id == guild_id))
+    rows = await s.execute(
+        select(HouseholdMember.user_id, HouseholdMember.timezone).where(
+            HouseholdMember.guild_id == guild_id,
+            HouseholdMember.timezone.is_not(None),
+        )
+    )
+    household = LocalClock(
+        zone(settings.timezone if settings else None),
+        settings.week_start if settings and settings.week_start is not None else SUNDAY,
+    )
+    return GuildClocks(household, {user_id: zone(name) for user_id, name in rows})
+
+
+async def guild_clocks(db, guild_id: int) -> GuildClocks:
+    """Cached ``load_clocks``; *db* is the session factory."""
+    hit = clocks.get(guild_id)
+    if hit is None:
+        async with db() as s:
+            hit = await load_clocks(s, guild_id)
+        clocks.put(guild_id, hit)
+    return hit
+
+
+async def clock_for(db, guild_id: int, user_id: int | None = None) -> LocalClock:
+    """The clock for *user_id* in *guild_id*, or the household's when None."""
+    return (await guild_clocks(db, guild_id)).for_user(user_id)
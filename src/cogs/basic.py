@@ -27,6 +27,11 @@ def basic_help_embed() -> discord.Embed:
         value="📶 Get the guest Wi-Fi network name and password.",
         inline=False,
     )
+    e.add_field(
+        name="/search query:<text>",
+        value="🔎 Search shopping, watchlist, bucket list, outings, date nights, special dates and ledger notes at once.",
+        inline=False,
+    )
     e.set_footer(text="Use the buttons below to switch pages.")
     return e
 
@@ -38,26 +43,51 @@ def playoff_help_embed() -> discord.Embed:
         color=discord.Color.gold(),
     )
     e.add_field(
-        name="/checkin pillar1:<yes/no> pillar2:<yes/no> pillar3:<yes/no>",
-        value="Log your 3 pillars for today. A WIN requires all 3. Updates your series score automatically.",
+        name="/checkin",
+        value="Log your pillars for today. A WIN requires all of them. Updates your series score automatically.",
+        inline=False,
+    )
+    e.add_field(
+        name="/playoff pillars [member] · /playoff set_pillars first [second] [third] [starting]",
+        value="See your pillars and past versions, or set up to 3 new ones from today or a future date.",
         inline=False,
     )
     e.add_field(
         name="/playoff_status",
-        value="See the current series score for both David and Stephanie, plus today's check-in status.",
+        value="See the household's current series score, plus today's check-in status.",
         inline=False,
     )
     e.add_field(
         name="/series_history",
-        value="View your last 8 series results (ephemeral).",
+        value="All-time streaks and pillar rates, then every past series, 8 per page (ephemeral).",
+        inline=False,
+    )
+    e.add_field(
+        name="/playoff week [day]",
+        value="Re-post the weekly review for the week containing `day` (default: last week).",
+        inline=False,
+    )
+    e.add_field(
+        name="/checkin_stats [member] [year]",
+        value="Current and longest streak, per-pillar completion and a year heatmap (ephemeral).",
+        inline=False,
+    )
+    e.add_field(
+        name="/playoff heatmap [member] [household] [start] [end]",
+        value="A contribution-style image of pillar completion for one person or the household (default: the last year).",
+        inline=False,
+    )
+    e.add_field(
+        name="/playoff insights",
+        value="4- and 12-week pillar rates, your best and toughest weekdays, and how pillars and partners move together.",
         inline=False,
     )
     e.add_field(
         name="How it works",
         value=(
-            "Each week is a best-of-7 series. Win = all 3 pillars hit. "
+            "Each week is a best-of-7 series. Win = everyone hits all their pillars. "
             "First to 4 wins takes the week. "
-            "The bot pings the check-in channel at 9 pm ET if you haven't logged yet."
+            "The bot pings the check-in channel each evening, with one-tap check-in buttons, if you haven't logged yet."
         ),
         inline=False,
     )
@@ -72,8 +102,11 @@ def budget_help_embed() -> discord.Embed:
         color=discord.Color.blurple(),
     )
     e.add_field(
-        name="/venmo amount:<number> note:<text>",
-        value="Create a ledger entry that your partner owes you. Example: `/venmo amount: 23.50 note: Dinner`",
+        name="/venmo amount:<number> note:<text> [category:<name>]",
+        value=(
+            "Create a ledger entry that your partner owes you. `category` autocompletes.\n"
+            "Example: `/venmo amount: 23.50 note: Dinner category: dining`"
+        ),
         inline=False,
     )
     e.add_field(
@@ -95,13 +128,52 @@ def budget_help_embed() -> discord.Embed:
         inline=False,
     )
     e.add_field(
-        name="/ledger",
-        value="Show an itemized list of this month’s entries and the current net.",
+        name="/recurring add name:<text> amount:<number> [split:<1/3>] [cadence:<monthly/weekly>]",
+        value=(
+            "Set up a bill you pay (rent, Wi-Fi…) that posts your partner’s share to the ledger "
+            "automatically every period. Manage with `/recurring list` and `/recurring remove`."
+        ),
+        inline=False,
+    )
+    e.add_field(
+        name="/ledger view [month:<YYYY-MM>]",
+        value=(
+            "Show this month’s entries (paged with ◀ / ▶) and the current net.\n"
+            "Pass a past `month` to see that month’s closed totals."
+        ),
+        inline=False,
+    )
+    e.add_field(
+        name="/ledger export [format:<csv/jsonl>]",
+        value="Download the full ledger history as a file.",
+        inline=False,
+    )
+    e.add_field(
+        name="/ledger import file:<csv> source:<venmo/splitwise>",
+        value="Backfill the ledger from a Venmo or Splitwise CSV. Duplicate (date, amount, note) rows are skipped.",
+        inline=False,
+    )
+    e.add_field(
+        name="/settle",
+        value="Show the fewest payments that square up everyone with a ledger balance in this server.",
+        inline=False,
+    )
+    e.add_field(
+        name="/budget review [month:<YYYY-MM>]",
+        value="Spending per category with the change from last month and a 6-month sparkline.",
         inline=False,
     )
     e.add_field(
         name="Setup",
-        value="Set env `PARTNER_IDS` to a comma-sep list containing both users’ IDs so the bot can infer your partner.",
+        value=(
+            "Run `/household add` for each person who shares the ledger so the bot can infer your partner. "
+            "See members with `/household list`; remove with `/household remove`. "
+            "`/household owner` sets who pays shared bills like rent. "
+            "`/schedule show` lists when and where reminders post; change them with "
+            "`/schedule time`, `/schedule channel` and `/schedule timezone`. "
+            "`/schedule week_start` picks the day weeks start on, and "
+            "`/schedule my_timezone` sets your own time zone for check-ins."
+        ),
         inline=False,
     )
     e.set_footer(text="Use the buttons below to switch pages.")
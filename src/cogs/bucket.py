@@ -9,7 +9,8 @@ from discord.ext import commands
 from sqlalchemy import select
 
 from src.db import BucketListItem
-from src.utils import DAVID_ID, STEPH_ID
+from src.paging import FIELD_MAX_CHARS, FIELD_NAME_MAX_CHARS, KeysetPager, clip
+from src.utils import household_roster, member_label
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
@@ -31,14 +32,6 @@ def _cat_label(category: str) -> str:
     return f"{_CAT_EMOJI.get(category, '⭐')} {category.capitalize()}"
 
 
-def _user_label(user_id: int) -> str:
-    if user_id == DAVID_ID:
-        return "David"
-    if user_id == STEPH_ID:
-        return "Steph"
-    return f"<@{user_id}>"
-
-
 class BucketList(commands.Cog):
     def __init__(self, bot: StavidBot) -> None:
         self.bot = bot
@@ -111,51 +104,58 @@ class BucketList(commands.Cog):
         category: str = "all",
         status: str = "todo",
     ) -> None:
-        async with self.bot.db() as s:
-            q = select(BucketListItem).where(BucketListItem.guild_id == interaction.guild_id)
-            if category != "all":
-                q = q.where(BucketListItem.category == category)
-            if status == "todo":
-                q = q.where(BucketListItem.completed == False)  # noqa: E712
-            elif status == "completed":
-                q = q.where(BucketListItem.completed == True)  # noqa: E712
-            q = q.order_by(BucketListItem.category, BucketListItem.created_at)
-            rows = (await s.scalars(q)).all()
-
-        if not rows:
-            label = "bucket list items" if status == "all" else ("completed items" if status == "completed" else "items to do")
-            await interaction.response.send_message(f"No {label}! Add something with `/bucket add`.", ephemeral=True)
-            return
+        roster = await household_roster(self.bot.db, interaction.guild_id or 0)
+        q = select(BucketListItem).where(BucketListItem.guild_id == interaction.guild_id)
+        if category != "all":
+            q = q.where(BucketListItem.category == category)
+        if status == "todo":
+            q = q.where(BucketListItem.completed == False)  # noqa: E712
+        elif status == "completed":
+            q = q.where(BucketListItem.completed == True)  # noqa: E712
 
         title_map = {
             "todo": "Bucket List",
             "completed": "Completed",
             "all": "Bucket List — All",
         }
-        embed = discord.Embed(
-            title=f"🪣 {title_map[status]}" + (f" — {_cat_label(category)}" if category != "all" else ""),
-            color=discord.Color.teal(),
-        )
 
-        for item in rows[:25]:
-            emoji = _CAT_EMOJI.get(item.category, "⭐")
-            check = "✅ " if item.completed else ""
-            field_name = f"{check}{emoji} {item.title}"
-            parts = [f"Added by {_user_label(item.added_by)}"]
-            if item.completed and item.completed_at:
-                parts.append(f"Completed {item.completed_at.strftime('%b %d, %Y')}")
-            if item.completed_notes:
-                parts.append(f"_{item.completed_notes}_")
-            if item.note and not item.completed:
-                parts.append(f"_{item.note}_")
-            if item.link:
-                parts.append(f"[Link]({item.link})")
-            embed.add_field(name=field_name, value="\n".join(parts), inline=False)
-
-        if len(rows) > 25:
-            embed.set_footer(text=f"Showing 25 of {len(rows)} items")
+        def render(rows: list[BucketListItem], _) -> discord.Embed:
+            embed = discord.Embed(
+                title=f"🪣 {title_map[status]}" + (f" — {_cat_label(category)}" if category != "all" else ""),
+                color=discord.Color.teal(),
+            )
+            for item in rows:
+                emoji = _CAT_EMOJI.get(item.category, "⭐")
+                check = "✅ " if item.completed else ""
+                field_name = f"{check}{emoji} {item.title}"
+                parts = [f"Added by {member_label(roster, item.added_by)}"]
+                if item.completed and item.completed_at:
+                    parts.append(f"Completed {item.completed_at.strftime('%b %d, %Y')}")
+                if item.completed_notes:
+                    parts.append(f"_{item.completed_notes}_")
+                if item.note and not item.completed:
+                    parts.append(f"_{item.note}_")
+                if item.link:
+                    parts.append(f"[Link]({item.link})")
+                embed.add_field(
+                    name=clip(field_name, FIELD_NAME_MAX_CHARS),
+                    value=clip("\n".join(parts), FIELD_MAX_CHARS),
+                    inline=False,
+                )
+            return embed
 
-        await interaction.response.send_message(embed=embed)
+        view = KeysetPager(
+            self.bot.db,
+            q,
+            (BucketListItem.category, BucketListItem.created_at, BucketListItem.id),
+            render,
+        )
+        await view.load()
+        if not view.rows:
+            label = "bucket list items" if status == "all" else ("completed items" if status == "completed" else "items to do")
+            await interaction.response.send_message(f"No {label}! Add something with `/bucket add`.", ephemeral=True)
+            return
+        await interaction.response.send_message(embed=view.embed(), view=view)
 
     # ------------------------------------------------------------------
     # /bucket done
@@ -1,22 +1,66 @@
 from __future__ import annotations
 
+import csv
 import datetime
+import heapq
+import io
+import json
+import tempfile
 import typing as t
-from decimal import ROUND_HALF_UP, Decimal
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 
 import discord
 from discord import app_commands
-from discord.ext import commands
-from sqlalchemy import case, func, select
+from discord.ext import commands, tasks
+from sqlalchemy import (
+    Date,
+    DateTime,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+)
 
-from src.db import LedgerEntry
-from src.utils import DAVID_ID, STEPH_ID, resolve_partner
+from src.db import LedgerCategoryMonthly, LedgerEntry, LedgerMonthlyRollup
+from src.utils import household_roster, resolve_partner
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
 
 MONTHLY_RENT = 230000
 
+# Entries per /ledger page — keeps the embed description well under 4096 chars
+LEDGER_PAGE_SIZE = 20
+
+# Rows fetched per round trip when streaming /ledger export
+EXPORT_CHUNK_SIZE = 500
+# Rows per executemany batch on /ledger import (Postgres uses a single COPY)
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_BYTES = 5_000_000
+
+_EXPORT_COLUMNS = [
+    "id", "created_at", "creditor_id", "debtor_id", "amount_cents", "amount", "category", "note",
+]
+
+# Suggested in autocomplete alongside any category the guild has already used
+CATEGORIES = [
+    "groceries", "dining", "rent", "utilities", "household",
+    "transport", "entertainment", "travel", "other",
+]
+# /pay settles up rather than spends, so /budget review leaves it out
+PAYMENT_CATEGORY = "payment"
+# Months shown in each /budget review sparkline (the target month included)
+REVIEW_MONTHS = 6
+_SPARK_CHARS = "▁▂▃▄▅▆▇█"
+# Transfers listed in the /settle embed before the rest are summarized
+SETTLE_MAX_LINES = 40
+
 
 class PartnerResolutionError(Exception):
     """Raised by _create_ledger_entry when the partner cannot be resolved."""
@@ -38,33 +82,319 @@ def _format_net_message(net_cents: int) -> str:
         return "✅ All square"
 
 
+def _month_start(d: datetime.date) -> datetime.date:
+    return d.replace(day=1)
+
+
+def _next_month(month: datetime.date) -> datetime.date:
+    if month.month == 12:
+        return datetime.date(month.year + 1, 1, 1)
+    return datetime.date(month.year, month.month + 1, 1)
+
+
+def _prev_month(month: datetime.date) -> datetime.date:
+    if month.month == 1:
+        return datetime.date(month.year - 1, 12, 1)
+    return datetime.date(month.year, month.month - 1, 1)
+
+
+def _month_bounds(month: datetime.date) -> tuple[datetime.datetime, datetime.datetime]:
+    """Return the [start, end) UTC datetimes covering *month*."""
+    utc = datetime.timezone.utc
+    start = datetime.datetime(month.year, month.month, 1, tzinfo=utc)
+    nxt = _next_month(month)
+    end = datetime.datetime(nxt.year, nxt.month, 1, tzinfo=utc)
+    return start, end
+
+
+def _parse_month(value: str) -> datetime.date | None:
+    """Parse ``YYYY-MM`` into the first day of that month, or None if invalid."""
+    try:
+        return datetime.datetime.strptime(value.strip(), "%Y-%m").date()
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class ImportedEntry:
+    """One parsed row from a Venmo/Splitwise CSV, from the importer's point of view.
+
+    ``amount_cents`` is always positive; ``importer_is_creditor`` says which
+    way it flows (True means the partner owes the importer).
+    """
+
+    created_at: datetime.datetime
+    amount_cents: int
+    note: str
+    importer_is_creditor: bool
+    category: str = ""
+
+
+def _parse_cents(raw: str) -> int | None:
+    """Parse a money cell like ``- $1,234.50`` or ``12.5`` into signed cents."""
+    cleaned = raw.replace("$", "").replace(",", "").replace(" ", "").strip()
+    if not cleaned:
+        return None
+    try:
+        value = Decimal(cleaned)
+    except InvalidOperation:
+        return None
+    return int(value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100)
+
+
+def _parse_import_datetime(raw: str) -> datetime.datetime | None:
+    """Parse an ISO date or datetime; naive values are taken as UTC."""
+    try:
+        value = datetime.datetime.fromisoformat(raw.strip())
+    except ValueError:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def parse_venmo_csv(text: str) -> list[ImportedEntry]:
+    """Parse a Venmo statement CSV.
+
+    Venmo prefixes the real header with account summary lines, so rows are
+    read from the first line containing a ``Datetime`` column.  Only
+    completed transactions are kept.  A negative amount means the importer
+    paid, which makes them the creditor — the same direction as ``/pay``.
+    """
+    lines = text.splitlines()
+    start = next((i for i, line in enumerate(lines) if "Datetime" in line), None)
+    if start is None:
+        return []
+    entries: list[ImportedEntry] = []
+    for row in csv.DictReader(lines[start:]):
+        status = (row.get("Status") or "").strip().lower()
+        if status and status != "complete":
+            continue
+        created_at = _parse_import_datetime(row.get("Datetime") or "")
+        cents = _parse_cents(row.get("Amount (total)") or "")
+        if created_at is None or not cents:
+            continue
+        entries.append(
+            ImportedEntry(
+                created_at=created_at,
+                amount_cents=abs(cents),
+                note=(row.get("Note") or "").strip(),
+                importer_is_creditor=cents < 0,
+            )
+        )
+    return entries
+
+
+def parse_splitwise_csv(text: str, me_column: str = "") -> list[ImportedEntry]:
+    """Parse a Splitwise expense export.
+
+    Splitwise lists one balance column per member after ``Currency``; a
+    positive value in the importer's column means the others owe them.
+    *me_column* picks that column by name (default: the first member column).
+    The trailing "Total balance" row is skipped.  Splitwise's own
+    ``Category`` column is carried over, lowercased.
+    """
+    reader = csv.DictReader(io.StringIO(text))
+    fields = reader.fieldnames or []
+    if "Currency" not in fields:
+        return []
+    members = fields[fields.index("Currency") + 1:]
+    column = me_column if me_column in members else (members[0] if members else "")
+    if not column:
+        return []
+    entries: list[ImportedEntry] = []
+    for row in reader:
+        description = (row.get("Description") or "").strip()
+        if description.lower() == "total balance":
+            continue
+        created_at = _parse_import_datetime(row.get("Date") or "")
+        cents = _parse_cents(row.get(column) or "")
+        if created_at is None or not cents:
+            continue
+        entries.append(
+            ImportedEntry(
+                created_at=created_at,
+                amount_cents=abs(cents),
+                note=description,
+                importer_is_creditor=cents > 0,
+                category=_normalize_category(row.get("Category") or ""),
+            )
+        )
+    return entries
+
+
+def _normalize_category(value: str) -> str:
+    return " ".join(value.split()).lower()
+
+
+def _category_label(category: str) -> str:
+    return category.capitalize() if category else "Uncategorized"
+
+
+def _sparkline(values: list[int]) -> str:
+    """Render *values* as a unicode sparkline, one block character per value."""
+    if not values:
+        return ""
+    lo, hi = min(values), max(values)
+    if hi == lo:
+        return (_SPARK_CHARS[0] if hi == 0 else _SPARK_CHARS[3]) * len(values)
+    top = len(_SPARK_CHARS) - 1
+    return "".join(_SPARK_CHARS[round((v - lo) * top / (hi - lo))] for v in values)
+
+
+def _format_delta(current: int, previous: int) -> str:
+    if previous == 0:
+        return "new" if current else "—"
+    diff = current - previous
+    if diff == 0:
+        return "± $0.00"
+    pct = abs(diff) * 100 // previous
+    return f"{'▲' if diff > 0 else '▼'} {_format_money(abs(diff))} ({pct}%)"
+
+
+def _format_ledger_line(
+    entry: LedgerEntry, me: discord.abc.User, partner: discord.abc.User
+) -> str:
+    direction = "←" if entry.creditor_id == me.id else "→"
+    note = entry.note if len(entry.note) <= 80 else entry.note[:79] + "…"
+    return (
+        f"{entry.created_at:%m/%d} • {me.mention} {direction} {partner.mention} | "
+        f"{_format_money(entry.amount_cents)} - {note}"
+    )
+
+
+class LedgerPager(discord.ui.View):
+    """Pages through one month of ledger entries using (created_at, id) keysets."""
+
+    def __init__(
+        self,
+        db,  # sessionmaker
+        guild_id: int,
+        me: discord.abc.User,
+        partner: discord.abc.User,
+        month: datetime.date,
+        net_cents: int,
+    ) -> None:
+        super().__init__(timeout=300)
+        self.db = db
+        self.guild_id = guild_id
+        self.me = me
+        self.partner = partner
+        self.month = month
+        self.net_cents = net_cents
+        self.rows: list[LedgerEntry] = []
+        self.page = 1
+        self.has_prev = False
+        self.has_next = False
+
+    async def load(
+        self,
+        *,
+        after: tuple[datetime.datetime, int] | None = None,
+        before: tuple[datetime.datetime, int] | None = None,
+    ) -> bool:
+        """Show the first page, or the page after/before a cursor.
+
+        Returns False, keeping the current page, when nothing is left on
+        that side (entries deleted while the pager was open).
+        """
+        start, end = _month_bounds(self.month)
+        async with self.db() as s:
+            rows, has_more = await _get_ledger_page(
+                s,
+                self.guild_id,
+                self.me.id,
+                self.partner.id,
+                start,
+                end,
+                after=after,
+                before=before,
+            )
+        if not rows and (after is not None or before is not None):
+            if after is not None:
+                self.has_next = False
+            else:
+                self.has_prev = False
+            self.prev_button.disabled = not self.has_prev
+            self.next_button.disabled = not self.has_next
+            return False
+        self.rows = rows
+        if before is not None:
+            self.has_prev, self.has_next = has_more, True
+        elif after is not None:
+            self.has_prev, self.has_next = True, has_more
+        else:
+            self.has_prev, self.has_next = False, has_more
+        self.prev_button.disabled = not self.has_prev
+        self.next_button.disabled = not self.has_next
+        return True
+
+    def embed(self) -> discord.Embed:
+        lines = [_format_ledger_line(e, self.me, self.partner) for e in self.rows]
+        embed = discord.Embed(
+            title=f"📒 Ledger with {self.partner.display_name} (this month)",
+            description="\n".join(lines) if lines else "_No entries this month._",
+            color=discord.Color.blurple(),
+        )
+        embed.add_field(name="Net", value=_format_net_message(self.net_cents), inline=False)
+        if self.has_prev or self.has_next:
+            embed.set_footer(text=f"Page {self.page}")
+        return embed
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary, disabled=True)
+    async def prev_button(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if self.rows:
+            first = self.rows[0]
+            if await self.load(before=(first.created_at, first.id)):
+                self.page = max(1, self.page - 1)
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary, disabled=True)
+    async def next_button(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if self.rows:
+            last = self.rows[-1]
+            if await self.load(after=(last.created_at, last.id)):
+                self.page += 1
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
+
 # This class includes all of the basic commands like help and quote
 class Budget(commands.Cog):
     def __init__(self, bot: StavidBot) -> None:
         self.bot = bot
+        self._closed_months: set[datetime.date] = set()
+        self.monthly_rollup.start()
+
+    def cog_unload(self) -> None:
+        self.monthly_rollup.cancel()
 
     async def _create_ledger_entry(
         self,
         interaction: discord.Interaction,
         cents: int,
         note: str,
+        category: str = "",
     ) -> int:
         partner = await resolve_partner(interaction)
         if not partner:
             await interaction.response.send_message(
-                "❌ I couldn’t infer who to request from (set `PARTNER_IDS`).",
+                "❌ I couldn’t infer who to request from (add them with `/household add`).",
                 ephemeral=True,
             )
             raise PartnerResolutionError
         async with self.bot.db() as s:
-            s.add(
-                LedgerEntry(
-                    guild_id=interaction.guild_id or 0,
-                    creditor_id=interaction.user.id,
-                    debtor_id=partner.id,
-                    amount_cents=cents,
-                    note=note,
-                )
+            await record_ledger_entries(
+                s,
+                [
+                    {
+                        "guild_id": interaction.guild_id or 0,
+                        "creditor_id": interaction.user.id,
+                        "debtor_id": partner.id,
+                        "amount_cents": cents,
+                        "note": note,
+                        "category": category,
+                    }
+                ],
             )
             await s.commit()
 
@@ -78,19 +408,22 @@ class Budget(commands.Cog):
     @app_commands.describe(
         amount="Amount",
         note="For what?",
+        category="Spending category, e.g. groceries (used by /budget review)",
     )
     async def venmo(
         self,
         interaction: discord.Interaction,
         amount: app_commands.Range[float, 0.01, 10000.0],
         note: str,
+        category: str = "",
     ) -> None:
         cents = int(
             Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100
         )
+        category = _normalize_category(category)
         try:
             net_cents = await self._create_ledger_entry(
-                interaction=interaction, cents=cents, note=note
+                interaction=interaction, cents=cents, note=note, category=category
             )
         except PartnerResolutionError:
             return
@@ -100,12 +433,38 @@ class Budget(commands.Cog):
                 f"🧾 **Ledger Entry Created**\n"
                 f"**From:** {partner.mention}\n"
                 f"**Amount:** {_format_money(cents)}\n"
-                f"**Note:** {note}\n\n"
-                f"{_format_net_message(net_cents)}"
+                f"**Note:** {note}\n"
+                + (f"**Category:** {_category_label(category)}\n" if category else "")
+                + f"\n{_format_net_message(net_cents)}"
             ),
             ephemeral=False,
         )
 
+    @venmo.autocomplete("category")
+    async def category_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        async with self.bot.db() as s:
+            used = (
+                await s.scalars(
+                    select(LedgerCategoryMonthly.category)
+                    .where(
+                        LedgerCategoryMonthly.guild_id == interaction.guild_id,
+                        LedgerCategoryMonthly.category.not_in(["", PAYMENT_CATEGORY]),
+                    )
+                    .group_by(LedgerCategoryMonthly.category)
+                    .order_by(func.sum(LedgerCategoryMonthly.entry_count).desc())
+                    .limit(25)
+                )
+            ).all()
+        needle = _normalize_category(current)
+        names = list(dict.fromkeys([*used, *CATEGORIES]))
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in names
+            if not needle or needle in name
+        ][:25]
+
     @app_commands.command(
         name="pay",
         description="Select an amount that you have paid the opposing person",
@@ -122,7 +481,7 @@ class Budget(commands.Cog):
         )
         try:
             net_cents = await self._create_ledger_entry(
-                interaction=interaction, cents=cents, note=note
+                interaction=interaction, cents=cents, note=note, category=PAYMENT_CATEGORY
             )
         except PartnerResolutionError:
             return
@@ -141,7 +500,9 @@ class Budget(commands.Cog):
     async def amount_autocomplete(self, interaction: discord.Interaction, current: str):
         partner = await resolve_partner(interaction)
         if not partner:
-            return [app_commands.Choice(name="Set PARTNER_IDS first", value=0.0)]
+            return [
+                app_commands.Choice(name="Add your partner with /household add first", value=0.0)
+            ]
 
         async with self.bot.db() as s:
             net_cents = await _net_between(s, partner.id, interaction)
@@ -159,95 +520,795 @@ class Budget(commands.Cog):
             ),
         ]
 
-    @app_commands.command(
-        name="rent", description="Run once a month to add rent payment"
-    )
-    async def rent(self, interaction: discord.Interaction):
-        partner = await resolve_partner(interaction)
-        if interaction.user.id == DAVID_ID:
-            net_cents = await self._create_ledger_entry(
-                interaction, MONTHLY_RENT // 3, "rent"
+    async def _post_bill_share(
+        self, interaction: discord.Interaction, share_cents: int, note: str, category: str
+    ) -> None:
+        """Post a bill split: the household owner paid, so the other side owes *share_cents*."""
+        roster = await household_roster(self.bot.db, interaction.guild_id or 0)
+        if not roster.is_member(interaction.user.id):
+            await interaction.response.send_message(
+                "This command is only available to household members.", ephemeral=True
             )
-        elif interaction.user.id == STEPH_ID:
+            return
+        sign = 1 if interaction.user.id == roster.owner_id else -1
+        try:
             net_cents = await self._create_ledger_entry(
-                interaction, -(MONTHLY_RENT // 3), "rent"
-            )
-        else:
-            await interaction.response.send_message(
-                "This command is only available to David and Steph.", ephemeral=True
+                interaction, sign * share_cents, note, category
             )
+        except PartnerResolutionError:
             return
+        partner = await resolve_partner(interaction)
         await interaction.response.send_message(
-            f"📊 **Current Balance after rent {partner.mention}:**\n{_format_net_message(net_cents)}",
+            f"📊 **Current Balance after {note} {partner.mention}:**\n{_format_net_message(net_cents)}",
         )
 
+    @app_commands.command(
+        name="rent", description="Run once a month to add rent payment"
+    )
+    async def rent(self, interaction: discord.Interaction):
+        await self._post_bill_share(interaction, MONTHLY_RENT // 3, "rent", "rent")
+
     @app_commands.command(
         name="wifi_bill", description="Run once a month to add wifi payment"
     )
     async def wifi_bill(self, interaction: discord.Interaction):
+        await self._post_bill_share(interaction, 8000 // 3, "wifi", "utilities")
+
+    ledger = app_commands.Group(name="ledger", description="Shared ledger history")
+
+    @ledger.command(name="view", description="See the itemized ledger for this month")
+    @app_commands.describe(month="Past month to summarize (YYYY-MM, default: this month)")
+    async def view(self, interaction: discord.Interaction, month: str = ""):
         partner = await resolve_partner(interaction)
-        if interaction.user.id == DAVID_ID:
-            net_cents = await self._create_ledger_entry(interaction, 8000 // 3, "wifi")
-        elif interaction.user.id == STEPH_ID:
-            net_cents = await self._create_ledger_entry(interaction, -(8000 // 3), "wifi")
-        else:
+        if not partner:
             await interaction.response.send_message(
-                "This command is only available to David and Steph.", ephemeral=True
+                "❌ I couldn’t infer who your partner is (add them with `/household add`).",
+                ephemeral=True,
             )
             return
-        await interaction.response.send_message(
-            f"📊 **Current Balance after wifi {partner.mention}:**\n{_format_net_message(net_cents)}",
+
+        this_month = _month_start(datetime.datetime.now(datetime.timezone.utc).date())
+        target = this_month
+        if month:
+            target = _parse_month(month)
+            if target is None:
+                await interaction.response.send_message(
+                    "❌ Invalid month — use YYYY-MM (e.g. `2026-03`).", ephemeral=True
+                )
+                return
+
+        if target > this_month:
+            await interaction.response.send_message(
+                "❌ That month hasn’t started yet.", ephemeral=True
+            )
+            return
+        if target < this_month:
+            await self._send_month_summary(interaction, partner, target)
+            return
+
+        async with self.bot.db() as s:
+            net_cents = await _net_between(s, partner.id, interaction)
+        view = LedgerPager(
+            self.bot.db,
+            interaction.guild_id or 0,
+            interaction.user,
+            partner,
+            this_month,
+            net_cents,
         )
+        await view.load()
+        await interaction.response.send_message(embed=view.embed(), view=view, ephemeral=True)
 
-    @app_commands.command(
-        name="ledger", description="See the itemized ledger for this month"
+    @view.autocomplete("month")
+    async def month_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        async with self.bot.db() as s:
+            months = (
+                await s.scalars(
+                    select(LedgerMonthlyRollup.month)
+                    .where(LedgerMonthlyRollup.guild_id == interaction.guild_id)
+                    .group_by(LedgerMonthlyRollup.month)
+                    .order_by(LedgerMonthlyRollup.month.desc())
+                    .limit(25)
+                )
+            ).all()
+        labels = [m.strftime("%Y-%m") for m in months]
+        return [
+            app_commands.Choice(name=label, value=label)
+            for label in labels
+            if not current or current in label
+        ]
+
+    async def _send_month_summary(
+        self,
+        interaction: discord.Interaction,
+        partner: discord.Member,
+        month: datetime.date,
+    ) -> None:
+        me_id = interaction.user.id
+        async with self.bot.db() as s:
+            owed_to_me, owed_by_me, count = await _rollup_totals(
+                s, interaction.guild_id or 0, month, me_id, partner.id
+            )
+
+        title = f"📒 Ledger with {partner.display_name} ({month:%B %Y})"
+        if count == 0:
+            embed = discord.Embed(
+                title=title,
+                description="_No entries recorded for this month._",
+                color=discord.Color.blurple(),
+            )
+        else:
+            embed = discord.Embed(title=title, color=discord.Color.blurple())
+            embed.add_field(name="They owed you", value=_format_money(owed_to_me), inline=True)
+            embed.add_field(name="You owed them", value=_format_money(owed_by_me), inline=True)
+            embed.add_field(name="Entries", value=str(count), inline=True)
+            embed.add_field(
+                name="Net for the month",
+                value=_format_net_message(owed_to_me - owed_by_me),
+                inline=False,
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @ledger.command(name="export", description="Download the full ledger history as a file")
+    @app_commands.describe(fmt="File format (default: CSV)")
+    @app_commands.rename(fmt="format")
+    @app_commands.choices(fmt=[
+        app_commands.Choice(name="CSV", value="csv"),
+        app_commands.Choice(name="JSON Lines", value="jsonl"),
+    ])
+    async def export(self, interaction: discord.Interaction, fmt: str = "csv") -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        # Spill to a temp file so memory stays flat regardless of history size
+        fp = tempfile.TemporaryFile()
+        out = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+        async with self.bot.db() as s:
+            count = await write_ledger_export(s, interaction.guild_id or 0, fmt, out)
+        out.flush()
+        out.detach()
+        fp.seek(0)
+
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        await interaction.followup.send(
+            f"📤 Exported **{count}** ledger entr{'y' if count == 1 else 'ies'}.",
+            file=discord.File(fp, filename=f"ledger-{today:%Y-%m-%d}.{fmt}"),
+            ephemeral=True,
+        )
+
+    @ledger.command(name="import", description="Backfill the ledger from a Venmo or Splitwise CSV")
+    @app_commands.describe(
+        file="CSV export from Venmo or Splitwise",
+        source="Which app the CSV came from",
+        splitwise_column="Splitwise only: your name column (default: first member column)",
     )
-    async def leder(self, interaction: discord.Interaction):
+    @app_commands.choices(source=[
+        app_commands.Choice(name="Venmo", value="venmo"),
+        app_commands.Choice(name="Splitwise", value="splitwise"),
+    ])
+    async def import_(
+        self,
+        interaction: discord.Interaction,
+        file: discord.Attachment,
+        source: str,
+        splitwise_column: str = "",
+    ) -> None:
         partner = await resolve_partner(interaction)
+        if not partner:
+            await interaction.response.send_message(
+                "❌ I couldn’t infer who your partner is (add them with `/household add`).",
+                ephemeral=True,
+            )
+            return
+        if file.size > IMPORT_MAX_BYTES:
+            await interaction.response.send_message(
+                f"❌ File too large (max {IMPORT_MAX_BYTES // 1_000_000} MB).", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        text = (await file.read()).decode("utf-8-sig", errors="replace")
+        if source == "venmo":
+            parsed = parse_venmo_csv(text)
+        else:
+            parsed = parse_splitwise_csv(text, splitwise_column)
+
+        if not parsed:
+            await interaction.followup.send(
+                "❌ No importable rows found — check the file and source.", ephemeral=True
+            )
+            return
+
         async with self.bot.db() as s:
+            added = await import_ledger_entries(
+                s, interaction.guild_id or 0, interaction.user.id, partner.id, parsed
+            )
             net_cents = await _net_between(s, partner.id, interaction)
-            entries: list[LedgerEntry] = await _get_ledger_itemized(
-                s, partner.id, interaction
+
+        skipped = len(parsed) - added
+        await interaction.followup.send(
+            (
+                f"📥 Imported **{added}** entr{'y' if added == 1 else 'ies'}"
+                + (f" ({skipped} duplicate{'s' if skipped != 1 else ''} skipped)" if skipped else "")
+                + f".\n\n{_format_net_message(net_cents)}"
+            ),
+            ephemeral=True,
+        )
+
+    @app_commands.command(
+        name="settle", description="Show the fewest payments that square up everyone in the ledger"
+    )
+    async def settle(self, interaction: discord.Interaction) -> None:
+        async with self.bot.db() as s:
+            balances = await member_balances(s, interaction.guild_id or 0)
+        transfers = simplify_debts(balances)
+
+        if not transfers:
+            await interaction.response.send_message("✅ Everyone is square — nothing to settle.")
+            return
+
+        lines = [
+            f"<@{debtor}> → <@{creditor}>: **{_format_money(cents)}**"
+            for debtor, creditor, cents in transfers
+        ]
+        shown = lines[:SETTLE_MAX_LINES]
+        if len(lines) > len(shown):
+            shown.append(f"_…and {len(lines) - len(shown)} more._")
+        embed = discord.Embed(
+            title="🤝 Settle Up",
+            description="\n".join(shown),
+            color=discord.Color.green(),
+        )
+        embed.set_footer(
+            text=f"{len(transfers)} payment{'s' if len(transfers) != 1 else ''} · "
+            "record each one with /pay once it’s sent"
+        )
+        await interaction.response.send_message(
+            embed=embed, allowed_mentions=discord.AllowedMentions.none()
+        )
+
+    budget = app_commands.Group(name="budget", description="Household spending")
+
+    @budget.command(name="review", description="Spending by category with month-over-month trends")
+    @app_commands.describe(month="Month to review (YYYY-MM, default: this month)")
+    async def review(self, interaction: discord.Interaction, month: str = "") -> None:
+        target = _month_start(datetime.datetime.now(datetime.timezone.utc).date())
+        if month:
+            target = _parse_month(month)
+            if target is None:
+                await interaction.response.send_message(
+                    "❌ Invalid month — use YYYY-MM (e.g. `2026-03`).", ephemeral=True
+                )
+                return
+
+        async with self.bot.db() as s:
+            months, series = await _category_series(
+                s, interaction.guild_id or 0, target, REVIEW_MONTHS
             )
-        entry_lines = []
-        for entry in entries:
-            direction = "←" if entry.creditor_id == interaction.user.id else "→"
-            entry_lines.append(
-                f"{entry.created_at:%m/%d} • {interaction.user.mention} {direction} {partner.mention} | {_format_money(entry.amount_cents)} - {entry.note}"
+
+        title = f"📊 Spending Review ({target:%B %Y})"
+        if not series:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title=title,
+                    description="_No categorized spending recorded yet._",
+                    color=discord.Color.blurple(),
+                ),
+                ephemeral=True,
             )
+            return
+
+        totals = [sum(values[i] for values in series.values()) for i in range(len(months))]
         embed = discord.Embed(
-            title=f"📒 Ledger with {partner.display_name} (this month)",
-            description="\n".join(entry_lines),  # cap if you want
+            title=title,
+            description=(
+                f"**Total:** {_format_money(totals[-1])} · {_format_delta(totals[-1], totals[-2])}\n"
+                f"`{_sparkline(totals)}` {months[0]:%b} → {months[-1]:%b}"
+            ),
             color=discord.Color.blurple(),
         )
-        embed.add_field(name="Net", value=_format_net_message(net_cents), inline=False)
+        ranked = sorted(series.items(), key=lambda kv: (-kv[1][-1], -sum(kv[1]), kv[0]))
+        for category, values in ranked[:25]:
+            embed.add_field(
+                name=_category_label(category),
+                value=(
+                    f"{_format_money(values[-1])} · {_format_delta(values[-1], values[-2])}\n"
+                    f"`{_sparkline(values)}`"
+                ),
+                inline=True,
+            )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        async def _format_entry_line(
-            self, me_id: int, partner_id: int, e: LedgerEntry
-        ) -> str:
-            direction = "→" if e.creditor_id == me_id else "←"
-            who = "You" if e.creditor_id == me_id else "Partner"
-            return f"{e.created_at:%Y-%m-%d} • {who} {direction} {_format_money(e.amount_cents)}"
+    @review.autocomplete("month")
+    async def review_month_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        async with self.bot.db() as s:
+            months = (
+                await s.scalars(
+                    select(LedgerCategoryMonthly.month)
+                    .where(LedgerCategoryMonthly.guild_id == interaction.guild_id)
+                    .group_by(LedgerCategoryMonthly.month)
+                    .order_by(LedgerCategoryMonthly.month.desc())
+                    .limit(25)
+                )
+            ).all()
+        labels = [m.strftime("%Y-%m") for m in months]
+        return [
+            app_commands.Choice(name=label, value=label)
+            for label in labels
+            if not current or current in label
+        ]
 
+    # ------------------------------------------------------------------ #
+    # Background tasks                                                     #
+    # ------------------------------------------------------------------ #
 
-async def _get_ledger_itemized(
-    s, partner_id: int, interaction: discord.Interaction
-) -> list[LedgerEntry]:
-    guild_id = interaction.guild_id
-    me_id = interaction.user.id
-    start = datetime.datetime.now(datetime.timezone.utc).replace(
-        day=1, hour=0, minute=0, second=0, microsecond=0
-    )
+    @tasks.loop(hours=1)
+    async def monthly_rollup(self) -> None:
+        """Close every finished month still missing from ledger_monthly_rollups.
+
+        Sweeps once per calendar month (UTC) and again after every restart,
+        so boundaries the bot was down through are caught up too.
+        """
+        this_month = _month_start(datetime.datetime.now(datetime.timezone.utc).date())
+        if this_month in self._closed_months:
+            return
+        async with self.bot.db() as s:
+            await close_missing_ledger_months(s, this_month)
+        self._closed_months.add(this_month)
+
+    @monthly_rollup.before_loop
+    async def before_monthly_rollup(self) -> None:
+        await self.bot.wait_until_ready()
+
+
+async def _get_ledger_page(
+    s,
+    guild_id: int,
+    me_id: int,
+    partner_id: int,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    *,
+    after: tuple[datetime.datetime, int] | None = None,
+    before: tuple[datetime.datetime, int] | None = None,
+    limit: int = LEDGER_PAGE_SIZE,
+) -> tuple[list[LedgerEntry], bool]:
+    """Return one page of entries between the two users in [start, end).
+
+    Pages are keyed on (created_at, id): pass the last row's key as *after*
+    for the next page or the first row's key as *before* for the previous
+    one.  Rows always come back oldest-first.  The bool reports whether more
+    rows exist beyond the page in the direction of travel.
+    """
     q = select(LedgerEntry).where(
         LedgerEntry.guild_id == guild_id,
         LedgerEntry.created_at >= start,
+        LedgerEntry.created_at < end,
         (
             (LedgerEntry.creditor_id == me_id) & (LedgerEntry.debtor_id == partner_id)
             | (LedgerEntry.creditor_id == partner_id) & (LedgerEntry.debtor_id == me_id)
         ),
     )
-    return (await s.scalars(q)).all()
+    if before is not None:
+        created_at, entry_id = before
+        q = q.where(
+            or_(
+                LedgerEntry.created_at < created_at,
+                and_(LedgerEntry.created_at == created_at, LedgerEntry.id < entry_id),
+            )
+        ).order_by(LedgerEntry.created_at.desc(), LedgerEntry.id.desc())
+    else:
+        if after is not None:
+            created_at, entry_id = after
+            q = q.where(
+                or_(
+                    LedgerEntry.created_at > created_at,
+                    and_(LedgerEntry.created_at == created_at, LedgerEntry.id > entry_id),
+                )
+            )
+        q = q.order_by(LedgerEntry.created_at, LedgerEntry.id)
+
+    rows = list((await s.scalars(q.limit(limit + 1))).all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if before is not None:
+        rows.reverse()
+    return rows, has_more
+
+
+async def record_ledger_entries(s, rows: list[dict[str, t.Any]]) -> int:
+    """Insert ledger rows in one statement — the write path for every ledger entry.
+
+    Rows whose ``idempotency_key`` already exists are skipped, so
+    machine-posted entries can be retried safely.  Only the rows actually
+    inserted are added to ledger_category_monthly, in the same transaction.
+    The caller commits.  Returns the number of rows actually inserted.
+    """
+    if not rows:
+        return 0
+    conn = await s.connection()
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = (
+        dialect_insert(LedgerEntry)
+        .on_conflict_do_nothing(index_elements=["idempotency_key"])
+        .returning(
+            LedgerEntry.guild_id,
+            LedgerEntry.created_at,
+            LedgerEntry.category,
+            LedgerEntry.amount_cents,
+        )
+    )
+    inserted = (await s.execute(stmt, rows)).all()
+    await _bump_category_totals(s, inserted)
+    return len(inserted)
+
+
+async def _bump_category_totals(s, rows: t.Iterable[t.Any]) -> None:
+    """Upsert (guild, month, category) totals for freshly inserted ledger rows.
+
+    *rows* need ``guild_id``, ``created_at``, ``category`` and ``amount_cents``
+    attributes or keys.  Rows are folded in Python first so each bucket is one
+    ``ON CONFLICT DO UPDATE``.
+    """
+    buckets: dict[tuple[int, datetime.date, str], list[int]] = {}
+    for row in rows:
+        r = row if isinstance(row, dict) else row._mapping
+        created_at = r["created_at"]
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(datetime.timezone.utc)
+        key = (r["guild_id"], _month_start(created_at.date()), r.get("category") or "")
+        bucket = buckets.setdefault(key, [0, 0])
+        bucket[0] += abs(r["amount_cents"])
+        bucket[1] += 1
+    if not buckets:
+        return
+
+    conn = await s.connection()
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(LedgerCategoryMonthly)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["guild_id", "month", "category"],
+        set_={
+            "amount_cents": LedgerCategoryMonthly.amount_cents + stmt.excluded.amount_cents,
+            "entry_count": LedgerCategoryMonthly.entry_count + stmt.excluded.entry_count,
+        },
+    )
+    for (guild_id, month, category), (amount, count) in buckets.items():
+        await s.execute(
+            stmt.values(
+                guild_id=guild_id,
+                month=month,
+                category=category,
+                amount_cents=amount,
+                entry_count=count,
+            )
+        )
+
+
+async def _category_series(
+    s, guild_id: int, month: datetime.date, length: int
+) -> tuple[list[datetime.date], dict[str, list[int]]]:
+    """Return the *length* months ending at *month* and per-category spend for each.
+
+    Reads only ledger_category_monthly.  Payments are excluded; categories
+    with no spend in the window are omitted.
+    """
+    months = [month]
+    for _ in range(length - 1):
+        months.insert(0, _prev_month(months[0]))
+    rows = (
+        await s.execute(
+            select(
+                LedgerCategoryMonthly.month,
+                LedgerCategoryMonthly.category,
+                LedgerCategoryMonthly.amount_cents,
+            ).where(
+                LedgerCategoryMonthly.guild_id == guild_id,
+                LedgerCategoryMonthly.month >= months[0],
+                LedgerCategoryMonthly.month <= month,
+                LedgerCategoryMonthly.category != PAYMENT_CATEGORY,
+            )
+        )
+    ).all()
+    index = {m: i for i, m in enumerate(months)}
+    series: dict[str, list[int]] = {}
+    for r in rows:
+        series.setdefault(r.category, [0] * len(months))[index[r.month]] += int(r.amount_cents)
+    return months, series
+
+
+def _export_record(e: LedgerEntry) -> dict[str, t.Any]:
+    return {
+        "id": e.id,
+        "created_at": e.created_at.isoformat(),
+        "creditor_id": e.creditor_id,
+        "debtor_id": e.debtor_id,
+        "amount_cents": e.amount_cents,
+        "amount": f"{Decimal(e.amount_cents) / Decimal(100):.2f}",
+        "category": e.category,
+        "note": e.note,
+    }
+
+
+async def write_ledger_export(s, guild_id: int, fmt: str, out: t.TextIO) -> int:
+    """Stream every entry for *guild_id* to *out* as CSV or JSON Lines.
+
+    Rows come through a server-side cursor ``EXPORT_CHUNK_SIZE`` at a time,
+    so memory use does not grow with history.  Returns the row count.
+    """
+    q = (
+        select(LedgerEntry)
+        .where(LedgerEntry.guild_id == guild_id)
+        .order_by(LedgerEntry.created_at, LedgerEntry.id)
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=_EXPORT_COLUMNS)
+        writer.writeheader()
+
+    count = 0
+    async for entry in await s.stream_scalars(q):
+        record = _export_record(entry)
+        if writer is not None:
+            writer.writerow(record)
+        else:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+async def import_ledger_entries(
+    s,
+    guild_id: int,
+    importer_id: int,
+    partner_id: int,
+    entries: list[ImportedEntry],
+) -> int:
+    """Insert *entries* for the importer/partner pair, skipping duplicates.
+
+    A row is a duplicate when an entry with the same (date, amount, note)
+    already exists in the guild or appears earlier in the same file.  Only
+    the date range covered by the import is read back for the check.
+    Rollups are rebuilt for every already-closed month that gained rows.
+    Returns the number of rows inserted.
+    """
+    if not entries:
+        return 0
+    lo = min(e.created_at for e in entries).date()
+    hi = max(e.created_at for e in entries).date()
+    utc = datetime.timezone.utc
+    existing = (
+        await s.execute(
+            select(LedgerEntry.created_at, LedgerEntry.amount_cents, LedgerEntry.note).where(
+                LedgerEntry.guild_id == guild_id,
+                LedgerEntry.created_at >= datetime.datetime.combine(lo, datetime.time.min, utc),
+                LedgerEntry.created_at
+                < datetime.datetime.combine(hi + datetime.timedelta(days=1), datetime.time.min, utc),
+            )
+        )
+    ).all()
+    seen = {(r.created_at.date(), r.amount_cents, r.note) for r in existing}
+
+    rows: list[dict[str, t.Any]] = []
+    for e in entries:
+        key = (e.created_at.date(), e.amount_cents, e.note)
+        if key in seen:
+            continue
+        seen.add(key)
+        rows.append(
+            {
+                "guild_id": guild_id,
+                "creditor_id": importer_id if e.importer_is_creditor else partner_id,
+                "debtor_id": partner_id if e.importer_is_creditor else importer_id,
+                "amount_cents": e.amount_cents,
+                "note": e.note,
+                "category": e.category,
+                "created_at": e.created_at,
+            }
+        )
+    if rows:
+        await _bulk_insert_ledger_rows(s, rows)
+        await _bump_category_totals(s, rows)
+    await s.commit()
+    await close_touched_ledger_months(s, [r["created_at"] for r in rows])
+    return len(rows)
+
+
+async def _bulk_insert_ledger_rows(s, rows: list[dict[str, t.Any]]) -> None:
+    """COPY on Postgres (asyncpg); batched executemany everywhere else."""
+    conn = await s.connection()
+    if conn.dialect.name == "postgresql":
+        raw = await conn.get_raw_connection()
+        columns = [
+            "guild_id", "creditor_id", "debtor_id", "amount_cents", "note", "category", "created_at",
+        ]
+        await raw.driver_connection.copy_records_to_table(
+            LedgerEntry.__tablename__,
+            records=[tuple(r[c] for c in columns) for r in rows],
+            columns=columns,
+        )
+        return
+    for i in range(0, len(rows), IMPORT_BATCH_SIZE):
+        await s.execute(insert(LedgerEntry), rows[i:i + IMPORT_BATCH_SIZE])
+
+
+async def close_ledger_month(s, month: datetime.date) -> int:
+    """Aggregate every guild's entries for *month* into ledger_monthly_rollups.
+
+    Idempotent — existing rollup rows for the month are replaced.  Returns the
+    number of rollup rows written.
+    """
+    start, end = _month_bounds(month)
+    await s.execute(delete(LedgerMonthlyRollup).where(LedgerMonthlyRollup.month == month))
+    agg = (
+        select(
+            LedgerEntry.guild_id,
+            literal(month, Date),
+            LedgerEntry.creditor_id,
+            LedgerEntry.debtor_id,
+            func.sum(LedgerEntry.amount_cents),
+            func.count(LedgerEntry.id),
+            literal(datetime.datetime.now(datetime.timezone.utc), DateTime(timezone=True)),
+        )
+        .where(LedgerEntry.created_at >= start, LedgerEntry.created_at < end)
+        .group_by(LedgerEntry.guild_id, LedgerEntry.creditor_id, LedgerEntry.debtor_id)
+    )
+    result = await s.execute(
+        insert(LedgerMonthlyRollup).from_select(
+            [
+                "guild_id",
+                "month",
+                "creditor_id",
+                "debtor_id",
+                "amount_cents",
+                "entry_count",
+                "closed_at",
+            ],
+            agg,
+        )
+    )
+    await s.commit()
+    return result.rowcount
+
+
+async def close_touched_ledger_months(
+    s, created_ats: t.Iterable[datetime.datetime]
+) -> list[datetime.date]:
+    """Re-roll every closed month holding one of *created_ats*.
+
+    For writers that backdate entries (imports, caught-up recurring
+    charges): a month already in ledger_monthly_rollups would otherwise
+    keep its old totals.  Call after committing the entries.  Returns the
+    months re-rolled, oldest first.
+    """
+    utc = datetime.timezone.utc
+    this_month = _month_start(datetime.datetime.now(utc).date())
+    touched = {
+        _month_start((ts.astimezone(utc) if ts.tzinfo else ts).date()) for ts in created_ats
+    }
+    months = sorted(m for m in touched if m < this_month)
+    for month in months:
+        await close_ledger_month(s, month)
+    return months
+
+
+async def close_missing_ledger_months(s, before: datetime.date) -> list[datetime.date]:
+    """Close every month before *before* that has entries but no rollup rows yet.
+
+    Covers month boundaries the bot was down through as well as history
+    older than the rollup table.  Returns the months closed, oldest first.
+    """
+    first = await s.scalar(select(func.min(LedgerEntry.created_at)))
+    if first is None:
+        return []
+    if first.tzinfo is not None:
+        first = first.astimezone(datetime.timezone.utc)
+    rolled_up = set((await s.scalars(select(LedgerMonthlyRollup.month).distinct())).all())
+
+    closed: list[datetime.date] = []
+    month = _month_start(first.date())
+    while month < before:
+        if month not in rolled_up:
+            start, end = _month_bounds(month)
+            has_entries = await s.scalar(
+                select(LedgerEntry.id)
+                .where(LedgerEntry.created_at >= start, LedgerEntry.created_at < end)
+                .limit(1)
+            )
+            if has_entries is not None:
+                await close_ledger_month(s, month)
+                closed.append(month)
+        month = _next_month(month)
+    return closed
+
+
+async def _rollup_totals(
+    s, guild_id: int, month: datetime.date, me_id: int, partner_id: int
+) -> tuple[int, int, int]:
+    """Return (owed_to_me, owed_by_me, entry_count) for *month* from the rollup table."""
+    rows = (
+        await s.execute(
+            select(
+                LedgerMonthlyRollup.creditor_id,
+                LedgerMonthlyRollup.amount_cents,
+                LedgerMonthlyRollup.entry_count,
+            ).where(
+                LedgerMonthlyRollup.guild_id == guild_id,
+                LedgerMonthlyRollup.month == month,
+                (
+                    (LedgerMonthlyRollup.creditor_id == me_id)
+                    & (LedgerMonthlyRollup.debtor_id == partner_id)
+                    | (LedgerMonthlyRollup.creditor_id == partner_id)
+                    & (LedgerMonthlyRollup.debtor_id == me_id)
+                ),
+            )
+        )
+    ).all()
+    owed_to_me = sum(r.amount_cents for r in rows if r.creditor_id == me_id)
+    owed_by_me = sum(r.amount_cents for r in rows if r.creditor_id != me_id)
+    count = sum(r.entry_count for r in rows)
+    return int(owed_to_me), int(owed_by_me), int(count)
+
+
+async def member_balances(s, guild_id: int) -> dict[int, int]:
+    """Return every member's net ledger balance in *guild_id* (positive = is owed).
+
+    One GROUP BY over the union of credits and debits; members who net to
+    zero are dropped.
+    """
+    legs = union_all(
+        select(
+            LedgerEntry.creditor_id.label("user_id"),
+            LedgerEntry.amount_cents.label("delta"),
+        ).where(LedgerEntry.guild_id == guild_id),
+        select(
+            LedgerEntry.debtor_id.label("user_id"),
+            (-LedgerEntry.amount_cents).label("delta"),
+        ).where(LedgerEntry.guild_id == guild_id),
+    ).subquery()
+    rows = (
+        await s.execute(
+            select(legs.c.user_id, func.sum(legs.c.delta))
+            .group_by(legs.c.user_id)
+            .having(func.sum(legs.c.delta) != 0)
+        )
+    ).all()
+    return {int(user_id): int(net) for user_id, net in rows}
+
+
+def simplify_debts(balances: dict[int, int]) -> list[tuple[int, int, int]]:
+    """Turn net balances into (debtor, creditor, cents) transfers.
+
+    Greedy: the largest debtor always pays the largest creditor, so every
+    transfer zeroes at least one member and at most ``n - 1`` transfers are
+    produced.  Runs in O(n log n) using two heaps.
+    """
+    creditors = [(-net, uid) for uid, net in balances.items() if net > 0]
+    debtors = [(net, uid) for uid, net in balances.items() if net < 0]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+
+    transfers: list[tuple[int, int, int]] = []
+    while creditors and debtors:
+        owed, creditor = heapq.heappop(creditors)
+        owes, debtor = heapq.heappop(debtors)
+        cents = min(-owed, -owes)
+        transfers.append((debtor, creditor, cents))
+        if -owed > cents:
+            heapq.heappush(creditors, (owed + cents, creditor))
+        if -owes > cents:
+            heapq.heappush(debtors, (owes + cents, debtor))
+    return transfers
 
 
 async def _net_between(s, partner_id: int, interaction: discord.Interaction) -> int:
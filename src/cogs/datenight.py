@@ -8,17 +8,16 @@ from datetime import datetime, timezone
 import discord
 from discord import app_commands
 from discord.ext import commands
-from sqlalchemy import select
+from sqlalchemy import func, select
 
+from src.clock import clock_for
 from src.db import DateNightLog, DateNightPlanner, DateNightWishlist, SpecialDate
-from src.utils import DAVID_ID, STEPH_ID
+from src.paging import FIELD_MAX_CHARS, KeysetPager, clip
+from src.utils import household_roster
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
 
-# Map each partner to the other so we can resolve "whose turn next"
-_PARTNER: dict[int, int] = {DAVID_ID: STEPH_ID, STEPH_ID: DAVID_ID}
-
 _STARS = {1: "★☆☆☆☆", 2: "★★☆☆☆", 3: "★★★☆☆", 4: "★★★★☆", 5: "★★★★★"}
 
 
@@ -60,6 +59,21 @@ async def _get_or_create_planner(s, guild_id: int) -> DateNightPlanner:
     return row
 
 
+def _add_lines(embed: discord.Embed, name: str, lines: list[str]) -> None:
+    """Add *lines* under *name*, continuing in unnamed fields past the value limit."""
+    chunk: list[str] = []
+    size = 0
+    for line in lines:
+        line = clip(line, FIELD_MAX_CHARS)
+        if chunk and size + 1 + len(line) > FIELD_MAX_CHARS:
+            embed.add_field(name=name, value="\n".join(chunk), inline=False)
+            name, chunk, size = "\u200b", [], 0
+        chunk.append(line)
+        size += len(line) + (1 if size else 0)
+    if chunk:
+        embed.add_field(name=name, value="\n".join(chunk), inline=False)
+
+
 # ---------------------------------------------------------------------------
 # Cog
 # ---------------------------------------------------------------------------
@@ -76,7 +90,7 @@ class DateNight(commands.Cog):
     @datenight.command(name="status", description="Who plans next + upcoming special dates")
     async def dn_status(self, interaction: discord.Interaction) -> None:
         guild_id = interaction.guild_id or 0
-        today = _dt.date.today()
+        today = (await clock_for(self.bot.db, guild_id)).today()
 
         async with self.bot.db() as s:
             planner = await _get_or_create_planner(s, guild_id)
@@ -92,7 +106,8 @@ class DateNight(commands.Cog):
         if planner.last_planner_id is None:
             turn_text = "No date nights logged yet — either of you can plan the first one!"
         else:
-            next_id = _PARTNER.get(planner.last_planner_id, planner.last_planner_id)
+            roster = await household_roster(self.bot.db, guild_id)
+            next_id = roster.next_after(planner.last_planner_id)
             turn_text = f"<@{next_id}>'s turn to plan! 🎉"
 
         embed = discord.Embed(title="💑 Date Night Status", color=discord.Color.from_str("#ff69b4"))
@@ -174,7 +189,8 @@ class DateNight(commands.Cog):
             s.add(entry)
             await s.commit()
 
-        next_id = _PARTNER.get(planner_id, planner_id)
+        roster = await household_roster(self.bot.db, guild_id)
+        next_id = roster.next_after(planner_id)
         parts = [f"💑 Date night logged for **{night_date}**!"]
         if place:
             parts.append(f"**Where:** {place}")
@@ -212,19 +228,18 @@ class DateNight(commands.Cog):
     @datenight.command(name="swap", description="Manually swap whose turn it is to plan")
     async def dn_swap(self, interaction: discord.Interaction) -> None:
         guild_id = interaction.guild_id or 0
+        roster = await household_roster(self.bot.db, guild_id)
         async with self.bot.db() as s:
             planner = await _get_or_create_planner(s, guild_id)
             if planner.last_planner_id is None:
                 # Bootstrap: treat the caller as having just planned, so partner is next
                 planner.last_planner_id = interaction.user.id
             else:
-                planner.last_planner_id = _PARTNER.get(
-                    planner.last_planner_id, planner.last_planner_id
-                )
+                planner.last_planner_id = roster.next_after(planner.last_planner_id)
             planner.updated_at = datetime.now(timezone.utc)
             await s.commit()
 
-        next_id = _PARTNER.get(planner.last_planner_id, planner.last_planner_id)
+        next_id = roster.next_after(planner.last_planner_id)
         await interaction.response.send_message(
             f"🔄 Swapped! It's now <@{next_id}>'s turn to plan the next date night."
         )
@@ -280,51 +295,60 @@ class DateNight(commands.Cog):
     @wish.command(name="list", description="Show the date night wishlist")
     async def wish_list(self, interaction: discord.Interaction) -> None:
         guild_id = interaction.guild_id or 0
-        async with self.bot.db() as s:
-            rows = (
-                await s.scalars(
-                    select(DateNightWishlist)
-                    .where(DateNightWishlist.guild_id == guild_id)
-                    .order_by(DateNightWishlist.visited, DateNightWishlist.created_at)
-                )
-            ).all()
 
-        if not rows:
+        async def counts(s, _) -> dict[bool, int]:
+            return dict(
+                (
+                    await s.execute(
+                        select(DateNightWishlist.visited, func.count())
+                        .where(DateNightWishlist.guild_id == guild_id)
+                        .group_by(DateNightWishlist.visited)
+                    )
+                ).all()
+            )
+
+        def render(rows: list[DateNightWishlist], totals) -> discord.Embed:
+            totals = totals or {}
+            embed = discord.Embed(title="✨ Date Night Wishlist", color=discord.Color.purple())
+
+            unvisited = [r for r in rows if not r.visited]
+            visited = [r for r in rows if r.visited]
+
+            if unvisited:
+                lines = []
+                for item in unvisited:
+                    line = f"• **{item.name}**"
+                    if item.notes:
+                        line += f" — _{item.notes}_"
+                    lines.append(line)
+                _add_lines(embed, f"To Try ({totals.get(False, len(unvisited))})", lines)
+
+            if visited:
+                lines = []
+                for item in visited:
+                    line = f"~~{item.name}~~"
+                    if item.visited_at:
+                        line += f" ✅ {item.visited_at}"
+                    if item.notes:
+                        line += f" — _{item.notes}_"
+                    lines.append(line)
+                _add_lines(embed, f"Done ({totals.get(True, len(visited))})", lines)
+            return embed
+
+        view = KeysetPager(
+            self.bot.db,
+            select(DateNightWishlist).where(DateNightWishlist.guild_id == guild_id),
+            (DateNightWishlist.visited, DateNightWishlist.created_at, DateNightWishlist.id),
+            render,
+            load_extra=counts,
+        )
+        await view.load()
+        if not view.rows:
             await interaction.response.send_message(
                 "Wishlist is empty! Add ideas with `/wish add`."
             )
             return
-
-        embed = discord.Embed(title="✨ Date Night Wishlist", color=discord.Color.purple())
-
-        unvisited = [r for r in rows if not r.visited]
-        visited = [r for r in rows if r.visited]
-
-        if unvisited:
-            lines = []
-            for item in unvisited[:20]:
-                line = f"• **{item.name}**"
-                if item.notes:
-                    line += f" — _{item.notes}_"
-                lines.append(line)
-            if len(unvisited) > 20:
-                lines.append(f"_…and {len(unvisited) - 20} more_")
-            embed.add_field(name=f"To Try ({len(unvisited)})", value="\n".join(lines), inline=False)
-
-        if visited:
-            lines = []
-            for item in visited[:10]:
-                line = f"~~{item.name}~~"
-                if item.visited_at:
-                    line += f" ✅ {item.visited_at}"
-                if item.notes:
-                    line += f" — _{item.notes}_"
-                lines.append(line)
-            if len(visited) > 10:
-                lines.append(f"_…and {len(visited) - 10} more_")
-            embed.add_field(name=f"Done ({len(visited)})", value="\n".join(lines), inline=False)
-
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=view.embed(), view=view)
 
     @wish.command(name="visit", description="Mark a wishlist item as visited")
     @app_commands.describe(item="Item to mark as visited", notes="Notes or memories from the visit")
@@ -336,6 +360,7 @@ class DateNight(commands.Cog):
             return
 
         guild_id = interaction.guild_id or 0
+        today = (await clock_for(self.bot.db, guild_id, interaction.user.id)).today()
         async with self.bot.db() as s:
             row = await s.get(DateNightWishlist, item_id)
             if row is None or row.guild_id != guild_id:
@@ -348,7 +373,7 @@ class DateNight(commands.Cog):
                 return
             name = row.name
             row.visited = True
-            row.visited_at = _dt.date.today()
+            row.visited_at = today
             if notes:
                 row.notes = notes
             await s.commit()
@@ -496,7 +521,7 @@ class DateNight(commands.Cog):
     @special.command(name="list", description="Show all special dates with countdowns and gift ideas")
     async def special_list(self, interaction: discord.Interaction) -> None:
         guild_id = interaction.guild_id or 0
-        today = _dt.date.today()
+        today = (await clock_for(self.bot.db, guild_id)).today()
         async with self.bot.db() as s:
             rows = (
                 await s.scalars(
@@ -0,0 +1,218 @@
+"""Household membership — who shares the ledger and partner commands in a guild."""
+from __future__ import annotations
+
+import typing as t
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from sqlalchemy import delete, select
+
+from src.clock import clocks
+from src.db import Household, HouseholdMember
+from src.utils import load_roster, membership
+
+if t.TYPE_CHECKING:
+    from src.main import StavidBot
+
+
+async def _get_or_create_household(s, guild_id: int, owner_id: int) -> Household:
+    row = await s.scalar(select(Household).where(Household.guild_id == guild_id))
+    if row is None:
+        row = Household(guild_id=guild_id, owner_id=owner_id)
+        s.add(row)
+        await s.flush()
+    return row
+
+
+async def add_household_member(
+    s, guild_id: int, user_id: int, display_name: str = ""
+) -> bool:
+    """Add *user_id* to the guild's household, creating it on first use.
+
+    The first member becomes the owner.  Returns False if already a member.
+    """
+    exists = await s.scalar(
+        select(HouseholdMember.id).where(
+            HouseholdMember.guild_id == guild_id,
+            HouseholdMember.user_id == user_id,
+        )
+    )
+    if exists is not None:
+        return False
+    household = await _get_or_create_household(s, guild_id, user_id)
+    if household.owner_id is None:
+        household.owner_id = user_id
+    s.add(
+        HouseholdMember(
+            household_id=household.id,
+            guild_id=guild_id,
+            user_id=user_id,
+            display_name=display_name,
+        )
+    )
+    await s.commit()
+    membership.invalidate(guild_id)
+    return True
+
+
+async def remove_household_member(s, guild_id: int, user_id: int) -> bool:
+    """Remove *user_id* from the guild's household.  Returns False if not a member.
+
+    If the owner leaves, ownership passes to the longest-standing member.
+    """
+    result = await s.execute(
+        delete(HouseholdMember).where(
+            HouseholdMember.guild_id == guild_id,
+            HouseholdMember.user_id == user_id,
+        )
+    )
+    household = await s.scalar(select(Household).where(Household.guild_id == guild_id))
+    if household is not None and household.owner_id == user_id:
+        household.owner_id = await s.scalar(
+            select(HouseholdMember.user_id)
+            .where(HouseholdMember.household_id == household.id)
+            .order_by(HouseholdMember.added_at, HouseholdMember.id)
+            .limit(1)
+        )
+    await s.commit()
+    membership.invalidate(guild_id)
+    clocks.invalidate(guild_id)
+    return bool(result.rowcount)
+
+
+async def set_household_owner(s, guild_id: int, user_id: int) -> bool:
+    """Make *user_id* the owner.  Returns False if they are not a member."""
+    household = await s.scalar(select(Household).where(Household.guild_id == guild_id))
+    is_member = await s.scalar(
+        select(HouseholdMember.id).where(
+            HouseholdMember.guild_id == guild_id,
+            HouseholdMember.user_id == user_id,
+        )
+    )
+    if household is None or is_member is None:
+        return False
+    household.owner_id = user_id
+    await s.commit()
+    membership.invalidate(guild_id)
+    return True
+
+
+class Households(commands.Cog):
+    def __init__(self, bot: StavidBot) -> None:
+        self.bot = bot
+
+    household = app_commands.Group(name="household", description="Who shares this server’s ledger")
+
+    async def _can_edit(self, interaction: discord.Interaction) -> bool:
+        """Anyone may start a household; after that only members can change it."""
+        async with self.bot.db() as s:
+            roster = await load_roster(s, interaction.guild_id or 0)
+        if not roster.member_ids or roster.is_member(interaction.user.id):
+            return True
+        await interaction.response.send_message(
+            "❌ Only household members can change the household.", ephemeral=True
+        )
+        return False
+
+    # ------------------------------------------------------------------
+    # /household add
+    # ------------------------------------------------------------------
+    @household.command(name="add", description="Add someone to the household")
+    @app_commands.describe(
+        member="Who to add (yourself included)",
+        name="Name to show in lists (default: their server nickname)",
+    )
+    async def add(
+        self, interaction: discord.Interaction, member: discord.Member, name: str = ""
+    ) -> None:
+        if member.bot:
+            await interaction.response.send_message("❌ Bots can’t join a household.", ephemeral=True)
+            return
+        if not await self._can_edit(interaction):
+            return
+        async with self.bot.db() as s:
+            added = await add_household_member(
+                s, interaction.guild_id or 0, member.id, name.strip() or member.display_name
+            )
+        if not added:
+            await interaction.response.send_message(
+                f"{member.mention} is already in the household.", ephemeral=True
+            )
+            return
+        await interaction.response.send_message(f"🏠 {member.mention} joined the household.")
+
+    # ------------------------------------------------------------------
+    # /household remove
+    # ------------------------------------------------------------------
+    @household.command(name="remove", description="Remove someone from the household")
+    @app_commands.describe(member="Who to remove")
+    async def remove(self, interaction: discord.Interaction, member: discord.Member) -> None:
+        if not await self._can_edit(interaction):
+            return
+        async with self.bot.db() as s:
+            removed = await remove_household_member(s, interaction.guild_id or 0, member.id)
+        if not removed:
+            await interaction.response.send_message(
+                f"❌ {member.mention} isn’t in the household.", ephemeral=True
+            )
+            return
+        await interaction.response.send_message(f"👋 {member.mention} left the household.")
+
+    # ------------------------------------------------------------------
+    # /household owner
+    # ------------------------------------------------------------------
+    @household.command(name="owner", description="Set who pays shared bills like rent")
+    @app_commands.describe(member="Household member who pays the bills")
+    async def owner(self, interaction: discord.Interaction, member: discord.Member) -> None:
+        if not await self._can_edit(interaction):
+            return
+        async with self.bot.db() as s:
+            ok = await set_household_owner(s, interaction.guild_id or 0, member.id)
+        if not ok:
+            await interaction.response.send_message(
+                f"❌ {member.mention} isn’t in the household.", ephemeral=True
+            )
+            return
+        await interaction.response.send_message(f"🏠 {member.mention} now pays the shared bills.")
+
+    # ------------------------------------------------------------------
+    # /household list
+    # ------------------------------------------------------------------
+    @household.command(name="list", description="Show household members")
+    async def list(self, interaction: discord.Interaction) -> None:
+        async with self.bot.db() as s:
+            roster = await load_roster(s, interaction.guild_id or 0)
+        if not roster.member_ids:
+            await interaction.response.send_message(
+                "No household yet. Start one with `/household add`.", ephemeral=True
+            )
+            return
+        lines = [
+            f"<@{uid}>"
+            + (f" ({roster.names[uid]})" if roster.names.get(uid) else "")
+            + (" — pays shared bills" if uid == roster.owner_id else "")
+            for uid in roster.member_ids
+        ]
+        embed = discord.Embed(
+            title="🏠 Household",
+            description="\n".join(lines),
+            color=discord.Color.blurple(),
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    # ------------------------------------------------------------------ #
+    # Cache invalidation                                                   #
+    # ------------------------------------------------------------------ #
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        membership.invalidate(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        membership.invalidate(member.guild.id)
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Households(bot))
@@ -2,17 +2,30 @@
 from __future__ import annotations
 
 import datetime as _dt
-import random
 import typing as t
 from datetime import datetime, timezone
 
 import discord
 from discord import app_commands
 from discord.ext import commands
-from sqlalchemy import select
-
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Integer,
+    Select,
+    case,
+    cast,
+    func,
+    literal,
+    select,
+)
+
+from src.clock import clock_for
 from src.db import OutingWishlistItem
-from src.utils import DAVID_ID, STEPH_ID
+from src.paging import FIELD_MAX_CHARS, FIELD_NAME_MAX_CHARS, KeysetPager, clip
+from src.sampling import weighted_choice
+from src.text_match import matches
+from src.utils import household_roster, member_label
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
@@ -63,33 +76,60 @@ def _cat_label(category: str) -> str:
     return f"{_CAT_EMOJI.get(category, '📍')} {category.capitalize()}"
 
 
-def _user_label(user_id: int) -> str:
-    if user_id == DAVID_ID:
-        return "David"
-    if user_id == STEPH_ID:
-        return "Steph"
-    return f"<@{user_id}>"
-
-
-def _roulette_weights(
-    candidates: list[OutingWishlistItem],
-    last_visit_by_category: dict[str, _dt.date],
+async def roulette_candidates(
+    s,
+    guild_id: int,
     today: _dt.date,
-) -> list[float]:
-    """Return a weight for each candidate based on how long since that category was visited.
-
-    Categories visited recently get lower weight; categories never visited or visited
-    long ago get higher weight (up to _NEVER_VISITED_WEIGHT days).
+    category: str = "any",
+    budget: str = "any",
+    neighborhood: str = "",
+) -> tuple[Select, ColumnElement]:
+    """The unvisited items matching the filters, and each one's roulette weight.
+
+    The weight is the days since the item's category was last visited (at
+    least 1), or ``_NEVER_VISITED_WEIGHT`` for a category never visited, so
+    under-visited categories come up more often.  The last visit per
+    category is a grouped subquery joined in, not rows loaded into Python.
     """
-    weights: list[float] = []
-    for item in candidates:
-        last = last_visit_by_category.get(item.category)
-        if last is None:
-            days = _NEVER_VISITED_WEIGHT
-        else:
-            days = max(1, (today - last).days)
-        weights.append(float(days))
-    return weights
+    last_visits = (
+        select(
+            OutingWishlistItem.category,
+            func.max(OutingWishlistItem.visited_at).label("last_visit"),
+        )
+        .where(
+            OutingWishlistItem.guild_id == guild_id,
+            OutingWishlistItem.visited == True,  # noqa: E712
+            OutingWishlistItem.visited_at != None,  # noqa: E711
+        )
+        .group_by(OutingWishlistItem.category)
+        .subquery()
+    )
+    dialect = (await s.connection()).dialect.name
+    if dialect == "postgresql":
+        days = literal(today, Date) - last_visits.c.last_visit
+    else:
+        days = cast(func.julianday(today) - func.julianday(last_visits.c.last_visit), Integer)
+    weight = case(
+        (last_visits.c.last_visit == None, _NEVER_VISITED_WEIGHT),  # noqa: E711
+        (days < 1, 1),
+        else_=days,
+    )
+
+    q = (
+        select(OutingWishlistItem)
+        .outerjoin(last_visits, last_visits.c.category == OutingWishlistItem.category)
+        .where(
+            OutingWishlistItem.guild_id == guild_id,
+            OutingWishlistItem.visited == False,  # noqa: E712
+        )
+    )
+    if category != "any":
+        q = q.where(OutingWishlistItem.category == category)
+    if budget != "any":
+        q = q.where(OutingWishlistItem.budget == budget)
+    if neighborhood:
+        q = q.where(matches(OutingWishlistItem.neighborhood_key, neighborhood, dialect))
+    return q, weight
 
 
 # ---------------------------------------------------------------------------
@@ -188,64 +228,67 @@ class Outings(commands.Cog):
         neighborhood: str = "",
         status: str = "unvisited",
     ) -> None:
-        async with self.bot.db() as s:
-            q = select(OutingWishlistItem).where(
-                OutingWishlistItem.guild_id == interaction.guild_id
-            )
-            if category != "all":
-                q = q.where(OutingWishlistItem.category == category)
-            if budget != "all":
-                q = q.where(OutingWishlistItem.budget == budget)
-            if status == "unvisited":
-                q = q.where(OutingWishlistItem.visited == False)  # noqa: E712
-            elif status == "visited":
-                q = q.where(OutingWishlistItem.visited == True)  # noqa: E712
-            q = q.order_by(OutingWishlistItem.category, OutingWishlistItem.created_at)
-            rows = (await s.scalars(q)).all()
-
-        # Neighborhood filter (case-insensitive substring) done in Python to keep
-        # the query backend-agnostic (SQLite vs Postgres ILIKE differences).
+        roster = await household_roster(self.bot.db, interaction.guild_id or 0)
+        # The pager runs the query in its own session; the engine knows the dialect
+        dialect = self.bot.db.kw["bind"].dialect.name
+        q = select(OutingWishlistItem).where(OutingWishlistItem.guild_id == interaction.guild_id)
         if neighborhood:
-            needle = neighborhood.lower()
-            rows = [r for r in rows if needle in r.neighborhood.lower()]
+            q = q.where(matches(OutingWishlistItem.neighborhood_key, neighborhood, dialect))
+        if category != "all":
+            q = q.where(OutingWishlistItem.category == category)
+        if budget != "all":
+            q = q.where(OutingWishlistItem.budget == budget)
+        if status == "unvisited":
+            q = q.where(OutingWishlistItem.visited == False)  # noqa: E712
+        elif status == "visited":
+            q = q.where(OutingWishlistItem.visited == True)  # noqa: E712
+
+        title_map = {"unvisited": "To Try", "visited": "Visited", "all": "All"}
+
+        def render(rows: list[OutingWishlistItem], _) -> discord.Embed:
+            embed = discord.Embed(
+                title=f"📍 Outings — {title_map[status]}"
+                + (f" · {_cat_label(category)}" if category != "all" else ""),
+                color=discord.Color.from_str("#e67e22"),
+            )
+            for item in rows:
+                emoji = _CAT_EMOJI.get(item.category, "📍")
+                check = "✅ " if item.visited else ""
+                field_name = f"{check}{emoji} {item.name}"
+                meta: list[str] = [f"Added by {member_label(roster, item.added_by)}"]
+                if item.budget:
+                    meta.append(_BUDGET_LABEL.get(item.budget, item.budget))
+                if item.neighborhood:
+                    meta.append(f"📍 {item.neighborhood}")
+                if item.visited and item.visited_at:
+                    meta.append(f"Visited {item.visited_at}")
+                if item.visited_notes:
+                    meta.append(f"_{item.visited_notes}_")
+                elif item.note:
+                    meta.append(f"_{item.note}_")
+                if item.link:
+                    meta.append(f"[Link]({item.link})")
+                embed.add_field(
+                    name=clip(field_name, FIELD_NAME_MAX_CHARS),
+                    value=clip("\n".join(meta), FIELD_MAX_CHARS),
+                    inline=False,
+                )
+            return embed
 
-        if not rows:
+        view = KeysetPager(
+            self.bot.db,
+            q,
+            (OutingWishlistItem.category, OutingWishlistItem.created_at, OutingWishlistItem.id),
+            render,
+        )
+        await view.load()
+        if not view.rows:
             label = "visited places" if status == "visited" else ("places to try" if status == "unvisited" else "places")
             await interaction.response.send_message(
                 f"No {label} found! Add one with `/outing add`.", ephemeral=True
             )
             return
-
-        title_map = {"unvisited": "To Try", "visited": "Visited", "all": "All"}
-        embed = discord.Embed(
-            title=f"📍 Outings — {title_map[status]}"
-            + (f" · {_cat_label(category)}" if category != "all" else ""),
-            color=discord.Color.from_str("#e67e22"),
-        )
-
-        for item in rows[:25]:
-            emoji = _CAT_EMOJI.get(item.category, "📍")
-            check = "✅ " if item.visited else ""
-            field_name = f"{check}{emoji} {item.name}"
-            meta: list[str] = [f"Added by {_user_label(item.added_by)}"]
-            if item.budget:
-                meta.append(_BUDGET_LABEL.get(item.budget, item.budget))
-            if item.neighborhood:
-                meta.append(f"📍 {item.neighborhood}")
-            if item.visited and item.visited_at:
-                meta.append(f"Visited {item.visited_at}")
-            if item.visited_notes:
-                meta.append(f"_{item.visited_notes}_")
-            elif item.note:
-                meta.append(f"_{item.note}_")
-            if item.link:
-                meta.append(f"[Link]({item.link})")
-            embed.add_field(name=field_name, value="\n".join(meta), inline=False)
-
-        if len(rows) > 25:
-            embed.set_footer(text=f"Showing 25 of {len(rows)} places")
-
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=view.embed(), view=view)
 
     # ------------------------------------------------------------------
     # /outing visited
@@ -268,6 +311,7 @@ class Outings(commands.Cog):
             return
 
         guild_id = interaction.guild_id or 0
+        today = (await clock_for(self.bot.db, guild_id, interaction.user.id)).today()
         async with self.bot.db() as s:
             row = await s.get(OutingWishlistItem, item_id)
             if row is None or row.guild_id != guild_id:
@@ -281,7 +325,7 @@ class Outings(commands.Cog):
             name = row.name
             emoji = _CAT_EMOJI.get(row.category, "📍")
             row.visited = True
-            row.visited_at = _dt.date.today()
+            row.visited_at = today
             if notes:
                 row.visited_notes = notes
             await s.commit()
@@ -392,55 +436,22 @@ class Outings(commands.Cog):
         neighborhood: str = "",
     ) -> None:
         guild_id = interaction.guild_id or 0
-        today = _dt.date.today()
+        today = (await clock_for(self.bot.db, guild_id)).today()
 
+        roster = await household_roster(self.bot.db, guild_id)
         async with self.bot.db() as s:
-            # All unvisited candidates (pre-filter by category/budget if set)
-            q = select(OutingWishlistItem).where(
-                OutingWishlistItem.guild_id == guild_id,
-                OutingWishlistItem.visited == False,  # noqa: E712
+            q, weight = await roulette_candidates(
+                s, guild_id, today, category, budget, neighborhood
             )
-            if category != "any":
-                q = q.where(OutingWishlistItem.category == category)
-            if budget != "any":
-                q = q.where(OutingWishlistItem.budget == budget)
-            candidates = list((await s.scalars(q)).all())
-
-            # Most-recent visit date per category across the whole guild
-            visited_rows = (
-                await s.scalars(
-                    select(OutingWishlistItem).where(
-                        OutingWishlistItem.guild_id == guild_id,
-                        OutingWishlistItem.visited == True,  # noqa: E712
-                        OutingWishlistItem.visited_at != None,  # noqa: E711
-                    )
-                )
-            ).all()
+            pick, _ = await weighted_choice(s, q, weight)
 
-        # Neighborhood filter (Python-side for backend compat)
-        if neighborhood:
-            needle = neighborhood.lower()
-            candidates = [c for c in candidates if needle in c.neighborhood.lower()]
-
-        if not candidates:
+        if pick is None:
             await interaction.response.send_message(
                 "No unvisited places match those filters. Add more with `/outing add`!",
                 ephemeral=True,
             )
             return
 
-        # Build last-visit-by-category lookup
-        last_visit_by_category: dict[str, _dt.date] = {}
-        for row in visited_rows:
-            if row.visited_at is None:
-                continue
-            current = last_visit_by_category.get(row.category)
-            if current is None or row.visited_at > current:
-                last_visit_by_category[row.category] = row.visited_at
-
-        weights = _roulette_weights(candidates, last_visit_by_category, today)
-        (pick,) = random.choices(candidates, weights=weights, k=1)
-
         emoji = _CAT_EMOJI.get(pick.category, "📍")
         embed = discord.Embed(
             title=f"🎲 Tonight: {pick.name}",
@@ -456,7 +467,7 @@ class Outings(commands.Cog):
         if pick.link:
             embed.add_field(name="Link", value=pick.link, inline=False)
         embed.set_footer(
-            text=f"Added by {_user_label(pick.added_by)} · "
+            text=f"Added by {member_label(roster, pick.added_by)} · "
             f"Use /outing visited to mark it done!"
         )
 
@@ -1,54 +1,426 @@
 # src/cogs/playoff.py
 from __future__ import annotations
 
-import os
+import asyncio
+import io
+import json
+import logging
+import re
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, date, timedelta
-from zoneinfo import ZoneInfo
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-from sqlalchemy import select
-
-from src.db import DailyResult, PlayoffCheckin, PlayoffSeries, WeeklyReview
-from src.utils import DAVID_ID, STEPH_ID
+from sqlalchemy import and_, case, delete, exists, func, select, update
+
+from src.caches import LRUCache
+from src.checkin_bits import load_histories, load_history, record_checkin_bits
+from src.clock import LocalClock, clock_for, guild_clocks
+from src.heatmap import HeatmapCache, render_heatmap_png
+from src.insights import LONG_WEEKS, SHORT_WEEKS, Insights, InsightsCache, compute_insights
+from src.db import (
+    DailyResult,
+    DailyResultMember,
+    GuildSettings,
+    HouseholdMember,
+    PlayoffCheckin,
+    PlayoffSeries,
+    PlayoffStats,
+    WeeklyReview,
+    WeeklySummary,
+)
+from src.playoff_stats import (
+    HOUSEHOLD,
+    current_streak,
+    pillar_rates,
+    record_member_checkin,
+    record_series_status,
+    record_settlement,
+)
+from src.pillars import (
+    DEFAULT_NAMES,
+    add_pillar_version,
+    guild_pillars,
+    pillar_cache,
+    pillar_names_on,
+    pillars_for,
+)
+from src.projection import SeriesOdds, WeekdayRates, load_weekday_rates, series_odds
+from src.scheduler import DueJob
+from src.utils import HouseholdRoster, household_roster, member_label
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
 
-ET = ZoneInfo("America/New_York")
+# (user_id, label) for each player, in roster order
+Players = t.Sequence[tuple[int, str]]
+
+
+@dataclass(frozen=True)
+class DaySummary:
+    """A settled day: the shared result and which members completed."""
+
+    result_date: date
+    won: bool
+    completed: frozenset[int] = frozenset()
+
+
+def players_for(roster: HouseholdRoster) -> list[tuple[int, str]]:
+    """Every household member plays; a day settles once all have checked in."""
+    return [(uid, member_label(roster, uid)) for uid in roster.member_ids]
+
+
+def _missed(day: DaySummary, players: Players) -> str:
+    return ", ".join(label for uid, label in players if uid not in day.completed)
+
+
+def _day_marks(day: DaySummary, players: Players) -> str:
+    """Per-member completion icons for one day, e.g. ``D:✅ S:❌``."""
+    return " ".join(
+        f"{label[:1]}:{'✅' if uid in day.completed else '❌'}" for uid, label in players
+    )
+
+
+async def settle_day(
+    s, guild_id: int, day: date, member_ids: t.Sequence[int]
+) -> tuple[DaySummary | None, bool]:
+    """Settle *day* once every member in *member_ids* has checked in.
+
+    Returns ``(summary, is_new)``; the summary is None while anyone is still
+    missing.  Runs the same four statements whatever the team size.
+    """
+    if not member_ids:
+        return None, False
+    checkins = (
+        await s.scalars(
+            select(PlayoffCheckin).where(
+                PlayoffCheckin.guild_id == guild_id,
+                PlayoffCheckin.checkin_date == day,
+                PlayoffCheckin.user_id.in_(member_ids),
+            )
+        )
+    ).all()
+    complete = {c.user_id: c.pillar1 and c.pillar2 and c.pillar3 for c in checkins}
+    if len(complete) < len(set(member_ids)):
+        return None, False
+
+    result = await s.scalar(
+        select(DailyResult).where(
+            DailyResult.guild_id == guild_id,
+            DailyResult.result_date == day,
+        )
+    )
+    is_new = result is None
+    if result is None:
+        result = DailyResult(guild_id=guild_id, result_date=day, won=False)
+        s.add(result)
+    result.won = all(complete.values())
+    result.updated_at = datetime.now(timezone.utc)
+
+    await s.execute(
+        delete(DailyResultMember).where(
+            DailyResultMember.guild_id == guild_id,
+            DailyResultMember.result_date == day,
+        )
+    )
+    s.add_all(
+        DailyResultMember(guild_id=guild_id, result_date=day, user_id=uid, complete=ok)
+        for uid, ok in complete.items()
+    )
+    await record_settlement(s, guild_id, day, result.won)
+    await s.commit()
+    return (
+        DaySummary(day, result.won, frozenset(uid for uid, ok in complete.items() if ok)),
+        is_new,
+    )
+
+
+async def week_tally(s, guild_id: int, week_start: date) -> tuple[int, int]:
+    """(wins, losses) for the week starting *week_start*, in one aggregate query."""
+    wins, played = (
+        await s.execute(
+            select(
+                func.coalesce(func.sum(case((DailyResult.won, 1), else_=0)), 0),
+                func.count(DailyResult.id),
+            ).where(
+                DailyResult.guild_id == guild_id,
+                DailyResult.result_date >= week_start,
+                DailyResult.result_date <= week_start + timedelta(days=6),
+            )
+        )
+    ).one()
+    return int(wins), int(played) - int(wins)
+
+
+async def load_days(s, guild_id: int, start: date, end: date) -> list[DaySummary]:
+    """Settled days between *start* and *end* inclusive, in date order."""
+    results = (
+        await s.execute(
+            select(DailyResult.result_date, DailyResult.won)
+            .where(
+                DailyResult.guild_id == guild_id,
+                DailyResult.result_date >= start,
+                DailyResult.result_date <= end,
+            )
+            .order_by(DailyResult.result_date)
+        )
+    ).all()
+    completed: dict[date, set[int]] = {}
+    for d, uid in (
+        await s.execute(
+            select(DailyResultMember.result_date, DailyResultMember.user_id).where(
+                DailyResultMember.guild_id == guild_id,
+                DailyResultMember.result_date >= start,
+                DailyResultMember.result_date <= end,
+                DailyResultMember.complete.is_(True),
+            )
+        )
+    ).all():
+        completed.setdefault(d, set()).add(uid)
+    return [DaySummary(d, won, frozenset(completed.get(d, ()))) for d, won in results]
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """Everything ``/playoff_status`` shows for one guild on one local day.
+
+    Plain values only, so it can be rebuilt in bulk and kept between calls;
+    ``checked_in`` and ``rates`` cover every user with check-ins, so roster
+    changes do not invalidate it.
+    """
+
+    guild_id: int
+    day: date
+    week_start: date
+    wins: int = 0
+    losses: int = 0
+    result: DaySummary | None = None
+    checked_in: frozenset[int] = frozenset()
+    # Per-member weekday completion rates, for the series odds
+    rates: t.Mapping[int, WeekdayRates] = field(default_factory=dict)
+
+    def days_left(self) -> list[date]:
+        """Days of the week still to play, counting today until it settles."""
+        first = self.day if self.result is None else self.day + timedelta(days=1)
+        last = self.week_start + timedelta(days=6)
+        return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+    def odds(self, players: Players) -> SeriesOdds | None:
+        return series_odds(
+            self.wins, self.losses, self.days_left(), self.rates, [uid for uid, _ in players]
+        )
+
+
+async def load_status_snapshots(
+    s, wanted: t.Mapping[int, tuple[date, date]]
+) -> dict[int, StatusSnapshot]:
+    """Snapshots for *wanted* ``{guild_id: (day, week_start)}`` in five queries total."""
+    if not wanted:
+        return {}
+    guild_ids = list(wanted)
+    days = {day for day, _ in wanted.values()}
+    weeks = {week for _, week in wanted.values()}
+
+    series = {
+        (guild_id, week): (wins, losses)
+        for guild_id, week, wins, losses in await s.execute(
+            select(
+                PlayoffSeries.guild_id,
+                PlayoffSeries.week_start,
+                PlayoffSeries.wins,
+                PlayoffSeries.losses,
+            ).where(PlayoffSeries.guild_id.in_(guild_ids), PlayoffSeries.week_start.in_(weeks))
+        )
+    }
+    results = {
+        (guild_id, day): won
+        for guild_id, day, won in await s.execute(
+            select(DailyResult.guild_id, DailyResult.result_date, DailyResult.won).where(
+                DailyResult.guild_id.in_(guild_ids), DailyResult.result_date.in_(days)
+            )
+        )
+    }
+    completed: dict[tuple[int, date], set[int]] = {}
+    for guild_id, day, user_id in await s.execute(
+        select(
+            DailyResultMember.guild_id, DailyResultMember.result_date, DailyResultMember.user_id
+        ).where(
+            DailyResultMember.guild_id.in_(guild_ids),
+            DailyResultMember.result_date.in_(days),
+            DailyResultMember.complete.is_(True),
+        )
+    ):
+        completed.setdefault((guild_id, day), set()).add(user_id)
+    checked_in: dict[tuple[int, date], set[int]] = {}
+    for guild_id, day, user_id in await s.execute(
+        select(PlayoffCheckin.guild_id, PlayoffCheckin.checkin_date, PlayoffCheckin.user_id).where(
+            PlayoffCheckin.guild_id.in_(guild_ids), PlayoffCheckin.checkin_date.in_(days)
+        )
+    ):
+        checked_in.setdefault((guild_id, day), set()).add(user_id)
+    rates = await load_weekday_rates(s, {guild_id: day for guild_id, (day, _) in wanted.items()})
+
+    snapshots = {}
+    for guild_id, (day, week) in wanted.items():
+        wins, losses = series.get((guild_id, week), (0, 0))
+        won = results.get((guild_id, day))
+        result = (
+            None
+            if won is None
+            else DaySummary(day, won, frozenset(completed.get((guild_id, day), ())))
+        )
+        snapshots[guild_id] = StatusSnapshot(
+            guild_id,
+            day,
+            week,
+            wins,
+            losses,
+            result,
+            frozenset(checked_in.get((guild_id, day), ())),
+            rates.get(guild_id, {}),
+        )
+    return snapshots
+
+
+class StatusCache:
+    """LRU of ``StatusSnapshot`` keyed by (guild, local day).
+
+    Check-ins and the reconciler replace a guild's snapshots when they
+    write, so a hit is always current and costs no database round trip.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._items: LRUCache[tuple[int, date], StatusSnapshot] = LRUCache(maxsize)
+
+    def get(self, guild_id: int, day: date, week_start: date) -> StatusSnapshot | None:
+        snap = self._items.get((guild_id, day))
+        # A changed week-start setting makes the cached week wrong
+        if snap is None or snap.week_start != week_start:
+            return None
+        return snap
+
+    def put(self, snap: StatusSnapshot) -> None:
+        self._items.put((snap.guild_id, snap.day), snap)
+
+    def invalidate(self, guild_id: int) -> None:
+        for key in [key for key in self._items if key[0] == guild_id]:
+            self._items.pop(key)
 
-DAVID_PILLARS = [
-    "Write & reflect on daily priorities",
-    "10,000 steps",
-    "Max Claude usage or 30min on personal project",
-]
-STEPH_PILLARS = [
-    "TikTok ≤ 90 minutes",
-    "Some form of movement",
-    "At least 15 min on a finite project",
-]
+    def __len__(self) -> int:
+        return len(self._items)
 
 
-def get_pillar_names(user_id: int) -> list[str]:
-    if user_id == DAVID_ID:
-        return DAVID_PILLARS
-    if user_id == STEPH_ID:
-        return STEPH_PILLARS
-    return ["Pillar 1", "Pillar 2", "Pillar 3"]
+WeeklyKey = tuple[int, date, int]
 
 
-def today_et() -> date:
-    return datetime.now(ET).date()
+class WeeklyEmbedCache(LRUCache[WeeklyKey, dict]):
+    """LRU of weekly review embeds (``Embed.to_dict()``) keyed by (guild, week start, version).
+
+    Every write to a week bumps its ``PlayoffSeries.version``, so a stale
+    entry is simply never asked for again and ages out.
+    """
+
 
+async def reconcile_stale_series(s, today: date) -> int:
+    """Finalize every past-week series still marked "ongoing", in all guilds.
 
-def week_start_for(d: date) -> date:
-    """Return the Sunday that starts the week containing d (weeks run Sun–Sat)."""
-    return d - timedelta(days=(d.weekday() + 1) % 7)
+    One UPDATE joined to per-series win/loss counts over ``DailyResult``
+    fixes them all; the rows it returns move the ``playoff_stats`` series
+    totals.  Commits.  Returns the number of series finalized.
+    """
+    conn = await s.connection()
+    if conn.dialect.name == "postgresql":
+        week_end = PlayoffSeries.week_start + 7
+    else:
+        week_end = func.date(PlayoffSeries.week_start, "+7 days")
+    tally = (
+        select(
+            PlayoffSeries.id.label("series_id"),
+            func.coalesce(func.sum(case((DailyResult.won, 1), else_=0)), 0).label("wins"),
+            func.count(DailyResult.id).label("days"),
+        )
+        .outerjoin(
+            DailyResult,
+            and_(
+                DailyResult.guild_id == PlayoffSeries.guild_id,
+                DailyResult.result_date >= PlayoffSeries.week_start,
+                DailyResult.result_date < week_end,
+            ),
+        )
+        .where(
+            PlayoffSeries.status == "ongoing",
+            PlayoffSeries.week_start <= today - timedelta(days=7),
+        )
+        .group_by(PlayoffSeries.id)
+        .subquery()
+    )
+    finalized = (
+        await s.execute(
+            update(PlayoffSeries)
+            .where(PlayoffSeries.id == tally.c.series_id)
+            .values(
+                wins=tally.c.wins,
+                losses=tally.c.days - tally.c.wins,
+                status=case((tally.c.wins >= 4, "won"), else_="lost"),
+                version=PlayoffSeries.version + 1,
+            )
+            .returning(PlayoffSeries.guild_id, PlayoffSeries.status)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+
+    for guild_id, status in finalized:
+        await record_series_status(s, guild_id, "ongoing", status)
+    await s.commit()
+    return len(finalized)
+
+
+async def missing_checkins(
+    s, day: date, guild_ids: t.Collection[int] | None = None
+) -> dict[int, tuple[int | None, list[int]]]:
+    """Household members who have not checked in on *day*, in every guild or *guild_ids*.
+
+    One anti-join over ``household_members``; returns ``{guild_id:
+    (configured reminder channel or None, [user_id, ...])}`` in roster order.
+    """
+    q = (
+        select(HouseholdMember.guild_id, HouseholdMember.user_id, GuildSettings.checkin_channel_id)
+        .outerjoin(GuildSettings, GuildSettings.guild_id == HouseholdMember.guild_id)
+        .where(
+            ~exists().where(
+                PlayoffCheckin.guild_id == HouseholdMember.guild_id,
+                PlayoffCheckin.user_id == HouseholdMember.user_id,
+                PlayoffCheckin.checkin_date == day,
+            )
+        )
+        .order_by(HouseholdMember.guild_id, HouseholdMember.added_at, HouseholdMember.id)
+    )
+    if guild_ids is not None:
+        q = q.where(HouseholdMember.guild_id.in_(list(guild_ids)))
+    rows = await s.execute(q)
+    missing: dict[int, tuple[int | None, list[int]]] = {}
+    for guild_id, user_id, channel_id in rows:
+        missing.setdefault(guild_id, (channel_id, []))[1].append(user_id)
+    return missing
+
+
+def ping_message(
+    user_ids: t.Iterable[int], pillar_names: t.Mapping[int, t.Sequence[str]] | None = None
+) -> str:
+    """One reminder listing everyone in a channel who still has to check in."""
+    pillar_names = pillar_names or {}
+    lines = ["⏰ Daily check-in time!"]
+    for user_id in user_ids:
+        pillars = " · ".join(pillar_names.get(user_id, DEFAULT_NAMES))
+        lines.append(f"<@{user_id}> — {pillars}")
+    lines.append("Tap your pillars below and **Log**, or use `/checkin`.")
+    return "\n".join(lines)
 
 
-def finalize_series_status(daily_results: list[DailyResult]) -> str:
+def finalize_series_status(daily_results: t.Sequence[DaySummary]) -> str:
     """Determine the final "won" or "lost" status for a completed week.
 
     Called at week end (Sunday review) to lock in the result.  A series
@@ -59,8 +431,22 @@ def finalize_series_status(daily_results: list[DailyResult]) -> str:
     return "won" if wins >= 4 else "lost"
 
 
-def series_message(wins: int, losses: int) -> str:
-    """Return motivational / status text for current series score."""
+def series_message(wins: int, losses: int, odds: SeriesOdds | None = None) -> str:
+    """Return motivational / status text for current series score.
+
+    With *odds*, an undecided series also shows the projected chance of
+    winning it, and of winning it if the next day is won.
+    """
+    text = _series_text(wins, losses)
+    if odds is None or wins >= 4 or losses >= 4:
+        return text
+    return (
+        f"{text}\n📈 **{odds.win:.0%}** to win the series — "
+        f"**{odds.if_next_won:.0%}** if you win {odds.next_day.strftime('%A')}."
+    )
+
+
+def _series_text(wins: int, losses: int) -> str:
     if wins >= 4:
         return "🏆 **Series Won!** You won the week!"
     if losses >= 4:
@@ -84,35 +470,232 @@ def series_message(wins: int, losses: int) -> str:
     return f"⚖️ Tied {wins}–{losses} — anyone's series. Need {wins_needed} more."
 
 
-_DAY_NAMES = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 
+_WEEKDAY_ABBR = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Heatmap cell per day: no check-in, then 0–3 pillars done
+_HEAT_CHARS = "·░▒▓█"
+
+HEATMAP_DEFAULT_DAYS = 365
+HEATMAP_MAX_DAYS = 366 * 5
 
-def format_weekly_summary(daily_results: list[DailyResult], week_start: date) -> str:
-    """Build a detailed weekly summary string from DailyResult rows.
+# Series per /series_history page
+SERIES_PAGE_SIZE = 8
+
+# Reminder messages in flight at once during the nightly ping
+PING_CONCURRENCY = 4
+
+
+def household_cells(
+    days: t.Sequence[DaySummary], start: date, end: date, member_count: int
+) -> list[int | None]:
+    """Per-day heat for the household: 3 on a shared win, else the share who completed."""
+    by_date = {d.result_date: d for d in days}
+    cells: list[int | None] = []
+    for i in range((end - start).days + 1):
+        day = by_date.get(start + timedelta(days=i))
+        if day is None:
+            cells.append(None)
+        elif day.won:
+            cells.append(3)
+        else:
+            cells.append(min(2, 3 * len(day.completed) // max(1, member_count)))
+    return cells
+
+
+async def series_page(
+    s,
+    guild_id: int,
+    *,
+    older_than: date | None = None,
+    newer_than: date | None = None,
+    limit: int = SERIES_PAGE_SIZE,
+) -> tuple[list[PlayoffSeries], bool]:
+    """Return one page of series, newest first, keyed on ``week_start``.
+
+    Pass the last row's week as *older_than* for the next page or the first
+    row's week as *newer_than* for the previous one.  The bool reports
+    whether more rows exist beyond the page in the direction of travel.
+    """
+    q = select(PlayoffSeries).where(PlayoffSeries.guild_id == guild_id)
+    if newer_than is not None:
+        q = q.where(PlayoffSeries.week_start > newer_than).order_by(
+            PlayoffSeries.week_start
+        )
+    else:
+        if older_than is not None:
+            q = q.where(PlayoffSeries.week_start < older_than)
+        q = q.order_by(PlayoffSeries.week_start.desc())
+
+    rows = list((await s.scalars(q.limit(limit + 1))).all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if newer_than is not None:
+        rows.reverse()
+    return rows, has_more
+
+
+def format_all_time(stats: t.Mapping[int, PlayoffStats], players: Players, today: date) -> str:
+    """All-time series record, shared streak and per-member streaks and pillar rates."""
+    household = stats.get(HOUSEHOLD)
+    won = household.series_won if household else 0
+    lost = household.series_lost if household else 0
+    best = household.longest_streak if household else 0
+    lines = [
+        f"Series **{won}W {lost}L** · Shared win streak "
+        f"**{current_streak(household, today)}** (best {best})"
+    ]
+    for uid, label in players:
+        row = stats.get(uid)
+        rates = " / ".join(f"{r:.0%}" for r in pillar_rates(row))
+        lines.append(
+            f"{label}: streak {current_streak(row, today)} "
+            f"(best {row.longest_streak if row else 0}) · pillars {rates}"
+        )
+    return "\n".join(lines)
+
+
+def status_embed(snap: StatusSnapshot, players: Players) -> discord.Embed:
+    """The ``/playoff_status`` dashboard for *snap*."""
+    embed = discord.Embed(
+        title=f"🏆 Playoff Week — {snap.week_start.strftime('Week of %b %d')}",
+        color=discord.Color.blurple(),
+    )
+    embed.add_field(
+        name=f"Stavid Series — {snap.wins}W {snap.losses}L",
+        value=series_message(snap.wins, snap.losses, snap.odds(players)),
+        inline=False,
+    )
+
+    # Combined day result is authoritative once every member has checked in
+    if snap.result is not None:
+        if snap.result.won:
+            today_text = "🏆 **Shared WIN** — everyone complete!"
+        else:
+            today_text = (
+                f"💀 **Shared LOSS** — {_missed(snap.result, players)} "
+                "didn't complete all pillars"
+            )
+        embed.add_field(name="Today's Combined Result", value=today_text, inline=False)
+    else:
+        # Day not yet settled — show individual check-in status
+        embed.add_field(
+            name="Today's Check-ins",
+            value="\n".join(
+                f"{label}: {'✅ checked in' if uid in snap.checked_in else '⏳ not yet'}"
+                for uid, label in players
+            )
+            or "Add players with `/household add` to start a series.",
+            inline=False,
+        )
+    return embed
+
+
+def _pct(rate: float | None) -> str:
+    return "—" if rate is None else f"{rate:.0%}"
+
+
+def _trend(recent: float | None, overall: float | None) -> str:
+    if recent is None or overall is None or abs(recent - overall) < 0.05:
+        return "→"
+    return "↗" if recent > overall else "↘"
+
+
+def _correlation_text(value: float | None) -> str:
+    if value is None:
+        return "not enough data"
+    if value >= 0.3:
+        tendency = "full days tend to line up"
+    elif value <= -0.3:
+        tendency = "full days tend to alternate"
+    else:
+        tendency = "mostly independent"
+    return f"{value:+.2f} — {tendency}"
+
+
+def insights_embed(
+    insights: Insights,
+    players: Players,
+    pillar_names: t.Mapping[int, t.Sequence[str]] | None = None,
+) -> discord.Embed:
+    """The ``/playoff insights`` embed: one field per member plus the household."""
+    pillar_names = pillar_names or {}
+    first = insights.week_start - timedelta(weeks=LONG_WEEKS)
+    last = insights.week_start - timedelta(days=1)
+    embed = discord.Embed(
+        title="🔍 Playoff Insights",
+        description=(
+            f"{first.strftime('%b %d')} – {last.strftime('%b %d, %Y')} · "
+            f"rates over the last {SHORT_WEEKS} and {LONG_WEEKS} weeks"
+        ),
+        color=discord.Color.purple(),
+    )
+    labels = dict(players)
+    for member in insights.members:
+        names = pillar_names.get(member.user_id, DEFAULT_NAMES)
+        lines = [
+            f"{name[:32]}: {_pct(recent)} · {_pct(overall)} {_trend(recent, overall)}"
+            for name, recent, overall in zip(names, member.recent, member.overall)
+        ]
+        weekdays = [(rate, w) for w, rate in enumerate(member.weekdays) if rate is not None]
+        if weekdays:
+            best, worst = max(weekdays), min(weekdays)
+            lines.append(
+                f"Best day: {_WEEKDAY_ABBR[best[1]]} ({_pct(best[0])}) · "
+                f"Toughest: {_WEEKDAY_ABBR[worst[1]]} ({_pct(worst[0])})"
+            )
+        pairs = [
+            f"{a + 1}–{b + 1} {'n/a' if value is None else f'{value:+.2f}'}"
+            for (a, b), value in member.pillar_correlations.items()
+            if b < len(names)
+        ]
+        lines.append("Pillars together: " + " · ".join(pairs))
+        embed.add_field(
+            name=labels.get(member.user_id, f"<@{member.user_id}>"),
+            value="\n".join(lines),
+            inline=False,
+        )
+    if insights.partner_correlations:
+        embed.add_field(
+            name="Together",
+            value="\n".join(
+                f"{labels.get(a, a)} ↔ {labels.get(b, b)}: {_correlation_text(value)}"
+                for (a, b), value in insights.partner_correlations.items()
+            ),
+            inline=False,
+        )
+    embed.set_footer(text="↗/↘ = last 4 weeks vs 12 · correlations run from −1 to +1")
+    return embed
+
+
+def format_weekly_summary(
+    daily_results: t.Sequence[DaySummary], week_start: date, players: Players | None = None
+) -> str:
+    """Build a detailed weekly summary string from settled days.
 
     Args:
-        daily_results: All DailyResult rows for the given week (any order).
+        daily_results: All settled days for the given week (any order).
         week_start: The Sunday that starts the week.
+        players: Optional (user_id, label) per member — used for the per-person lines.
     """
+    players = players or []
     by_date = {r.result_date: r for r in daily_results}
     week_dates = [week_start + timedelta(days=i) for i in range(7)]
 
-    david_days = sum(1 for r in daily_results if r.david_complete)
-    steph_days = sum(1 for r in daily_results if r.steph_complete)
+    member_days = {uid: sum(1 for r in daily_results if uid in r.completed) for uid, _ in players}
     combined_wins = sum(1 for r in daily_results if r.won)
     total_played = len(daily_results)
 
     # Build per-day lines and win sequence for streak calculation
     day_lines: list[str] = []
     win_sequence: list[bool] = []
-    for i, d in enumerate(week_dates):
-        label = f"{_DAY_NAMES[i]} {d.strftime('%m/%d')}"
+    for d in week_dates:
+        label = d.strftime("%a %m/%d")
         if d in by_date:
             r = by_date[d]
-            d_icon = "✅" if r.david_complete else "❌"
-            s_icon = "✅" if r.steph_complete else "❌"
             result_label = "🏆 Win" if r.won else "💔 Loss"
-            day_lines.append(f"`{label}`  D:{d_icon} S:{s_icon} → {result_label}")
+            marks = _day_marks(r, players)
+            day_lines.append(f"`{label}`  {marks + ' ' if marks else ''}→ {result_label}")
             win_sequence.append(r.won)
         else:
             day_lines.append(f"`{label}`  —")
@@ -137,8 +720,9 @@ def format_weekly_summary(daily_results: list[DailyResult], week_start: date) ->
         lines.append("**Day-by-day breakdown:**")
         lines.extend(day_lines)
         lines.append("")
-        lines.append(f"**David:** {david_days}/7 days complete")
-        lines.append(f"**Steph:** {steph_days}/7 days complete")
+        lines.extend(
+            f"**{name}:** {member_days[uid]}/7 days complete" for uid, name in players
+        )
         lines.append(f"**Combined wins:** {combined_wins}/7 days")
         if max_streak >= 2:
             lines.append(f"**Best streak this week:** {max_streak} days in a row 🔥")
@@ -155,23 +739,30 @@ def format_weekly_summary(daily_results: list[DailyResult], week_start: date) ->
 
 
 def build_weekly_embed(
-    daily_results: list[DailyResult],
+    daily_results: t.Sequence[DaySummary],
     week_start: date,
     checkin_rows: list[PlayoffCheckin] | None = None,
+    players: Players | None = None,
+    pillar_names: t.Mapping[int, t.Sequence[str]] | None = None,
 ) -> discord.Embed:
     """Build a rich Discord embed for the Sunday weekly review.
 
     Args:
-        daily_results: All DailyResult rows for the week (any order).
+        daily_results: All settled days for the week (any order).
         week_start: The Sunday that starts the week.
         checkin_rows: Optional PlayoffCheckin rows for the week — used to
             compute per-pillar completion rates per person.
+        players: Optional (user_id, label) per member — needed to match
+            check-ins to people.
+        pillar_names: Each member's pillar names for the week (default:
+            the generic pillars).
     """
+    players = players or []
+    pillar_names = pillar_names or {}
     by_date = {r.result_date: r for r in daily_results}
     week_dates = [week_start + timedelta(days=i) for i in range(7)]
 
-    david_days = sum(1 for r in daily_results if r.david_complete)
-    steph_days = sum(1 for r in daily_results if r.steph_complete)
+    member_days = {uid: sum(1 for r in daily_results if uid in r.completed) for uid, _ in players}
     combined_wins = sum(1 for r in daily_results if r.won)
     total_played = len(daily_results)
 
@@ -201,14 +792,13 @@ def build_weekly_embed(
     # Day-by-day breakdown
     day_lines: list[str] = []
     win_sequence: list[bool] = []
-    for i, d in enumerate(week_dates):
-        label = f"{_DAY_NAMES[i]} {d.strftime('%m/%d')}"
+    for d in week_dates:
+        label = d.strftime("%a %m/%d")
         if d in by_date:
             r = by_date[d]
-            d_icon = "✅" if r.david_complete else "❌"
-            s_icon = "✅" if r.steph_complete else "❌"
             result_label = "🏆" if r.won else "💔"
-            day_lines.append(f"`{label}` D:{d_icon} S:{s_icon} {result_label}")
+            marks = _day_marks(r, players)
+            day_lines.append(f"`{label}` {marks + ' ' if marks else ''}{result_label}")
             win_sequence.append(r.won)
         else:
             day_lines.append(f"`{label}` —")
@@ -228,32 +818,25 @@ def build_weekly_embed(
 
     # Per-person summaries (with optional per-pillar breakdown)
     checkins = checkin_rows or []
-    david_checkins = [r for r in checkins if r.user_id == DAVID_ID]
-    steph_checkins = [r for r in checkins if r.user_id == STEPH_ID]
 
-    def _pillar_lines(user_checkins: list[PlayoffCheckin], pillars: list[str]) -> str:
+    def _pillar_lines(user_checkins: list[PlayoffCheckin], pillars: t.Sequence[str]) -> str:
         total = len(user_checkins)
         denom = total if total else 7
         p_counts = [
             sum(1 for r in user_checkins if getattr(r, f"pillar{j + 1}"))
-            for j in range(3)
+            for j in range(len(pillars))
         ]
-        lines = [f"{'✅' if p_counts[j] == denom else '🔸'} {pillars[j][:40]}: {p_counts[j]}/{denom}" for j in range(3)]
+        lines = [f"{'✅' if p_counts[j] == denom else '🔸'} {pillars[j][:40]}: {p_counts[j]}/{denom}" for j in range(len(pillars))]
         return "\n".join(lines)
 
-    david_header = f"**David — {david_days}/7 days complete**"
-    if david_checkins:
-        david_body = _pillar_lines(david_checkins, DAVID_PILLARS)
-        embed.add_field(name=david_header, value=david_body, inline=True)
-    else:
-        embed.add_field(name=david_header, value=f"Days complete: {david_days}/7", inline=True)
-
-    steph_header = f"**Steph — {steph_days}/7 days complete**"
-    if steph_checkins:
-        steph_body = _pillar_lines(steph_checkins, STEPH_PILLARS)
-        embed.add_field(name=steph_header, value=steph_body, inline=True)
-    else:
-        embed.add_field(name=steph_header, value=f"Days complete: {steph_days}/7", inline=True)
+    for uid, name in players:
+        header = f"**{name} — {member_days[uid]}/7 days complete**"
+        user_checkins = [r for r in checkins if r.user_id == uid]
+        if user_checkins:
+            body = _pillar_lines(user_checkins, pillar_names.get(uid, DEFAULT_NAMES))
+        else:
+            body = f"Days complete: {member_days[uid]}/7"
+        embed.add_field(name=header, value=body, inline=True)
 
     if max_streak >= 2:
         embed.add_field(
@@ -283,51 +866,266 @@ class WeeklyReviewModal(discord.ui.Modal, title="Weekly Review"):
 
 
 class CheckinModal(discord.ui.Modal, title="Daily Check-in"):
-    def __init__(self, pillar_names: list[str], callback) -> None:
+    def __init__(self, pillar_names: t.Sequence[str], callback) -> None:
         super().__init__()
         self._callback = callback
-        self.p1 = discord.ui.TextInput(
-            label=pillar_names[0][:45],
-            placeholder="y or n",
-            max_length=3,
-        )
-        self.p2 = discord.ui.TextInput(
-            label=pillar_names[1][:45],
-            placeholder="y or n",
-            max_length=3,
-        )
-        self.p3 = discord.ui.TextInput(
-            label=pillar_names[2][:45],
-            placeholder="y or n",
-            max_length=3,
-        )
-        self.add_item(self.p1)
-        self.add_item(self.p2)
-        self.add_item(self.p3)
+        self.inputs = [
+            discord.ui.TextInput(label=name[:45], placeholder="y or n", max_length=3)
+            for name in pillar_names
+        ]
+        for item in self.inputs:
+            self.add_item(item)
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
         def parse(val: str) -> bool:
             return val.strip().lower() in ("y", "yes", "1", "true")
 
-        await self._callback(
-            interaction,
-            parse(self.p1.value),
-            parse(self.p2.value),
-            parse(self.p3.value),
+        await self._callback(interaction, [parse(item.value) for item in self.inputs])
+
+
+# Discord allows five rows of components per message: one row per member
+CHECKIN_ROWS_PER_MESSAGE = 5
+
+_CHECKIN_BUTTON = (
+    r"checkin:(?P<action>all|log|p[0-9]):(?P<user>[0-9]+):(?P<mask>[0-9]+):(?P<day>[0-9]+)"
+)
+
+# (user_id, pillar names, toggled-on mask, day) for one member's row
+CheckinRow = tuple[int, t.Sequence[str], int, date]
+
+
+class CheckinButton(discord.ui.DynamicItem[discord.ui.Button], template=_CHECKIN_BUTTON):
+    """One button in a member's row on the check-in reminder.
+
+    The row's state (whose row, which pillars are toggled on, which day)
+    lives in the custom ID, so the buttons keep working across restarts
+    without storing anything.
+    """
+
+    def __init__(
+        self,
+        action: str,
+        user_id: int,
+        mask: int,
+        day: date,
+        *,
+        label: str | None = None,
+        style: discord.ButtonStyle = discord.ButtonStyle.secondary,
+        row: int | None = None,
+    ) -> None:
+        self.action = action
+        self.user_id = user_id
+        self.mask = mask
+        self.day = day
+        super().__init__(
+            discord.ui.Button(
+                label=label or action,
+                style=style,
+                row=row,
+                custom_id=f"checkin:{action}:{user_id}:{mask}:{day.toordinal()}",
+            )
+        )
+
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str], /
+    ) -> CheckinButton:
+        return cls(
+            match["action"],
+            int(match["user"]),
+            int(match["mask"]),
+            date.fromordinal(int(match["day"])),
         )
 
+    async def callback(self, interaction: discord.Interaction) -> None:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                f"❌ That row is for <@{self.user_id}>.", ephemeral=True
+            )
+            return
+        cog = interaction.client.get_cog("Playoff")
+        await cog.handle_checkin_button(interaction, self.action, self.mask, self.day)
+
+
+def checkin_view(rows: t.Sequence[CheckinRow], roster: HouseholdRoster) -> discord.ui.View:
+    """Reminder buttons: per member, "All done", a toggle per pillar and "Log".
+
+    *roster* is the household the rows belong to, for the members' names.
+    """
+    view = discord.ui.View(timeout=None)
+    for r, (user_id, names, mask, day) in enumerate(rows[:CHECKIN_ROWS_PER_MESSAGE]):
+        view.add_item(
+            CheckinButton(
+                "all",
+                user_id,
+                mask,
+                day,
+                label=f"All done — {member_label(roster, user_id)}"[:80],
+                style=discord.ButtonStyle.success,
+                row=r,
+            )
+        )
+        for i, name in enumerate(names):
+            on = bool(mask >> i & 1)
+            view.add_item(
+                CheckinButton(
+                    f"p{i}",
+                    user_id,
+                    mask,
+                    day,
+                    label=f"{'✅' if on else '⬜'} {name}"[:80],
+                    style=discord.ButtonStyle.primary if on else discord.ButtonStyle.secondary,
+                    row=r,
+                )
+            )
+        view.add_item(CheckinButton("log", user_id, mask, day, label="Log", row=r))
+    return view
+
+
+def checkin_rows_of(message: discord.Message) -> list[tuple[int, int, date]]:
+    """(user_id, mask, day) of each member row on a reminder message."""
+    rows = []
+    for action_row in message.components:
+        for child in getattr(action_row, "children", ()):
+            match = re.fullmatch(_CHECKIN_BUTTON, getattr(child, "custom_id", None) or "")
+            if match and match["action"] == "log":
+                rows.append(
+                    (int(match["user"]), int(match["mask"]), date.fromordinal(int(match["day"])))
+                )
+    return rows
+
+
+class SeriesHistoryView(discord.ui.View):
+    """Pages through every series using ``week_start`` keysets."""
+
+    def __init__(self, db, guild_id: int, players: Players, clock: LocalClock) -> None:
+        super().__init__(timeout=300)
+        self.db = db  # sessionmaker
+        self.guild_id = guild_id
+        self.players = players
+        self.clock = clock
+        self.today = clock.today()
+        self.rows: list[PlayoffSeries] = []
+        self.daily_by_week: dict[date, list[DaySummary]] = {}
+        self.stats: dict[int, PlayoffStats] = {}
+        self.page = 1
+        self.has_prev = False
+        self.has_next = False
+
+    async def load(
+        self, *, older_than: date | None = None, newer_than: date | None = None
+    ) -> bool:
+        """Show the newest page, or the page older/newer than a week.
+
+        Returns False, keeping the current page, when nothing is left on
+        that side.
+        """
+        async with self.db() as s:
+            rows, has_more = await series_page(
+                s, self.guild_id, older_than=older_than, newer_than=newer_than
+            )
+            if not rows and (older_than is not None or newer_than is not None):
+                if older_than is not None:
+                    self.has_next = False
+                else:
+                    self.has_prev = False
+                self.prev_button.disabled = not self.has_prev
+                self.next_button.disabled = not self.has_next
+                return False
+            daily_rows = (
+                await load_days(
+                    s, self.guild_id, rows[-1].week_start, rows[0].week_start + timedelta(days=6)
+                )
+                if rows
+                else []
+            )
+            self.stats = {
+                r.user_id: r
+                for r in await s.scalars(
+                    select(PlayoffStats).where(PlayoffStats.guild_id == self.guild_id)
+                )
+            }
+
+        # Group settled days by the Sunday that started their week
+        daily_by_week: dict[date, list[DaySummary]] = {}
+        for dr in daily_rows:
+            daily_by_week.setdefault(self.clock.week_start_for(dr.result_date), []).append(dr)
+
+        self.rows = rows
+        self.daily_by_week = daily_by_week
+        if newer_than is not None:
+            self.has_prev, self.has_next = has_more, True
+        elif older_than is not None:
+            self.has_prev, self.has_next = True, has_more
+        else:
+            self.has_prev, self.has_next = False, has_more
+        self.prev_button.disabled = not self.has_prev
+        self.next_button.disabled = not self.has_next
+        return True
+
+    def embed(self) -> discord.Embed:
+        icons = {"won": "🏆", "lost": "💀", "ongoing": "🔄"}
+        lines = []
+        for r in self.rows:
+            icon = icons.get(r.status, "❓")
+            week_daily = self.daily_by_week.get(r.week_start, [])
+            member_days = " ".join(
+                f"{label[:1]}:{sum(1 for dr in week_daily if uid in dr.completed)}/7"
+                for uid, label in self.players
+            )
+            lines.append(
+                f"{icon} Week of {r.week_start.strftime('%b %d, %Y')} — "
+                f"**{r.wins}–{r.losses}** ({r.status})"
+                f"  {member_days}"
+            )
+
+        embed = discord.Embed(
+            title="📊 Stavid Series History",
+            description="\n".join(lines),
+            color=discord.Color.blurple(),
+        )
+        embed.add_field(
+            name="All-time",
+            value=format_all_time(self.stats, self.players, self.today),
+            inline=False,
+        )
+        if self.has_prev or self.has_next:
+            embed.set_footer(text=f"Page {self.page}")
+        return embed
+
+    @discord.ui.button(label="◀ Newer", style=discord.ButtonStyle.secondary, disabled=True)
+    async def prev_button(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if self.rows and await self.load(newer_than=self.rows[0].week_start):
+            self.page = max(1, self.page - 1)
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
+    @discord.ui.button(label="Older ▶", style=discord.ButtonStyle.secondary, disabled=True)
+    async def next_button(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if self.rows and await self.load(older_than=self.rows[-1].week_start):
+            self.page += 1
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
 
 class Playoff(commands.Cog):
     def __init__(self, bot: StavidBot) -> None:
         self.bot = bot
-        self._pinged_dates: set[date] = set()
-        self._reviewed_dates: set[date] = set()
-        self.daily_ping.start()
-        self.sunday_review.start()
+        # PNG encoding is CPU-bound; keep it off the event loop
+        self._render_pool = ProcessPoolExecutor(max_workers=1)
+        self._heatmaps = HeatmapCache()
+        self._status = StatusCache()
+        self._insights = InsightsCache()
+        self._weekly = WeeklyEmbedCache()
+        self.reconcile_series.start()
+
+    async def cog_load(self) -> None:
+        self.bot.add_dynamic_items(CheckinButton)
 
     def cog_unload(self) -> None:
-        self.daily_ping.cancel()
-        self.sunday_review.cancel()
+        self.bot.remove_dynamic_items(CheckinButton)
+        self.reconcile_series.cancel()
+        self._render_pool.shutdown(wait=False, cancel_futures=True)
+
+    playoff = app_commands.Group(name="playoff", description="Playoff stats and charts")
 
     # ------------------------------------------------------------------ #
     # Commands                                                             #
@@ -335,22 +1133,26 @@ class Playoff(commands.Cog):
 
     @app_commands.command(name="checkin", description="Log your daily pillars")
     async def checkin(self, interaction: discord.Interaction) -> None:
-        modal = CheckinModal(get_pillar_names(interaction.user.id), self._process_checkin)
+        guild_id = interaction.guild_id or 0
+        today = (await clock_for(self.bot.db, guild_id, interaction.user.id)).today()
+        pillars = await pillars_for(self.bot.db, guild_id, interaction.user.id, today)
+        modal = CheckinModal(pillars.names, self._process_checkin)
         await interaction.response.send_modal(modal)
 
     async def _process_checkin(
-        self,
-        interaction: discord.Interaction,
-        pillar1: bool,
-        pillar2: bool,
-        pillar3: bool,
+        self, interaction: discord.Interaction, done: list[bool]
     ) -> None:
-        today = today_et()
-        week_start = week_start_for(today)
         user_id = interaction.user.id
         guild_id = interaction.guild_id or 0
-        pillar_names = get_pillar_names(user_id)
-        individual_win = pillar1 and pillar2 and pillar3
+        # The day is the member's own; the week boundaries are the household's
+        clock = await clock_for(self.bot.db, guild_id, user_id)
+        today = clock.today()
+        week_start = clock.week_start_for(today)
+        pillars = await pillars_for(self.bot.db, guild_id, user_id, today)
+        mask = pillars.mask(done)
+        pillar1, pillar2, pillar3 = pillars.slots(mask)
+        individual_win = mask == pillars.full_mask
+        players = players_for(await household_roster(self.bot.db, guild_id))
 
         async with self.bot.db() as s:
             # --- Step 1: upsert this user's individual check-in ---
@@ -361,10 +1163,13 @@ class Playoff(commands.Cog):
                     PlayoffCheckin.checkin_date == today,
                 )
             )
+            old = (existing.pillar1, existing.pillar2, existing.pillar3) if existing else None
             if existing:
                 existing.pillar1 = pillar1
                 existing.pillar2 = pillar2
                 existing.pillar3 = pillar3
+                existing.pillars_done = mask
+                existing.pillar_version = pillars.version
                 existing.updated_at = datetime.now(timezone.utc)
             else:
                 s.add(
@@ -375,74 +1180,23 @@ class Playoff(commands.Cog):
                         pillar1=pillar1,
                         pillar2=pillar2,
                         pillar3=pillar3,
+                        pillars_done=mask,
+                        pillar_version=pillars.version,
                     )
                 )
+            await record_checkin_bits(s, guild_id, user_id, today, pillar1, pillar2, pillar3)
+            await record_member_checkin(
+                s, guild_id, user_id, today, old, (pillar1, pillar2, pillar3)
+            )
             await s.commit()
 
-            # --- Step 2: if both players have checked in, settle today's combined result ---
-            david_checkin = await s.scalar(
-                select(PlayoffCheckin).where(
-                    PlayoffCheckin.guild_id == guild_id,
-                    PlayoffCheckin.user_id == DAVID_ID,
-                    PlayoffCheckin.checkin_date == today,
-                )
-            )
-            steph_checkin = await s.scalar(
-                select(PlayoffCheckin).where(
-                    PlayoffCheckin.guild_id == guild_id,
-                    PlayoffCheckin.user_id == STEPH_ID,
-                    PlayoffCheckin.checkin_date == today,
-                )
+            # --- Step 2: once every member has checked in, settle today's combined result ---
+            today_result, is_new_settlement = await settle_day(
+                s, guild_id, today, [uid for uid, _ in players]
             )
 
-            today_result: DailyResult | None = None
-            is_new_settlement = False
-            if david_checkin and steph_checkin:
-                david_complete = (
-                    david_checkin.pillar1 and david_checkin.pillar2 and david_checkin.pillar3
-                )
-                steph_complete = (
-                    steph_checkin.pillar1 and steph_checkin.pillar2 and steph_checkin.pillar3
-                )
-                won_shared = david_complete and steph_complete
-
-                existing_result = await s.scalar(
-                    select(DailyResult).where(
-                        DailyResult.guild_id == guild_id,
-                        DailyResult.result_date == today,
-                    )
-                )
-                is_new_settlement = existing_result is None
-                if existing_result:
-                    existing_result.david_complete = david_complete
-                    existing_result.steph_complete = steph_complete
-                    existing_result.won = won_shared
-                    existing_result.updated_at = datetime.now(timezone.utc)
-                    today_result = existing_result
-                else:
-                    today_result = DailyResult(
-                        guild_id=guild_id,
-                        result_date=today,
-                        david_complete=david_complete,
-                        steph_complete=steph_complete,
-                        won=won_shared,
-                    )
-                    s.add(today_result)
-                await s.commit()
-
             # --- Step 3: derive series tally from DailyResult rows (authoritative) ---
-            daily_results = (
-                await s.scalars(
-                    select(DailyResult).where(
-                        DailyResult.guild_id == guild_id,
-                        DailyResult.result_date >= week_start,
-                        DailyResult.result_date <= week_start + timedelta(days=6),
-                    )
-                )
-            ).all()
-
-            wins = sum(1 for r in daily_results if r.won)
-            losses = sum(1 for r in daily_results if not r.won)
+            wins, losses = await week_tally(s, guild_id, week_start)
 
             if wins >= 4:
                 status = "won"
@@ -458,10 +1212,12 @@ class Playoff(commands.Cog):
                     PlayoffSeries.week_start == week_start,
                 )
             )
+            await record_series_status(s, guild_id, series.status if series else None, status)
             if series:
                 series.wins = wins
                 series.losses = losses
                 series.status = status
+                series.version += 1
             else:
                 s.add(
                     PlayoffSeries(
@@ -470,10 +1226,16 @@ class Playoff(commands.Cog):
                         wins=wins,
                         losses=losses,
                         status=status,
+                        version=1,
                     )
                 )
             await s.commit()
 
+            # --- Step 5: replace the guild's cached /playoff_status snapshots ---
+            self._status.invalidate(guild_id)
+            snap = (await load_status_snapshots(s, {guild_id: (today, week_start)}))[guild_id]
+            self._status.put(snap)
+
         # --- Build response embed ---
         # Combined result is the headline — a day only wins if BOTH complete everything.
         # Individual completion is shown as context, not as the win/loss verdict.
@@ -499,29 +1261,24 @@ class Playoff(commands.Cog):
             name="Your Pillars",
             value="\n".join(
                 f"{'✅' if v else '❌'} {name}"
-                for name, v in zip(pillar_names, [pillar1, pillar2, pillar3])
+                for name, v in zip(pillars.names, done)
             ),
             inline=False,
         )
 
-        # Combined result — only available once both players have checked in
+        # Combined result — only available once every member has checked in
         if today_result is not None:
             if today_result.won:
-                combined_text = "Both complete — you won the day together!"
+                combined_text = "Everyone complete — you won the day together!"
             else:
-                missed = []
-                if not today_result.david_complete:
-                    missed.append("David")
-                if not today_result.steph_complete:
-                    missed.append("Stephanie")
-                combined_text = f"{', '.join(missed)} didn't complete all pillars"
+                combined_text = f"{_missed(today_result, players)} didn't complete all pillars"
         else:
-            combined_text = "Waiting for other player to check in..."
+            combined_text = "Waiting for everyone to check in..."
 
         embed.add_field(name="Combined Result", value=combined_text, inline=False)
         embed.add_field(
             name=f"Series — {wins}W {losses}L",
-            value=series_message(wins, losses),
+            value=series_message(wins, losses, snap.odds(players)),
             inline=False,
         )
         await interaction.response.send_message(embed=embed)
@@ -529,182 +1286,388 @@ class Playoff(commands.Cog):
         # Cross-notify the other player when the day is first settled, so they
         # don't have to manually check /playoff_status to see the combined result.
         if is_new_settlement and today_result is not None:
-            other_id = STEPH_ID if user_id == DAVID_ID else DAVID_ID
+            others = " ".join(f"<@{uid}>" for uid, _ in players if uid != user_id)
             if today_result.won:
                 notif = (
-                    f"<@{other_id}> 🏆 Day settled — **both complete!** "
+                    f"{others} 🏆 Day settled — **everyone complete!** "
                     f"Series: **{wins}W {losses}L**"
                 )
             else:
-                missed = []
-                if not today_result.david_complete:
-                    missed.append("David")
-                if not today_result.steph_complete:
-                    missed.append("Stephanie")
                 notif = (
-                    f"<@{other_id}> 💔 Day settled — "
-                    f"{', '.join(missed)} didn't complete all pillars. "
+                    f"{others} 💔 Day settled — "
+                    f"{_missed(today_result, players)} didn't complete all pillars. "
                     f"Series: **{wins}W {losses}L**"
                 )
-            await interaction.followup.send(notif)
+            if others:
+                await interaction.followup.send(notif)
+
+    async def handle_checkin_button(
+        self, interaction: discord.Interaction, action: str, mask: int, day: date
+    ) -> None:
+        """Toggle a pillar on the reminder, or log the day through ``_process_checkin``."""
+        guild_id = interaction.guild_id or 0
+        user_id = interaction.user.id
+        today = (await clock_for(self.bot.db, guild_id, user_id)).today()
+        if day != today:
+            await interaction.response.send_message(
+                f"⌛ That reminder was for {day.strftime('%A, %b %d')} — "
+                "use `/checkin` for today.",
+                ephemeral=True,
+            )
+            return
+        pillars = await pillars_for(self.bot.db, guild_id, user_id, today)
+
+        if action.startswith("p"):
+            mask ^= 1 << int(action[1:])
+            current = checkin_rows_of(interaction.message)
+            names = await pillar_names_on(self.bot.db, guild_id, [uid for uid, *_ in current], day)
+            rows = [
+                (uid, names[uid], mask if uid == user_id else row_mask, row_day)
+                for uid, row_mask, row_day in current
+            ]
+            roster = await household_roster(self.bot.db, guild_id)
+            await interaction.response.edit_message(view=checkin_view(rows, roster))
+            return
+
+        if action == "all":
+            mask = pillars.full_mask
+        await self._process_checkin(
+            interaction, [bool(mask >> i & 1) for i in range(len(pillars.names))]
+        )
 
     @app_commands.command(
         name="playoff_status",
-        description="Check current series scores for both players",
+        description="Check the household's current series score",
     )
     async def playoff_status(self, interaction: discord.Interaction) -> None:
-        today = today_et()
-        week_start = week_start_for(today)
         guild_id = interaction.guild_id or 0
+        clock = await clock_for(self.bot.db, guild_id, interaction.user.id)
+        today = clock.today()
+        week_start = clock.week_start_for(today)
+        players = players_for(await household_roster(self.bot.db, guild_id))
 
-        async with self.bot.db() as s:
-            series = await s.scalar(
-                select(PlayoffSeries).where(
-                    PlayoffSeries.guild_id == guild_id,
-                    PlayoffSeries.week_start == week_start,
-                )
-            )
-            wins = series.wins if series else 0
-            losses = series.losses if series else 0
+        snap = self._status.get(guild_id, today, week_start)
+        if snap is None:
+            async with self.bot.db() as s:
+                snaps = await load_status_snapshots(s, {guild_id: (today, week_start)})
+            snap = snaps[guild_id]
+            self._status.put(snap)
+        await interaction.response.send_message(embed=status_embed(snap, players))
 
-            today_result = await s.scalar(
-                select(DailyResult).where(
-                    DailyResult.guild_id == guild_id,
-                    DailyResult.result_date == today,
-                )
+    @app_commands.command(
+        name="series_history",
+        description="All-time playoff stats and every past series",
+    )
+    async def series_history(self, interaction: discord.Interaction) -> None:
+        guild_id = interaction.guild_id or 0
+        players = players_for(await household_roster(self.bot.db, guild_id))
+
+        clock = await clock_for(self.bot.db, guild_id)
+        view = SeriesHistoryView(self.bot.db, guild_id, players, clock)
+        await view.load()
+        if not view.rows:
+            await interaction.response.send_message(
+                "No series history yet. Use `/checkin` to get started!",
+                ephemeral=True,
             )
+            return
+        await interaction.response.send_message(embed=view.embed(), view=view, ephemeral=True)
 
-            # Only needed for the "waiting" state when no combined result yet
-            david_checkin = await s.scalar(
-                select(PlayoffCheckin).where(
-                    PlayoffCheckin.guild_id == guild_id,
-                    PlayoffCheckin.user_id == DAVID_ID,
-                    PlayoffCheckin.checkin_date == today,
-                )
+    @app_commands.command(
+        name="checkin_stats",
+        description="Streaks, pillar rates and a heatmap for one year of check-ins",
+    )
+    @app_commands.describe(
+        member="Whose stats to show (default: you)",
+        year="Calendar year (default: this year)",
+    )
+    async def checkin_stats(
+        self,
+        interaction: discord.Interaction,
+        member: discord.Member | None = None,
+        year: app_commands.Range[int, 2000, 2100] | None = None,
+    ) -> None:
+        user = member or interaction.user
+        guild_id = interaction.guild_id or 0
+        today = (await clock_for(self.bot.db, guild_id, user.id)).today()
+        year = year or today.year
+
+        async with self.bot.db() as s:
+            history = await load_history(s, guild_id, user.id, year, year)
+
+        if not history.days_checked():
+            await interaction.response.send_message(
+                f"No check-ins from {user.mention} in {year}.", ephemeral=True
             )
-            steph_checkin = await s.scalar(
-                select(PlayoffCheckin).where(
-                    PlayoffCheckin.guild_id == guild_id,
-                    PlayoffCheckin.user_id == STEPH_ID,
-                    PlayoffCheckin.checkin_date == today,
-                )
+            return
+
+        pillar_names = (await pillars_for(self.bot.db, guild_id, user.id, today)).names
+        rates = history.pillar_rates()
+        cells = history.heatmap()
+        months = []
+        for month in range(1, 13):
+            first = history.index_of(date(year, month, 1))
+            last = history.index_of(date(year + month // 12, month % 12 + 1, 1))
+            months.append(
+                f"{date(year, month, 1).strftime('%b')} "
+                + "".join(_HEAT_CHARS[0 if c is None else c + 1] for c in cells[first:last])
             )
 
         embed = discord.Embed(
-            title=f"🏆 Playoff Week — {week_start.strftime('Week of %b %d')}",
+            title=f"📈 {user.display_name}'s {year} check-ins",
+            description=(
+                f"**{history.days_checked()}** days checked in · "
+                f"**{history.complete_days()}** all-pillar days\n"
+                f"🔥 Current streak: **{history.current_streak(today)}** · "
+                f"Longest: **{history.longest_streak()}**"
+            ),
             color=discord.Color.blurple(),
         )
         embed.add_field(
-            name=f"Stavid Series — {wins}W {losses}L",
-            value=series_message(wins, losses),
+            name="Pillar completion",
+            value="\n".join(
+                f"{name[:40]}: {rate:.0%}" for name, rate in zip(pillar_names, rates)
+            ),
             inline=False,
         )
+        embed.add_field(
+            name="Heatmap", value="```\n" + "\n".join(months) + "\n```", inline=False
+        )
+        embed.set_footer(text=f"{_HEAT_CHARS[0]} no check-in · {_HEAT_CHARS[1:]} 0–3 pillars")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        # Combined day result is authoritative once both players have checked in
-        if today_result is not None:
-            if today_result.won:
-                today_text = "🏆 **Shared WIN** — both complete!"
+    # ------------------------------------------------------------------
+    # /playoff heatmap
+    # ------------------------------------------------------------------
+    @playoff.command(name="heatmap", description="Contribution-style chart of pillar completion")
+    @app_commands.describe(
+        member="Whose check-ins to chart (default: you)",
+        household="Chart the household's shared days instead of one person",
+        start="First day, YYYY-MM-DD (default: a year before end)",
+        end="Last day, YYYY-MM-DD (default: today)",
+    )
+    async def heatmap(
+        self,
+        interaction: discord.Interaction,
+        member: discord.Member | None = None,
+        household: bool = False,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> None:
+        guild_id = interaction.guild_id or 0
+        user = member or interaction.user
+        user_id = 0 if household else user.id
+        clock = await clock_for(self.bot.db, guild_id, None if household else user.id)
+        try:
+            end_day = date.fromisoformat(end) if end else clock.today()
+            start_day = (
+                date.fromisoformat(start)
+                if start
+                else end_day - timedelta(days=HEATMAP_DEFAULT_DAYS - 1)
+            )
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Invalid date — use YYYY-MM-DD (e.g. `2026-05-01`).", ephemeral=True
+            )
+            return
+        if not 0 <= (end_day - start_day).days < HEATMAP_MAX_DAYS:
+            await interaction.response.send_message(
+                "❌ Start must be on or before end, and the range at most 5 years.",
+                ephemeral=True,
+            )
+            return
+
+        async with self.bot.db() as s:
+            if household:
+                stamp = select(func.count(DailyResult.id), func.max(DailyResult.updated_at)).where(
+                    DailyResult.guild_id == guild_id,
+                    DailyResult.result_date >= start_day,
+                    DailyResult.result_date <= end_day,
+                )
             else:
-                missed = []
-                if not today_result.david_complete:
-                    missed.append("David")
-                if not today_result.steph_complete:
-                    missed.append("Stephanie")
-                today_text = f"💀 **Shared LOSS** — {', '.join(missed)} didn't complete all pillars"
-            embed.add_field(name="Today's Combined Result", value=today_text, inline=False)
+                stamp = select(
+                    func.count(PlayoffCheckin.id), func.max(PlayoffCheckin.updated_at)
+                ).where(
+                    PlayoffCheckin.guild_id == guild_id,
+                    PlayoffCheckin.user_id == user_id,
+                    PlayoffCheckin.checkin_date >= start_day,
+                    PlayoffCheckin.checkin_date <= end_day,
+                )
+            version = tuple((await s.execute(stamp)).one())
+            key = (guild_id, user_id, start_day, end_day, version)
+            png = self._heatmaps.get(key)
+
+            if png is None:
+                if household:
+                    roster = await household_roster(self.bot.db, guild_id)
+                    days = await load_days(s, guild_id, start_day, end_day)
+                    cells = household_cells(days, start_day, end_day, len(roster.member_ids))
+                else:
+                    history = await load_history(
+                        s, guild_id, user_id, start_day.year, end_day.year
+                    )
+                    first = history.index_of(start_day)
+                    cells = history.heatmap()[first : first + (end_day - start_day).days + 1]
+
+        if png is None:
+            await interaction.response.defer()
+            png = await asyncio.get_running_loop().run_in_executor(
+                self._render_pool, render_heatmap_png, cells, start_day
+            )
+            self._heatmaps.put(key, png)
+            send = interaction.followup.send
         else:
-            # Day not yet settled — show individual check-in status
+            send = interaction.response.send_message
+
+        subject = "Household" if household else user.display_name
+        embed = discord.Embed(
+            title=f"🟩 {subject} — {start_day.strftime('%b %d, %Y')} to {end_day.strftime('%b %d, %Y')}",
+            color=discord.Color.green(),
+        )
+        embed.set_image(url="attachment://heatmap.png")
+        embed.set_footer(text="Darker = more pillars done · grey = no check-in")
+        await send(embed=embed, file=discord.File(io.BytesIO(png), filename="heatmap.png"))
+
+    # ------------------------------------------------------------------
+    # /playoff pillars
+    # ------------------------------------------------------------------
+    @playoff.command(name="pillars", description="Show your pillars and how they have changed")
+    @app_commands.describe(member="Whose pillars to show (default: you)")
+    async def pillars(
+        self, interaction: discord.Interaction, member: discord.Member | None = None
+    ) -> None:
+        user = member or interaction.user
+        guild_id = interaction.guild_id or 0
+        today = (await clock_for(self.bot.db, guild_id, user.id)).today()
+        history = (await guild_pillars(self.bot.db, guild_id)).get(user.id)
+        current = await pillars_for(self.bot.db, guild_id, user.id, today)
+
+        embed = discord.Embed(
+            title=f"🏛️ {user.display_name}'s pillars",
+            description="\n".join(f"{i}. {name}" for i, name in enumerate(current.names, 1)),
+            color=discord.Color.blurple(),
+        )
+        if history is not None:
             embed.add_field(
-                name="Today's Check-ins",
-                value=(
-                    f"David: {'✅ checked in' if david_checkin else '⏳ not yet'}\n"
-                    f"Stephanie: {'✅ checked in' if steph_checkin else '⏳ not yet'}"
+                name="Versions",
+                value="\n".join(
+                    f"v{p.version} from {p.effective_from.strftime('%b %d, %Y')}: "
+                    + " · ".join(p.names)
+                    for p in reversed(history.versions[-10:])
                 ),
                 inline=False,
             )
+        else:
+            embed.set_footer(text="Set your own with /playoff set_pillars")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        await interaction.response.send_message(embed=embed)
-
-    @app_commands.command(
-        name="series_history",
-        description="View past series results",
+    @playoff.command(name="set_pillars", description="Change your pillars from a given day on")
+    @app_commands.describe(
+        first="First pillar",
+        second="Second pillar (optional)",
+        third="Third pillar (optional)",
+        starting="First day the new pillars count, YYYY-MM-DD (default: today)",
     )
-    async def series_history(self, interaction: discord.Interaction) -> None:
+    async def set_pillars(
+        self,
+        interaction: discord.Interaction,
+        first: app_commands.Range[str, 1, 100],
+        second: app_commands.Range[str, 1, 100] | None = None,
+        third: app_commands.Range[str, 1, 100] | None = None,
+        starting: str | None = None,
+    ) -> None:
         guild_id = interaction.guild_id or 0
-        today = today_et()
+        user_id = interaction.user.id
+        today = (await clock_for(self.bot.db, guild_id, user_id)).today()
+        try:
+            effective_from = date.fromisoformat(starting) if starting else today
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Invalid date — use YYYY-MM-DD (e.g. `2026-05-01`).", ephemeral=True
+            )
+            return
+        if effective_from < today:
+            # Past check-ins were made against the old list
+            await interaction.response.send_message(
+                "❌ New pillars can start today at the earliest.", ephemeral=True
+            )
+            return
 
         async with self.bot.db() as s:
-            rows = (
-                await s.scalars(
-                    select(PlayoffSeries)
-                    .where(PlayoffSeries.guild_id == guild_id)
-                    .order_by(PlayoffSeries.week_start.desc())
-                    .limit(8)
-                )
-            ).all()
-
-            if not rows:
-                await interaction.response.send_message(
-                    "No series history yet. Use `/checkin` to get started!",
-                    ephemeral=True,
-                )
-                return
+            pillars = await add_pillar_version(
+                s, guild_id, user_id, [first, second or "", third or ""], effective_from
+            )
+            await s.commit()
+        pillar_cache.invalidate(guild_id)
 
-            # Fetch per-person completion data for all shown weeks in one query
-            oldest_week = rows[-1].week_start
-            newest_week_end = rows[0].week_start + timedelta(days=6)
-            daily_rows = (
-                await s.scalars(
-                    select(DailyResult).where(
-                        DailyResult.guild_id == guild_id,
-                        DailyResult.result_date >= oldest_week,
-                        DailyResult.result_date <= newest_week_end,
-                    )
-                )
-            ).all()
-
-            # Group DailyResult rows by the Sunday that started their week
-            daily_by_week: dict[date, list[DailyResult]] = {}
-            for dr in daily_rows:
-                ws = week_start_for(dr.result_date)
-                daily_by_week.setdefault(ws, []).append(dr)
-
-            # Auto-heal stale "ongoing" status for fully completed past weeks.
-            # If the bot missed a Sunday review, old weeks stay "ongoing" forever
-            # unless we fix them here.
-            needs_commit = False
-            for row in rows:
-                week_end = row.week_start + timedelta(days=6)
-                if week_end < today and row.status == "ongoing":
-                    week_daily = daily_by_week.get(row.week_start, [])
-                    row.wins = sum(1 for dr in week_daily if dr.won)
-                    row.losses = sum(1 for dr in week_daily if not dr.won)
-                    row.status = finalize_series_status(week_daily)
-                    needs_commit = True
-            if needs_commit:
-                await s.commit()
+        when = "today" if effective_from == today else effective_from.strftime("%b %d")
+        await interaction.response.send_message(
+            f"🏛️ From {when}, your pillars are:\n"
+            + "\n".join(f"{i}. {name}" for i, name in enumerate(pillars.names, 1)),
+            ephemeral=True,
+        )
 
-        icons = {"won": "🏆", "lost": "💀", "ongoing": "🔄"}
-        lines = []
-        for r in rows:
-            icon = icons.get(r.status, "❓")
-            week_daily = daily_by_week.get(r.week_start, [])
-            david_days = sum(1 for dr in week_daily if dr.david_complete)
-            steph_days = sum(1 for dr in week_daily if dr.steph_complete)
-            lines.append(
-                f"{icon} Week of {r.week_start.strftime('%b %d')} — "
-                f"**{r.wins}–{r.losses}** ({r.status})"
-                f"  D:{david_days}/7 S:{steph_days}/7"
+    # ------------------------------------------------------------------
+    # /playoff insights
+    # ------------------------------------------------------------------
+    @playoff.command(name="insights", description="Pillar trends, weekday effects and correlations")
+    async def insights(self, interaction: discord.Interaction) -> None:
+        guild_id = interaction.guild_id or 0
+        clock = await clock_for(self.bot.db, guild_id)
+        week_start = clock.week_start_for(clock.today())
+        players = players_for(await household_roster(self.bot.db, guild_id))
+        user_ids = tuple(uid for uid, _ in players)
+
+        key = (guild_id, week_start, user_ids)
+        insights = self._insights.get(key)
+        if insights is None:
+            first = week_start - timedelta(weeks=LONG_WEEKS)
+            last = week_start - timedelta(days=1)
+            async with self.bot.db() as s:
+                histories = await load_histories(s, guild_id, user_ids, first.year, last.year)
+            insights = compute_insights(histories, week_start)
+            self._insights.put(key, insights)
+
+        if not any(rate is not None for m in insights.members for rate in m.overall):
+            await interaction.response.send_message(
+                f"No check-ins in the last {LONG_WEEKS} weeks yet — insights start "
+                "after your first full week.",
+                ephemeral=True,
             )
-
-        won_count = sum(1 for r in rows if r.status == "won")
-        embed = discord.Embed(
-            title="📊 Stavid Series History",
-            description="\n".join(lines),
-            color=discord.Color.blurple(),
+            return
+        names = await pillar_names_on(
+            self.bot.db, guild_id, user_ids, week_start - timedelta(days=1)
+        )
+        await interaction.response.send_message(embed=insights_embed(insights, players, names))
+
+    # ------------------------------------------------------------------
+    # /playoff week
+    # ------------------------------------------------------------------
+    @playoff.command(name="week", description="Show the weekly review for a past week")
+    @app_commands.describe(day="Any day in the week, YYYY-MM-DD (default: last week)")
+    async def week(self, interaction: discord.Interaction, day: str | None = None) -> None:
+        guild_id = interaction.guild_id or 0
+        clock = await clock_for(self.bot.db, guild_id)
+        today = clock.today()
+        try:
+            week_start = (
+                clock.week_start_for(date.fromisoformat(day))
+                if day
+                else clock.week_start_for(today) - timedelta(weeks=1)
+            )
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Invalid date — use YYYY-MM-DD (e.g. `2026-05-01`).", ephemeral=True
+            )
+            return
+        if week_start > today:
+            await interaction.response.send_message(
+                "❌ That week hasn't started yet.", ephemeral=True
+            )
+            return
+        await interaction.response.send_message(
+            embed=await self.weekly_embed(guild_id, week_start)
         )
-        embed.set_footer(text=f"Won {won_count} of {len(rows)} series shown")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(
         name="weekly_review",
@@ -717,9 +1680,10 @@ class Playoff(commands.Cog):
     async def _save_weekly_review(
         self, interaction: discord.Interaction, text: str
     ) -> None:
-        week_of = week_start_for(today_et())
         guild_id = interaction.guild_id or 0
         user_id = interaction.user.id
+        clock = await clock_for(self.bot.db, guild_id, user_id)
+        week_of = clock.week_start_for(clock.today())
 
         async with self.bot.db() as s:
             existing = await s.scalar(
@@ -751,83 +1715,74 @@ class Playoff(commands.Cog):
     # Background tasks                                                     #
     # ------------------------------------------------------------------ #
 
-    @tasks.loop(hours=1)
-    async def daily_ping(self) -> None:
-        """At 10 pm ET, remind users who haven't checked in yet."""
-        now_et = datetime.now(ET)
-        today = now_et.date()
-
-        if now_et.hour != 22 or today in self._pinged_dates:
-            return
-        self._pinged_dates.add(today)
+    @commands.Cog.listener()
+    async def on_checkin_ping(self, due: list[DueJob]) -> None:
+        """At each guild's ping time, remind members who haven't checked in yet."""
+        channels = {job.guild_id: job.channel_id for job in due}
+        by_day: dict[date, list[int]] = {}
+        for job in due:
+            by_day.setdefault(job.day, []).append(job.guild_id)
 
-        channel_id = os.getenv("CHECKIN_CHANNEL_ID")
-        if not channel_id or not channel_id.isdigit():
-            return
-        channel = self.bot.get_channel(int(channel_id))
-        if channel is None:
-            return
-
-        for user_id in (DAVID_ID, STEPH_ID):
-            async with self.bot.db() as s:
-                already = await s.scalar(
-                    select(PlayoffCheckin).where(
-                        PlayoffCheckin.user_id == user_id,
-                        PlayoffCheckin.checkin_date == today,
+        missing_by_day = {}
+        async with self.bot.db() as s:
+            for day, guild_ids in by_day.items():
+                missing_by_day[day] = await missing_checkins(s, day, guild_ids)
+
+        by_channel: dict[int, list[CheckinRow]] = {}
+        rosters: dict[int, HouseholdRoster] = {}
+        for day, missing in missing_by_day.items():
+            for guild_id, (_, user_ids) in missing.items():
+                channel_id = channels[guild_id]
+                if channel_id is not None:
+                    rosters[channel_id] = await household_roster(self.bot.db, guild_id)
+                    names = await pillar_names_on(self.bot.db, guild_id, user_ids, day)
+                    by_channel.setdefault(channel_id, []).extend(
+                        (uid, names[uid], 0, day) for uid in user_ids
                     )
-                )
-            if already:
-                continue
 
-            pillar_list = "\n".join(
-                f"{i + 1}. {p}" for i, p in enumerate(get_pillar_names(user_id))
-            )
-            member = channel.guild.get_member(user_id)
-            mention = member.mention if member else f"<@{user_id}>"
-            await channel.send(
-                f"⏰ {mention} — daily check-in time!\n"
-                f"Your pillars:\n{pillar_list}\n\n"
-                f"Use `/checkin` to log your results!"
-            )
+        # discord.py waits out 429s itself; the semaphore keeps bursts small
+        limit = asyncio.Semaphore(PING_CONCURRENCY)
 
-    @daily_ping.before_loop
-    async def before_daily_ping(self) -> None:
-        await self.bot.wait_until_ready()
+        async def send(channel_id: int, rows: list[CheckinRow]) -> None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                return
+            async with limit:
+                try:
+                    # One message per five members, each with their own button row
+                    for i in range(0, len(rows), CHECKIN_ROWS_PER_MESSAGE):
+                        chunk = rows[i : i + CHECKIN_ROWS_PER_MESSAGE]
+                        await channel.send(
+                            ping_message(
+                                [uid for uid, *_ in chunk],
+                                {uid: names for uid, names, *_ in chunk},
+                            ),
+                            view=checkin_view(chunk, rosters[channel_id]),
+                        )
+                except discord.HTTPException:
+                    logging.exception("Check-in reminder to channel %s failed", channel_id)
 
-    @tasks.loop(hours=1)
-    async def sunday_review(self) -> None:
-        """On Sunday at 10 am ET, post a weekly review prompt."""
-        now_et = datetime.now(ET)
-        today = now_et.date()
+        await asyncio.gather(*(send(cid, rows) for cid, rows in by_channel.items()))
 
-        if now_et.weekday() != 6 or now_et.hour != 10 or today in self._reviewed_dates:
-            return
-        self._reviewed_dates.add(today)
-
-        channel_id = os.getenv("CHECKIN_CHANNEL_ID")
-        if not channel_id or not channel_id.isdigit():
-            return
-        channel = self.bot.get_channel(int(channel_id))
-        if channel is None:
-            return
+    @commands.Cog.listener()
+    async def on_weekly_review(self, due: list[DueJob]) -> None:
+        """At each guild's review time, finalize last week and post its summary."""
+        for job in due:
+            channel = self.bot.get_channel(job.channel_id) if job.channel_id else None
+            if channel is None:
+                continue
+            try:
+                await self._post_weekly_review(channel, job.guild_id, job.day)
+            except discord.HTTPException:
+                logging.exception("Weekly review for guild %s failed", job.guild_id)
 
-        prev_week_start = week_start_for(today) - timedelta(weeks=1)
-        guild_id = channel.guild.id if channel.guild else 0
+    async def _post_weekly_review(self, channel, guild_id: int, today: date) -> None:
+        clock = await clock_for(self.bot.db, guild_id)
+        prev_week_start = clock.week_start_for(today) - timedelta(weeks=1)
 
         async with self.bot.db() as s:
-            rows = list(
-                (
-                    await s.execute(
-                        select(DailyResult).where(
-                            DailyResult.guild_id == guild_id,
-                            DailyResult.result_date >= prev_week_start,
-                            DailyResult.result_date
-                            <= prev_week_start + timedelta(days=6),
-                        )
-                    )
-                )
-                .scalars()
-                .all()
+            rows = await load_days(
+                s, guild_id, prev_week_start, prev_week_start + timedelta(days=6)
             )
 
             # Finalize the previous week's series record so history is accurate
@@ -843,10 +1798,14 @@ class Playoff(commands.Cog):
                         PlayoffSeries.week_start == prev_week_start,
                     )
                 )
+                await record_series_status(
+                    s, guild_id, prev_series.status if prev_series else None, final_status
+                )
                 if prev_series:
                     prev_series.wins = wins_final
                     prev_series.losses = losses_final
                     prev_series.status = final_status
+                    prev_series.version += 1
                 else:
                     s.add(
                         PlayoffSeries(
@@ -855,31 +1814,109 @@ class Playoff(commands.Cog):
                             wins=wins_final,
                             losses=losses_final,
                             status=final_status,
+                            version=1,
                         )
                     )
                 await s.commit()
 
-            # Fetch per-person checkin rows for the detailed pillar breakdown
-            checkin_rows = list(
-                (
-                    await s.execute(
-                        select(PlayoffCheckin).where(
-                            PlayoffCheckin.guild_id == guild_id,
-                            PlayoffCheckin.checkin_date >= prev_week_start,
-                            PlayoffCheckin.checkin_date
-                            <= prev_week_start + timedelta(days=6),
-                        )
+        await channel.send(embed=await self.weekly_embed(guild_id, prev_week_start, persist=True))
+
+    async def weekly_embed(
+        self, guild_id: int, week_start: date, *, persist: bool = False
+    ) -> discord.Embed:
+        """The weekly review embed for *week_start*, rendered once per series version.
+
+        Looks in memory, then in ``weekly_summaries``.  Only the Sunday review
+        passes *persist*, storing the finished week so re-posting it later
+        costs one query; ``/playoff week`` renders without writing.
+        """
+        async with self.bot.db() as s:
+            version = await s.scalar(
+                select(PlayoffSeries.version).where(
+                    PlayoffSeries.guild_id == guild_id,
+                    PlayoffSeries.week_start == week_start,
+                )
+            )
+            key = (guild_id, week_start, version or 0)
+            data = self._weekly.get(key)
+            if data is not None and not persist:
+                return discord.Embed.from_dict(data)
+
+            stored = await s.scalar(
+                select(WeeklySummary).where(
+                    WeeklySummary.guild_id == guild_id,
+                    WeeklySummary.week_start == week_start,
+                )
+            )
+            if stored is not None and stored.version == key[2]:
+                data = json.loads(stored.embed)
+            else:
+                if data is None:
+                    data = (await self._render_week(s, guild_id, week_start)).to_dict()
+                if persist:
+                    if stored is None:
+                        stored = WeeklySummary(guild_id=guild_id, week_start=week_start)
+                        s.add(stored)
+                    stored.version = key[2]
+                    stored.embed = json.dumps(data)
+                    await s.commit()
+        self._weekly.put(key, data)
+        return discord.Embed.from_dict(data)
+
+    async def _render_week(self, s, guild_id: int, week_start: date) -> discord.Embed:
+        week_end = week_start + timedelta(days=6)
+        rows = await load_days(s, guild_id, week_start, week_end)
+        # Per-person checkin rows for the detailed pillar breakdown
+        checkin_rows = list(
+            (
+                await s.execute(
+                    select(PlayoffCheckin).where(
+                        PlayoffCheckin.guild_id == guild_id,
+                        PlayoffCheckin.checkin_date >= week_start,
+                        PlayoffCheckin.checkin_date <= week_end,
                     )
                 )
-                .scalars()
-                .all()
             )
+            .scalars()
+            .all()
+        )
+        players = players_for(await household_roster(self.bot.db, guild_id))
+        names = await pillar_names_on(self.bot.db, guild_id, [uid for uid, _ in players], week_end)
+        return build_weekly_embed(rows, week_start, checkin_rows, players, names)
+
+    @tasks.loop(hours=6)
+    async def reconcile_series(self) -> None:
+        """Finalize past weeks left "ongoing" (e.g. the bot was down that Sunday).
+
+        The first run happens at startup, so history is correct before anyone
+        asks for it; each run then rebuilds the status snapshots it may have
+        changed, which also warms them at startup.
+        """
+        async with self.bot.db() as s:
+            # The earliest local date anywhere (UTC-12), so no week is closed early
+            earliest = datetime.now(timezone.utc).date() - timedelta(days=1)
+            await reconcile_stale_series(s, earliest)
+        await self.warm_status([g.id for g in self.bot.guilds])
+
+    async def warm_status(self, guild_ids: t.Collection[int]) -> None:
+        """Rebuild the ``/playoff_status`` snapshot of each guild's household day.
+
+        Also loads each guild's pillar lists, so ``/checkin`` starts warm.
+        """
+        wanted = {}
+        for guild_id in guild_ids:
+            await guild_pillars(self.bot.db, guild_id)
+            clock = (await guild_clocks(self.bot.db, guild_id)).household
+            today = clock.today()
+            wanted[guild_id] = (today, clock.week_start_for(today))
+        async with self.bot.db() as s:
+            snaps = await load_status_snapshots(s, wanted)
+        for guild_id, snap in snaps.items():
+            self._status.invalidate(guild_id)
+            self._status.put(snap)
 
-        embed = build_weekly_embed(rows, prev_week_start, checkin_rows)
-        await channel.send(embed=embed)
-
-    @sunday_review.before_loop
-    async def before_sunday_review(self) -> None:
+    @reconcile_series.before_loop
+    async def before_reconcile_series(self) -> None:
         await self.bot.wait_until_ready()
 
 
@@ -0,0 +1,304 @@
+"""Recurring charges — bills like rent and Wi-Fi that post to the ledger on a schedule."""
+from __future__ import annotations
+
+import datetime as _dt
+import typing as t
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from sqlalchemy import select, update
+
+from src.cogs.budget import (
+    _format_money,
+    close_touched_ledger_months,
+    record_ledger_entries,
+)
+from src.db import RecurringCharge
+from src.utils import resolve_partner
+
+if t.TYPE_CHECKING:
+    from src.main import StavidBot
+
+CADENCES = ["monthly", "weekly"]
+
+# Monthly charges must fall on a day every month has, so next_due never drifts
+_MAX_MONTHLY_DAY = 28
+
+# Ledger category for every posting, so bills group together in /budget review
+RECURRING_CATEGORY = "bills"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _parse_ratio(value: str) -> Fraction | None:
+    """Parse a share like "1/3", "0.5" or "50%" into a Fraction in (0, 1]."""
+    raw = value.strip()
+    try:
+        ratio = Fraction(raw[:-1]) / 100 if raw.endswith("%") else Fraction(raw)
+    except (ValueError, ZeroDivisionError):
+        return None
+    if not 0 < ratio <= 1:
+        return None
+    return ratio
+
+
+def _share_cents(amount_cents: int, split_ratio: str) -> int:
+    """Return the debtor's share, rounded down to the cent like ``MONTHLY_RENT // 3``."""
+    ratio = _parse_ratio(split_ratio) or Fraction(1, 2)
+    return int(amount_cents * ratio)
+
+
+def _advance(due: _dt.date, cadence: str) -> _dt.date:
+    """Return the due date one period after *due*."""
+    if cadence == "weekly":
+        return due + _dt.timedelta(weeks=1)
+    if due.month == 12:
+        return due.replace(year=due.year + 1, month=1)
+    return due.replace(month=due.month + 1)
+
+
+def _idempotency_key(charge_id: int, due: _dt.date) -> str:
+    return f"recurring:{charge_id}:{due.isoformat()}"
+
+
+async def post_due_charges(s, today: _dt.date) -> int:
+    """Post every active charge due on or before *today*, across all guilds.
+
+    Missed periods are caught up.  All ledger rows go out in one batched
+    insert keyed by (charge, period), so re-running after a crash or retry
+    never double-charges.  ``next_due`` is advanced in the same transaction.
+    Caught-up periods in already-closed months are re-rolled afterwards.
+    Returns the number of ledger entries posted.
+    """
+    charges = (
+        await s.scalars(
+            select(RecurringCharge).where(
+                RecurringCharge.active.is_(True),
+                RecurringCharge.next_due <= today,
+            )
+        )
+    ).all()
+    if not charges:
+        return 0
+
+    rows: list[dict[str, t.Any]] = []
+    advanced: list[dict[str, t.Any]] = []
+    for charge in charges:
+        share = _share_cents(charge.amount_cents, charge.split_ratio)
+        due = charge.next_due
+        while due <= today:
+            rows.append(
+                {
+                    "guild_id": charge.guild_id,
+                    "creditor_id": charge.creditor_id,
+                    "debtor_id": charge.debtor_id,
+                    "amount_cents": share,
+                    "note": charge.name,
+                    "category": RECURRING_CATEGORY,
+                    "idempotency_key": _idempotency_key(charge.id, due),
+                    "created_at": datetime.combine(due, _dt.time.min, timezone.utc),
+                }
+            )
+            due = _advance(due, charge.cadence)
+        advanced.append({"id": charge.id, "next_due": due})
+
+    posted = await record_ledger_entries(s, rows)
+    await s.execute(update(RecurringCharge), advanced)
+    await s.commit()
+    if posted:
+        await close_touched_ledger_months(s, [r["created_at"] for r in rows])
+    return posted
+
+
+# ---------------------------------------------------------------------------
+# Cog
+# ---------------------------------------------------------------------------
+
+class Recurring(commands.Cog):
+    def __init__(self, bot: StavidBot) -> None:
+        self.bot = bot
+        self.post_charges.start()
+
+    def cog_unload(self) -> None:
+        self.post_charges.cancel()
+
+    recurring = app_commands.Group(name="recurring", description="Bills that post to the ledger automatically")
+
+    # ------------------------------------------------------------------
+    # /recurring add
+    # ------------------------------------------------------------------
+    @recurring.command(name="add", description="Add a bill you pay that your partner owes a share of")
+    @app_commands.describe(
+        name="What the bill is (used as the ledger note)",
+        amount="Full bill amount",
+        split="Your partner's share, e.g. 1/3, 0.5 or 50% (default: 1/2)",
+        cadence="How often it repeats (default: monthly)",
+        first_due="First due date, YYYY-MM-DD (default: today)",
+    )
+    @app_commands.choices(cadence=[
+        app_commands.Choice(name=c.capitalize(), value=c) for c in CADENCES
+    ])
+    async def add(
+        self,
+        interaction: discord.Interaction,
+        name: str,
+        amount: app_commands.Range[float, 0.01, 100000.0],
+        split: str = "1/2",
+        cadence: str = "monthly",
+        first_due: str = "",
+    ) -> None:
+        partner = await resolve_partner(interaction)
+        if not partner:
+            await interaction.response.send_message(
+                "❌ I couldn’t infer who owes the share (add them with `/household add`).",
+                ephemeral=True,
+            )
+            return
+        ratio = _parse_ratio(split)
+        if ratio is None:
+            await interaction.response.send_message(
+                "❌ Split must be a share between 0 and 1, e.g. `1/3` or `50%`.", ephemeral=True
+            )
+            return
+        if first_due:
+            try:
+                due = _dt.date.fromisoformat(first_due)
+            except ValueError:
+                await interaction.response.send_message(
+                    "❌ Invalid date — use YYYY-MM-DD (e.g. `2026-05-01`).", ephemeral=True
+                )
+                return
+        else:
+            due = datetime.now(timezone.utc).date()
+        if cadence == "monthly" and due.day > _MAX_MONTHLY_DAY:
+            await interaction.response.send_message(
+                f"❌ Monthly bills must be due on day {_MAX_MONTHLY_DAY} or earlier.", ephemeral=True
+            )
+            return
+
+        cents = int(Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100)
+        async with self.bot.db() as s:
+            s.add(
+                RecurringCharge(
+                    guild_id=interaction.guild_id or 0,
+                    name=name,
+                    amount_cents=cents,
+                    split_ratio=str(ratio),
+                    creditor_id=interaction.user.id,
+                    debtor_id=partner.id,
+                    cadence=cadence,
+                    next_due=due,
+                )
+            )
+            await s.commit()
+
+        await interaction.response.send_message(
+            f"🔁 **{name}** added — {_format_money(cents)} {cadence}, "
+            f"{partner.mention} owes {ratio} ({_format_money(_share_cents(cents, str(ratio)))}).\n"
+            f"First posts on **{due}**."
+        )
+
+    # ------------------------------------------------------------------
+    # /recurring list
+    # ------------------------------------------------------------------
+    @recurring.command(name="list", description="Show recurring bills")
+    async def list(self, interaction: discord.Interaction) -> None:
+        async with self.bot.db() as s:
+            rows = (
+                await s.scalars(
+                    select(RecurringCharge)
+                    .where(
+                        RecurringCharge.guild_id == interaction.guild_id,
+                        RecurringCharge.active.is_(True),
+                    )
+                    .order_by(RecurringCharge.next_due)
+                )
+            ).all()
+
+        if not rows:
+            await interaction.response.send_message(
+                "No recurring bills yet. Add one with `/recurring add`.", ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(title="🔁 Recurring Bills", color=discord.Color.blurple())
+        for charge in rows[:25]:
+            embed.add_field(
+                name=f"{charge.name} — {_format_money(charge.amount_cents)} {charge.cadence}",
+                value=(
+                    f"<@{charge.debtor_id}> owes <@{charge.creditor_id}> {charge.split_ratio} "
+                    f"({_format_money(_share_cents(charge.amount_cents, charge.split_ratio))})\n"
+                    f"Next due {charge.next_due}"
+                ),
+                inline=False,
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    # ------------------------------------------------------------------
+    # /recurring remove
+    # ------------------------------------------------------------------
+    @recurring.command(name="remove", description="Stop a recurring bill")
+    @app_commands.describe(charge="Bill to stop")
+    async def remove(self, interaction: discord.Interaction, charge: str) -> None:
+        try:
+            charge_id = int(charge)
+        except ValueError:
+            await interaction.response.send_message("❌ Bill not found.", ephemeral=True)
+            return
+
+        async with self.bot.db() as s:
+            row = await s.get(RecurringCharge, charge_id)
+            if row is None or row.guild_id != interaction.guild_id or not row.active:
+                await interaction.response.send_message("❌ Bill not found.", ephemeral=True)
+                return
+            row.active = False
+            name = row.name
+            await s.commit()
+
+        await interaction.response.send_message(f"🗑️ **{name}** will no longer post to the ledger.")
+
+    @remove.autocomplete("charge")
+    async def remove_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        async with self.bot.db() as s:
+            rows = (
+                await s.scalars(
+                    select(RecurringCharge)
+                    .where(
+                        RecurringCharge.guild_id == interaction.guild_id,
+                        RecurringCharge.active.is_(True),
+                    )
+                    .order_by(RecurringCharge.name)
+                    .limit(25)
+                )
+            ).all()
+        return [
+            app_commands.Choice(name=r.name, value=str(r.id))
+            for r in rows
+            if not current or current.lower() in r.name.lower()
+        ]
+
+    # ------------------------------------------------------------------ #
+    # Background task                                                      #
+    # ------------------------------------------------------------------ #
+
+    @tasks.loop(hours=1)
+    async def post_charges(self) -> None:
+        """Post all due recurring charges for every guild."""
+        async with self.bot.db() as s:
+            await post_due_charges(s, datetime.now(timezone.utc).date())
+
+    @post_charges.before_loop
+    async def before_post_charges(self) -> None:
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Recurring(bot))
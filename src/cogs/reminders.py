@@ -12,7 +12,7 @@ from discord.ext import commands
 from sqlalchemy import case, func, select
 
 from src.db import ReminderEntry
-from src.utils import DAVID_ID, STEPH_ID, resolve_partner
+from src.utils import resolve_partner
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
@@ -33,7 +33,7 @@ class Reminder(commands.Cog):
         partner = await resolve_partner(interaction)
         if not partner:
             return await interaction.response.send_message(
-                "❌ I couldn’t infer who to remind from (set `PARTNER_IDS`).",
+                "❌ I couldn’t infer who to remind from (add them with `/household add`).",
                 ephemeral=True,
             )
         async with self.bot.db() as s:
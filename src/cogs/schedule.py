@@ -0,0 +1,313 @@
+"""Per-guild schedules for the check-in ping, weekly review and supply check.
+
+The cog owns a ``FireQueue`` of every guild's next fire times.  It sleeps
+until the earliest one, then dispatches ``on_checkin_ping``,
+``on_weekly_review`` or ``on_supply_check`` with a list of ``DueJob``s for
+the cogs that do the work.
+"""
+from __future__ import annotations
+
+import asyncio
+import datetime as _dt
+import logging
+import typing as t
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from sqlalchemy import select
+
+from src.clock import SUNDAY, clocks
+from src.db import HouseholdMember
+from src.scheduler import (
+    CHECKIN_PING,
+    JOBS,
+    SUPPLY_CHECK,
+    WEEKLY_REVIEW,
+    DueJob,
+    FireQueue,
+    env_channel_id,
+    guild_settings_row,
+    job_specs,
+    load_settings,
+    next_fire,
+    zone,
+)
+from src.utils import load_roster
+
+if t.TYPE_CHECKING:
+    from src.main import StavidBot
+
+# Upper bound on one sleep, so a suspended host catches up within the hour
+MAX_SLEEP = 3600
+
+_JOB_LABELS = {
+    CHECKIN_PING: "Check-in reminder",
+    WEEKLY_REVIEW: "Weekly review",
+    SUPPLY_CHECK: "Supply check",
+}
+_JOB_CHOICES = [app_commands.Choice(name=label, value=job) for job, label in _JOB_LABELS.items()]
+_WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+_WEEKDAY_CHOICES = [app_commands.Choice(name=name, value=i) for i, name in enumerate(_WEEKDAYS)]
+
+
+def parse_time(text: str) -> _dt.time | None:
+    """Parse ``HH:MM`` (24-hour); None if malformed."""
+    try:
+        return _dt.datetime.strptime(text.strip(), "%H:%M").time()
+    except ValueError:
+        return None
+
+
+class Schedule(commands.Cog):
+    def __init__(self, bot: StavidBot) -> None:
+        self.bot = bot
+        self._queue = FireQueue()
+        self._wake = asyncio.Event()
+        self._runner: asyncio.Task | None = None
+
+    async def cog_load(self) -> None:
+        self._runner = asyncio.create_task(self._run())
+
+    def cog_unload(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+
+    schedule = app_commands.Group(name="schedule", description="When and where reminders post")
+
+    # ------------------------------------------------------------------ #
+    # Scheduler                                                            #
+    # ------------------------------------------------------------------ #
+
+    def _fallback_for(self, guild_id: int) -> int | None:
+        """CHECKIN_CHANNEL_ID, but only for the guild that channel is in."""
+        channel_id = env_channel_id()
+        channel = self.bot.get_channel(channel_id) if channel_id else None
+        return channel_id if getattr(getattr(channel, "guild", None), "id", None) == guild_id else None
+
+    async def reschedule(self, guild_ids: t.Collection[int]) -> None:
+        """Recompute the next fire time of every job for *guild_ids*."""
+        now = _dt.datetime.now(_dt.timezone.utc)
+        async with self.bot.db() as s:
+            settings = await load_settings(s, guild_ids)
+        for guild_id in guild_ids:
+            for job, spec in job_specs(settings.get(guild_id)).items():
+                self._queue.schedule(guild_id, job, next_fire(spec, now))
+        self._wake.set()
+
+    async def _fire(self, due: list[tuple[_dt.datetime, int, str]]) -> None:
+        """Dispatch due jobs grouped by job, then queue each one's next run."""
+        async with self.bot.db() as s:
+            settings = await load_settings(s, {guild_id for _, guild_id, _ in due})
+        by_job: dict[str, list[DueJob]] = {}
+        for fire_at, guild_id, job in due:
+            spec = job_specs(settings.get(guild_id), self._fallback_for(guild_id))[job]
+            local_day = fire_at.astimezone(spec.tz).date()
+            by_job.setdefault(job, []).append(DueJob(guild_id, local_day, spec.channel_id))
+            self._queue.schedule(guild_id, job, next_fire(spec, fire_at))
+        for job, jobs in by_job.items():
+            self.bot.dispatch(job, jobs)
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        await self.reschedule([g.id for g in self.bot.guilds])
+        while True:
+            self._wake.clear()
+            try:
+                due = self._queue.pop_due(_dt.datetime.now(_dt.timezone.utc))
+                if due:
+                    await self._fire(due)
+            except Exception:
+                logging.exception("Scheduler tick failed")
+            next_at = self._queue.next_fire_at()
+            timeout = MAX_SLEEP
+            if next_at is not None:
+                wait = (next_at - _dt.datetime.now(_dt.timezone.utc)).total_seconds()
+                timeout = min(MAX_SLEEP, max(0.0, wait))
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        await self.reschedule([guild.id])
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._queue.cancel(guild.id)
+
+    # ------------------------------------------------------------------ #
+    # Commands                                                             #
+    # ------------------------------------------------------------------ #
+
+    async def _can_edit(self, interaction: discord.Interaction) -> bool:
+        """Anyone may configure a guild with no household; after that only members."""
+        async with self.bot.db() as s:
+            roster = await load_roster(s, interaction.guild_id or 0)
+        if not roster.member_ids or roster.is_member(interaction.user.id):
+            return True
+        await interaction.response.send_message(
+            "❌ Only household members can change the schedule.", ephemeral=True
+        )
+        return False
+
+    @schedule.command(name="show", description="Show when and where each reminder posts")
+    async def show(self, interaction: discord.Interaction) -> None:
+        guild_id = interaction.guild_id or 0
+        async with self.bot.db() as s:
+            row = (await load_settings(s, [guild_id])).get(guild_id)
+        specs = job_specs(row, self._fallback_for(guild_id))
+        lines = []
+        for job in JOBS:
+            spec = specs[job]
+            when = "Daily" if spec.weekday is None else _WEEKDAYS[spec.weekday] + "s"
+            where = f"<#{spec.channel_id}>" if spec.channel_id else "_no channel set_"
+            lines.append(f"**{_JOB_LABELS[job]}** — {when} at {spec.at:%H:%M} → {where}")
+        embed = discord.Embed(
+            title="⏰ Schedule",
+            description="\n".join(lines),
+            color=discord.Color.blurple(),
+        )
+        week_start = row.week_start if row is not None else SUNDAY
+        embed.set_footer(
+            text=f"Time zone: {specs[CHECKIN_PING].tz.key} · Weeks start on {_WEEKDAYS[week_start]}"
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @schedule.command(name="timezone", description="Set the time zone reminders follow")
+    @app_commands.describe(name="IANA time zone, e.g. America/Chicago or Europe/London")
+    async def timezone(self, interaction: discord.Interaction, name: str) -> None:
+        if zone(name).key != name.strip():
+            await interaction.response.send_message(
+                f"❌ Unknown time zone `{name}`. Use a name like `America/Chicago`.",
+                ephemeral=True,
+            )
+            return
+        if not await self._can_edit(interaction):
+            return
+        guild_id = interaction.guild_id or 0
+        async with self.bot.db() as s:
+            row = await guild_settings_row(s, guild_id)
+            row.timezone = name.strip()
+            await s.commit()
+        clocks.invalidate(guild_id)
+        await self.reschedule([guild_id])
+        await interaction.response.send_message(f"🌍 Reminders now follow **{name.strip()}**.")
+
+    @schedule.command(name="my_timezone", description="Use your own time zone for your check-in day")
+    @app_commands.describe(name="IANA time zone (leave empty to follow the household)")
+    async def my_timezone(self, interaction: discord.Interaction, name: str = "") -> None:
+        name = name.strip()
+        if name and zone(name).key != name:
+            await interaction.response.send_message(
+                f"❌ Unknown time zone `{name}`. Use a name like `America/Chicago`.",
+                ephemeral=True,
+            )
+            return
+        guild_id = interaction.guild_id or 0
+        async with self.bot.db() as s:
+            member = await s.scalar(
+                select(HouseholdMember).where(
+                    HouseholdMember.guild_id == guild_id,
+                    HouseholdMember.user_id == interaction.user.id,
+                )
+            )
+            if member is None:
+                await interaction.response.send_message(
+                    "❌ Join the household first with `/household add`.", ephemeral=True
+                )
+                return
+            member.timezone = name or None
+            await s.commit()
+        clocks.invalidate(guild_id)
+        text = f"your days now follow **{name}**" if name else "you follow the household time zone"
+        await interaction.response.send_message(f"🌍 Got it — {text}.", ephemeral=True)
+
+    @schedule.command(name="week_start", description="Set the day playoff and supply weeks start")
+    @app_commands.describe(weekday="First day of the week")
+    @app_commands.choices(weekday=_WEEKDAY_CHOICES)
+    async def week_start(
+        self, interaction: discord.Interaction, weekday: app_commands.Choice[int]
+    ) -> None:
+        if not await self._can_edit(interaction):
+            return
+        guild_id = interaction.guild_id or 0
+        async with self.bot.db() as s:
+            row = await guild_settings_row(s, guild_id)
+            row.week_start = weekday.value
+            await s.commit()
+        clocks.invalidate(guild_id)
+        await interaction.response.send_message(f"📅 Weeks now start on **{weekday.name}**.")
+
+    @schedule.command(name="time", description="Set when a reminder posts")
+    @app_commands.describe(
+        job="Which reminder",
+        at="Local time, 24-hour HH:MM",
+        weekday="Day of the week (weekly reminders only)",
+    )
+    @app_commands.choices(job=_JOB_CHOICES, weekday=_WEEKDAY_CHOICES)
+    async def time(
+        self,
+        interaction: discord.Interaction,
+        job: app_commands.Choice[str],
+        at: str,
+        weekday: app_commands.Choice[int] | None = None,
+    ) -> None:
+        parsed = parse_time(at)
+        if parsed is None:
+            await interaction.response.send_message(
+                "❌ Use 24-hour `HH:MM`, e.g. `21:30`.", ephemeral=True
+            )
+            return
+        if not await self._can_edit(interaction):
+            return
+        guild_id = interaction.guild_id or 0
+        async with self.bot.db() as s:
+            row = await guild_settings_row(s, guild_id)
+            if job.value == CHECKIN_PING:
+                row.ping_time = parsed
+            elif job.value == WEEKLY_REVIEW:
+                row.review_time = parsed
+                if weekday is not None:
+                    row.review_weekday = weekday.value
+            else:
+                row.supply_time = parsed
+                if weekday is not None:
+                    row.supply_weekday = weekday.value
+            await s.commit()
+        await self.reschedule([guild_id])
+        await interaction.response.send_message(
+            f"⏰ **{job.name}** will post at {parsed:%H:%M}"
+            + (f" on {weekday.name}s." if weekday is not None and job.value != CHECKIN_PING else ".")
+        )
+
+    @schedule.command(name="channel", description="Set where a reminder posts")
+    @app_commands.describe(
+        job="Which reminder",
+        channel="Target channel (leave empty to use the check-in channel)",
+    )
+    @app_commands.choices(job=_JOB_CHOICES)
+    async def channel(
+        self,
+        interaction: discord.Interaction,
+        job: app_commands.Choice[str],
+        channel: discord.TextChannel | None = None,
+    ) -> None:
+        if not await self._can_edit(interaction):
+            return
+        column = {
+            CHECKIN_PING: "checkin_channel_id",
+            WEEKLY_REVIEW: "review_channel_id",
+            SUPPLY_CHECK: "supply_channel_id",
+        }[job.value]
+        async with self.bot.db() as s:
+            row = await guild_settings_row(s, interaction.guild_id or 0)
+            setattr(row, column, channel.id if channel else None)
+            await s.commit()
+        where = channel.mention if channel else "the default channel"
+        await interaction.response.send_message(f"📣 **{job.name}** will post to {where}.")
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Schedule(bot))
@@ -0,0 +1,86 @@
+"""``/search`` — one ranked query across every list in the bot."""
+from __future__ import annotations
+
+import typing as t
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from src.paging import EMBED_MAX_CHARS, FIELD_MAX_CHARS, clip
+from src.search import SearchHit, query_terms, search
+
+if t.TYPE_CHECKING:
+    from src.main import StavidBot
+
+# Heading per search_documents kind, and the command that opens that list
+_KIND_LABEL: dict[str, tuple[str, str]] = {
+    "shopping": ("🛒 Shopping", "/shopping list"),
+    "watch": ("🎬 Watchlist", "/watch list"),
+    "bucket": ("⭐ Bucket list", "/bucket list"),
+    "outing": ("📍 Outings", "/outing list"),
+    "datenight": ("💑 Date night ideas", "/wish list"),
+    "datelog": ("📖 Date night log", "/datenight history"),
+    "special": ("🎂 Special dates", "/special list"),
+    "ledger": ("💸 Ledger notes", "/ledger view"),
+}
+
+_SNIPPET = 80
+_TITLE = 200
+
+
+def _hit_line(hit: SearchHit) -> str:
+    title = clip(hit.title or "(untitled)", _TITLE)
+    if not hit.body:
+        return f"• **{title}**"
+    return f"• **{title}** — {clip(hit.body, _SNIPPET)}"
+
+
+def search_embed(query: str, hits: t.Mapping[str, t.Sequence[SearchHit]]) -> discord.Embed:
+    """Results grouped by list, lists in order of their best match.
+
+    Hits that would overflow a field, and lists that would overflow the
+    embed, are left off whole rather than cut mid-line.
+    """
+    embed = discord.Embed(title=f"🔎 “{query}”", color=discord.Color.blurple())
+    for kind, kind_hits in hits.items():
+        label, command = _KIND_LABEL.get(kind, (kind.capitalize(), ""))
+        lines: list[str] = []
+        for hit in kind_hits:
+            line = _hit_line(hit)
+            if len("\n".join([*lines, line])) > FIELD_MAX_CHARS:
+                break
+            lines.append(line)
+        name = label + (f" · {command}" if command else "")
+        if len(embed) + len(name) + len("\n".join(lines)) > EMBED_MAX_CHARS:
+            break
+        embed.add_field(name=name, value="\n".join(lines), inline=False)
+    return embed
+
+
+class Search(commands.Cog):
+    def __init__(self, bot: StavidBot) -> None:
+        self.bot = bot
+
+    @app_commands.command(name="search", description="Search every list at once")
+    @app_commands.describe(query="Words to look for (prefixes work: 'pas' finds 'pasta')")
+    async def search(
+        self, interaction: discord.Interaction, query: app_commands.Range[str, 1, 100]
+    ) -> None:
+        if not query_terms(query):
+            await interaction.response.send_message(
+                "❌ Search for at least one word.", ephemeral=True
+            )
+            return
+        async with self.bot.db() as s:
+            hits = await search(s, interaction.guild_id or 0, query)
+        if not hits:
+            await interaction.response.send_message(
+                f"Nothing matches “{query}”.", ephemeral=True
+            )
+            return
+        await interaction.response.send_message(embed=search_embed(query, hits), ephemeral=True)
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Search(bot))
@@ -13,6 +13,7 @@ from discord.ext import commands
 from sqlalchemy import select
 
 from src.db import ShoppingItem
+from src.paging import FIELD_MAX_CHARS, FIELD_NAME_MAX_CHARS, KeysetPager, clip
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
@@ -161,49 +162,46 @@ class Shopping(commands.Cog):
 
     @shopping.command(name="list", description="Show the current shopping list")
     async def list(self, interaction: discord.Interaction) -> None:
-        async with self.bot.db() as s:
-            rows = (
-                await s.scalars(
-                    select(ShoppingItem)
-                    .where(
-                        ShoppingItem.guild_id == interaction.guild_id,
-                        ShoppingItem.bought == False,  # noqa: E712
-                    )
-                    .order_by(ShoppingItem.created_at)
+        q = select(ShoppingItem).where(
+            ShoppingItem.guild_id == interaction.guild_id,
+            ShoppingItem.bought == False,  # noqa: E712
+        )
+
+        def render(rows: list[ShoppingItem], _) -> discord.Embed:
+            embed = discord.Embed(
+                title="🛒 Shopping List",
+                color=discord.Color.green(),
+            )
+
+            # Use the page's first item image as the embed thumbnail if available
+            first_with_image = next((r for r in rows if r.og_image), None)
+            if first_with_image:
+                embed.set_thumbnail(url=first_with_image.og_image)
+
+            for item in rows:
+                display_name = item.og_title or item.name
+                value_parts = [f"Added by <@{item.added_by}>"]
+                if item.og_price:
+                    value_parts.append(f"**{item.og_price}**")
+                if item.note:
+                    value_parts.append(f"_{item.note}_")
+                if item.link:
+                    value_parts.append(f"[Link]({item.link})")
+                embed.add_field(
+                    name=clip(display_name, FIELD_NAME_MAX_CHARS),
+                    value=clip("\n".join(value_parts), FIELD_MAX_CHARS),
+                    inline=False,
                 )
-            ).all()
+            return embed
 
-        if not rows:
+        view = KeysetPager(self.bot.db, q, (ShoppingItem.created_at, ShoppingItem.id), render)
+        await view.load()
+        if not view.rows:
             await interaction.response.send_message(
                 "Shopping list is empty!", ephemeral=False
             )
             return
-
-        embed = discord.Embed(
-            title="🛒 Shopping List",
-            color=discord.Color.green(),
-        )
-
-        # Use the first item's image as the embed thumbnail if available
-        first_with_image = next((r for r in rows if r.og_image), None)
-        if first_with_image:
-            embed.set_thumbnail(url=first_with_image.og_image)
-
-        for item in rows:
-            display_name = item.og_title or item.name
-            value_parts = [f"Added by <@{item.added_by}>"]
-            if item.og_price:
-                value_parts.append(f"**{item.og_price}**")
-            if item.note:
-                value_parts.append(f"_{item.note}_")
-            if item.link:
-                value_parts.append(f"[Link]({item.link})")
-            embed.add_field(
-                name=display_name,
-                value="\n".join(value_parts),
-                inline=False,
-            )
-        await interaction.response.send_message(embed=embed, ephemeral=False)
+        await interaction.response.send_message(embed=view.embed(), view=view, ephemeral=False)
 
     @shopping.command(name="remove", description="Mark an item as bought and remove it")
     @app_commands.describe(item="Item to remove")
@@ -3,18 +3,18 @@ from __future__ import annotations
 
 import asyncio
 import json
-import os
 import typing as t
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, timedelta
 from pathlib import Path
-from zoneinfo import ZoneInfo
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 from sqlalchemy import func, select
 
+from src.clock import clock_for
 from src.db import SupplyCheckResult, SupplyItem
+from src.scheduler import DueJob
 
 _CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "supply_items.json"
 
@@ -51,14 +51,6 @@ async def seed_supply_items(session, guild_id: int, names: list[str]) -> int:
 if t.TYPE_CHECKING:
     from src.main import StavidBot
 
-ET = ZoneInfo("America/New_York")
-
-
-def _this_sunday(d: date) -> date:
-    """Return the most recent Sunday on or before d."""
-    return d - timedelta(days=(d.weekday() + 1) % 7)
-
-
 def _build_status_embed(
     items: list[SupplyItem],
     flagged_item_ids: set[int],
@@ -219,11 +211,6 @@ class SupplySelectMenu(discord.ui.Select):
 class Supplies(commands.Cog):
     def __init__(self, bot: StavidBot) -> None:
         self.bot = bot
-        self._checked_sundays: set[date] = set()
-        self.weekly_supply_check.start()
-
-    def cog_unload(self) -> None:
-        self.weekly_supply_check.cancel()
 
     async def cog_load(self) -> None:
         asyncio.create_task(self._seed_default_items())
@@ -242,6 +229,11 @@ class Supplies(commands.Cog):
     # Helpers                                                              #
     # ------------------------------------------------------------------ #
 
+    async def _this_week(self, guild_id: int) -> date:
+        """First day of the household's current week, in its time zone."""
+        clock = await clock_for(self.bot.db, guild_id)
+        return clock.week_start_for(clock.today())
+
     async def _active_items(self, guild_id: int, session) -> list[SupplyItem]:
         return list(
             (
@@ -373,7 +365,7 @@ class Supplies(commands.Cog):
     )
     async def supply_list(self, interaction: discord.Interaction) -> None:
         guild_id = interaction.guild_id or 0
-        four_weeks_ago = _this_sunday(datetime.now(ET).date()) - timedelta(weeks=4)
+        four_weeks_ago = await self._this_week(guild_id) - timedelta(weeks=4)
 
         async with self.bot.db() as s:
             items = await self._active_items(guild_id, s)
@@ -425,7 +417,7 @@ class Supplies(commands.Cog):
     @app_commands.autocomplete(name=_item_autocomplete)
     async def supply_restock(self, interaction: discord.Interaction, name: str) -> None:
         guild_id = interaction.guild_id or 0
-        week_of = _this_sunday(datetime.now(ET).date())
+        week_of = await self._this_week(guild_id)
 
         async with self.bot.db() as s:
             item = await s.scalar(
@@ -477,7 +469,7 @@ class Supplies(commands.Cog):
     )
     async def supply_check(self, interaction: discord.Interaction) -> None:
         guild_id = interaction.guild_id or 0
-        week_of = _this_sunday(datetime.now(ET).date())
+        week_of = await self._this_week(guild_id)
 
         async with self.bot.db() as s:
             items = await self._active_items(guild_id, s)
@@ -506,35 +498,21 @@ class Supplies(commands.Cog):
         await interaction.response.send_message(embed=embed, view=view)
 
     # ------------------------------------------------------------------ #
-    # Background task                                                      #
+    # Scheduled job                                                        #
     # ------------------------------------------------------------------ #
 
-    @tasks.loop(hours=1)
-    async def weekly_supply_check(self) -> None:
-        """Every Sunday at 10am ET, post the supply checklist to the channel."""
-        now_et = datetime.now(ET)
-        today = now_et.date()
-
-        # weekday() == 6 is Sunday; fire at 10:00
-        if now_et.weekday() != 6 or now_et.hour != 10 or today in self._checked_sundays:
-            return
-        self._checked_sundays.add(today)
-
-        channel_id = os.getenv("CHECKIN_CHANNEL_ID")
-        if not channel_id or not channel_id.isdigit():
-            return
-        channel = self.bot.get_channel(int(channel_id))
-        if channel is None:
-            return
-
-        guild_id = channel.guild.id if channel.guild else 0
-        week_of = _this_sunday(today)
-        embed, view = await self._build_checklist_embed(guild_id, week_of)
-        await channel.send(embed=embed, view=view)
-
-    @weekly_supply_check.before_loop
-    async def before_weekly_supply_check(self) -> None:
-        await self.bot.wait_until_ready()
+    @commands.Cog.listener()
+    async def on_supply_check(self, due: list[DueJob]) -> None:
+        """At each guild's supply-check time, post the checklist to its channel."""
+        for job in due:
+            channel = self.bot.get_channel(job.channel_id) if job.channel_id else None
+            if channel is None:
+                continue
+            clock = await clock_for(self.bot.db, job.guild_id)
+            embed, view = await self._build_checklist_embed(
+                job.guild_id, clock.week_start_for(job.day)
+            )
+            await channel.send(embed=embed, view=view)
 
 
 async def setup(bot: commands.Bot) -> None:
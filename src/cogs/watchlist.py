@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import random
 import typing as t
 from datetime import datetime, timezone
 
 import discord
 from discord import app_commands
 from discord.ext import commands
-from sqlalchemy import select
+from sqlalchemy import case, delete, select
 
-from src.db import WatchlistItem
-from src.utils import DAVID_ID, STEPH_ID
+from src.db import WatchlistItem, WatchlistRating
+from src.paging import FIELD_MAX_CHARS, FIELD_NAME_MAX_CHARS, KeysetPager, clip
+from src.sampling import weighted_choice
+from src.utils import household_roster, member_label
 
 if t.TYPE_CHECKING:
     from src.main import StavidBot
@@ -24,12 +25,42 @@ def _stars(rating: int | None) -> str:
     return "⭐" * rating + "☆" * (5 - rating)
 
 
-def _user_label(user_id: int) -> str:
-    if user_id == DAVID_ID:
-        return "David"
-    if user_id == STEPH_ID:
-        return "Steph"
-    return f"<@{user_id}>"
+async def _save_rating(s, item_id: int, user_id: int, rating: int | None, review: str) -> None:
+    """Set *user_id*'s rating and/or notes on a title; blanks leave the old value."""
+    row = await s.scalar(
+        select(WatchlistRating).where(
+            WatchlistRating.item_id == item_id,
+            WatchlistRating.user_id == user_id,
+        )
+    )
+    if row is None:
+        row = WatchlistRating(item_id=item_id, user_id=user_id)
+        s.add(row)
+    if rating is not None:
+        row.rating = rating
+    if review:
+        row.notes = review
+
+
+def _tonight_weight(caller_id: int):
+    """Pick weight for ``/watch tonight``: titles the other person added count double.
+
+    Surfaces each other's picks.
+    """
+    return case((WatchlistItem.added_by != caller_id, 2), else_=1)
+
+
+async def _ratings_by_item(s, item_ids: list[int]) -> dict[int, dict[int, WatchlistRating]]:
+    """Return {item_id: {user_id: rating}} for *item_ids* in one query."""
+    if not item_ids:
+        return {}
+    rows = (
+        await s.scalars(select(WatchlistRating).where(WatchlistRating.item_id.in_(item_ids)))
+    ).all()
+    out: dict[int, dict[int, WatchlistRating]] = {}
+    for r in rows:
+        out.setdefault(r.item_id, {})[r.user_id] = r
+    return out
 
 
 class Watchlist(commands.Cog):
@@ -95,51 +126,69 @@ class Watchlist(commands.Cog):
         interaction: discord.Interaction,
         status: str = "unwatched",
     ) -> None:
-        async with self.bot.db() as s:
-            q = select(WatchlistItem).where(WatchlistItem.guild_id == interaction.guild_id)
-            if status == "unwatched":
-                q = q.where(WatchlistItem.watched == False)  # noqa: E712
-            elif status == "watched":
-                q = q.where(WatchlistItem.watched == True)  # noqa: E712
-            q = q.order_by(WatchlistItem.created_at)
-            rows = (await s.scalars(q)).all()
-
-        if not rows:
-            labels = {"unwatched": "unwatched titles", "watched": "watched titles", "all": "titles"}
-            await interaction.response.send_message(
-                f"No {labels[status]} in the watchlist!", ephemeral=True
-            )
-            return
+        roster = await household_roster(self.bot.db, interaction.guild_id or 0)
+        q = select(WatchlistItem).where(WatchlistItem.guild_id == interaction.guild_id)
+        if status == "unwatched":
+            q = q.where(WatchlistItem.watched == False)  # noqa: E712
+        elif status == "watched":
+            q = q.where(WatchlistItem.watched == True)  # noqa: E712
 
         embed_titles = {
             "unwatched": "🎬 Watchlist",
             "watched": "✅ Watched",
             "all": "🎬 All Titles",
         }
-        embed = discord.Embed(title=embed_titles[status], color=discord.Color.purple())
-
-        for item in rows[:25]:
-            emoji = _TYPE_EMOJI.get(item.media_type, "🎬")
-            field_name = f"{'✅ ' if item.watched else ''}{emoji} {item.title}"
-            parts = [f"Added by {_user_label(item.added_by)}"]
-            if item.watched:
-                parts.append(
-                    f"David: {_stars(item.david_rating)}  Steph: {_stars(item.steph_rating)}"
-                )
-                if item.david_notes:
-                    parts.append(f"David: _{item.david_notes}_")
-                if item.steph_notes:
-                    parts.append(f"Steph: _{item.steph_notes}_")
-            if item.note:
-                parts.append(f"_{item.note}_")
-            if item.link:
-                parts.append(f"[Link]({item.link})")
-            embed.add_field(name=field_name, value="\n".join(parts), inline=False)
-
-        if len(rows) > 25:
-            embed.set_footer(text=f"Showing 25 of {len(rows)} titles")
 
-        await interaction.response.send_message(embed=embed)
+        def render(rows: list[WatchlistItem], ratings) -> discord.Embed:
+            ratings = ratings or {}
+            embed = discord.Embed(title=embed_titles[status], color=discord.Color.purple())
+            for item in rows:
+                emoji = _TYPE_EMOJI.get(item.media_type, "🎬")
+                field_name = f"{'✅ ' if item.watched else ''}{emoji} {item.title}"
+                parts = [f"Added by {member_label(roster, item.added_by)}"]
+                if item.watched:
+                    item_ratings = ratings.get(item.id, {})
+                    # Every household member, plus anyone who rated before leaving it
+                    raters = list(roster.member_ids) + [
+                        uid for uid in item_ratings if uid not in roster.member_ids
+                    ]
+                    if raters:
+                        parts.append(
+                            "  ".join(
+                                f"{member_label(roster, uid)}: "
+                                f"{_stars(item_ratings[uid].rating if uid in item_ratings else None)}"
+                                for uid in raters
+                            )
+                        )
+                    for uid in raters:
+                        if uid in item_ratings and item_ratings[uid].notes:
+                            parts.append(f"{member_label(roster, uid)}: _{item_ratings[uid].notes}_")
+                if item.note:
+                    parts.append(f"_{item.note}_")
+                if item.link:
+                    parts.append(f"[Link]({item.link})")
+                embed.add_field(
+                    name=clip(field_name, FIELD_NAME_MAX_CHARS),
+                    value=clip("\n".join(parts), FIELD_MAX_CHARS),
+                    inline=False,
+                )
+            return embed
+
+        view = KeysetPager(
+            self.bot.db,
+            q,
+            (WatchlistItem.created_at, WatchlistItem.id),
+            render,
+            load_extra=lambda s, rows: _ratings_by_item(s, [r.id for r in rows if r.watched]),
+        )
+        await view.load()
+        if not view.rows:
+            labels = {"unwatched": "unwatched titles", "watched": "watched titles", "all": "titles"}
+            await interaction.response.send_message(
+                f"No {labels[status]} in the watchlist!", ephemeral=True
+            )
+            return
+        await interaction.response.send_message(embed=view.embed(), view=view)
 
     # ------------------------------------------------------------------
     # /watch done
@@ -176,16 +225,7 @@ class Watchlist(commands.Cog):
             if not row.watched:
                 row.watched = True
                 row.watched_at = datetime.now(timezone.utc)
-            if interaction.user.id == DAVID_ID:
-                if rating is not None:
-                    row.david_rating = rating
-                if review:
-                    row.david_notes = review
-            else:
-                if rating is not None:
-                    row.steph_rating = rating
-                if review:
-                    row.steph_notes = review
+            await _save_rating(s, row.id, interaction.user.id, rating, review)
             await s.commit()
             title = row.title
 
@@ -257,16 +297,7 @@ class Watchlist(commands.Cog):
                     "❌ Watched title not found.", ephemeral=True
                 )
                 return
-            if interaction.user.id == DAVID_ID:
-                if rating is not None:
-                    row.david_rating = rating
-                if review:
-                    row.david_notes = review
-            else:
-                if rating is not None:
-                    row.steph_rating = rating
-                if review:
-                    row.steph_notes = review
+            await _save_rating(s, row.id, interaction.user.id, rating, review)
             await s.commit()
             title = row.title
 
@@ -312,6 +343,7 @@ class Watchlist(commands.Cog):
         interaction: discord.Interaction,
         media_type: str = "any",
     ) -> None:
+        roster = await household_roster(self.bot.db, interaction.guild_id or 0)
         async with self.bot.db() as s:
             q = select(WatchlistItem).where(
                 WatchlistItem.guild_id == interaction.guild_id,
@@ -319,9 +351,9 @@ class Watchlist(commands.Cog):
             )
             if media_type != "any":
                 q = q.where(WatchlistItem.media_type == media_type)
-            rows = (await s.scalars(q)).all()
+            pick, total = await weighted_choice(s, q, _tonight_weight(interaction.user.id))
 
-        if not rows:
+        if pick is None:
             label = f" {media_type}s" if media_type != "any" else ""
             await interaction.response.send_message(
                 f"No unwatched{label} in the watchlist! Add something with `/watch add`.",
@@ -329,11 +361,6 @@ class Watchlist(commands.Cog):
             )
             return
 
-        # Items added by the other person get 2× weight — surface each other's picks
-        caller_id = interaction.user.id
-        weights = [2 if r.added_by != caller_id else 1 for r in rows]
-        pick = random.choices(rows, weights=weights, k=1)[0]
-
         emoji = _TYPE_EMOJI.get(pick.media_type, "🎬")
         embed = discord.Embed(
             title=f"{emoji} Tonight's Pick",
@@ -341,12 +368,11 @@ class Watchlist(commands.Cog):
             color=discord.Color.gold(),
         )
         embed.add_field(name="Type", value=pick.media_type.capitalize(), inline=True)
-        embed.add_field(name="Added by", value=_user_label(pick.added_by), inline=True)
+        embed.add_field(name="Added by", value=member_label(roster, pick.added_by), inline=True)
         if pick.note:
             embed.add_field(name="Note", value=pick.note, inline=False)
         if pick.link:
             embed.add_field(name="Link", value=pick.link, inline=False)
-        total = len(rows)
         embed.set_footer(text=f"{total} unwatched title{'s' if total != 1 else ''} in the queue")
 
         await interaction.response.send_message(embed=embed)
@@ -373,6 +399,7 @@ class Watchlist(commands.Cog):
                 await interaction.response.send_message("❌ Item not found.", ephemeral=True)
                 return
             title = row.title
+            await s.execute(delete(WatchlistRating).where(WatchlistRating.item_id == item_id))
             await s.delete(row)
             await s.commit()
 
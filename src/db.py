@@ -9,10 +9,24 @@ from pathlib import Path
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from dotenv import load_dotenv
-from sqlalchemy import BigInteger, Boolean, Date, DateTime, Integer, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    Text,
+    Time,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy.ext.asyncio import AsyncAttrs, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from src.text_match import normalize
+
 # -----------------------------------------------------------------------------
 # Load .env for local runs (no effect on Heroku)
 # -----------------------------------------------------------------------------
@@ -115,6 +129,10 @@ class Base(AsyncAttrs, DeclarativeBase):
 
 class LedgerEntry(Base):
     __tablename__ = "ledger_entries"
+    __table_args__ = (
+        # Supports month-range scans and keyset paging on (created_at, id) per guild
+        Index("ix_ledger_entries_guild_id_created_at", "guild_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
@@ -122,6 +140,149 @@ class LedgerEntry(Base):
     debtor_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
     amount_cents: Mapped[int] = mapped_column(Integer, nullable=False)
     note: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    category: Mapped[str] = mapped_column(Text, default="", nullable=False)  # "" = uncategorized
+    # Set for machine-posted entries (e.g. "recurring:<charge_id>:<due>") so a
+    # retried job can never post the same charge twice; NULL for manual entries.
+    idempotency_key: Mapped[str | None] = mapped_column(
+        Text, index=True, unique=True, nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class LedgerMonthlyRollup(Base):
+    """Per-month ledger totals for one creditor/debtor pair, written at month close.
+
+    Past months are read from here instead of re-scanning ``ledger_entries``.
+    ``month`` is the first day of the month (UTC).
+    """
+
+    __tablename__ = "ledger_monthly_rollups"
+    __table_args__ = (
+        UniqueConstraint("guild_id", "month", "creditor_id", "debtor_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    month: Mapped[_dt.date] = mapped_column(Date, nullable=False)
+    creditor_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    debtor_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    amount_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    closed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class LedgerCategoryMonthly(Base):
+    """Running per-month spend per category, bumped on every ledger insert.
+
+    ``amount_cents`` sums the absolute entry amounts so direction does not
+    cancel spending out.  ``month`` is the first day of the month (UTC).
+    """
+
+    __tablename__ = "ledger_category_monthly"
+    __table_args__ = (UniqueConstraint("guild_id", "month", "category"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    month: Mapped[_dt.date] = mapped_column(Date, nullable=False)
+    category: Mapped[str] = mapped_column(Text, nullable=False)
+    amount_cents: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    entry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class Household(Base):
+    """The tenancy unit — one household per guild.
+
+    ``owner_id`` is the member who pays shared bills (``/rent``, ``/wifi_bill``)
+    and is listed first in the roster.
+    """
+
+    __tablename__ = "households"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, unique=True, index=True, nullable=False)
+    owner_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class HouseholdMember(Base):
+    """A user who shares the guild's ledger, reminders and partner commands."""
+
+    __tablename__ = "household_members"
+    __table_args__ = (UniqueConstraint("guild_id", "user_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    household_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    # Denormalized from households so roster lookups by guild need no join
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    display_name: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    # IANA name overriding the household time zone for this member's "today"
+    timezone: Mapped[str | None] = mapped_column(Text, nullable=True)
+    added_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class GuildSettings(Base):
+    """Per-guild channels, time zone and local times for the scheduled jobs.
+
+    Weekly jobs without their own channel post to ``checkin_channel_id``;
+    when that is unset too, the ``CHECKIN_CHANNEL_ID`` environment variable
+    is used for the guild that channel belongs to.  Weekdays, including
+    ``week_start`` (the first day of a playoff or supply week), follow
+    ``date.weekday()`` (Monday is 0, Sunday 6).
+    """
+
+    __tablename__ = "guild_settings"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, unique=True, index=True, nullable=False)
+    timezone: Mapped[str] = mapped_column(Text, default="America/New_York", nullable=False)
+    week_start: Mapped[int] = mapped_column(Integer, default=6, nullable=False)
+    checkin_channel_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    review_channel_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    supply_channel_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    ping_time: Mapped[_dt.time] = mapped_column(Time, default=_dt.time(22, 0), nullable=False)
+    review_weekday: Mapped[int] = mapped_column(Integer, default=6, nullable=False)
+    review_time: Mapped[_dt.time] = mapped_column(Time, default=_dt.time(10, 0), nullable=False)
+    supply_weekday: Mapped[int] = mapped_column(Integer, default=6, nullable=False)
+    supply_time: Mapped[_dt.time] = mapped_column(Time, default=_dt.time(10, 0), nullable=False)
+
+
+class RecurringCharge(Base):
+    """A bill that posts a ledger entry automatically every period.
+
+    When due, ``debtor_id`` owes ``creditor_id`` ``amount_cents`` times
+    ``split_ratio`` (an exact fraction such as "1/3").  ``next_due`` is
+    advanced by ``cadence`` ("monthly" or "weekly") each time it posts.
+    """
+
+    __tablename__ = "recurring_charges"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    amount_cents: Mapped[int] = mapped_column(Integer, nullable=False)
+    split_ratio: Mapped[str] = mapped_column(Text, default="1/2", nullable=False)
+    creditor_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    debtor_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    cadence: Mapped[str] = mapped_column(Text, default="monthly", nullable=False)
+    next_due: Mapped[_dt.date] = mapped_column(Date, index=True, nullable=False)
+    active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -146,6 +307,32 @@ class ReminderEntry(Base):
     done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
 
+class Pillar(Base):
+    """One pillar in one version of a member's pillar list.
+
+    Changing the list adds a new ``version`` whose rows apply from
+    ``effective_from``; earlier check-ins keep pointing at the version they
+    were made against.  Members without rows use the generic pillars.
+    """
+
+    __tablename__ = "pillars"
+    __table_args__ = (UniqueConstraint("guild_id", "user_id", "version", "position"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Zero-based; bit ``position`` of ``PlayoffCheckin.pillars_done``
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    effective_from: Mapped[_dt.date] = mapped_column(Date, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
 class PlayoffCheckin(Base):
     __tablename__ = "playoff_checkins"
 
@@ -153,9 +340,14 @@ class PlayoffCheckin(Base):
     guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
     user_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
     checkin_date: Mapped[_dt.date] = mapped_column(Date, nullable=False)
+    # Per-slot flags read by the archive and stats; slots past the member's
+    # list are stored as done so "all three" still means "every pillar"
     pillar1: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     pillar2: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     pillar3: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Bit i set = pillar at position i of ``pillar_version`` done (None: generic pillars)
+    pillars_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pillar_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -168,6 +360,26 @@ class PlayoffCheckin(Base):
     )
 
 
+class CheckinBitmap(Base):
+    """One user's check-ins for a calendar year, packed into bit arrays.
+
+    ``pillars`` holds 3 bits per day (bit ``3 * day + p`` is pillar ``p + 1``
+    on day-of-year ``day``, zero-based) and ``checked`` 1 bit per day marking
+    that a check-in exists, so a day with no pillars done is not mistaken for
+    a missing day.  Both are little-endian; see ``src.checkin_bits``.
+    """
+
+    __tablename__ = "checkin_bitmaps"
+    __table_args__ = (UniqueConstraint("guild_id", "user_id", "year"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    pillars: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    checked: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
 class PlayoffSeries(Base):
     __tablename__ = "playoff_series"
 
@@ -177,6 +389,31 @@ class PlayoffSeries(Base):
     wins: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     losses: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     status: Mapped[str] = mapped_column(Text, default="ongoing", nullable=False)
+    # Bumped by every write to the week (check-ins, settlement, finalizing),
+    # so rendered summaries of the week know when they are stale
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class WeeklySummary(Base):
+    """A finished weekly review embed (``Embed.to_dict()`` as JSON) for a past week.
+
+    Past weeks never change, so re-posting one reads this row instead of
+    rebuilding the embed; ``version`` is the series version it was built from.
+    """
+
+    __tablename__ = "weekly_summaries"
+    __table_args__ = (UniqueConstraint("guild_id", "week_start"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    week_start: Mapped[_dt.date] = mapped_column(Date, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    embed: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -187,11 +424,11 @@ class PlayoffSeries(Base):
 class DailyResult(Base):
     """Combined win/loss for a single day — authoritative result for the series.
 
-    A row is created (or updated) only once both David and Stephanie have
-    submitted their check-ins for the day.  ``won`` is True only when both
-    players completed all three pillars.  Individual completion flags
-    (``david_complete``, ``steph_complete``) are stored so individual progress
-    remains visible without re-joining to ``playoff_checkins``.
+    A row is created (or updated) only once every household member has
+    submitted a check-in for the day.  ``won`` is True only when all of them
+    completed all three pillars.  Who completed is stored per member in
+    ``daily_result_members`` so individual progress remains visible without
+    re-joining to ``playoff_checkins``.
     """
 
     __tablename__ = "daily_results"
@@ -199,9 +436,7 @@ class DailyResult(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
     result_date: Mapped[_dt.date] = mapped_column(Date, nullable=False)
-    david_complete: Mapped[bool] = mapped_column(Boolean, nullable=False)
-    steph_complete: Mapped[bool] = mapped_column(Boolean, nullable=False)
-    # True iff david_complete AND steph_complete — this is the authoritative result
+    # True iff every member completed — this is the authoritative result
     won: Mapped[bool] = mapped_column(Boolean, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -215,6 +450,49 @@ class DailyResult(Base):
     )
 
 
+class DailyResultMember(Base):
+    """One member's completion flag for a settled day.
+
+    Keyed by (guild, date) rather than the parent row's id so a week's
+    per-member tally is a single range scan with no join.
+    """
+
+    __tablename__ = "daily_result_members"
+    __table_args__ = (UniqueConstraint("guild_id", "result_date", "user_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    result_date: Mapped[_dt.date] = mapped_column(Date, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    complete: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+
+class PlayoffStats(Base):
+    """Running playoff totals per guild and user, updated as check-ins settle.
+
+    ``user_id`` 0 holds the household's shared numbers: the streak of shared
+    wins and series won/lost.  Member rows hold that member's all-pillar
+    streak and lifetime pillar counts.  ``streak_through`` is the last day
+    of ``current_streak``.
+    """
+
+    __tablename__ = "playoff_stats"
+    __table_args__ = (UniqueConstraint("guild_id", "user_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    current_streak: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    longest_streak: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    streak_through: Mapped[_dt.date | None] = mapped_column(Date, nullable=True)
+    series_won: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    series_lost: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    days_checked: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pillar1_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pillar2_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pillar3_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
 class WeeklyReview(Base):
     __tablename__ = "weekly_reviews"
 
@@ -350,10 +628,6 @@ class WatchlistItem(Base):
     note: Mapped[str] = mapped_column(Text, default="", nullable=False)
     watched: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     watched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    david_rating: Mapped[int | None] = mapped_column(Integer, nullable=True)  # 1–5
-    steph_rating: Mapped[int | None] = mapped_column(Integer, nullable=True)  # 1–5
-    david_notes: Mapped[str] = mapped_column(Text, default="", nullable=False)
-    steph_notes: Mapped[str] = mapped_column(Text, default="", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -361,6 +635,19 @@ class WatchlistItem(Base):
     )
 
 
+class WatchlistRating(Base):
+    """One household member's rating and notes for a watched title."""
+
+    __tablename__ = "watchlist_ratings"
+    __table_args__ = (UniqueConstraint("item_id", "user_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    item_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    rating: Mapped[int | None] = mapped_column(Integer, nullable=True)  # 1–5
+    notes: Mapped[str] = mapped_column(Text, default="", nullable=False)
+
+
 class BucketListItem(Base):
     """A shared bucket list item for the couple."""
 
@@ -387,6 +674,16 @@ class OutingWishlistItem(Base):
     """A shared wishlist of restaurants and activities to try."""
 
     __tablename__ = "outing_wishlist_items"
+    __table_args__ = (
+        Index("ix_outing_wishlist_items_guild_id_neighborhood_key", "guild_id", "neighborhood_key"),
+        # Serves substring and similarity matches on the key (src/text_match.py)
+        Index(
+            "ix_outing_wishlist_items_neighborhood_key_trgm",
+            "neighborhood_key",
+            postgresql_using="gin",
+            postgresql_ops={"neighborhood_key": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
@@ -394,6 +691,12 @@ class OutingWishlistItem(Base):
     category: Mapped[str] = mapped_column(Text, nullable=False, default="other")
     budget: Mapped[str] = mapped_column(Text, nullable=False, default="")  # "", "budget", "moderate", "splurge"
     neighborhood: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # normalize(neighborhood), filled in on insert
+    neighborhood_key: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        default=lambda ctx: normalize(ctx.get_current_parameters().get("neighborhood")),
+    )
     link: Mapped[str] = mapped_column(Text, nullable=False, default="")
     note: Mapped[str] = mapped_column(Text, nullable=False, default="")
     added_by: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -427,6 +730,146 @@ class ShoppingItem(Base):
     og_image: Mapped[str | None] = mapped_column(Text, nullable=True)
 
 
+class SearchDocument(Base):
+    """One row of a searchable list, as ``/search`` sees it.
+
+    Written only by the triggers from ``search_ddl`` on each source table,
+    so every write path (ORM, bulk inserts, ``COPY``) keeps it current.
+    ``kind`` names the source in ``SEARCH_SOURCES``; ``item_id`` is its id.
+    """
+
+    __tablename__ = "search_documents"
+    __table_args__ = (UniqueConstraint("kind", "item_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
+    kind: Mapped[str] = mapped_column(Text, nullable=False)
+    item_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    body: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+
+# (kind, table, title SQL, body SQL) per searchable list; the SQL reads the
+# source row through a NEW./OLD. prefix written as "{row}."
+SEARCH_SOURCES: tuple[tuple[str, str, str, str], ...] = (
+    ("shopping", "shopping_items", "{row}.name", "{row}.note || ' ' || COALESCE({row}.og_title, '')"),
+    ("watch", "watchlist_items", "{row}.title", "{row}.note"),
+    ("bucket", "bucket_list_items", "{row}.title", "{row}.note || ' ' || {row}.completed_notes"),
+    (
+        "outing",
+        "outing_wishlist_items",
+        "{row}.name",
+        "{row}.neighborhood || ' ' || {row}.note || ' ' || {row}.visited_notes",
+    ),
+    ("datenight", "datenight_wishlist", "{row}.name", "{row}.notes"),
+    ("datelog", "datenight_log", "{row}.place", "{row}.notes"),
+    ("special", "special_dates", "{row}.label", "{row}.gift_ideas"),
+    ("ledger", "ledger_entries", "{row}.note", "{row}.category"),
+)
+
+# The weighted document ``/search`` matches on Postgres; the GIN index is on
+# this exact expression
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, body), 'B')"
+)
+
+
+def search_ddl(dialect: str) -> list[str]:
+    """Statements that index ``search_documents`` and keep it in step with its sources.
+
+    Postgres: a GIN index on ``SEARCH_VECTOR_SQL`` and one row trigger per
+    source.  SQLite: an FTS5 table mirroring ``search_documents`` (kept in
+    sync by its own triggers) and insert/update/delete triggers per source.
+    """
+    statements = []
+    if dialect == "postgresql":
+        statements.append(
+            "CREATE INDEX IF NOT EXISTS ix_search_documents_vector "
+            f"ON search_documents USING gin (({SEARCH_VECTOR_SQL}))"
+        )
+        for kind, table, title, body in SEARCH_SOURCES:
+            new_title, new_body = title.format(row="NEW"), body.format(row="NEW")
+            statements += [
+                f"""
+                CREATE OR REPLACE FUNCTION search_sync_{table}() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP = 'DELETE' THEN
+                        DELETE FROM search_documents WHERE kind = '{kind}' AND item_id = OLD.id;
+                        RETURN OLD;
+                    END IF;
+                    INSERT INTO search_documents (guild_id, kind, item_id, title, body)
+                    VALUES (NEW.guild_id, '{kind}', NEW.id, {new_title}, TRIM({new_body}))
+                    ON CONFLICT (kind, item_id)
+                    DO UPDATE SET title = EXCLUDED.title, body = EXCLUDED.body;
+                    RETURN NEW;
+                END
+                $$ LANGUAGE plpgsql
+                """,
+                f"""
+                CREATE OR REPLACE TRIGGER search_sync_{table}
+                AFTER INSERT OR UPDATE OR DELETE ON {table}
+                FOR EACH ROW EXECUTE FUNCTION search_sync_{table}()
+                """,
+            ]
+        return statements
+
+    statements += [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+            title, body, content='search_documents', content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_fts_ai AFTER INSERT ON search_documents BEGIN
+            INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_fts_ad AFTER DELETE ON search_documents BEGIN
+            INSERT INTO search_fts (search_fts, rowid, title, body)
+            VALUES ('delete', OLD.id, OLD.title, OLD.body);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_fts_au AFTER UPDATE ON search_documents BEGIN
+            INSERT INTO search_fts (search_fts, rowid, title, body)
+            VALUES ('delete', OLD.id, OLD.title, OLD.body);
+            INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+        END
+        """,
+    ]
+    for kind, table, title, body in SEARCH_SOURCES:
+        new_title, new_body = title.format(row="NEW"), body.format(row="NEW")
+        statements += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS search_{table}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO search_documents (guild_id, kind, item_id, title, body)
+                VALUES (NEW.guild_id, '{kind}', NEW.id, {new_title}, TRIM({new_body}));
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS search_{table}_au AFTER UPDATE ON {table} BEGIN
+                UPDATE search_documents SET title = {new_title}, body = TRIM({new_body})
+                WHERE kind = '{kind}' AND item_id = NEW.id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS search_{table}_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM search_documents WHERE kind = '{kind}' AND item_id = OLD.id;
+            END
+            """,
+        ]
+    return statements
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_triggers(metadata, connection, tables=(), **kw) -> None:
+    """``create_all`` builds the search index alongside ``search_documents``."""
+    if SearchDocument.__table__ in tables:
+        for statement in search_ddl(connection.dialect.name):
+            connection.exec_driver_sql(statement)
+
 # -----------------------------------------------------------------------------
 # Engine / Session
 # -----------------------------------------------------------------------------
@@ -0,0 +1,80 @@
+"""GitHub-style contribution heatmaps rendered to PNG, plus a render cache.
+
+``render_heatmap_png`` is a plain top-level function over plain data so it
+can run in a ``ProcessPoolExecutor``; it uses only ``zlib`` and ``struct``
+to write the PNG.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import struct
+import typing as t
+import zlib
+
+from src.caches import LRUCache
+
+CELL = 11
+GAP = 2
+MARGIN = 6
+
+# None (no data), then 0–3 pillars done
+_BLANK = (0xEB, 0xED, 0xF0)
+_LEVELS = [(0xD0, 0xD7, 0xDE), (0x9B, 0xE9, 0xA8), (0x40, 0xC4, 0x63), (0x21, 0x6E, 0x39)]
+_BACKGROUND = (0xFF, 0xFF, 0xFF)
+
+HeatmapKey = tuple[int, int, _dt.date, _dt.date, tuple]
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+
+def encode_png(width: int, height: int, pixels: t.Sequence[bytes]) -> bytes:
+    """Encode *height* rows of packed RGB bytes as an 8-bit truecolour PNG."""
+    raw = b"".join(b"\x00" + row for row in pixels)  # filter type 0 on every row
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + _chunk(b"IDAT", zlib.compress(raw, 9))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def render_heatmap_png(cells: t.Sequence[int | None], start: _dt.date) -> bytes:
+    """Render one square per day, weeks as columns and Sunday on top.
+
+    *cells* holds 0–3 (pillars done) or None (no check-in) for consecutive
+    days from *start*.
+    """
+    lead = (start.weekday() + 1) % 7  # blank squares before start in its first week
+    weeks = max(1, (lead + len(cells) + 6) // 7)
+    width = 2 * MARGIN + weeks * (CELL + GAP) - GAP
+    height = 2 * MARGIN + 7 * (CELL + GAP) - GAP
+
+    # Build each of the 7 weekday pixel rows once, then repeat it CELL times
+    pixels: list[bytes] = []
+    blank_row = bytes(_BACKGROUND) * width
+    pixels.extend([blank_row] * MARGIN)
+    for weekday in range(7):
+        row = bytearray(bytes(_BACKGROUND) * width)
+        for week in range(weeks):
+            i = week * 7 + weekday - lead
+            if not 0 <= i < len(cells):
+                continue
+            colour = _BLANK if cells[i] is None else _LEVELS[cells[i]]
+            x = MARGIN + week * (CELL + GAP)
+            row[3 * x : 3 * (x + CELL)] = bytes(colour) * CELL
+        pixels.extend([bytes(row)] * CELL)
+        if weekday < 6:
+            pixels.extend([blank_row] * GAP)
+    pixels.extend([blank_row] * MARGIN)
+    return encode_png(width, height, pixels)
+
+
+class HeatmapCache(LRUCache[HeatmapKey, bytes]):
+    """LRU of rendered PNGs keyed by (guild, user, start, end, data version).
+
+    A new check-in changes the data version, so stale images are never
+    served; they simply age out.
+    """
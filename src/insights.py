@@ -0,0 +1,136 @@
+"""Pillar trends, weekday effects and correlations over packed check-in history.
+
+Everything works on ``CheckinHistory`` bit arrays (one bulk load per
+household): a rate is a masked ``bit_count`` over a window, a weekday is a
+mask with every seventh day set, and the correlation of two yes/no series
+is the phi coefficient from four bit counts.  Insights cover whole weeks up
+to the current one, so they only change once a week and are cached by
+week start.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import math
+import typing as t
+from dataclasses import dataclass
+
+from src.caches import LRUCache
+from src.checkin_bits import PILLARS_PER_DAY, CheckinHistory
+
+SHORT_WEEKS = 4
+LONG_WEEKS = 12
+
+# Fewer shared days than this and a correlation means nothing
+MIN_CORRELATION_DAYS = 7
+
+PILLAR_PAIRS = ((0, 1), (0, 2), (1, 2))
+
+InsightsKey = tuple[int, _dt.date, tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class MemberInsights:
+    """One member's rates and pillar correlations."""
+
+    user_id: int
+    recent: tuple[float | None, ...]  # per pillar, last SHORT_WEEKS weeks
+    overall: tuple[float | None, ...]  # per pillar, last LONG_WEEKS weeks
+    weekdays: tuple[float | None, ...]  # all-pillar rate per weekday, Monday first
+    pillar_correlations: t.Mapping[tuple[int, int], float | None]
+
+
+@dataclass(frozen=True)
+class Insights:
+    """A household's insights for the weeks before *week_start*."""
+
+    week_start: _dt.date
+    members: tuple[MemberInsights, ...]
+    # Correlation of all-pillar days between each pair of members
+    partner_correlations: t.Mapping[tuple[int, int], float | None]
+
+
+def _rate(hits: int, population: int) -> float | None:
+    return hits.bit_count() / population.bit_count() if population else None
+
+
+def phi(a: int, b: int, population: int) -> float | None:
+    """Phi coefficient of the yes/no bit series *a* and *b* over *population* days.
+
+    None when there are too few days or either series never varies.
+    """
+    n = population.bit_count()
+    if n < MIN_CORRELATION_DAYS:
+        return None
+    a &= population
+    b &= population
+    na, nb, nab = a.bit_count(), b.bit_count(), (a & b).bit_count()
+    denominator = na * (n - na) * nb * (n - nb)
+    if not denominator:
+        return None
+    return (n * nab - na * nb) / math.sqrt(denominator)
+
+
+def weekday_mask(start: _dt.date, days: int, weekday: int) -> int:
+    """Bits of the days in ``[start, start + days)`` that fall on *weekday*."""
+    first = (weekday - start.weekday()) % 7
+    if first >= days:
+        return 0
+    count = (days - first + 6) // 7
+    return ((1 << 7 * count) - 1) // ((1 << 7) - 1) << first
+
+
+def member_insights(
+    user_id: int, history: CheckinHistory, week_start: _dt.date
+) -> MemberInsights:
+    """Insights for one member from a *history* that covers the long window."""
+    last = week_start - _dt.timedelta(days=1)
+    recent = history.window(week_start - _dt.timedelta(weeks=SHORT_WEEKS), last)
+    overall = history.window(week_start - _dt.timedelta(weeks=LONG_WEEKS), last)
+
+    recent_bits = [recent.day_bits(p) for p in range(PILLARS_PER_DAY)]
+    pillar_bits = [overall.day_bits(p) for p in range(PILLARS_PER_DAY)]
+    complete = overall.day_bits()
+    checked = overall.checked
+    weekdays = []
+    for weekday in range(7):
+        days = checked & weekday_mask(overall.start, overall.days, weekday)
+        weekdays.append(_rate(complete & days, days))
+    return MemberInsights(
+        user_id=user_id,
+        recent=tuple(_rate(bits & recent.checked, recent.checked) for bits in recent_bits),
+        overall=tuple(_rate(bits & checked, checked) for bits in pillar_bits),
+        weekdays=tuple(weekdays),
+        pillar_correlations={
+            (a, b): phi(pillar_bits[a], pillar_bits[b], checked) for a, b in PILLAR_PAIRS
+        },
+    )
+
+
+def compute_insights(
+    histories: t.Mapping[int, CheckinHistory], week_start: _dt.date
+) -> Insights:
+    """Insights for every member in *histories* (in order) before *week_start*."""
+    first = week_start - _dt.timedelta(weeks=LONG_WEEKS)
+    last = week_start - _dt.timedelta(days=1)
+    windows = {user_id: history.window(first, last) for user_id, history in histories.items()}
+    user_ids = list(windows)
+    partners = {}
+    for i, a in enumerate(user_ids):
+        for b in user_ids[i + 1 :]:
+            both = windows[a].checked & windows[b].checked
+            partners[(a, b)] = phi(windows[a].day_bits(), windows[b].day_bits(), both)
+    return Insights(
+        week_start=week_start,
+        members=tuple(member_insights(uid, h, week_start) for uid, h in histories.items()),
+        partner_correlations=partners,
+    )
+
+
+class InsightsCache(LRUCache[InsightsKey, Insights]):
+    """LRU of ``Insights`` keyed by (guild, week start, members).
+
+    Insights stop at the current week, so an entry stays valid all week.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        super().__init__(maxsize)
@@ -0,0 +1,183 @@
+"""Keyset-paginated embed lists with previous/next buttons.
+
+``keyset_page`` fetches one page of any query past (or before) a sort
+key, so page 40 costs the same as page 1.  ``KeysetPager`` wraps it in a
+view: it fetches the next page in the background while the current one is
+on screen, and drops rows off the end of a page until its embed fits
+Discord's size limits; the dropped rows go to the neighbouring page.
+"""
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import discord
+from sqlalchemy import Select, tuple_
+
+# Discord allows at most 25 fields per embed
+PAGE_SIZE = 25
+
+# Discord's limit on the total characters in an embed
+EMBED_MAX_CHARS = 6000
+
+# Discord's limits on a field's name and value
+FIELD_NAME_MAX_CHARS = 256
+FIELD_MAX_CHARS = 1024
+
+Key = tuple[t.Any, ...]
+Render = t.Callable[[list[t.Any], t.Any], discord.Embed]
+LoadExtra = t.Callable[[t.Any, list[t.Any]], t.Awaitable[t.Any]]
+
+
+def clip(text: str, limit: int) -> str:
+    """*text*, cut to *limit* characters with an ellipsis when too long."""
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def key_of(row: t.Any, keys: t.Sequence[t.Any]) -> Key:
+    """The sort key of *row* for the ORM attributes *keys*."""
+    return tuple(getattr(row, k.key) for k in keys)
+
+
+async def keyset_page(
+    s,
+    query: Select,
+    keys: t.Sequence[t.Any],
+    *,
+    after: Key | None = None,
+    before: Key | None = None,
+    limit: int = PAGE_SIZE,
+) -> tuple[list[t.Any], bool]:
+    """One page of *query* in ascending *keys* order.
+
+    *keys* are ORM attributes ending in a unique one (the id), so the key
+    orders rows totally.  Pass the last row's key as *after* for the next
+    page or the first row's key as *before* for the previous one.  The bool
+    reports whether more rows exist beyond the page in the direction of
+    travel.
+    """
+    key = tuple_(*keys)
+    if before is not None:
+        query = query.where(key < tuple_(*before)).order_by(*(k.desc() for k in keys))
+    else:
+        if after is not None:
+            query = query.where(key > tuple_(*after))
+        query = query.order_by(*keys)
+
+    rows = list((await s.scalars(query.limit(limit + 1))).all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if before is not None:
+        rows.reverse()
+    return rows, has_more
+
+
+class KeysetPager(discord.ui.View):
+    """Pages through *query* with ``keyset_page``, one embed per page.
+
+    *render* builds a page's embed from its rows and whatever *load_extra*
+    (optional, run in the page's session) returned for them.
+    """
+
+    def __init__(
+        self,
+        db,  # sessionmaker
+        query: Select,
+        keys: t.Sequence[t.Any],
+        render: Render,
+        *,
+        load_extra: LoadExtra | None = None,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        super().__init__(timeout=300)
+        self.db = db
+        self.query = query
+        self.keys = keys
+        self.render = render
+        self.load_extra = load_extra
+        self.page_size = page_size
+        self.rows: list[t.Any] = []
+        self.extra: t.Any = None
+        self.page = 1
+        self.has_prev = False
+        self.has_next = False
+        self._ahead: tuple[Key, asyncio.Task] | None = None
+
+    async def _fetch(
+        self, *, after: Key | None = None, before: Key | None = None
+    ) -> tuple[list[t.Any], bool, t.Any]:
+        async with self.db() as s:
+            rows, has_more = await keyset_page(
+                s, self.query, self.keys, after=after, before=before, limit=self.page_size
+            )
+            extra = await self.load_extra(s, rows) if self.load_extra and rows else None
+        return rows, has_more, extra
+
+    async def load(self, *, after: Key | None = None, before: Key | None = None) -> bool:
+        """Show the first page, or the page after/before a key.
+
+        Returns False, leaving the current page in place, when there is no
+        row on that side any more (deleted while the pager was open).
+        """
+        ahead, self._ahead = self._ahead, None
+        if ahead is not None and after is not None and ahead[0] == after:
+            rows, has_more, extra = await ahead[1]
+        else:
+            if ahead is not None:
+                ahead[1].cancel()
+            rows, has_more, extra = await self._fetch(after=after, before=before)
+        if not rows and (after is not None or before is not None):
+            if after is not None:
+                self.has_next = False
+            else:
+                self.has_prev = False
+            self.prev_button.disabled = not self.has_prev
+            self.next_button.disabled = not self.has_next
+            return False
+        self.rows, self.extra = rows, extra
+        if before is not None:
+            self.has_prev, self.has_next = has_more, True
+        elif after is not None:
+            self.has_prev, self.has_next = True, has_more
+        else:
+            self.has_prev, self.has_next = False, has_more
+
+        # Rows that don't fit move to the neighbouring page on the far side
+        # from the one just left, so paging back and forth lands on the same rows
+        while len(self.rows) > 1 and len(self.embed()) > EMBED_MAX_CHARS:
+            if before is not None:
+                self.rows = self.rows[1:]
+                self.has_prev = True
+            else:
+                self.rows = self.rows[:-1]
+                self.has_next = True
+
+        self.prev_button.disabled = not self.has_prev
+        self.next_button.disabled = not self.has_next
+        if self.has_next:
+            last = key_of(self.rows[-1], self.keys)
+            self._ahead = (last, asyncio.create_task(self._fetch(after=last)))
+        return True
+
+    def embed(self) -> discord.Embed:
+        embed = self.render(self.rows, self.extra)
+        if self.has_prev or self.has_next:
+            embed.set_footer(text=f"Page {self.page}")
+        return embed
+
+    async def on_timeout(self) -> None:
+        if self._ahead is not None:
+            self._ahead[1].cancel()
+            self._ahead = None
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary, disabled=True)
+    async def prev_button(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if self.rows and await self.load(before=key_of(self.rows[0], self.keys)):
+            self.page = max(1, self.page - 1)
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary, disabled=True)
+    async def next_button(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if self.rows and await self.load(after=key_of(self.rows[-1], self.keys)):
+            self.page += 1
+        await interaction.response.edit_message(embed=self.embed(), view=self)
@@ -0,0 +1,152 @@
+"""Members' pillar lists, versioned by the day each list takes effect.
+
+A member's pillars live in the ``pillars`` table, one row per pillar per
+version.  ``PillarCache`` holds every member's versions per guild, so
+resolving the list in force on a day (every ``/checkin``, every reminder)
+needs no query once the guild is loaded.  All writes go through this bot,
+which invalidates the guild after committing, so entries never expire.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import typing as t
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+
+from src.checkin_bits import PILLARS_PER_DAY
+from src.db import Pillar
+
+# The archive and all-time stats keep one slot per pillar
+MAX_PILLARS = PILLARS_PER_DAY
+
+DEFAULT_NAMES = ("Pillar 1", "Pillar 2", "Pillar 3")
+
+
+@dataclass(frozen=True)
+class PillarSet:
+    """One version of a member's pillar list.  ``version`` None is the generic list."""
+
+    names: tuple[str, ...] = DEFAULT_NAMES
+    version: int | None = None
+    effective_from: _dt.date | None = None
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << len(self.names)) - 1
+
+    def mask(self, done: t.Sequence[bool]) -> int:
+        """Bitmask of *done* flags, one per pillar in order."""
+        return sum(1 << i for i, flag in enumerate(done[: len(self.names)]) if flag)
+
+    def slots(self, mask: int) -> tuple[bool, ...]:
+        """The per-slot ``pillar1..3`` flags for *mask*; unused slots count as done."""
+        return tuple(bool(mask >> i & 1) or i >= len(self.names) for i in range(MAX_PILLARS))
+
+
+@dataclass(frozen=True)
+class MemberPillars:
+    """Every version of one member's list, oldest first."""
+
+    versions: tuple[PillarSet, ...] = ()
+
+    def on(self, day: _dt.date) -> PillarSet:
+        """The list in force on *day*: the newest version already effective."""
+        current = PillarSet()
+        for pillars in self.versions:
+            if pillars.effective_from <= day:
+                current = pillars
+        return current
+
+
+class PillarCache:
+    """In-memory ``MemberPillars`` per guild and user."""
+
+    def __init__(self) -> None:
+        self._guilds: dict[int, dict[int, MemberPillars]] = {}
+
+    def get(self, guild_id: int) -> dict[int, MemberPillars] | None:
+        return self._guilds.get(guild_id)
+
+    def put(self, guild_id: int, members: dict[int, MemberPillars]) -> None:
+        self._guilds[guild_id] = members
+
+    def invalidate(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+
+pillar_cache = PillarCache()
+
+
+async def load_pillars(s, guild_id: int) -> dict[int, MemberPillars]:
+    """Every member's pillar versions in the guild, in one query."""
+    rows = await s.execute(
+        select(Pillar.user_id, Pillar.version, Pillar.effective_from, Pillar.name)
+        .where(Pillar.guild_id == guild_id)
+        .order_by(Pillar.user_id, Pillar.version, Pillar.position)
+    )
+    versions: dict[int, dict[int, tuple[_dt.date, list[str]]]] = {}
+    for user_id, version, effective_from, name in rows:
+        versions.setdefault(user_id, {}).setdefault(version, (effective_from, []))[1].append(name)
+    return {
+        user_id: MemberPillars(
+            tuple(
+                PillarSet(tuple(names), version, effective_from)
+                for version, (effective_from, names) in by_version.items()
+            )
+        )
+        for user_id, by_version in versions.items()
+    }
+
+
+async def guild_pillars(db, guild_id: int) -> dict[int, MemberPillars]:
+    """Cached ``load_pillars``; *db* is the session factory."""
+    hit = pillar_cache.get(guild_id)
+    if hit is None:
+        async with db() as s:
+            hit = await load_pillars(s, guild_id)
+        pillar_cache.put(guild_id, hit)
+    return hit
+
+
+async def pillars_for(db, guild_id: int, user_id: int, day: _dt.date) -> PillarSet:
+    """*user_id*'s pillar list in force on *day*."""
+    return (await guild_pillars(db, guild_id)).get(user_id, MemberPillars()).on(day)
+
+
+async def add_pillar_version(
+    s, guild_id: int, user_id: int, names: t.Sequence[str], effective_from: _dt.date
+) -> PillarSet:
+    """Store *names* as the member's next list version.  Caller commits and invalidates.
+
+    Raises ValueError unless there are 1 to ``MAX_PILLARS`` non-blank names.
+    """
+    names = tuple(n.strip() for n in names if n and n.strip())
+    if not 1 <= len(names) <= MAX_PILLARS:
+        raise ValueError(f"A pillar list needs 1 to {MAX_PILLARS} pillars")
+    latest = await s.scalar(
+        select(func.max(Pillar.version)).where(
+            Pillar.guild_id == guild_id, Pillar.user_id == user_id
+        )
+    )
+    version = (latest or 0) + 1
+    s.add_all(
+        Pillar(
+            guild_id=guild_id,
+            user_id=user_id,
+            version=version,
+            position=position,
+            name=name,
+            effective_from=effective_from,
+        )
+        for position, name in enumerate(names)
+    )
+    return PillarSet(names, version, effective_from)
+
+
+async def pillar_names_on(
+    db, guild_id: int, user_ids: t.Iterable[int], day: _dt.date
+) -> dict[int, tuple[str, ...]]:
+    """Each of *user_ids*' pillar names in force on *day*."""
+    members = await guild_pillars(db, guild_id)
+    return {uid: members.get(uid, MemberPillars()).on(day).names for uid in user_ids}
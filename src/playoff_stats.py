@@ -0,0 +1,161 @@
+"""Incremental upkeep of ``playoff_stats`` as check-ins and days settle.
+
+Every update touches one row and applies a delta, so all-time numbers cost
+the same to maintain in year five as in week one.  The only exception is a
+re-check-in that breaks a streak that was already counted.  That rare undo
+rebuilds the streak from history instead of guessing.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import typing as t
+
+from sqlalchemy import func, select
+
+from src.checkin_bits import load_history
+from src.db import CheckinBitmap, DailyResult, PlayoffStats
+
+# user_id of the household-wide stats row
+HOUSEHOLD = 0
+
+_PILLAR_COLUMNS = ("pillar1_done", "pillar2_done", "pillar3_done")
+
+
+async def stats_row(s, guild_id: int, user_id: int = HOUSEHOLD) -> PlayoffStats:
+    """The stats row for (guild, user), created empty on first use."""
+    row = await s.scalar(
+        select(PlayoffStats).where(
+            PlayoffStats.guild_id == guild_id,
+            PlayoffStats.user_id == user_id,
+        )
+    )
+    if row is None:
+        row = PlayoffStats(
+            guild_id=guild_id,
+            user_id=user_id,
+            current_streak=0,
+            longest_streak=0,
+            series_won=0,
+            series_lost=0,
+            days_checked=0,
+            pillar1_done=0,
+            pillar2_done=0,
+            pillar3_done=0,
+        )
+        s.add(row)
+    return row
+
+
+def advance_streak(row: PlayoffStats, day: _dt.date, complete: bool) -> bool:
+    """Fold *day*'s outcome into the row's streak.
+
+    Returns False when the change cannot be applied as a delta (a day that
+    was already counted turned incomplete, or an out-of-order day) and the
+    caller must rebuild the streak.
+    """
+    through = row.streak_through
+    if not complete:
+        return through is None or through < day
+    if through == day:
+        return True
+    if through is not None and through > day:
+        return False
+    row.current_streak = row.current_streak + 1 if through == day - _dt.timedelta(days=1) else 1
+    row.streak_through = day
+    row.longest_streak = max(row.longest_streak, row.current_streak)
+    return True
+
+
+def current_streak(row: PlayoffStats | None, today: _dt.date) -> int:
+    """The streak as of *today* — still alive if it ran through yesterday."""
+    if row is None or row.streak_through is None:
+        return 0
+    return row.current_streak if row.streak_through >= today - _dt.timedelta(days=1) else 0
+
+
+def pillar_rates(row: PlayoffStats | None) -> tuple[float, float, float]:
+    if row is None or not row.days_checked:
+        return (0.0, 0.0, 0.0)
+    return tuple(getattr(row, c) / row.days_checked for c in _PILLAR_COLUMNS)
+
+
+def _runs(days: t.Iterable[_dt.date]) -> tuple[int, _dt.date | None, int]:
+    """(current run length, last day of it, longest run) over sorted *days*."""
+    current = longest = 0
+    last: _dt.date | None = None
+    for d in days:
+        current = current + 1 if last is not None and d - last == _dt.timedelta(days=1) else 1
+        last = d
+        longest = max(longest, current)
+    return current, last, longest
+
+
+async def record_member_checkin(
+    s,
+    guild_id: int,
+    user_id: int,
+    day: _dt.date,
+    old: tuple[bool, bool, bool] | None,
+    new: tuple[bool, bool, bool],
+) -> None:
+    """Apply one check-in (or a re-check-in replacing *old*).  Caller commits.
+
+    Expects the check-in's bitmap to be updated first, since a broken streak
+    is rebuilt from it.
+    """
+    row = await stats_row(s, guild_id, user_id)
+    if old is None:
+        row.days_checked += 1
+    for column, was, now in zip(_PILLAR_COLUMNS, old or (False, False, False), new):
+        setattr(row, column, getattr(row, column) + int(now) - int(was))
+    if advance_streak(row, day, all(new)):
+        return
+
+    first_year = await s.scalar(
+        select(func.min(CheckinBitmap.year)).where(
+            CheckinBitmap.guild_id == guild_id,
+            CheckinBitmap.user_id == user_id,
+        )
+    )
+    # The live streak ends at the latest day seen, which may be after *day*
+    anchor = max(day, row.streak_through) if row.streak_through else day
+    history = await load_history(s, guild_id, user_id, first_year or day.year, anchor.year)
+    row.current_streak = history.current_streak(anchor)
+    if not row.current_streak:
+        row.streak_through = None
+    elif history.completed_on(anchor):
+        row.streak_through = anchor
+    else:
+        row.streak_through = anchor - _dt.timedelta(days=1)
+    row.longest_streak = history.longest_streak()
+
+
+async def record_settlement(s, guild_id: int, day: _dt.date, won: bool) -> None:
+    """Apply a settled (or re-settled) shared result to the household row.  Caller commits."""
+    row = await stats_row(s, guild_id)
+    if advance_streak(row, day, won):
+        return
+    won_days = (
+        await s.scalars(
+            select(DailyResult.result_date)
+            .where(DailyResult.guild_id == guild_id, DailyResult.won.is_(True))
+            .order_by(DailyResult.result_date)
+        )
+    ).all()
+    current, last, longest = _runs(won_days)
+    row.current_streak, row.streak_through, row.longest_streak = current, last, longest
+
+
+async def record_series_status(s, guild_id: int, old: str | None, new: str) -> None:
+    """Move a series between the won/lost totals when its status changes.  Caller commits."""
+    if old == new:
+        return
+    row = await stats_row(s, guild_id)
+    if old == "won":
+        row.series_won -= 1
+    elif old == "lost":
+        row.series_lost -= 1
+    if new == "won":
+        row.series_won += 1
+    elif new == "lost":
+        row.series_lost += 1
@@ -0,0 +1,133 @@
+"""Series-outcome odds from each member's recent check-in history.
+
+A member's chance of completing every pillar is estimated per weekday from
+the last ``HISTORY_WEEKS`` weeks of ``PlayoffCheckin`` rows, pulled toward
+their overall rate so a weekday seen once or twice does not read as 0% or
+100%.  A day is won only if everyone completes, so its win chance is the
+product over members.  The series is won at four wins; the number of wins
+left to come is a Poisson-binomial over the remaining days, computed
+exactly in O(days²) rather than sampled.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import typing as t
+from dataclasses import dataclass
+
+from sqlalchemy import and_, select
+
+from src.db import PlayoffCheckin
+
+HISTORY_WEEKS = 12
+
+# Pseudo-observations of the member's overall rate added to each weekday
+PRIOR_WEIGHT = 2.0
+
+# Completion rate assumed for a member with no history at all
+DEFAULT_RATE = 0.5
+
+SERIES_WINS = 4
+
+# P(every pillar done) per weekday, Monday first
+WeekdayRates = tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class SeriesOdds:
+    """Chance of winning the series, and of winning it if the next day is won."""
+
+    win: float
+    next_day: _dt.date
+    if_next_won: float
+
+
+def weekday_rates(checkins: t.Iterable[tuple[_dt.date, bool]]) -> WeekdayRates:
+    """Smoothed completion rate per weekday from ``(day, all pillars done)`` pairs."""
+    done = [0] * 7
+    seen = [0] * 7
+    for day, complete in checkins:
+        seen[day.weekday()] += 1
+        done[day.weekday()] += complete
+    overall = sum(done) / sum(seen) if sum(seen) else DEFAULT_RATE
+    return tuple(
+        (done[w] + PRIOR_WEIGHT * overall) / (seen[w] + PRIOR_WEIGHT) for w in range(7)
+    )
+
+
+def day_win_probability(
+    rates: t.Mapping[int, WeekdayRates], member_ids: t.Iterable[int], day: _dt.date
+) -> float:
+    """Chance that every member completes on *day*."""
+    p = 1.0
+    for user_id in member_ids:
+        member = rates.get(user_id)
+        p *= member[day.weekday()] if member is not None else DEFAULT_RATE
+    return p
+
+
+def series_win_probability(wins: int, day_probs: t.Sequence[float]) -> float:
+    """Chance of reaching ``SERIES_WINS`` from *wins* with independent *day_probs*."""
+    need = SERIES_WINS - wins
+    if need <= 0:
+        return 1.0
+    if need > len(day_probs):
+        return 0.0
+    # dist[k]: chance of exactly k more wins so far; dist[need] absorbs "or more"
+    dist = [1.0] + [0.0] * need
+    for p in day_probs:
+        dist[need] += dist[need - 1] * p
+        for k in range(need - 1, 0, -1):
+            dist[k] = dist[k] * (1 - p) + dist[k - 1] * p
+        dist[0] *= 1 - p
+    return dist[need]
+
+
+def series_odds(
+    wins: int,
+    losses: int,
+    days_left: t.Sequence[_dt.date],
+    rates: t.Mapping[int, WeekdayRates],
+    member_ids: t.Sequence[int],
+) -> SeriesOdds | None:
+    """Odds for an undecided series with *days_left* to play; None once decided."""
+    if wins >= SERIES_WINS or losses >= SERIES_WINS or not days_left or not member_ids:
+        return None
+    probs = [day_win_probability(rates, member_ids, day) for day in days_left]
+    return SeriesOdds(
+        win=series_win_probability(wins, probs),
+        next_day=days_left[0],
+        if_next_won=series_win_probability(wins + 1, probs[1:]),
+    )
+
+
+async def load_weekday_rates(
+    s, days: t.Mapping[int, _dt.date]
+) -> dict[int, dict[int, WeekdayRates]]:
+    """Per-member weekday rates for each ``{guild_id: day}``, in one query.
+
+    Each guild's window is the ``HISTORY_WEEKS`` weeks up to and including
+    its *day*.
+    """
+    if not days:
+        return {}
+    span = _dt.timedelta(weeks=HISTORY_WEEKS)
+    rows = await s.execute(
+        select(
+            PlayoffCheckin.guild_id,
+            PlayoffCheckin.user_id,
+            PlayoffCheckin.checkin_date,
+            and_(PlayoffCheckin.pillar1, PlayoffCheckin.pillar2, PlayoffCheckin.pillar3),
+        ).where(
+            PlayoffCheckin.guild_id.in_(list(days)),
+            PlayoffCheckin.checkin_date > min(days.values()) - span,
+            PlayoffCheckin.checkin_date <= max(days.values()),
+        )
+    )
+    history: dict[int, dict[int, list[tuple[_dt.date, bool]]]] = {}
+    for guild_id, user_id, day, complete in rows:
+        if days[guild_id] - span < day <= days[guild_id]:
+            history.setdefault(guild_id, {}).setdefault(user_id, []).append((day, bool(complete)))
+    return {
+        guild_id: {user_id: weekday_rates(pairs) for user_id, pairs in members.items()}
+        for guild_id, members in history.items()
+    }
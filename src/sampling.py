@@ -0,0 +1,48 @@
+"""Weighted random picks done by the database.
+
+``weighted_choice`` turns a candidate query into one row: a window
+``SUM(weight) OVER (ORDER BY id)`` gives each candidate its slice of the
+running total, and the first slice past ``r * total`` wins, where ``r`` is
+drawn in Python and bound as a parameter.  Only the pick and the candidate
+count come back, however long the list.  The draw is a plain parameter
+rather than ``-ln(random()) / weight`` because SQLite only has ``ln`` when
+built with its math functions.
+"""
+from __future__ import annotations
+
+import random
+import typing as t
+
+from sqlalchemy import ColumnElement, Select, func, select
+
+
+async def weighted_choice(
+    s, candidates: Select, weight: ColumnElement, rng: random.Random | None = None
+) -> tuple[t.Any | None, int]:
+    """Pick one row of *candidates* with probability proportional to *weight*.
+
+    *candidates* selects a single mapped entity (filters and joins
+    included); *weight* is a positive SQL expression over it.  Returns the
+    picked instance, or None when there are no candidates, and the number
+    of candidates.
+    """
+    entity = candidates.column_descriptions[0]["entity"]
+    ranked = candidates.with_only_columns(
+        entity.id.label("pick_id"),
+        func.sum(weight).over(order_by=entity.id).label("upto"),
+        func.sum(weight).over().label("total"),
+        func.count().over().label("candidates"),
+    ).subquery()
+    draw = (rng or random).random()
+    row = (
+        await s.execute(
+            select(entity, ranked.c.candidates)
+            .join(ranked, entity.id == ranked.c.pick_id)
+            .where(ranked.c.upto > ranked.c.total * draw)
+            .order_by(ranked.c.upto, entity.id)
+            .limit(1)
+        )
+    ).first()
+    if row is None:
+        return None, 0
+    return row[0], row[1]
@@ -0,0 +1,184 @@
+"""Per-guild job schedules and the fire-time heap that drives them.
+
+Each guild runs the nightly check-in ping, the weekly review and the weekly
+supply check at local times stored in ``guild_settings``.  ``FireQueue``
+keeps the next UTC fire time of every (guild, job) in a heap, so the
+scheduler sleeps until the earliest one and pops due jobs in O(log n)
+instead of waking every guild up each hour to compare clocks.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import heapq
+import itertools
+import os
+import typing as t
+from dataclasses import dataclass
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import select
+
+from src.db import GuildSettings
+
+DEFAULT_TIMEZONE = "America/New_York"
+
+CHECKIN_PING = "checkin_ping"
+WEEKLY_REVIEW = "weekly_review"
+SUPPLY_CHECK = "supply_check"
+JOBS = (CHECKIN_PING, WEEKLY_REVIEW, SUPPLY_CHECK)
+
+# Settings columns per job: (channel, weekday or None for daily, local time)
+_JOB_COLUMNS = {
+    CHECKIN_PING: ("checkin_channel_id", None, "ping_time"),
+    WEEKLY_REVIEW: ("review_channel_id", "review_weekday", "review_time"),
+    SUPPLY_CHECK: ("supply_channel_id", "supply_weekday", "supply_time"),
+}
+
+# Used for guilds without a settings row; matches the column defaults
+DEFAULTS: dict[str, t.Any] = {
+    "timezone": DEFAULT_TIMEZONE,
+    "week_start": 6,
+    "checkin_channel_id": None,
+    "review_channel_id": None,
+    "supply_channel_id": None,
+    "ping_time": _dt.time(22, 0),
+    "review_weekday": 6,  # Sunday
+    "review_time": _dt.time(10, 0),
+    "supply_weekday": 6,
+    "supply_time": _dt.time(10, 0),
+}
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """When and where one job runs for one guild.  ``weekday`` None means daily."""
+
+    channel_id: int | None
+    weekday: int | None
+    at: _dt.time
+    tz: ZoneInfo
+
+
+@dataclass(frozen=True)
+class DueJob:
+    """A job that has come due: the guild, its local date and target channel."""
+
+    guild_id: int
+    day: _dt.date
+    channel_id: int | None
+
+
+def zone(name: str | None) -> ZoneInfo:
+    """Resolve an IANA name, falling back to the default for unknown names."""
+    try:
+        return ZoneInfo(name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def _setting(row: GuildSettings | None, column: str) -> t.Any:
+    value = getattr(row, column, None) if row is not None else None
+    return DEFAULTS[column] if value is None else value
+
+
+def job_specs(
+    row: GuildSettings | None, fallback_channel_id: int | None = None
+) -> dict[str, JobSpec]:
+    """Every job's spec for a guild.
+
+    Weekly jobs without their own channel post to the check-in channel;
+    without that, to *fallback_channel_id* (``CHECKIN_CHANNEL_ID``).
+    """
+    tz = zone(_setting(row, "timezone"))
+    checkin_channel = _setting(row, "checkin_channel_id") or fallback_channel_id
+    specs = {}
+    for job, (channel_col, weekday_col, time_col) in _JOB_COLUMNS.items():
+        specs[job] = JobSpec(
+            channel_id=_setting(row, channel_col) or checkin_channel,
+            weekday=_setting(row, weekday_col) if weekday_col else None,
+            at=_setting(row, time_col),
+            tz=tz,
+        )
+    return specs
+
+
+def next_fire(spec: JobSpec, after: _dt.datetime) -> _dt.datetime:
+    """The first UTC instant strictly after *after* when *spec* fires."""
+    local_day = after.astimezone(spec.tz).date()
+    for offset in range(8):
+        day = local_day + _dt.timedelta(days=offset)
+        if spec.weekday is not None and day.weekday() != spec.weekday:
+            continue
+        fire = _dt.datetime.combine(day, spec.at, tzinfo=spec.tz).astimezone(_dt.timezone.utc)
+        if fire > after:
+            return fire
+    raise AssertionError("a daily or weekly job always fires within 8 days")
+
+
+class FireQueue:
+    """Min-heap of (UTC fire time, guild, job).
+
+    Rescheduling a (guild, job) just pushes a new entry; the old one is
+    recognised as stale by its sequence number and dropped when it reaches
+    the top, so updates stay O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[_dt.datetime, int, int, str]] = []
+        self._live: dict[tuple[int, str], int] = {}
+        self._seq = itertools.count()
+
+    def schedule(self, guild_id: int, job: str, fire_at: _dt.datetime) -> None:
+        seq = next(self._seq)
+        self._live[(guild_id, job)] = seq
+        heapq.heappush(self._heap, (fire_at, seq, guild_id, job))
+
+    def cancel(self, guild_id: int) -> None:
+        for job in JOBS:
+            self._live.pop((guild_id, job), None)
+
+    def _drop_stale(self) -> None:
+        while self._heap:
+            _, seq, guild_id, job = self._heap[0]
+            if self._live.get((guild_id, job)) == seq:
+                return
+            heapq.heappop(self._heap)
+
+    def next_fire_at(self) -> _dt.datetime | None:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: _dt.datetime) -> list[tuple[_dt.datetime, int, str]]:
+        """Remove and return every live (fire time, guild, job) due at *now*."""
+        due = []
+        while (fire_at := self.next_fire_at()) is not None and fire_at <= now:
+            _, _, guild_id, job = heapq.heappop(self._heap)
+            del self._live[(guild_id, job)]
+            due.append((fire_at, guild_id, job))
+        return due
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+
+def env_channel_id() -> int | None:
+    """``CHECKIN_CHANNEL_ID`` from the environment, for guilds with no channel set."""
+    value = os.getenv("CHECKIN_CHANNEL_ID", "")
+    return int(value) if value.isdigit() else None
+
+
+async def load_settings(s, guild_ids: t.Iterable[int]) -> dict[int, GuildSettings]:
+    """Settings rows for *guild_ids* in one query; guilds without one are absent."""
+    rows = await s.scalars(
+        select(GuildSettings).where(GuildSettings.guild_id.in_(list(guild_ids)))
+    )
+    return {row.guild_id: row for row in rows}
+
+
+async def guild_settings_row(s, guild_id: int) -> GuildSettings:
+    """The guild's settings row, created with defaults on first use."""
+    row = await s.scalar(select(GuildSettings).where(GuildSettings.guild_id == guild_id))
+    if row is None:
+        row = GuildSettings(guild_id=guild_id, **DEFAULTS)
+        s.add(row)
+    return row
@@ -0,0 +1,84 @@
+"""Ranked full-text search over every list in the bot, in one query.
+
+``search_documents`` holds one row per list item, written by triggers
+(``src.db.search_ddl``).  Postgres matches a weighted ``tsvector`` through
+its GIN index and ranks with ``ts_rank``; SQLite matches the FTS5 mirror
+``search_fts`` and ranks with ``bm25``.  Either way titles count ten times
+as much as the rest of the text, every word of the query must match (as a
+prefix), and each kind keeps only its best ``PER_KIND`` hits.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import column, func, literal_column, select, table, text
+
+from src.db import SEARCH_VECTOR_SQL, SearchDocument
+
+PER_KIND = 5
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    kind: str
+    item_id: int
+    title: str
+    body: str
+
+
+def query_terms(query: str) -> list[str]:
+    """The words of *query*, casefolded; punctuation never reaches the matcher."""
+    return _WORD.findall(query.casefold())
+
+
+async def search(
+    s, guild_id: int, query: str, per_kind: int = PER_KIND
+) -> dict[str, list[SearchHit]]:
+    """``{kind: hits}`` for *query* in the guild, best match first within each kind.
+
+    Kinds come out in the order of their best hit.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return {}
+    doc = SearchDocument.__table__
+    if (await s.connection()).dialect.name == "postgresql":
+        vector = literal_column(f"({SEARCH_VECTOR_SQL})")
+        tsquery = func.to_tsquery(
+            literal_column("'simple'::regconfig"), " & ".join(f"{term}:*" for term in terms)
+        )
+        score = func.ts_rank(vector, tsquery)
+        matched = select(doc).where(vector.op("@@")(tsquery))
+    else:
+        fts = table("search_fts", column("rowid"))
+        # bm25 is lower-is-better
+        score = -func.bm25(literal_column("search_fts"), 10.0, 1.0)
+        matched = (
+            select(doc)
+            .join(fts, fts.c.rowid == doc.c.id)
+            .where(
+                text("search_fts MATCH :terms").bindparams(
+                    terms=" ".join(f'"{term}"*' for term in terms)
+                )
+            )
+        )
+    scored = matched.where(doc.c.guild_id == guild_id).add_columns(score.label("score")).subquery()
+    # A separate level, as bm25() only works directly against its FTS match
+    ranked = select(
+        scored,
+        func.row_number()
+        .over(partition_by=scored.c.kind, order_by=scored.c.score.desc())
+        .label("place"),
+    ).subquery()
+    rows = await s.execute(
+        select(ranked.c.kind, ranked.c.item_id, ranked.c.title, ranked.c.body)
+        .where(ranked.c.place <= per_kind)
+        .order_by(ranked.c.score.desc())
+    )
+    hits: dict[str, list[SearchHit]] = {}
+    for kind, item_id, title, body in rows:
+        hits.setdefault(kind, []).append(SearchHit(kind, item_id, title, body))
+    return hits
@@ -0,0 +1,31 @@
+"""Case-insensitive partial text matching that runs in the database.
+
+Searchable text is stored a second time in a ``*_key`` column holding
+``normalize(text)``, so both sides of a comparison are already folded and
+a plain ``LIKE`` works the same on every backend.  On Postgres the key
+columns carry ``pg_trgm`` GIN indexes, which serve ``LIKE '%needle%'`` and
+also let a near miss ("misison") match through trigram similarity.  On
+SQLite a leading-wildcard ``LIKE`` cannot use a b-tree, so the
+``(guild_id, *_key)`` index only narrows the scan to one guild's rows.
+"""
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement, or_
+
+
+def normalize(text: str | None) -> str:
+    """Casefolded *text* with runs of whitespace collapsed to one space."""
+    return " ".join((text or "").casefold().split())
+
+
+def matches(key_column, needle: str, dialect: str) -> ColumnElement[bool]:
+    """Whether the normalized *key_column* contains *needle*.
+
+    On Postgres, values trigram-similar to *needle* (``pg_trgm``'s ``%``)
+    also match, so small typos still find the place.
+    """
+    needle = normalize(needle)
+    contains = key_column.contains(needle, autoescape=True)
+    if dialect == "postgresql":
+        return or_(contains, key_column.op("%")(needle))
+    return contains
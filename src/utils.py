@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import datetime
-import os
+import time
 import typing as t
+from dataclasses import dataclass, field
 from decimal import ROUND_HALF_UP, Decimal
 
 import discord
@@ -10,21 +11,125 @@ from discord import app_commands
 from discord.ext import commands
 from sqlalchemy import case, func, select
 
-DAVID_ID = 240608458888445953
-STEPH_ID = 694650702466908160
+from src.caches import TTLCache
+from src.db import Household, HouseholdMember
+
+# Seconds a loaded household roster is trusted before re-reading household_members
+MEMBERSHIP_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class HouseholdRoster:
+    """A guild's household as loaded from the database.
+
+    ``member_ids`` lists the owner first, then everyone else in join order;
+    it is empty when the guild has no household.
+    """
+
+    guild_id: int
+    household_id: int | None = None
+    owner_id: int | None = None
+    member_ids: tuple[int, ...] = ()
+    names: dict[int, str] = field(default_factory=dict)
+
+    def is_member(self, user_id: int) -> bool:
+        return user_id in self.member_ids
+
+    def partners_of(self, user_id: int) -> tuple[int, ...]:
+        """Everyone else in the household, or () if *user_id* is not a member."""
+        if user_id not in self.member_ids:
+            return ()
+        return tuple(m for m in self.member_ids if m != user_id)
+
+    def next_after(self, user_id: int) -> int:
+        """Round-robin successor of *user_id* (themselves if alone or unknown)."""
+        if user_id not in self.member_ids:
+            return user_id
+        i = self.member_ids.index(user_id)
+        return self.member_ids[(i + 1) % len(self.member_ids)]
+
+
+class MembershipCache(TTLCache[int, HouseholdRoster]):
+    """In-memory index of household rosters per guild, with a TTL.
+
+    A miss loads the whole guild roster in one query.
+    """
+
+    def __init__(
+        self, ttl: float = MEMBERSHIP_TTL, clock: t.Callable[[], float] = time.monotonic
+    ) -> None:
+        super().__init__(ttl, clock)
+
+
+membership = MembershipCache()
+
+
+async def load_roster(s, guild_id: int) -> HouseholdRoster:
+    """Read the guild's household and members (owner first, then join order)."""
+    household = await s.scalar(select(Household).where(Household.guild_id == guild_id))
+    if household is None:
+        return HouseholdRoster(guild_id=guild_id)
+    rows = (
+        await s.execute(
+            select(HouseholdMember.user_id, HouseholdMember.display_name)
+            .where(HouseholdMember.household_id == household.id)
+            .order_by(
+                case((HouseholdMember.user_id == household.owner_id, 0), else_=1),
+                HouseholdMember.added_at,
+                HouseholdMember.id,
+            )
+        )
+    ).all()
+    return HouseholdRoster(
+        guild_id=guild_id,
+        household_id=household.id,
+        owner_id=household.owner_id,
+        member_ids=tuple(int(r.user_id) for r in rows),
+        names={int(r.user_id): r.display_name for r in rows},
+    )
+
+
+async def load_household(s, guild_id: int) -> list[int]:
+    """Return the guild's household member IDs, owner first."""
+    return list((await load_roster(s, guild_id)).member_ids)
+
+
+async def household_roster(db, guild_id: int) -> HouseholdRoster:
+    """The guild's roster, from the cache or one load on a miss."""
+    cached = membership.get(guild_id)
+    if cached is not None:
+        return cached
+    async with db() as s:
+        roster = await load_roster(s, guild_id)
+    membership.put(guild_id, roster)
+    return roster
+
+
+async def household_partner_ids(db, guild_id: int, user_id: int) -> tuple[int, ...]:
+    """Partner IDs for *user_id*, from the cache or one roster load on a miss."""
+    return (await household_roster(db, guild_id)).partners_of(user_id)
+
+
+def member_label(roster: HouseholdRoster, user_id: int) -> str:
+    """*user_id*'s display name in *roster*'s household, else a mention."""
+    return roster.names.get(user_id) or f"<@{user_id}>"
 
 
 async def resolve_partner(interaction: discord.Interaction) -> discord.Member | None:
-    me_id = interaction.user.id
+    """Return the caller's household partner, or None if they have none.
+
+    Membership comes from ``membership`` and members from the gateway cache,
+    so a warm call makes no network requests.  ``fetch_member`` is only a
+    fallback for members the gateway has not cached yet.
+    """
     guild = interaction.guild
     if guild is None:
         return None
 
-    partner_ids = {
-        int(x) for x in os.getenv("PARTNER_IDS", "").split(",") if x.strip().isdigit()
-    }
-    other_id = next((uid for uid in partner_ids if uid != me_id), None)
-    if other_id:
+    partner_ids = await household_partner_ids(
+        interaction.client.db, guild.id, interaction.user.id
+    )
+    for other_id in partner_ids:
         m = guild.get_member(other_id)
         if m is None:
             try:
@@ -33,3 +138,4 @@ async def resolve_partner(interaction: discord.Interaction) -> discord.Member |
                 m = None
         if m and not m.bot:
             return m
+    return None
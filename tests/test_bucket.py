@@ -5,8 +5,9 @@ import pytest
 from datetime import datetime, timezone
 from sqlalchemy import select
 
-from src.cogs.bucket import _cat_label, _user_label, CATEGORIES, _CAT_EMOJI
+from src.cogs.bucket import _cat_label, CATEGORIES, _CAT_EMOJI
 from src.db import BucketListItem
+from src.utils import HouseholdRoster, member_label
 
 GUILD_ID = 999_000_000_000_000_004
 DAVID_ID = 240608458888445953
@@ -41,15 +42,17 @@ def test_all_categories_have_emoji():
 
 
 def test_user_label_david():
-    assert _user_label(DAVID_ID) == "David"
+    roster = HouseholdRoster(GUILD_ID, member_ids=(DAVID_ID,), names={DAVID_ID: "David"})
+    assert member_label(roster, DAVID_ID) == "David"
 
 
 def test_user_label_steph():
-    assert _user_label(STEPH_ID) == "Steph"
+    roster = HouseholdRoster(GUILD_ID, member_ids=(STEPH_ID,), names={STEPH_ID: "Steph"})
+    assert member_label(roster, STEPH_ID) == "Steph"
 
 
 def test_user_label_unknown():
-    label = _user_label(OTHER_ID)
+    label = member_label(HouseholdRoster(GUILD_ID), OTHER_ID)
     assert str(OTHER_ID) in label
 
 
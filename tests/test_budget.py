@@ -0,0 +1,558 @@
+"""Tests for the shared ledger — paging, rollups, export, import, categories and settling."""
+from __future__ import annotations
+
+import datetime
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.cogs.budget import (
+    LEDGER_PAGE_SIZE,
+    PAYMENT_CATEGORY,
+    ImportedEntry,
+    LedgerPager,
+    _category_series,
+    _format_delta,
+    _get_ledger_page,
+    _month_bounds,
+    _next_month,
+    _parse_month,
+    _prev_month,
+    _rollup_totals,
+    _sparkline,
+    close_ledger_month,
+    close_missing_ledger_months,
+    import_ledger_entries,
+    member_balances,
+    parse_splitwise_csv,
+    parse_venmo_csv,
+    record_ledger_entries,
+    simplify_debts,
+    write_ledger_export,
+)
+from src.db import LedgerCategoryMonthly, LedgerEntry, LedgerMonthlyRollup
+
+GUILD_ID = 999_000_000_000_000_007
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+OTHER_ID = 111222333444555777
+
+UTC = datetime.timezone.utc
+MARCH = datetime.date(2026, 3, 1)
+
+
+def _entry(creditor: int, debtor: int, cents: int, when: datetime.datetime, note: str = "") -> LedgerEntry:
+    return LedgerEntry(
+        guild_id=GUILD_ID,
+        creditor_id=creditor,
+        debtor_id=debtor,
+        amount_cents=cents,
+        note=note,
+        created_at=when,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Month helpers
+# ---------------------------------------------------------------------------
+
+def test_parse_month_valid():
+    assert _parse_month("2026-03") == MARCH
+
+
+def test_parse_month_invalid():
+    assert _parse_month("March") is None
+    assert _parse_month("2026-13") is None
+
+
+def test_next_month_wraps_year():
+    assert _next_month(datetime.date(2025, 12, 1)) == datetime.date(2026, 1, 1)
+
+
+def test_prev_month_wraps_year():
+    assert _prev_month(datetime.date(2026, 1, 1)) == datetime.date(2025, 12, 1)
+
+
+def test_month_bounds_are_half_open_utc():
+    start, end = _month_bounds(MARCH)
+    assert start == datetime.datetime(2026, 3, 1, tzinfo=UTC)
+    assert end == datetime.datetime(2026, 4, 1, tzinfo=UTC)
+
+
+# ---------------------------------------------------------------------------
+# Keyset paging
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_ledger_pages_walk_forward_and_back(db_session):
+    base = datetime.datetime(2026, 3, 2, tzinfo=UTC)
+    for i in range(7):
+        db_session.add(_entry(DAVID_ID, STEPH_ID, 100 + i, base + datetime.timedelta(hours=i), f"e{i}"))
+    await db_session.commit()
+    start, end = _month_bounds(MARCH)
+
+    page1, more = await _get_ledger_page(db_session, GUILD_ID, DAVID_ID, STEPH_ID, start, end, limit=3)
+    assert [e.note for e in page1] == ["e0", "e1", "e2"]
+    assert more is True
+
+    last = page1[-1]
+    page2, more = await _get_ledger_page(
+        db_session, GUILD_ID, DAVID_ID, STEPH_ID, start, end,
+        after=(last.created_at, last.id), limit=3,
+    )
+    assert [e.note for e in page2] == ["e3", "e4", "e5"]
+    assert more is True
+
+    first = page2[0]
+    back, more = await _get_ledger_page(
+        db_session, GUILD_ID, DAVID_ID, STEPH_ID, start, end,
+        before=(first.created_at, first.id), limit=3,
+    )
+    assert [e.note for e in back] == ["e0", "e1", "e2"]
+    assert more is False
+
+
+@pytest.mark.asyncio
+async def test_ledger_page_ties_on_created_at_use_id(db_session):
+    """Entries sharing a timestamp are still paged without gaps or repeats."""
+    when = datetime.datetime(2026, 3, 5, tzinfo=UTC)
+    for i in range(4):
+        db_session.add(_entry(DAVID_ID, STEPH_ID, 100, when, f"t{i}"))
+    await db_session.commit()
+    start, end = _month_bounds(MARCH)
+
+    page1, _ = await _get_ledger_page(db_session, GUILD_ID, DAVID_ID, STEPH_ID, start, end, limit=2)
+    last = page1[-1]
+    page2, more = await _get_ledger_page(
+        db_session, GUILD_ID, DAVID_ID, STEPH_ID, start, end,
+        after=(last.created_at, last.id), limit=2,
+    )
+    assert [e.note for e in page1 + page2] == ["t0", "t1", "t2", "t3"]
+    assert more is False
+
+
+@pytest.mark.asyncio
+async def test_ledger_pager_keeps_its_page_when_the_next_one_vanished(db_session):
+    for i in range(LEDGER_PAGE_SIZE + 1):
+        when = datetime.datetime(2026, 3, 1, tzinfo=UTC) + datetime.timedelta(hours=i)
+        db_session.add(_entry(DAVID_ID, STEPH_ID, 100, when, f"t{i}"))
+    await db_session.commit()
+    me = SimpleNamespace(id=DAVID_ID, mention="@david")
+    partner = SimpleNamespace(id=STEPH_ID, mention="@steph", display_name="Steph")
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    pager = LedgerPager(db, GUILD_ID, me, partner, MARCH, 0)
+    await pager.load()
+    assert not pager.next_button.disabled
+
+    await db_session.execute(delete(LedgerEntry).where(LedgerEntry.note == f"t{LEDGER_PAGE_SIZE}"))
+    await db_session.commit()
+    edits = []
+
+    async def edit_message(**kwargs):
+        edits.append(kwargs)
+
+    await pager.next_button.callback(
+        SimpleNamespace(response=SimpleNamespace(edit_message=edit_message))
+    )
+
+    assert pager.page == 1
+    assert len(pager.rows) == LEDGER_PAGE_SIZE
+    assert pager.next_button.disabled
+    assert edits[0]["embed"].footer.text is None
+
+
+@pytest.mark.asyncio
+async def test_ledger_page_excludes_other_pairs_and_months(db_session):
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 100, datetime.datetime(2026, 3, 3, tzinfo=UTC), "mine"))
+    db_session.add(_entry(DAVID_ID, OTHER_ID, 100, datetime.datetime(2026, 3, 3, tzinfo=UTC), "other"))
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 100, datetime.datetime(2026, 4, 1, tzinfo=UTC), "april"))
+    await db_session.commit()
+    start, end = _month_bounds(MARCH)
+
+    rows, more = await _get_ledger_page(db_session, GUILD_ID, DAVID_ID, STEPH_ID, start, end)
+    assert [e.note for e in rows] == ["mine"]
+    assert more is False
+
+
+# ---------------------------------------------------------------------------
+# Monthly rollups
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_close_ledger_month_aggregates_per_pair(db_session):
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 1000, datetime.datetime(2026, 3, 3, tzinfo=UTC)))
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 500, datetime.datetime(2026, 3, 20, tzinfo=UTC)))
+    db_session.add(_entry(STEPH_ID, DAVID_ID, 300, datetime.datetime(2026, 3, 21, tzinfo=UTC)))
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 9999, datetime.datetime(2026, 4, 2, tzinfo=UTC)))
+    await db_session.commit()
+
+    written = await close_ledger_month(db_session, MARCH)
+    assert written == 2
+
+    owed_to_me, owed_by_me, count = await _rollup_totals(
+        db_session, GUILD_ID, MARCH, DAVID_ID, STEPH_ID
+    )
+    assert owed_to_me == 1500
+    assert owed_by_me == 300
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_close_ledger_month_is_idempotent(db_session):
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 1000, datetime.datetime(2026, 3, 3, tzinfo=UTC)))
+    await db_session.commit()
+
+    await close_ledger_month(db_session, MARCH)
+    await close_ledger_month(db_session, MARCH)
+
+    rows = (await db_session.scalars(select(LedgerMonthlyRollup))).all()
+    assert len(rows) == 1
+    assert rows[0].amount_cents == 1000
+    assert rows[0].month == MARCH
+
+
+@pytest.mark.asyncio
+async def test_close_missing_ledger_months_catches_up(db_session):
+    """Months skipped while the bot was down are closed; rolled-up and empty ones aren't."""
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 100, datetime.datetime(2026, 1, 9, tzinfo=UTC)))
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 200, datetime.datetime(2026, 3, 3, tzinfo=UTC)))
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 400, datetime.datetime(2026, 4, 2, tzinfo=UTC)))
+    await db_session.commit()
+    await close_ledger_month(db_session, MARCH)
+
+    closed = await close_missing_ledger_months(db_session, datetime.date(2026, 4, 1))
+
+    assert closed == [datetime.date(2026, 1, 1)]
+    jan = await _rollup_totals(db_session, GUILD_ID, datetime.date(2026, 1, 1), DAVID_ID, STEPH_ID)
+    assert jan == (100, 0, 1)
+    april = await _rollup_totals(db_session, GUILD_ID, datetime.date(2026, 4, 1), DAVID_ID, STEPH_ID)
+    assert april == (0, 0, 0)
+    assert await close_missing_ledger_months(db_session, datetime.date(2026, 4, 1)) == []
+
+
+@pytest.mark.asyncio
+async def test_rollup_totals_empty_month(db_session):
+    assert await _rollup_totals(db_session, GUILD_ID, MARCH, DAVID_ID, STEPH_ID) == (0, 0, 0)
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_export_csv_streams_all_rows_in_order(db_session):
+    for i in range(3):
+        db_session.add(_entry(DAVID_ID, STEPH_ID, 1234 + i, datetime.datetime(2026, 3, 1 + i, tzinfo=UTC), f"n{i}"))
+    await db_session.commit()
+
+    out = io.StringIO()
+    count = await write_ledger_export(db_session, GUILD_ID, "csv", out)
+    lines = out.getvalue().splitlines()
+    assert count == 3
+    assert lines[0].startswith("id,created_at,creditor_id")
+    assert [line.split(",")[-1] for line in lines[1:]] == ["n0", "n1", "n2"]
+    assert "12.34" in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_export_jsonl_one_object_per_line(db_session):
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 500, datetime.datetime(2026, 3, 1, tzinfo=UTC), "pizza"))
+    await db_session.commit()
+
+    out = io.StringIO()
+    count = await write_ledger_export(db_session, GUILD_ID, "jsonl", out)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == 1
+    assert records[0]["note"] == "pizza"
+    assert records[0]["amount_cents"] == 500
+
+
+@pytest.mark.asyncio
+async def test_export_is_guild_scoped(db_session):
+    other = _entry(DAVID_ID, STEPH_ID, 500, datetime.datetime(2026, 3, 1, tzinfo=UTC))
+    other.guild_id = GUILD_ID + 1
+    db_session.add(other)
+    await db_session.commit()
+
+    assert await write_ledger_export(db_session, GUILD_ID, "csv", io.StringIO()) == 0
+
+
+# ---------------------------------------------------------------------------
+# Import parsing
+# ---------------------------------------------------------------------------
+
+VENMO_CSV = """Account Statement - (@David) ,,,,,,,
+Account Activity,,,,,,,
+,ID,Datetime,Type,Status,Note,From,To,Amount (total)
+,1,2026-03-02T18:21:05,Payment,Complete,Groceries,David,Steph,- $42.10
+,2,2026-03-05T09:00:00,Payment,Complete,Dinner,Steph,David,"+ $1,020.00"
+,3,2026-03-06T09:00:00,Payment,Pending,Ignored,Steph,David,+ $5.00
+"""
+
+SPLITWISE_CSV = """Date,Description,Category,Cost,Currency,David,Steph
+2026-03-02,Groceries,Food,80.00,USD,40.00,-40.00
+2026-03-04,Electric,Utilities,60.00,USD,-30.00,30.00
+
+2026-03-31,Total balance, , ,USD,10.00,-10.00
+"""
+
+
+def test_parse_venmo_skips_preamble_and_pending():
+    rows = parse_venmo_csv(VENMO_CSV)
+    assert [r.note for r in rows] == ["Groceries", "Dinner"]
+    assert rows[0].amount_cents == 4210
+    assert rows[0].importer_is_creditor is True  # importer paid
+    assert rows[1].amount_cents == 102000
+    assert rows[1].importer_is_creditor is False
+
+
+def test_parse_venmo_without_header_returns_empty():
+    assert parse_venmo_csv("not,a,venmo,file\n1,2,3,4") == []
+
+
+def test_parse_splitwise_defaults_to_first_member_column():
+    rows = parse_splitwise_csv(SPLITWISE_CSV)
+    assert [(r.note, r.amount_cents, r.importer_is_creditor) for r in rows] == [
+        ("Groceries", 4000, True),
+        ("Electric", 3000, False),
+    ]
+
+
+def test_parse_splitwise_named_column_flips_direction():
+    rows = parse_splitwise_csv(SPLITWISE_CSV, me_column="Steph")
+    assert [r.importer_is_creditor for r in rows] == [False, True]
+
+
+def test_parse_splitwise_keeps_category():
+    assert [r.category for r in parse_splitwise_csv(SPLITWISE_CSV)] == ["food", "utilities"]
+    assert all(r.category == "" for r in parse_venmo_csv(VENMO_CSV))
+
+
+# ---------------------------------------------------------------------------
+# Import insertion
+# ---------------------------------------------------------------------------
+
+def _imported(day: int, cents: int, note: str, creditor: bool = True) -> ImportedEntry:
+    return ImportedEntry(
+        created_at=datetime.datetime(2026, 3, day, 12, tzinfo=UTC),
+        amount_cents=cents,
+        note=note,
+        importer_is_creditor=creditor,
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_inserts_with_direction(db_session):
+    added = await import_ledger_entries(
+        db_session, GUILD_ID, DAVID_ID, STEPH_ID,
+        [_imported(2, 100, "a"), _imported(3, 200, "b", creditor=False)],
+    )
+    assert added == 2
+    rows = (await db_session.scalars(select(LedgerEntry).order_by(LedgerEntry.created_at))).all()
+    assert (rows[0].creditor_id, rows[0].debtor_id) == (DAVID_ID, STEPH_ID)
+    assert (rows[1].creditor_id, rows[1].debtor_id) == (STEPH_ID, DAVID_ID)
+
+
+@pytest.mark.asyncio
+async def test_import_dedupes_against_db_and_within_file(db_session):
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 100, datetime.datetime(2026, 3, 2, 8, tzinfo=UTC), "a"))
+    await db_session.commit()
+
+    added = await import_ledger_entries(
+        db_session, GUILD_ID, DAVID_ID, STEPH_ID,
+        [_imported(2, 100, "a"), _imported(4, 300, "c"), _imported(4, 300, "c")],
+    )
+    assert added == 1
+    total = len((await db_session.scalars(select(LedgerEntry))).all())
+    assert total == 2
+
+
+@pytest.mark.asyncio
+async def test_import_reimport_is_noop(db_session):
+    batch = [_imported(d, 100 * d, f"n{d}") for d in range(1, 29)]
+    assert await import_ledger_entries(db_session, GUILD_ID, DAVID_ID, STEPH_ID, batch) == 28
+    assert await import_ledger_entries(db_session, GUILD_ID, DAVID_ID, STEPH_ID, batch) == 0
+
+
+@pytest.mark.asyncio
+async def test_import_into_closed_month_rebuilds_rollup(db_session):
+    db_session.add(_entry(DAVID_ID, STEPH_ID, 1000, datetime.datetime(2026, 3, 1, 8, tzinfo=UTC)))
+    await db_session.commit()
+    await close_ledger_month(db_session, MARCH)
+
+    await import_ledger_entries(
+        db_session, GUILD_ID, DAVID_ID, STEPH_ID,
+        [_imported(2, 100, "a"), _imported(3, 200, "b", creditor=False)],
+    )
+
+    owed_to_me, owed_by_me, count = await _rollup_totals(
+        db_session, GUILD_ID, MARCH, DAVID_ID, STEPH_ID
+    )
+    assert (owed_to_me, owed_by_me, count) == (1100, 200, 3)
+
+
+# ---------------------------------------------------------------------------
+# Shared insert path
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_record_ledger_entries_skips_repeated_keys_only(db_session):
+    row = {"guild_id": GUILD_ID, "creditor_id": DAVID_ID, "debtor_id": STEPH_ID, "amount_cents": 100, "note": "x"}
+    assert await record_ledger_entries(db_session, [row, dict(row)]) == 2  # manual rows: no key
+    keyed = dict(row, idempotency_key="recurring:1:2026-05-01")
+    assert await record_ledger_entries(db_session, [keyed]) == 1
+    assert await record_ledger_entries(db_session, [keyed]) == 0
+    await db_session.commit()
+    assert len((await db_session.scalars(select(LedgerEntry))).all()) == 3
+
+
+# ---------------------------------------------------------------------------
+# Category aggregate and /budget review
+# ---------------------------------------------------------------------------
+
+def _row(cents: int, category: str, when: datetime.datetime, guild_id: int = GUILD_ID) -> dict:
+    return {
+        "guild_id": guild_id,
+        "creditor_id": DAVID_ID,
+        "debtor_id": STEPH_ID,
+        "amount_cents": cents,
+        "note": "",
+        "category": category,
+        "created_at": when,
+    }
+
+
+async def _category_totals(db_session) -> dict[tuple[datetime.date, str], tuple[int, int]]:
+    rows = (
+        await db_session.scalars(
+            select(LedgerCategoryMonthly).where(LedgerCategoryMonthly.guild_id == GUILD_ID)
+        )
+    ).all()
+    return {(r.month, r.category): (r.amount_cents, r.entry_count) for r in rows}
+
+
+@pytest.mark.asyncio
+async def test_record_ledger_entries_bumps_category_totals(db_session):
+    march = datetime.datetime(2026, 3, 5, tzinfo=UTC)
+    await record_ledger_entries(db_session, [_row(1000, "groceries", march), _row(-500, "groceries", march)])
+    await record_ledger_entries(db_session, [_row(250, "groceries", march), _row(300, "", march)])
+    await db_session.commit()
+
+    assert await _category_totals(db_session) == {
+        (MARCH, "groceries"): (1750, 3),  # absolute amounts: direction does not cancel spend
+        (MARCH, ""): (300, 1),
+    }
+
+
+@pytest.mark.asyncio
+async def test_skipped_idempotent_rows_do_not_bump_totals(db_session):
+    row = dict(_row(1000, "bills", datetime.datetime(2026, 3, 1, tzinfo=UTC)), idempotency_key="k")
+    await record_ledger_entries(db_session, [row])
+    await record_ledger_entries(db_session, [dict(row)])
+    await db_session.commit()
+
+    assert await _category_totals(db_session) == {(MARCH, "bills"): (1000, 1)}
+
+
+@pytest.mark.asyncio
+async def test_import_bumps_category_totals(db_session):
+    entry = ImportedEntry(
+        created_at=datetime.datetime(2026, 3, 9, tzinfo=UTC),
+        amount_cents=4000,
+        note="Groceries",
+        importer_is_creditor=True,
+        category="food",
+    )
+    await import_ledger_entries(db_session, GUILD_ID, DAVID_ID, STEPH_ID, [entry, entry])
+
+    assert await _category_totals(db_session) == {(MARCH, "food"): (4000, 1)}
+
+
+@pytest.mark.asyncio
+async def test_category_series_window_and_exclusions(db_session):
+    await record_ledger_entries(
+        db_session,
+        [
+            _row(100, "dining", datetime.datetime(2026, 1, 10, tzinfo=UTC)),
+            _row(300, "dining", datetime.datetime(2026, 3, 10, tzinfo=UTC)),
+            _row(900, PAYMENT_CATEGORY, datetime.datetime(2026, 3, 11, tzinfo=UTC)),
+            _row(700, "dining", datetime.datetime(2025, 9, 1, tzinfo=UTC)),  # outside window
+            _row(500, "dining", datetime.datetime(2026, 3, 12, tzinfo=UTC), guild_id=OTHER_ID),
+        ],
+    )
+    await db_session.commit()
+
+    months, series = await _category_series(db_session, GUILD_ID, MARCH, 6)
+    assert months[0] == datetime.date(2025, 10, 1) and months[-1] == MARCH
+    assert series == {"dining": [0, 0, 0, 100, 0, 300]}
+
+
+def test_sparkline_scales_between_min_and_max():
+    assert _sparkline([0, 50, 100]) == "▁▅█"
+    assert _sparkline([0, 0]) == "▁▁"
+    assert _sparkline([7, 7]) == "▄▄"
+
+
+def test_format_delta():
+    assert _format_delta(1500, 1000) == "▲ $5.00 (50%)"
+    assert _format_delta(500, 1000) == "▼ $5.00 (50%)"
+    assert _format_delta(500, 0) == "new"
+    assert _format_delta(0, 0) == "—"
+
+
+# ---------------------------------------------------------------------------
+# Settling up
+# ---------------------------------------------------------------------------
+
+def _apply(balances: dict[int, int], transfers: list[tuple[int, int, int]]) -> dict[int, int]:
+    after = dict(balances)
+    for debtor, creditor, cents in transfers:
+        after[debtor] += cents
+        after[creditor] -= cents
+    return after
+
+
+@pytest.mark.asyncio
+async def test_member_balances_nets_every_member(db_session):
+    when = datetime.datetime(2026, 3, 1, tzinfo=UTC)
+    db_session.add_all([
+        _entry(DAVID_ID, STEPH_ID, 1000, when),
+        _entry(STEPH_ID, OTHER_ID, 400, when),
+        _entry(STEPH_ID, DAVID_ID, -200, when),  # negative: David is the one owed
+        _entry(OTHER_ID, DAVID_ID, 0, when),
+    ])
+    await db_session.commit()
+
+    assert await member_balances(db_session, GUILD_ID) == {
+        DAVID_ID: 1200,
+        STEPH_ID: -800,
+        OTHER_ID: -400,
+    }
+    assert await member_balances(db_session, GUILD_ID + 1) == {}
+
+
+def test_simplify_debts_two_people():
+    assert simplify_debts({DAVID_ID: 500, STEPH_ID: -500}) == [(STEPH_ID, DAVID_ID, 500)]
+
+
+def test_simplify_debts_collapses_chains():
+    # a owes b 10, b owes c 10 → a pays c directly
+    assert simplify_debts({1: -10, 2: 0, 3: 10}) == [(1, 3, 10)]
+
+
+def test_simplify_debts_settles_large_group_in_at_most_n_minus_one():
+    balances = {uid: (uid * 37) % 101 - 50 for uid in range(1, 60)}
+    balances[60] = -sum(balances.values())
+    transfers = simplify_debts(balances)
+
+    assert len(transfers) <= len(balances) - 1
+    assert all(cents > 0 for _, _, cents in transfers)
+    assert all(v == 0 for v in _apply(balances, transfers).values())
+
+
+def test_simplify_debts_nothing_owed():
+    assert simplify_debts({}) == []
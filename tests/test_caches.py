@@ -0,0 +1,47 @@
+"""Tests for the shared in-process caches."""
+from __future__ import annotations
+
+from src.caches import LRUCache, TTLCache
+
+# ---------------------------------------------------------------------------
+# LRUCache
+# ---------------------------------------------------------------------------
+
+def test_lru_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a is now most recent
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert list(cache) == ["a", "c"]
+    assert len(cache) == 2
+
+
+def test_lru_pop_removes_one_key():
+    cache: LRUCache[str, int] = LRUCache()
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert list(cache) == ["b"]
+
+
+# ---------------------------------------------------------------------------
+# TTLCache
+# ---------------------------------------------------------------------------
+
+def test_ttl_expires_and_invalidates_per_key():
+    now = [0.0]
+    cache: TTLCache[int, str] = TTLCache(ttl=10, clock=lambda: now[0])
+    cache.put(1, "a")
+    cache.put(2, "b")
+    now[0] = 9.5
+    assert cache.get(1) == "a"
+
+    cache.invalidate(1)
+    assert cache.get(1) is None and cache.get(2) == "b"
+    now[0] = 10
+    assert cache.get(2) is None
@@ -0,0 +1,162 @@
+"""Tests for the packed check-in archive — bit layout, analytics, and upkeep."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from src.checkin_bits import (
+    CHECKED_BYTES,
+    PILLAR_BYTES,
+    CheckinHistory,
+    day_of_year,
+    load_histories,
+    load_history,
+    record_checkin_bits,
+    set_day,
+    unpack,
+)
+from src.db import CheckinBitmap
+
+GUILD_ID = 999_000_000_000_000_011
+DAVID_ID = 240608458888445953
+
+JAN_1 = date(2026, 1, 1)
+
+
+def _history(days: dict[int, tuple[bool, bool, bool]], length: int = 365) -> CheckinHistory:
+    pillars = checked = 0
+    for index, flags in days.items():
+        pillars, checked = set_day(pillars, checked, index, *flags)
+    return CheckinHistory(JAN_1, length, pillars, checked)
+
+
+ALL = (True, True, True)
+NONE = (False, False, False)
+
+
+# ---------------------------------------------------------------------------
+# Bit layout
+# ---------------------------------------------------------------------------
+
+def test_set_day_packs_three_bits_per_day():
+    pillars, checked = set_day(0, 0, 2, True, False, True)
+    assert pillars == 0b101 << 6
+    assert checked == 0b100
+
+
+def test_set_day_overwrites_previous_value():
+    pillars, checked = set_day(0, 0, 0, *ALL)
+    pillars, checked = set_day(pillars, checked, 0, False, True, False)
+    assert pillars == 0b010
+    assert checked == 1
+
+
+def test_leap_year_fits_in_stored_size():
+    pillars, checked = set_day(0, 0, day_of_year(date(2028, 12, 31)), *ALL)
+    assert day_of_year(date(2028, 12, 31)) == 365
+    pillars.to_bytes(PILLAR_BYTES, "little")
+    checked.to_bytes(CHECKED_BYTES, "little")
+
+
+# ---------------------------------------------------------------------------
+# Analytics
+# ---------------------------------------------------------------------------
+
+def test_zero_pillar_day_still_counts_as_checked_in():
+    h = _history({0: NONE, 1: ALL})
+    assert h.days_checked() == 2
+    assert h.heatmap()[:3] == [0, 3, None]
+
+
+def test_pillar_counts_and_rates():
+    h = _history({0: ALL, 1: (True, False, False), 2: (True, True, False), 3: NONE})
+    assert h.pillar_counts() == (3, 2, 1)
+    assert h.pillar_rates() == (0.75, 0.5, 0.25)
+
+
+def test_longest_streak():
+    h = _history({0: ALL, 1: ALL, 3: ALL, 4: ALL, 5: ALL, 6: (True, True, False)})
+    assert h.longest_streak() == 3
+    assert h.complete_days() == 5
+
+
+def test_current_streak_counts_back_from_today():
+    h = _history({3: ALL, 4: ALL, 5: ALL})
+    assert h.current_streak(JAN_1 + timedelta(days=5)) == 3
+    # Today not logged yet — the streak through yesterday still stands
+    assert h.current_streak(JAN_1 + timedelta(days=6)) == 3
+    assert h.current_streak(JAN_1 + timedelta(days=7)) == 0
+
+
+def test_current_streak_from_day_zero():
+    assert _history({0: ALL, 1: ALL}).current_streak(JAN_1 + timedelta(days=1)) == 2
+
+
+def test_streak_carries_across_new_year():
+    dec_31 = day_of_year(date(2025, 12, 31))
+    p25, c25 = set_day(0, 0, dec_31, *ALL)
+    p26, c26 = set_day(0, 0, 0, *ALL)
+    h = CheckinHistory.from_years([(2025, p25, c25), (2026, p26, c26)], 2025, 2026)
+    assert h.days == 365 + 365
+    assert h.longest_streak() == 2
+    assert h.current_streak(JAN_1) == 2
+
+
+def test_window_shifts_and_pads():
+    h = _history({0: ALL, 1: (True, False, False), 3: ALL})
+    w = h.window(date(2026, 1, 2), date(2026, 1, 4))
+    assert (w.days, w.days_checked(), w.complete_days()) == (3, 2, 1)
+    # Days before the history are empty
+    w = h.window(date(2025, 12, 30), date(2026, 1, 1))
+    assert w.checked == 0b100
+
+
+def test_day_bits_one_bit_per_day():
+    h = _history({0: ALL, 1: (True, False, False), 2: (False, True, False)}, length=5)
+    assert h.day_bits() == 0b001
+    assert h.day_bits(0) == 0b011
+    assert h.day_bits(1) == 0b101
+    assert h.day_bits(2) == 0b001
+
+
+# ---------------------------------------------------------------------------
+# Database upkeep
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_record_checkin_bits_creates_and_updates_row(db_session):
+    day = date(2026, 4, 21)
+    await record_checkin_bits(db_session, GUILD_ID, DAVID_ID, day, True, False, True)
+    await db_session.commit()
+    await record_checkin_bits(db_session, GUILD_ID, DAVID_ID, day, True, True, True)
+    await db_session.commit()
+
+    rows = (await db_session.scalars(select(CheckinBitmap))).all()
+    assert len(rows) == 1
+    assert len(rows[0].pillars) == PILLAR_BYTES
+    assert unpack(rows[0].pillars) == 0b111 << (3 * day_of_year(day))
+
+
+@pytest.mark.asyncio
+async def test_load_history_spans_years(db_session):
+    await record_checkin_bits(db_session, GUILD_ID, DAVID_ID, date(2025, 12, 31), *ALL)
+    await record_checkin_bits(db_session, GUILD_ID, DAVID_ID, date(2026, 1, 1), *ALL)
+    await db_session.commit()
+
+    h = await load_history(db_session, GUILD_ID, DAVID_ID, 2025, 2026)
+    assert h.days_checked() == 2
+    assert h.longest_streak() == 2
+    assert (await load_history(db_session, GUILD_ID + 1, DAVID_ID, 2025, 2026)).days_checked() == 0
+
+
+@pytest.mark.asyncio
+async def test_load_histories_reads_every_member(db_session):
+    await record_checkin_bits(db_session, GUILD_ID, DAVID_ID, date(2026, 1, 2), *ALL)
+    await db_session.commit()
+
+    histories = await load_histories(db_session, GUILD_ID, [DAVID_ID, 1], 2026, 2026)
+    assert list(histories) == [DAVID_ID, 1]
+    assert histories[DAVID_ID].days_checked() == 1
+    assert histories[1].days_checked() == 0
@@ -0,0 +1,97 @@
+"""Tests for per-household and per-member local clocks."""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import select
+
+from src.clock import ClockCache, GuildClocks, LocalClock, load_clocks, week_start_for
+from src.cogs.household import add_household_member
+from src.db import HouseholdMember
+from src.scheduler import guild_settings_row
+
+GUILD_ID = 999_000_000_000_000_013
+
+ET = ZoneInfo("America/New_York")
+TOKYO = ZoneInfo("Asia/Tokyo")
+UTC = timezone.utc
+
+
+# ---------------------------------------------------------------------------
+# Local days and weeks
+# ---------------------------------------------------------------------------
+
+def test_week_start_for_a_monday_week():
+    # Sunday Apr 26 2026 belongs to the week starting Monday Apr 20
+    assert week_start_for(date(2026, 4, 26), 0) == date(2026, 4, 20)
+    assert week_start_for(date(2026, 4, 27), 0) == date(2026, 4, 27)
+    # With the default Sunday start it opens its own week
+    assert week_start_for(date(2026, 4, 26)) == date(2026, 4, 26)
+
+
+def test_today_follows_the_clock_zone():
+    now = datetime(2026, 4, 21, 2, 30, tzinfo=UTC)  # 22:30 EDT on Apr 20
+    assert LocalClock(ET).today(now) == date(2026, 4, 20)
+    assert LocalClock(TOKYO).today(now) == date(2026, 4, 21)
+
+
+def test_day_bounds_span_the_dst_change():
+    start, end = LocalClock(ET).day_bounds(date(2026, 3, 8))
+    assert start == datetime(2026, 3, 8, 5, 0, tzinfo=UTC)
+    assert end == datetime(2026, 3, 9, 4, 0, tzinfo=UTC)
+    assert (end - start).total_seconds() == 23 * 3600
+
+
+def test_range_bounds_cover_whole_local_days():
+    start, end = LocalClock(TOKYO).range_bounds(date(2026, 4, 1), date(2026, 4, 30))
+    assert start == datetime(2026, 3, 31, 15, 0, tzinfo=UTC)
+    assert end == datetime(2026, 4, 30, 15, 0, tzinfo=UTC)
+
+
+def test_member_zone_overrides_the_household():
+    clocks = GuildClocks(LocalClock(ET, 0), {1: TOKYO})
+    assert clocks.for_user(1) == LocalClock(TOKYO, 0)
+    assert clocks.for_user(2) is clocks.household
+    assert clocks.for_user(None) is clocks.household
+
+
+# ---------------------------------------------------------------------------
+# Loading and caching
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_load_clocks_reads_settings_and_members(db_session):
+    assert await load_clocks(db_session, GUILD_ID) == GuildClocks()
+
+    row = await guild_settings_row(db_session, GUILD_ID)
+    row.timezone = "Europe/London"
+    row.week_start = 0
+    await add_household_member(db_session, GUILD_ID, 1)
+    await add_household_member(db_session, GUILD_ID, 2)
+    member = await db_session.scalar(
+        select(HouseholdMember).where(
+            HouseholdMember.guild_id == GUILD_ID, HouseholdMember.user_id == 1
+        )
+    )
+    member.timezone = "Asia/Tokyo"
+    await db_session.commit()
+
+    clocks = await load_clocks(db_session, GUILD_ID)
+    assert clocks.household == LocalClock(ZoneInfo("Europe/London"), 0)
+    assert clocks.member_zones == {1: TOKYO}
+
+
+def test_clock_cache_expires_and_invalidates():
+    now = [0.0]
+    cache = ClockCache(ttl=10, clock=lambda: now[0])
+    cache.put(GUILD_ID, GuildClocks())
+    assert cache.get(GUILD_ID) == GuildClocks()
+
+    now[0] = 10.0
+    assert cache.get(GUILD_ID) is None
+
+    cache.put(GUILD_ID, GuildClocks())
+    cache.invalidate(GUILD_ID)
+    assert cache.get(GUILD_ID) is None
@@ -3,11 +3,13 @@ from __future__ import annotations
 
 import datetime as _dt
 
+import discord
 import pytest
 from sqlalchemy import select
 
-from src.cogs.datenight import _days_until, _get_or_create_planner
+from src.cogs.datenight import _add_lines, _days_until, _get_or_create_planner
 from src.db import DateNightLog, DateNightPlanner, DateNightWishlist, SpecialDate
+from src.paging import FIELD_MAX_CHARS
 
 GUILD_ID = 999_000_000_000_000_002
 DAVID_ID = 240608458888445953
@@ -336,3 +338,25 @@ def test_days_until_years_for_anniversary():
     birth_year = 2019
     years = next_date.year - birth_year
     assert years == 7
+
+
+# ---------------------------------------------------------------------------
+# _add_lines — wishlist sections within Discord's field limit
+# ---------------------------------------------------------------------------
+
+def test_add_lines_fits_in_one_field():
+    embed = discord.Embed()
+    _add_lines(embed, "To Try (2)", ["• **Picnic**", "• **Planetarium**"])
+    assert [(f.name, f.value) for f in embed.fields] == [
+        ("To Try (2)", "• **Picnic**\n• **Planetarium**")
+    ]
+
+
+def test_add_lines_continues_past_value_limit():
+    lines = [f"• {'x' * 400} {i}" for i in range(5)]
+    embed = discord.Embed()
+    _add_lines(embed, "To Try (5)", lines)
+    assert embed.fields[0].name == "To Try (5)"
+    assert all(f.name == "\u200b" for f in embed.fields[1:])
+    assert all(len(f.value) <= FIELD_MAX_CHARS for f in embed.fields)
+    assert "\n".join(f.value for f in embed.fields) == "\n".join(lines)
@@ -0,0 +1,99 @@
+"""Tests for heatmap PNG rendering and the render cache."""
+from __future__ import annotations
+
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+from src.cogs.playoff import DaySummary, household_cells
+from src.heatmap import CELL, GAP, MARGIN, HeatmapCache, render_heatmap_png
+
+SUNDAY = date(2026, 4, 19)
+
+
+def _decode(png: bytes) -> tuple[int, int, list[bytes]]:
+    """Return (width, height, RGB rows) from a PNG written by encode_png."""
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, idat, width, height = 8, b"", 0, 0
+    while pos < len(png):
+        (length,) = struct.unpack(">I", png[pos : pos + 4])
+        kind, data = png[pos + 4 : pos + 8], png[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack(">I", png[pos + 8 + length : pos + 12 + length])
+        assert crc == zlib.crc32(kind + data)
+        if kind == b"IHDR":
+            width, height = struct.unpack(">II", data[:8])
+        elif kind == b"IDAT":
+            idat += data
+        pos += 12 + length
+    raw = zlib.decompress(idat)
+    stride = 1 + 3 * width
+    return width, height, [raw[i * stride + 1 : (i + 1) * stride] for i in range(height)]
+
+
+def _pixel(rows: list[bytes], week: int, weekday: int) -> tuple[int, int, int]:
+    x = MARGIN + week * (CELL + GAP)
+    y = MARGIN + weekday * (CELL + GAP)
+    return tuple(rows[y][3 * x : 3 * x + 3])
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def test_png_dimensions_follow_week_count():
+    width, height, rows = _decode(render_heatmap_png([3] * 14, SUNDAY))
+    assert width == 2 * MARGIN + 2 * (CELL + GAP) - GAP
+    assert height == 2 * MARGIN + 7 * (CELL + GAP) - GAP
+    assert len(rows) == height and all(len(r) == 3 * width for r in rows)
+
+
+def test_cells_land_on_their_weekday():
+    # Start on a Tuesday: Sun/Mon of the first week are left as background
+    tuesday = SUNDAY + timedelta(days=2)
+    _, _, rows = _decode(render_heatmap_png([3, None, 0], tuesday))
+    assert _pixel(rows, 0, 0) == (0xFF, 0xFF, 0xFF)
+    assert _pixel(rows, 0, 2) == (0x21, 0x6E, 0x39)   # 3 pillars
+    assert _pixel(rows, 0, 3) == (0xEB, 0xED, 0xF0)   # no check-in
+    assert _pixel(rows, 0, 4) == (0xD0, 0xD7, 0xDE)   # checked in, 0 pillars
+
+
+def test_render_runs_in_a_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        png = pool.submit(render_heatmap_png, [1, 2, 3], SUNDAY).result(timeout=30)
+    assert png == render_heatmap_png([1, 2, 3], SUNDAY)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def test_cache_evicts_least_recently_used():
+    cache = HeatmapCache(maxsize=2)
+    a, b, c = ((1, 1, SUNDAY, SUNDAY, (n,)) for n in range(3))
+    cache.put(a, b"a")
+    cache.put(b, b"b")
+    assert cache.get(a) == b"a"  # a is now most recent
+    cache.put(c, b"c")
+    assert cache.get(b) is None
+    assert cache.get(a) == b"a" and cache.get(c) == b"c"
+
+
+def test_new_data_version_misses():
+    cache = HeatmapCache()
+    cache.put((1, 1, SUNDAY, SUNDAY, (3, "t1")), b"old")
+    assert cache.get((1, 1, SUNDAY, SUNDAY, (4, "t2"))) is None
+
+
+# ---------------------------------------------------------------------------
+# Household cells
+# ---------------------------------------------------------------------------
+
+def test_household_cells_scale_by_share_complete():
+    days = [
+        DaySummary(SUNDAY, won=True, completed=frozenset({1, 2, 3})),
+        DaySummary(SUNDAY + timedelta(days=1), won=False, completed=frozenset({1, 2})),
+        DaySummary(SUNDAY + timedelta(days=3), won=False, completed=frozenset()),
+    ]
+    cells = household_cells(days, SUNDAY, SUNDAY + timedelta(days=3), member_count=3)
+    assert cells == [3, 2, None, 0]
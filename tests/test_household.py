@@ -0,0 +1,160 @@
+"""Tests for household membership — roster storage and the partner cache."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.cogs.household import (
+    add_household_member,
+    remove_household_member,
+    set_household_owner,
+)
+from src.utils import (
+    HouseholdRoster,
+    MembershipCache,
+    household_partner_ids,
+    load_household,
+    load_roster,
+    member_label,
+    membership,
+)
+
+GUILD_ID = 999_000_000_000_000_010
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+OTHER_ID = 111222333444555777
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------------------------------------------------------------------------
+# MembershipCache
+# ---------------------------------------------------------------------------
+
+def _roster(guild_id: int = GUILD_ID, *member_ids: int) -> HouseholdRoster:
+    return HouseholdRoster(guild_id=guild_id, member_ids=member_ids or (DAVID_ID, STEPH_ID))
+
+
+def test_cache_miss_until_roster_loaded():
+    cache = MembershipCache(clock=FakeClock())
+    assert cache.get(GUILD_ID) is None
+
+
+def test_roster_partners_from_one_load():
+    roster = _roster()
+    assert roster.partners_of(DAVID_ID) == (STEPH_ID,)
+    assert roster.partners_of(STEPH_ID) == (DAVID_ID,)
+    assert roster.partners_of(OTHER_ID) == ()  # known non-member
+
+
+def test_roster_next_after_round_robins():
+    roster = _roster(GUILD_ID, DAVID_ID, STEPH_ID, OTHER_ID)
+    assert roster.next_after(DAVID_ID) == STEPH_ID
+    assert roster.next_after(OTHER_ID) == DAVID_ID
+    assert _roster(GUILD_ID, DAVID_ID).next_after(DAVID_ID) == DAVID_ID
+
+
+def test_cache_expires_after_ttl():
+    clock = FakeClock()
+    cache = MembershipCache(ttl=60, clock=clock)
+    cache.put(GUILD_ID, _roster())
+    clock.now += 59
+    assert cache.get(GUILD_ID).member_ids == (DAVID_ID, STEPH_ID)
+    clock.now += 1
+    assert cache.get(GUILD_ID) is None
+
+
+def test_cache_invalidate_is_per_guild():
+    cache = MembershipCache(clock=FakeClock())
+    cache.put(GUILD_ID, _roster())
+    cache.put(GUILD_ID + 1, _roster(GUILD_ID + 1, OTHER_ID))
+    cache.invalidate(GUILD_ID)
+    assert cache.get(GUILD_ID) is None
+    assert cache.get(GUILD_ID + 1).member_ids == (OTHER_ID,)
+
+
+def test_member_label_only_uses_its_own_roster():
+    ours = HouseholdRoster(GUILD_ID, member_ids=(DAVID_ID,), names={DAVID_ID: "David"})
+    theirs = HouseholdRoster(GUILD_ID + 1, member_ids=(DAVID_ID,), names={DAVID_ID: "Dave"})
+    assert member_label(ours, DAVID_ID) == "David"
+    assert member_label(theirs, DAVID_ID) == "Dave"
+    assert member_label(ours, STEPH_ID) == f"<@{STEPH_ID}>"
+
+
+# ---------------------------------------------------------------------------
+# Roster storage
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_add_and_remove_household_member(db_session):
+    assert await add_household_member(db_session, GUILD_ID, DAVID_ID) is True
+    assert await add_household_member(db_session, GUILD_ID, STEPH_ID) is True
+    assert await add_household_member(db_session, GUILD_ID, DAVID_ID) is False
+    assert await load_household(db_session, GUILD_ID) == [DAVID_ID, STEPH_ID]
+
+    assert await remove_household_member(db_session, GUILD_ID, DAVID_ID) is True
+    assert await remove_household_member(db_session, GUILD_ID, DAVID_ID) is False
+    assert await load_household(db_session, GUILD_ID) == [STEPH_ID]
+
+
+@pytest.mark.asyncio
+async def test_partner_ids_served_from_cache_after_first_load(db_session):
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    membership.invalidate(GUILD_ID)
+    await add_household_member(db_session, GUILD_ID, DAVID_ID)
+    await add_household_member(db_session, GUILD_ID, STEPH_ID)
+
+    assert await household_partner_ids(db, GUILD_ID, DAVID_ID) == (STEPH_ID,)
+    assert membership.get(GUILD_ID).partners_of(STEPH_ID) == (DAVID_ID,)
+
+
+@pytest.mark.asyncio
+async def test_membership_change_invalidates_cache(db_session):
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    await add_household_member(db_session, GUILD_ID, DAVID_ID)
+    assert await household_partner_ids(db, GUILD_ID, DAVID_ID) == ()
+
+    await add_household_member(db_session, GUILD_ID, STEPH_ID)
+    assert membership.get(GUILD_ID) is None
+    assert await household_partner_ids(db, GUILD_ID, DAVID_ID) == (STEPH_ID,)
+
+
+@pytest.mark.asyncio
+async def test_first_member_owns_household(db_session):
+    await add_household_member(db_session, GUILD_ID, STEPH_ID, "Steph")
+    await add_household_member(db_session, GUILD_ID, DAVID_ID, "David")
+    roster = await load_roster(db_session, GUILD_ID)
+    assert roster.owner_id == STEPH_ID
+    assert roster.member_ids == (STEPH_ID, DAVID_ID)
+    assert roster.names == {STEPH_ID: "Steph", DAVID_ID: "David"}
+
+
+@pytest.mark.asyncio
+async def test_owner_is_listed_first(db_session):
+    await add_household_member(db_session, GUILD_ID, DAVID_ID)
+    await add_household_member(db_session, GUILD_ID, STEPH_ID)
+    await add_household_member(db_session, GUILD_ID, OTHER_ID)
+    assert await set_household_owner(db_session, GUILD_ID, OTHER_ID) is True
+    assert await load_household(db_session, GUILD_ID) == [OTHER_ID, DAVID_ID, STEPH_ID]
+
+
+@pytest.mark.asyncio
+async def test_set_owner_requires_membership(db_session):
+    await add_household_member(db_session, GUILD_ID, DAVID_ID)
+    assert await set_household_owner(db_session, GUILD_ID, OTHER_ID) is False
+    assert (await load_roster(db_session, GUILD_ID)).owner_id == DAVID_ID
+
+
+@pytest.mark.asyncio
+async def test_owner_leaving_passes_ownership_on(db_session):
+    await add_household_member(db_session, GUILD_ID, DAVID_ID)
+    await add_household_member(db_session, GUILD_ID, STEPH_ID)
+    await add_household_member(db_session, GUILD_ID, OTHER_ID)
+    await remove_household_member(db_session, GUILD_ID, DAVID_ID)
+    assert (await load_roster(db_session, GUILD_ID)).owner_id == STEPH_ID
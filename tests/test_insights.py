@@ -0,0 +1,122 @@
+"""Tests for pillar trends, weekday effects and correlations."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.checkin_bits import CheckinHistory, set_day
+from src.insights import (
+    LONG_WEEKS,
+    InsightsCache,
+    compute_insights,
+    member_insights,
+    phi,
+    weekday_mask,
+)
+
+WEEK_START = date(2026, 4, 19)  # Sunday
+FIRST = WEEK_START - timedelta(weeks=LONG_WEEKS)
+
+ALL = (True, True, True)
+
+
+def _history(days: dict[date, tuple[bool, bool, bool]]) -> CheckinHistory:
+    pillars = checked = 0
+    for day, flags in days.items():
+        pillars, checked = set_day(pillars, checked, (day - FIRST).days, *flags)
+    return CheckinHistory(FIRST, LONG_WEEKS * 7, pillars, checked)
+
+
+def _every_day(flags_for) -> dict[date, tuple[bool, bool, bool]]:
+    return {FIRST + timedelta(days=i): flags_for(i) for i in range(LONG_WEEKS * 7)}
+
+
+# ---------------------------------------------------------------------------
+# Building blocks
+# ---------------------------------------------------------------------------
+
+def test_phi_of_identical_and_opposite_series():
+    population = (1 << 10) - 1
+    a = 0b1010101010
+    assert phi(a, a, population) == pytest.approx(1.0)
+    assert phi(a, ~a & population, population) == pytest.approx(-1.0)
+
+
+def test_phi_needs_enough_varying_days():
+    assert phi(0b1, 0b1, 0b11) is None
+    # A series that never varies has no correlation
+    assert phi((1 << 10) - 1, 0b1010101010, (1 << 10) - 1) is None
+
+
+def test_weekday_mask():
+    # Jan 1 2026 is a Thursday
+    mask = weekday_mask(date(2026, 1, 1), 15, 3)
+    assert [i for i in range(15) if mask >> i & 1] == [0, 7, 14]
+    assert weekday_mask(date(2026, 1, 1), 3, 0) == 0
+
+
+# ---------------------------------------------------------------------------
+# Insights
+# ---------------------------------------------------------------------------
+
+def test_recent_and_long_rates():
+    # Pillar 3 only done in the last four weeks
+    recent_start = (WEEK_START - timedelta(weeks=4) - FIRST).days
+    history = _history(_every_day(lambda i: (True, False, i >= recent_start)))
+    m = member_insights(1, history, WEEK_START)
+
+    assert m.recent == (1.0, 0.0, 1.0)
+    assert m.overall[0] == 1.0
+    assert m.overall[2] == pytest.approx(4 / LONG_WEEKS)
+
+
+def test_weekday_effects():
+    # Complete except on Saturdays
+    def flags(i: int) -> tuple[bool, bool, bool]:
+        return (True, False, False) if (FIRST + timedelta(days=i)).weekday() == 5 else ALL
+
+    history = _history(_every_day(flags))
+    m = member_insights(1, history, WEEK_START)
+    assert m.weekdays[5] == 0.0
+    assert m.weekdays[0] == 1.0
+
+
+def test_member_without_checkins():
+    m = member_insights(1, CheckinHistory(FIRST, 0), WEEK_START)
+    assert m.recent == (None, None, None)
+    assert m.weekdays == (None,) * 7
+    assert set(m.pillar_correlations.values()) == {None}
+
+
+def test_pillar_and_partner_correlations():
+    david = _history(_every_day(lambda i: (i % 2 == 0, i % 2 == 0, True)))
+    steph = _history(_every_day(lambda i: ALL if i % 2 == 1 else (False, False, False)))
+    insights = compute_insights({1: david, 2: steph}, WEEK_START)
+
+    m = insights.members[0]
+    assert m.pillar_correlations[(0, 1)] == pytest.approx(1.0)
+    # Pillar 3 never varies
+    assert m.pillar_correlations[(0, 2)] is None
+    assert insights.partner_correlations[(1, 2)] == pytest.approx(-1.0)
+
+
+def test_current_week_is_ignored():
+    history = _history({WEEK_START - timedelta(days=1): ALL})
+    monday = history.days + 1
+    later = CheckinHistory(
+        history.start,
+        history.days + 7,
+        history.pillars | 0b111 << 3 * monday,
+        history.checked | 1 << monday,
+    )
+    assert member_insights(1, later, WEEK_START) == member_insights(1, history, WEEK_START)
+
+
+def test_cache_evicts_oldest():
+    cache = InsightsCache(maxsize=1)
+    first = compute_insights({}, WEEK_START)
+    cache.put((1, WEEK_START, ()), first)
+    cache.put((2, WEEK_START, ()), compute_insights({}, WEEK_START))
+    assert cache.get((1, WEEK_START, ())) is None
+    assert len(cache) == 1
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import datetime
-import typing as t
 import pytest
 from sqlalchemy import select
 
@@ -12,10 +11,10 @@ from src.cogs.outings import (
     _BUDGET_LABEL,
     _NEVER_VISITED_WEIGHT,
     _cat_label,
-    _user_label,
-    _roulette_weights,
+    roulette_candidates,
 )
 from src.db import OutingWishlistItem
+from src.utils import HouseholdRoster, member_label
 
 GUILD_ID = 999_000_000_000_000_005
 DAVID_ID = 240608458888445953
@@ -46,15 +45,17 @@ def test_cat_label_unknown_falls_back():
 
 
 def test_user_label_david():
-    assert _user_label(DAVID_ID) == "David"
+    roster = HouseholdRoster(GUILD_ID, member_ids=(DAVID_ID,), names={DAVID_ID: "David"})
+    assert member_label(roster, DAVID_ID) == "David"
 
 
 def test_user_label_steph():
-    assert _user_label(STEPH_ID) == "Steph"
+    roster = HouseholdRoster(GUILD_ID, member_ids=(STEPH_ID,), names={STEPH_ID: "Steph"})
+    assert member_label(roster, STEPH_ID) == "Steph"
 
 
 def test_user_label_unknown_mentions():
-    label = _user_label(OTHER_ID)
+    label = member_label(HouseholdRoster(GUILD_ID), OTHER_ID)
     assert str(OTHER_ID) in label
 
 
@@ -68,59 +69,68 @@ def test_budget_labels_defined():
 # Roulette weight logic
 # ---------------------------------------------------------------------------
 
-import types as _types
+async def _add_item(db_session, name: str, category: str, visited_at=None, **kw) -> None:
+    db_session.add(OutingWishlistItem(
+        guild_id=GUILD_ID, name=name, category=category, added_by=DAVID_ID,
+        visited=visited_at is not None, visited_at=visited_at, **kw,
+    ))
+    await db_session.commit()
 
 
-def _make_item(category: str) -> t.Any:
-    """Lightweight stand-in for roulette weight tests — only needs .category."""
-    return _types.SimpleNamespace(category=category)
+async def _weights(db_session, **filters) -> dict[str, float]:
+    """{name: roulette weight} for the unvisited candidates, computed in SQL."""
+    q, weight = await roulette_candidates(db_session, GUILD_ID, TODAY, **filters)
+    rows = await db_session.execute(q.with_only_columns(OutingWishlistItem.name, weight))
+    return {name: float(w) for name, w in rows}
 
 
-def test_never_visited_category_gets_max_weight():
-    candidates = [_make_item("italian")]
-    weights = _roulette_weights(candidates, {}, TODAY)
-    assert weights[0] == float(_NEVER_VISITED_WEIGHT)
+@pytest.mark.asyncio
+async def test_never_visited_category_gets_max_weight(db_session):
+    await _add_item(db_session, "Pasta", "italian")
+    assert await _weights(db_session) == {"Pasta": float(_NEVER_VISITED_WEIGHT)}
 
 
-def test_recently_visited_category_gets_low_weight():
-    # Visited yesterday → 1 day
-    last = {TODAY.category if hasattr(TODAY, "category") else "italian": TODAY - datetime.timedelta(days=1)}
-    last = {"italian": TODAY - datetime.timedelta(days=1)}
-    candidates = [_make_item("italian")]
-    weights = _roulette_weights(candidates, last, TODAY)
-    assert weights[0] == 1.0
+@pytest.mark.asyncio
+async def test_recently_visited_category_gets_low_weight(db_session):
+    await _add_item(db_session, "Old", "italian", TODAY - datetime.timedelta(days=1))
+    await _add_item(db_session, "Pasta", "italian")
+    assert await _weights(db_session) == {"Pasta": 1.0}
 
 
-def test_weight_reflects_days_since_visit():
-    last = {"thai": TODAY - datetime.timedelta(days=30)}
-    candidates = [_make_item("thai")]
-    weights = _roulette_weights(candidates, last, TODAY)
-    assert weights[0] == 30.0
+@pytest.mark.asyncio
+async def test_weight_reflects_days_since_visit(db_session):
+    await _add_item(db_session, "Old", "thai", TODAY - datetime.timedelta(days=30))
+    await _add_item(db_session, "Curry", "thai")
+    assert await _weights(db_session) == {"Curry": 30.0}
 
 
-def test_unvisited_category_outweighs_recently_visited():
-    last = {"italian": TODAY - datetime.timedelta(days=5)}
-    candidates = [_make_item("italian"), _make_item("japanese")]
-    weights = _roulette_weights(candidates, last, TODAY)
-    italian_w, japanese_w = weights
+@pytest.mark.asyncio
+async def test_unvisited_category_outweighs_recently_visited(db_session):
+    await _add_item(db_session, "Old", "italian", TODAY - datetime.timedelta(days=5))
+    await _add_item(db_session, "Pasta", "italian")
+    await _add_item(db_session, "Sushi", "japanese")
+    weights = await _weights(db_session)
     # japanese never visited → max weight; italian visited 5 days ago → 5
-    assert japanese_w == float(_NEVER_VISITED_WEIGHT)
-    assert italian_w == 5.0
-    assert japanese_w > italian_w
+    assert weights == {"Pasta": 5.0, "Sushi": float(_NEVER_VISITED_WEIGHT)}
 
 
-def test_roulette_weights_floor_at_one():
+@pytest.mark.asyncio
+async def test_roulette_weights_floor_at_one(db_session):
     # visited today → 0 days difference, floor should be 1
-    last = {"mexican": TODAY}
-    candidates = [_make_item("mexican")]
-    weights = _roulette_weights(candidates, last, TODAY)
-    assert weights[0] >= 1.0
+    await _add_item(db_session, "Old", "mexican", TODAY)
+    await _add_item(db_session, "Tacos", "mexican")
+    assert await _weights(db_session) == {"Tacos": 1.0}
 
 
-def test_roulette_weights_length_matches_candidates():
-    candidates = [_make_item("bar"), _make_item("cafe"), _make_item("activity")]
-    weights = _roulette_weights(candidates, {}, TODAY)
-    assert len(weights) == len(candidates)
+@pytest.mark.asyncio
+async def test_roulette_candidates_apply_filters(db_session):
+    await _add_item(db_session, "Bar A", "bar", budget="budget", neighborhood="Mission")
+    await _add_item(db_session, "Bar B", "bar", budget="splurge", neighborhood="SoMa")
+    await _add_item(db_session, "Cafe", "cafe", budget="budget", neighborhood="Mission Bay")
+
+    assert set(await _weights(db_session, category="bar")) == {"Bar A", "Bar B"}
+    assert set(await _weights(db_session, budget="budget")) == {"Bar A", "Cafe"}
+    assert set(await _weights(db_session, neighborhood="mission")) == {"Bar A", "Cafe"}
 
 
 # ---------------------------------------------------------------------------
@@ -327,6 +337,23 @@ async def test_remove_item(db_session):
     assert gone is None
 
 
+
+@pytest.mark.asyncio
+async def test_neighborhood_key_filled_on_insert(db_session):
+    await _add_item(db_session, "Bar", "bar", neighborhood="  Lower   Haight ")
+    row = await db_session.scalar(select(OutingWishlistItem))
+    assert row.neighborhood_key == "lower haight"
+
+
+@pytest.mark.asyncio
+async def test_neighborhood_filter_ignores_case_and_spacing(db_session):
+    await _add_item(db_session, "Bar", "bar", neighborhood="Lower Haight")
+    await _add_item(db_session, "Cafe", "cafe", neighborhood="100% Haight")
+
+    assert set(await _weights(db_session, neighborhood="LOWER  haight")) == {"Bar"}
+    # LIKE wildcards in the needle are literal
+    assert set(await _weights(db_session, neighborhood="100%")) == {"Cafe"}
+
 # ---------------------------------------------------------------------------
 # Roulette: last-visit-by-category from real rows
 # ---------------------------------------------------------------------------
@@ -338,39 +365,9 @@ async def test_roulette_weight_uses_most_recent_visit(db_session):
     later = datetime.date(2026, 3, 1)
 
     # Two visited italian items; the later one should be used for the weight calc
-    db_session.add(OutingWishlistItem(
-        guild_id=GUILD_ID, name="Old Italian", category="italian",
-        added_by=DAVID_ID, visited=True, visited_at=earlier,
-    ))
-    db_session.add(OutingWishlistItem(
-        guild_id=GUILD_ID, name="Newer Italian", category="italian",
-        added_by=STEPH_ID, visited=True, visited_at=later,
-    ))
-    unvisited = OutingWishlistItem(
-        guild_id=GUILD_ID, name="Try This Italian", category="italian", added_by=DAVID_ID
-    )
-    db_session.add(unvisited)
-    await db_session.commit()
-
-    # Build last_visit_by_category the same way the cog does
-    visited_rows = (
-        await db_session.scalars(
-            select(OutingWishlistItem).where(
-                OutingWishlistItem.guild_id == GUILD_ID,
-                OutingWishlistItem.visited == True,  # noqa: E712
-                OutingWishlistItem.visited_at != None,  # noqa: E711
-            )
-        )
-    ).all()
-
-    last_visit_by_category: dict[str, datetime.date] = {}
-    for row in visited_rows:
-        current = last_visit_by_category.get(row.category)
-        if current is None or row.visited_at > current:
-            last_visit_by_category[row.category] = row.visited_at
-
-    assert last_visit_by_category["italian"] == later
+    await _add_item(db_session, "Old Italian", "italian", earlier)
+    await _add_item(db_session, "Newer Italian", "italian", later)
+    await _add_item(db_session, "Try This Italian", "italian")
 
-    weights = _roulette_weights([unvisited], last_visit_by_category, TODAY)
-    expected_days = (TODAY - later).days
-    assert weights[0] == float(expected_days)
+    weights = await _weights(db_session)
+    assert weights == {"Try This Italian": float((TODAY - later).days)}
@@ -0,0 +1,217 @@
+"""Tests for keyset pagination and the paged list view."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.db import BucketListItem, WatchlistItem
+from src.paging import EMBED_MAX_CHARS, KeysetPager, clip, key_of, keyset_page
+
+GUILD_ID = 999_000_000_000_000_019
+OTHER_GUILD_ID = GUILD_ID + 1
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_KEYS = (WatchlistItem.created_at, WatchlistItem.id)
+
+
+async def _add_titles(db_session, count: int, guild_id: int = GUILD_ID, note: str = "") -> None:
+    for i in range(count):
+        db_session.add(
+            WatchlistItem(
+                guild_id=guild_id,
+                title=f"t{i:02}",
+                media_type="movie",
+                added_by=1,
+                note=note,
+                created_at=T0 + timedelta(minutes=i),
+            )
+        )
+    await db_session.commit()
+
+
+def _titles(guild_id: int = GUILD_ID):
+    return select(WatchlistItem).where(WatchlistItem.guild_id == guild_id)
+
+
+def _render(rows, _) -> discord.Embed:
+    embed = discord.Embed(title="Titles")
+    for row in rows:
+        embed.add_field(name=row.title, value=row.note or "-", inline=False)
+    return embed
+
+
+# ---------------------------------------------------------------------------
+# clip
+# ---------------------------------------------------------------------------
+
+def test_clip_leaves_short_text():
+    assert clip("popcorn", 7) == "popcorn"
+
+
+def test_clip_cuts_with_ellipsis():
+    assert clip("popcorn", 4) == "pop…"
+
+
+# ---------------------------------------------------------------------------
+# keyset_page
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_keyset_page_walks_forward(db_session):
+    await _add_titles(db_session, 7)
+    await _add_titles(db_session, 3, guild_id=OTHER_GUILD_ID)
+
+    seen, after, more = [], None, True
+    pages = 0
+    while more:
+        rows, more = await keyset_page(db_session, _titles(), _KEYS, after=after, limit=3)
+        seen += [r.title for r in rows]
+        after = key_of(rows[-1], _KEYS)
+        pages += 1
+
+    assert pages == 3
+    assert seen == [f"t{i:02}" for i in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_keyset_page_walks_backward(db_session):
+    await _add_titles(db_session, 7)
+    last, _ = await keyset_page(db_session, _titles(), _KEYS, after=None, limit=10)
+
+    rows, more = await keyset_page(
+        db_session, _titles(), _KEYS, before=key_of(last[5], _KEYS), limit=3
+    )
+    assert [r.title for r in rows] == ["t02", "t03", "t04"]
+    assert more is True
+
+    rows, more = await keyset_page(
+        db_session, _titles(), _KEYS, before=key_of(rows[0], _KEYS), limit=3
+    )
+    assert [r.title for r in rows] == ["t00", "t01"]
+    assert more is False
+
+
+@pytest.mark.asyncio
+async def test_keyset_page_breaks_ties_on_id(db_session):
+    """Rows sharing category and timestamp are neither skipped nor repeated."""
+    for i in range(5):
+        db_session.add(
+            BucketListItem(
+                guild_id=GUILD_ID,
+                title=f"b{i}",
+                category="food" if i % 2 else "travel",
+                added_by=1,
+                created_at=T0,
+            )
+        )
+    await db_session.commit()
+    keys = (BucketListItem.category, BucketListItem.created_at, BucketListItem.id)
+    query = select(BucketListItem).where(BucketListItem.guild_id == GUILD_ID)
+
+    first, more = await keyset_page(db_session, query, keys, limit=2)
+    second, _ = await keyset_page(db_session, query, keys, after=key_of(first[-1], keys), limit=5)
+
+    assert more is True
+    assert [r.title for r in first + second] == ["b1", "b3", "b0", "b2", "b4"]
+
+
+# ---------------------------------------------------------------------------
+# KeysetPager
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_pager_pages_with_prefetch(db_session):
+    await _add_titles(db_session, 5)
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    pager = KeysetPager(db, _titles(), _KEYS, _render, page_size=2)
+
+    await pager.load()
+    assert [r.title for r in pager.rows] == ["t00", "t01"]
+    assert pager.prev_button.disabled and not pager.next_button.disabled
+    assert pager._ahead is not None and pager._ahead[0] == key_of(pager.rows[-1], _KEYS)
+
+    await pager.load(after=key_of(pager.rows[-1], _KEYS))
+    await pager.load(after=key_of(pager.rows[-1], _KEYS))
+    assert [r.title for r in pager.rows] == ["t04"]
+    assert not pager.prev_button.disabled and pager.next_button.disabled
+    assert pager._ahead is None
+
+    await pager.load(before=key_of(pager.rows[0], _KEYS))
+    assert [r.title for r in pager.rows] == ["t02", "t03"]
+    assert not pager.next_button.disabled
+    await pager.on_timeout()
+
+
+@pytest.mark.asyncio
+async def test_pager_trims_page_to_embed_limit(db_session):
+    await _add_titles(db_session, 10, note="x" * 1000)
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    pager = KeysetPager(db, _titles(), _KEYS, _render)
+
+    await pager.load()
+    assert len(pager.embed()) <= EMBED_MAX_CHARS
+    assert len(pager.rows) == 5
+    assert pager.has_next
+
+    await pager.load(after=key_of(pager.rows[-1], _KEYS))
+    assert pager.rows[0].title == "t05"
+    await pager.on_timeout()
+
+
+@pytest.mark.asyncio
+async def test_pager_trims_the_front_when_paging_back(db_session):
+    await _add_titles(db_session, 12, note="x" * 1000)
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    pager = KeysetPager(db, _titles(), _KEYS, _render)
+
+    await pager.load()
+    await pager.load(after=key_of(pager.rows[-1], _KEYS))
+    second = [r.title for r in pager.rows]
+    await pager.load(after=key_of(pager.rows[-1], _KEYS))
+    assert [r.title for r in pager.rows] == ["t10", "t11"]
+
+    await pager.load(before=key_of(pager.rows[0], _KEYS))
+    assert [r.title for r in pager.rows] == second == ["t05", "t06", "t07", "t08", "t09"]
+    assert pager.has_prev and pager.has_next
+    await pager.on_timeout()
+
+
+@pytest.mark.asyncio
+async def test_pager_stays_put_when_the_next_page_vanished(db_session):
+    await _add_titles(db_session, 3)
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    pager = KeysetPager(db, _titles(), _KEYS, _render, page_size=2)
+    await pager.load()
+    await pager.on_timeout()  # drop the prefetch so the deletion is seen
+    await db_session.execute(delete(WatchlistItem).where(WatchlistItem.title == "t02"))
+    await db_session.commit()
+
+    edits = []
+
+    async def edit_message(**kwargs):
+        edits.append(kwargs)
+
+    interaction = SimpleNamespace(response=SimpleNamespace(edit_message=edit_message))
+    await pager.next_button.callback(interaction)
+
+    assert [r.title for r in pager.rows] == ["t00", "t01"]
+    assert pager.page == 1
+    assert pager.next_button.disabled
+    assert edits[0]["embed"].footer.text is None
+
+
+@pytest.mark.asyncio
+async def test_pager_empty_list(db_session):
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    pager = KeysetPager(db, _titles(), _KEYS, _render)
+
+    await pager.load()
+    assert pager.rows == []
+    assert pager.prev_button.disabled and pager.next_button.disabled
+    assert pager.embed().footer.text is None
@@ -0,0 +1,75 @@
+"""Tests for versioned per-member pillar lists."""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from src.pillars import (
+    DEFAULT_NAMES,
+    MemberPillars,
+    PillarSet,
+    add_pillar_version,
+    load_pillars,
+)
+
+GUILD_ID = 999_000_000_000_000_015
+DAVID_ID = 240608458888445953
+
+APR_1 = date(2026, 4, 1)
+MAY_1 = date(2026, 5, 1)
+
+
+# ---------------------------------------------------------------------------
+# Masks and slots
+# ---------------------------------------------------------------------------
+
+def test_mask_and_full_mask():
+    pillars = PillarSet(("Read", "Walk"), 1, APR_1)
+    assert pillars.full_mask == 0b11
+    assert pillars.mask([True, False]) == 0b01
+    assert pillars.mask([True, True]) == pillars.full_mask
+
+
+def test_unused_slots_count_as_done():
+    pillars = PillarSet(("Read", "Walk"), 1, APR_1)
+    assert pillars.slots(0b11) == (True, True, True)
+    assert pillars.slots(0b10) == (False, True, True)
+    assert PillarSet().slots(0b011) == (True, True, False)
+
+
+def test_version_in_force_on_a_day():
+    v1 = PillarSet(("Read",), 1, APR_1)
+    v2 = PillarSet(("Walk",), 2, MAY_1)
+    member = MemberPillars((v1, v2))
+    assert member.on(date(2026, 3, 31)).names == DEFAULT_NAMES
+    assert member.on(APR_1) is v1
+    assert member.on(MAY_1) is v2
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_versions_round_trip(db_session):
+    await add_pillar_version(db_session, GUILD_ID, DAVID_ID, ["Read", " ", "Walk"], APR_1)
+    await db_session.commit()
+    v2 = await add_pillar_version(db_session, GUILD_ID, DAVID_ID, ["Steps"], MAY_1)
+    await db_session.commit()
+    assert v2.version == 2
+
+    members = await load_pillars(db_session, GUILD_ID)
+    assert members[DAVID_ID].versions == (
+        PillarSet(("Read", "Walk"), 1, APR_1),
+        PillarSet(("Steps",), 2, MAY_1),
+    )
+    assert await load_pillars(db_session, GUILD_ID + 1) == {}
+
+
+@pytest.mark.asyncio
+async def test_pillar_list_size_is_bounded(db_session):
+    with pytest.raises(ValueError):
+        await add_pillar_version(db_session, GUILD_ID, DAVID_ID, ["", " "], APR_1)
+    with pytest.raises(ValueError):
+        await add_pillar_version(db_session, GUILD_ID, DAVID_ID, ["a", "b", "c", "d"], APR_1)
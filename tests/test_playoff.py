@@ -1,16 +1,29 @@
 """Tests for daily pillar check-in persistence and playoff logic."""
 from __future__ import annotations
 
+import json
 from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
 
+import discord
 import pytest
-from sqlalchemy import select
-
-from src.cogs.playoff import build_weekly_embed, finalize_series_status, format_weekly_summary, get_pillar_names, series_message, week_start_for
-from src.db import DailyResult, PlayoffCheckin, PlayoffSeries, WeeklyReview
-from src.utils import DAVID_ID, STEPH_ID
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.clock import LocalClock, week_start_for
+from src.cogs.household import add_household_member
+from src.cogs.playoff import SERIES_PAGE_SIZE, CheckinButton, DaySummary, Playoff, SeriesHistoryView, StatusCache, StatusSnapshot, WeeklyEmbedCache, build_weekly_embed, checkin_rows_of, checkin_view, finalize_series_status, format_weekly_summary, load_days, load_status_snapshots, missing_checkins, ping_message, reconcile_stale_series, series_message, settle_day, status_embed, week_tally
+from src.db import DailyResult, DailyResultMember, PlayoffCheckin, PlayoffSeries, WeeklyReview, WeeklySummary
+from src.pillars import DEFAULT_NAMES
+from src.playoff_stats import stats_row
+from src.scheduler import guild_settings_row
+from src.utils import HouseholdRoster
 
 GUILD_ID = 999_000_000_000_000_000
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+PLAYERS = [(DAVID_ID, "David"), (STEPH_ID, "Steph")]
+ROSTER = HouseholdRoster(GUILD_ID, member_ids=(DAVID_ID, STEPH_ID), names=dict(PLAYERS))
 
 # ---------------------------------------------------------------------------
 # week_start_for — must map every day in a Sun–Sat week to that week's Sunday
@@ -78,28 +91,6 @@ def test_series_message_close_still_alive():
     assert "alive" in msg.lower()
 
 
-# ---------------------------------------------------------------------------
-# get_pillar_names — correct per-user pillars
-# ---------------------------------------------------------------------------
-
-
-def test_david_gets_his_pillars():
-    pillars = get_pillar_names(DAVID_ID)
-    assert any("steps" in p.lower() or "10,000" in p for p in pillars)
-    assert len(pillars) == 3
-
-
-def test_steph_gets_her_pillars():
-    pillars = get_pillar_names(STEPH_ID)
-    assert any("tiktok" in p.lower() for p in pillars)
-    assert len(pillars) == 3
-
-
-def test_unknown_user_gets_generic_pillars():
-    pillars = get_pillar_names(0)
-    assert pillars == ["Pillar 1", "Pillar 2", "Pillar 3"]
-
-
 # ---------------------------------------------------------------------------
 # DB persistence — PlayoffCheckin
 # ---------------------------------------------------------------------------
@@ -429,101 +420,98 @@ async def test_series_row_persisted(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_daily_result_persisted(db_session):
-    """A DailyResult row can be written and read back."""
-    now = datetime.now(timezone.utc)
+async def _add_checkin(db_session, user_id: int, day: date, *, complete: bool) -> None:
     db_session.add(
-        DailyResult(
+        PlayoffCheckin(
             guild_id=GUILD_ID,
-            result_date=date(2026, 4, 21),
-            david_complete=True,
-            steph_complete=True,
-            won=True,
-            created_at=now,
-            updated_at=now,
+            user_id=user_id,
+            checkin_date=day,
+            pillar1=True,
+            pillar2=True,
+            pillar3=complete,
         )
     )
     await db_session.commit()
 
+
+@pytest.mark.asyncio
+async def test_daily_result_persisted(db_session):
+    """Settling a day writes the shared result and per-member rows."""
+    day = date(2026, 4, 21)
+    await _add_checkin(db_session, DAVID_ID, day, complete=True)
+    await _add_checkin(db_session, STEPH_ID, day, complete=True)
+
+    summary, is_new = await settle_day(db_session, GUILD_ID, day, [DAVID_ID, STEPH_ID])
+    assert is_new is True
+    assert summary.won is True
+    assert summary.completed == {DAVID_ID, STEPH_ID}
+
     row = await db_session.scalar(
         select(DailyResult).where(
             DailyResult.guild_id == GUILD_ID,
-            DailyResult.result_date == date(2026, 4, 21),
+            DailyResult.result_date == day,
         )
     )
     assert row is not None
     assert row.won is True
-    assert row.david_complete is True
-    assert row.steph_complete is True
+    members = (
+        await db_session.scalars(
+            select(DailyResultMember).where(DailyResultMember.result_date == day)
+        )
+    ).all()
+    assert {(m.user_id, m.complete) for m in members} == {(DAVID_ID, True), (STEPH_ID, True)}
 
 
 @pytest.mark.asyncio
 async def test_daily_result_loss_when_one_incomplete(db_session):
-    """won=False when either player is incomplete."""
-    now = datetime.now(timezone.utc)
-    db_session.add(
-        DailyResult(
-            guild_id=GUILD_ID,
-            result_date=date(2026, 4, 21),
-            david_complete=True,
-            steph_complete=False,  # Steph didn't finish
-            won=False,
-            created_at=now,
-            updated_at=now,
-        )
-    )
-    await db_session.commit()
+    """won=False when any member is incomplete."""
+    day = date(2026, 4, 21)
+    await _add_checkin(db_session, DAVID_ID, day, complete=True)
+    await _add_checkin(db_session, STEPH_ID, day, complete=False)  # Steph didn't finish
 
-    row = await db_session.scalar(
-        select(DailyResult).where(
-            DailyResult.guild_id == GUILD_ID,
-            DailyResult.result_date == date(2026, 4, 21),
-        )
-    )
-    assert row is not None
-    assert row.won is False
-    assert row.david_complete is True
-    assert row.steph_complete is False
+    summary, _ = await settle_day(db_session, GUILD_ID, day, [DAVID_ID, STEPH_ID])
+    assert summary.won is False
+    assert summary.completed == {DAVID_ID}
 
 
 @pytest.mark.asyncio
 async def test_daily_result_upsert(db_session):
-    """Re-settling a day (e.g., after a re-checkin) updates the existing row."""
-    now = datetime.now(timezone.utc)
-    db_session.add(
-        DailyResult(
-            guild_id=GUILD_ID,
-            result_date=date(2026, 4, 21),
-            david_complete=True,
-            steph_complete=False,
-            won=False,
-            created_at=now,
-            updated_at=now,
-        )
-    )
-    await db_session.commit()
+    """Re-settling a day (e.g., after a re-checkin) updates the existing rows."""
+    day = date(2026, 4, 21)
+    await _add_checkin(db_session, DAVID_ID, day, complete=True)
+    await _add_checkin(db_session, STEPH_ID, day, complete=False)
+    await settle_day(db_session, GUILD_ID, day, [DAVID_ID, STEPH_ID])
 
     # Steph re-checks in — now both complete
-    row = await db_session.scalar(
-        select(DailyResult).where(
-            DailyResult.guild_id == GUILD_ID,
-            DailyResult.result_date == date(2026, 4, 21),
-        )
+    checkin = await db_session.scalar(
+        select(PlayoffCheckin).where(PlayoffCheckin.user_id == STEPH_ID)
     )
-    row.steph_complete = True
-    row.won = True
-    row.updated_at = datetime.now(timezone.utc)
+    checkin.pillar3 = True
     await db_session.commit()
+    summary, is_new = await settle_day(db_session, GUILD_ID, day, [DAVID_ID, STEPH_ID])
 
-    refreshed = await db_session.scalar(
-        select(DailyResult).where(
-            DailyResult.guild_id == GUILD_ID,
-            DailyResult.result_date == date(2026, 4, 21),
-        )
-    )
-    assert refreshed.won is True
-    assert refreshed.steph_complete is True
+    assert is_new is False
+    assert summary.won is True
+    rows = (await db_session.scalars(select(DailyResult))).all()
+    assert len(rows) == 1 and rows[0].won is True
+    members = (await db_session.scalars(select(DailyResultMember))).all()
+    assert len(members) == 2 and all(m.complete for m in members)
+
+
+@pytest.mark.asyncio
+async def test_settle_day_handles_any_team_size(db_session):
+    """A day settles only when every member has checked in, however many there are."""
+    day = date(2026, 4, 21)
+    team = [DAVID_ID, STEPH_ID] + [1000 + i for i in range(8)]
+    for uid in team[:-1]:
+        await _add_checkin(db_session, uid, day, complete=True)
+
+    assert await settle_day(db_session, GUILD_ID, day, team) == (None, False)
+
+    await _add_checkin(db_session, team[-1], day, complete=False)
+    summary, _ = await settle_day(db_session, GUILD_ID, day, team)
+    assert summary.won is False
+    assert summary.completed == set(team[:-1])
 
 
 @pytest.mark.asyncio
@@ -538,8 +526,6 @@ async def test_series_tally_from_daily_results(db_session):
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=week_start + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
                 won=True,
                 created_at=now,
                 updated_at=now,
@@ -549,8 +535,6 @@ async def test_series_tally_from_daily_results(db_session):
         DailyResult(
             guild_id=GUILD_ID,
             result_date=week_start + timedelta(days=3),
-            david_complete=True,
-            steph_complete=False,
             won=False,
             created_at=now,
             updated_at=now,
@@ -592,6 +576,9 @@ async def test_no_daily_result_until_both_checked_in(db_session):
     await db_session.commit()
 
     # No DailyResult should exist yet — Steph hasn't checked in
+    assert await settle_day(
+        db_session, GUILD_ID, date(2026, 4, 21), [DAVID_ID, STEPH_ID]
+    ) == (None, False)
     result = await db_session.scalar(
         select(DailyResult).where(
             DailyResult.guild_id == GUILD_ID,
@@ -603,7 +590,7 @@ async def test_no_daily_result_until_both_checked_in(db_session):
 
 @pytest.mark.asyncio
 async def test_combined_win_requires_both_complete(db_session):
-    """won=True only when david_complete AND steph_complete are both True."""
+    """won=True only when both players completed."""
     now = datetime.now(timezone.utc)
     today = date(2026, 4, 21)
 
@@ -619,8 +606,6 @@ async def test_combined_win_requires_both_complete(db_session):
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=result_date,
-                david_complete=dc,
-                steph_complete=sc,
                 won=dc and sc,
                 created_at=now,
                 updated_at=now,
@@ -649,23 +634,12 @@ async def test_combined_win_requires_both_complete(db_session):
 WEEK_SUN = date(2026, 4, 19)  # Sunday — week of Apr 19–25
 
 
-def _make_result(
-    offset: int,
-    *,
-    david: bool,
-    steph: bool,
-    guild_id: int = GUILD_ID,
-) -> DailyResult:
-    """Create an unsaved DailyResult for day (WEEK_SUN + offset)."""
-    now = datetime.now(timezone.utc)
-    return DailyResult(
-        guild_id=guild_id,
+def _make_result(offset: int, *, david: bool, steph: bool) -> DaySummary:
+    """Create a settled day for (WEEK_SUN + offset)."""
+    return DaySummary(
         result_date=WEEK_SUN + timedelta(days=offset),
-        david_complete=david,
-        steph_complete=steph,
         won=david and steph,
-        created_at=now,
-        updated_at=now,
+        completed=frozenset(uid for uid, ok in ((DAVID_ID, david), (STEPH_ID, steph)) if ok),
     )
 
 
@@ -697,7 +671,7 @@ def test_summary_david_individual_count():
         _make_result(1, david=True, steph=False),
         _make_result(2, david=False, steph=True),
     ]
-    msg = format_weekly_summary(results, WEEK_SUN)
+    msg = format_weekly_summary(results, WEEK_SUN, PLAYERS)
     assert "David:** 2/7" in msg
 
 
@@ -707,7 +681,7 @@ def test_summary_steph_individual_count():
         _make_result(1, david=True, steph=False),
         _make_result(2, david=False, steph=True),
     ]
-    msg = format_weekly_summary(results, WEEK_SUN)
+    msg = format_weekly_summary(results, WEEK_SUN, PLAYERS)
     assert "Steph:** 2/7" in msg
 
 
@@ -840,8 +814,6 @@ async def test_series_finalized_won_from_daily_results(db_session):
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=week_start + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
                 won=True,
                 created_at=now,
                 updated_at=now,
@@ -852,8 +824,6 @@ async def test_series_finalized_won_from_daily_results(db_session):
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=week_start + timedelta(days=i),
-                david_complete=False,
-                steph_complete=True,
                 won=False,
                 created_at=now,
                 updated_at=now,
@@ -919,8 +889,6 @@ async def test_series_finalized_lost_when_ongoing_status_overwritten(db_session)
         r = DailyResult(
             guild_id=GUILD_ID,
             result_date=week_start + timedelta(days=i),
-            david_complete=True,
-            steph_complete=True,
             won=True,
             created_at=now,
             updated_at=now,
@@ -931,8 +899,6 @@ async def test_series_finalized_lost_when_ongoing_status_overwritten(db_session)
         r = DailyResult(
             guild_id=GUILD_ID,
             result_date=week_start + timedelta(days=i),
-            david_complete=False,
-            steph_complete=True,
             won=False,
             created_at=now,
             updated_at=now,
@@ -976,8 +942,6 @@ async def test_series_finalized_creates_row_when_missing(db_session):
         r = DailyResult(
             guild_id=GUILD_ID,
             result_date=week_start + timedelta(days=i),
-            david_complete=True,
-            steph_complete=True,
             won=True,
             created_at=now,
             updated_at=now,
@@ -1019,11 +983,19 @@ async def test_series_finalized_creates_row_when_missing(db_session):
 # ---------------------------------------------------------------------------
 
 
+async def _add_day(db_session, day: date, *, david: bool, steph: bool) -> None:
+    db_session.add(DailyResult(guild_id=GUILD_ID, result_date=day, won=david and steph))
+    db_session.add_all(
+        DailyResultMember(guild_id=GUILD_ID, result_date=day, user_id=uid, complete=ok)
+        for uid, ok in ((DAVID_ID, david), (STEPH_ID, steph))
+    )
+    await db_session.commit()
+
+
 @pytest.mark.asyncio
 async def test_history_per_person_stats_correct(db_session):
-    """DailyResult rows grouped by week give correct per-person day counts."""
+    """Settled days give correct per-person day counts."""
     week_start = SUNDAY_APR_19
-    now = datetime.now(timezone.utc)
 
     # David: 5 days complete; Steph: 3 days complete; combined wins: 3
     profiles = [
@@ -1034,86 +1006,36 @@ async def test_history_per_person_stats_correct(db_session):
         (True, False),  # Thu — David only
     ]
     for i, (dc, sc) in enumerate(profiles):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week_start + timedelta(days=i),
-                david_complete=dc,
-                steph_complete=sc,
-                won=dc and sc,
-                created_at=now,
-                updated_at=now,
-            )
-        )
-    await db_session.commit()
+        await _add_day(db_session, week_start + timedelta(days=i), david=dc, steph=sc)
 
-    rows = (
-        await db_session.scalars(
-            select(DailyResult).where(DailyResult.guild_id == GUILD_ID)
-        )
-    ).all()
+    rows = await load_days(db_session, GUILD_ID, week_start, week_start + timedelta(days=6))
 
-    david_days = sum(1 for r in rows if r.david_complete)
-    steph_days = sum(1 for r in rows if r.steph_complete)
+    david_days = sum(1 for r in rows if DAVID_ID in r.completed)
+    steph_days = sum(1 for r in rows if STEPH_ID in r.completed)
     combined_wins = sum(1 for r in rows if r.won)
 
     assert david_days == 5
     assert steph_days == 3
     assert combined_wins == 3
+    assert [r.result_date for r in rows] == sorted(r.result_date for r in rows)
 
 
 @pytest.mark.asyncio
 async def test_history_multiple_weeks_grouped_correctly(db_session):
-    """DailyResult rows from two different weeks are grouped independently."""
+    """Settled days from two different weeks are grouped independently."""
     week1 = SUNDAY_APR_19
     week2 = SUNDAY_APR_19 + timedelta(weeks=1)  # Apr 26
-    now = datetime.now(timezone.utc)
 
     # Week 1: 4 wins (David & Steph both complete all 4 days)
     for i in range(4):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week1 + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
-                won=True,
-                created_at=now,
-                updated_at=now,
-            )
-        )
+        await _add_day(db_session, week1 + timedelta(days=i), david=True, steph=True)
     # Week 2: 2 wins (Steph missed 2 days)
     for i in range(2):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week2 + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
-                won=True,
-                created_at=now,
-                updated_at=now,
-            )
-        )
+        await _add_day(db_session, week2 + timedelta(days=i), david=True, steph=True)
     for i in range(2, 4):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week2 + timedelta(days=i),
-                david_complete=True,
-                steph_complete=False,
-                won=False,
-                created_at=now,
-                updated_at=now,
-            )
-        )
-    await db_session.commit()
+        await _add_day(db_session, week2 + timedelta(days=i), david=True, steph=False)
 
-    all_rows = (
-        await db_session.scalars(
-            select(DailyResult).where(DailyResult.guild_id == GUILD_ID)
-        )
-    ).all()
+    all_rows = await load_days(db_session, GUILD_ID, week1, week2 + timedelta(days=6))
 
     # Group by week (mirror series_history logic)
     daily_by_week: dict[date, list] = {}
@@ -1124,10 +1046,47 @@ async def test_history_multiple_weeks_grouped_correctly(db_session):
     w1_rows = daily_by_week[week1]
     w2_rows = daily_by_week[week2]
 
-    assert sum(1 for r in w1_rows if r.david_complete) == 4
-    assert sum(1 for r in w1_rows if r.steph_complete) == 4
-    assert sum(1 for r in w2_rows if r.david_complete) == 4
-    assert sum(1 for r in w2_rows if r.steph_complete) == 2
+    assert sum(1 for r in w1_rows if DAVID_ID in r.completed) == 4
+    assert sum(1 for r in w1_rows if STEPH_ID in r.completed) == 4
+    assert sum(1 for r in w2_rows if DAVID_ID in r.completed) == 4
+    assert sum(1 for r in w2_rows if STEPH_ID in r.completed) == 2
+
+
+@pytest.mark.asyncio
+async def test_history_view_keeps_its_page_when_older_weeks_vanished(db_session):
+    weeks = [SUNDAY_APR_19 - timedelta(weeks=i) for i in range(SERIES_PAGE_SIZE + 1)]
+    db_session.add_all(
+        PlayoffSeries(
+            guild_id=GUILD_ID,
+            week_start=week,
+            wins=4,
+            losses=0,
+            status="won",
+            created_at=datetime.now(timezone.utc),
+        )
+        for week in weeks
+    )
+    await db_session.commit()
+    db = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    view = SeriesHistoryView(db, GUILD_ID, PLAYERS, LocalClock())
+    await view.load()
+    assert not view.next_button.disabled
+
+    await db_session.execute(delete(PlayoffSeries).where(PlayoffSeries.week_start == weeks[-1]))
+    await db_session.commit()
+    edits = []
+
+    async def edit_message(**kwargs):
+        edits.append(kwargs)
+
+    await view.next_button.callback(
+        SimpleNamespace(response=SimpleNamespace(edit_message=edit_message))
+    )
+
+    assert view.page == 1
+    assert [r.week_start for r in view.rows] == weeks[:SERIES_PAGE_SIZE]
+    assert view.next_button.disabled
+    assert edits[0]["embed"].footer.text is None
 
 
 @pytest.mark.asyncio
@@ -1148,8 +1107,6 @@ async def test_checkin_tally_bounded_to_current_week(db_session):
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=week1 + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
                 won=True,
                 created_at=now,
                 updated_at=now,
@@ -1161,8 +1118,6 @@ async def test_checkin_tally_bounded_to_current_week(db_session):
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=week2 + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
                 won=True,
                 created_at=now,
                 updated_at=now,
@@ -1194,190 +1149,325 @@ async def test_checkin_tally_bounded_to_current_week(db_session):
     ).all()
     assert sum(1 for r in week2_rows if r.won) == 2
 
+    # week_tally is the single aggregate query used by _process_checkin
+    assert await week_tally(db_session, GUILD_ID, week1) == (3, 0)
+    assert await week_tally(db_session, GUILD_ID, week2) == (2, 0)
+    assert await week_tally(db_session, GUILD_ID, week2 + timedelta(weeks=1)) == (0, 0)
+
 
 # ---------------------------------------------------------------------------
-# series_history auto-heal — stale "ongoing" status for completed past weeks
+# reconcile_stale_series — stale "ongoing" status for completed past weeks
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_stale_ongoing_healed_for_past_week(db_session):
-    """A past week stuck as 'ongoing' is corrected when history is queried."""
-    week_start = SUNDAY_APR_12  # week ended Apr 18 — fully in the past
+async def _add_stale_series(db_session, week_start: date, wins: int, losses: int) -> None:
     now = datetime.now(timezone.utc)
-
-    # Series record never got finalized (e.g. bot was down that Sunday)
     db_session.add(
         PlayoffSeries(
             guild_id=GUILD_ID,
             week_start=week_start,
-            wins=3,
-            losses=2,
+            wins=0,
+            losses=0,
             status="ongoing",
             created_at=now,
         )
     )
-    # 3 wins, 2 losses — week is over, not enough wins → "lost"
-    for i in range(3):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week_start + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
-                won=True,
-                created_at=now,
-                updated_at=now,
-            )
-        )
-    for i in range(3, 5):
+    for i in range(wins + losses):
         db_session.add(
             DailyResult(
                 guild_id=GUILD_ID,
                 result_date=week_start + timedelta(days=i),
-                david_complete=False,
-                steph_complete=True,
-                won=False,
+                won=i < wins,
                 created_at=now,
                 updated_at=now,
             )
         )
     await db_session.commit()
 
-    # Simulate the auto-heal logic from series_history
-    daily_rows = (
-        await db_session.scalars(select(DailyResult).where(DailyResult.guild_id == GUILD_ID))
-    ).all()
-
-    daily_by_week: dict[date, list[DailyResult]] = {}
-    for dr in daily_rows:
-        ws = week_start_for(dr.result_date)
-        daily_by_week.setdefault(ws, []).append(dr)
 
-    series = await db_session.scalar(
+async def _series(db_session, week_start: date) -> PlayoffSeries:
+    db_session.expire_all()
+    return await db_session.scalar(
         select(PlayoffSeries).where(
             PlayoffSeries.guild_id == GUILD_ID,
             PlayoffSeries.week_start == week_start,
         )
     )
-    week_daily = daily_by_week.get(week_start, [])
-    series.wins = sum(1 for dr in week_daily if dr.won)
-    series.losses = sum(1 for dr in week_daily if not dr.won)
-    series.status = finalize_series_status(week_daily)
-    await db_session.commit()
 
-    refreshed = await db_session.scalar(
-        select(PlayoffSeries).where(
-            PlayoffSeries.guild_id == GUILD_ID,
-            PlayoffSeries.week_start == week_start,
-        )
-    )
+
+@pytest.mark.asyncio
+async def test_stale_ongoing_reconciled_for_past_week(db_session):
+    """A past week stuck as 'ongoing' (bot down that Sunday) is finalized to 'lost'."""
+    await _add_stale_series(db_session, SUNDAY_APR_12, wins=3, losses=2)
+
+    assert await reconcile_stale_series(db_session, SUNDAY_APR_19) == 1
+
+    refreshed = await _series(db_session, SUNDAY_APR_12)
     assert refreshed.status == "lost"  # 3 wins < 4 → lost
     assert refreshed.wins == 3
     assert refreshed.losses == 2
 
 
 @pytest.mark.asyncio
-async def test_stale_ongoing_healed_to_won(db_session):
-    """A past week with 4+ wins is healed to 'won', not 'lost'."""
-    week_start = SUNDAY_APR_12
-    now = datetime.now(timezone.utc)
+async def test_stale_ongoing_reconciled_to_won(db_session):
+    """A past week with 4+ wins is finalized to 'won', not 'lost'."""
+    await _add_stale_series(db_session, SUNDAY_APR_12, wins=4, losses=2)
 
-    db_session.add(
-        PlayoffSeries(
-            guild_id=GUILD_ID,
-            week_start=week_start,
-            wins=4,
-            losses=2,
-            status="ongoing",
-            created_at=now,
-        )
-    )
-    for i in range(4):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week_start + timedelta(days=i),
-                david_complete=True,
-                steph_complete=True,
-                won=True,
-                created_at=now,
-                updated_at=now,
-            )
-        )
-    for i in range(4, 6):
-        db_session.add(
-            DailyResult(
-                guild_id=GUILD_ID,
-                result_date=week_start + timedelta(days=i),
-                david_complete=False,
-                steph_complete=True,
-                won=False,
-                created_at=now,
-                updated_at=now,
-            )
-        )
-    await db_session.commit()
+    await reconcile_stale_series(db_session, SUNDAY_APR_19)
 
-    daily_rows = (
-        await db_session.scalars(select(DailyResult).where(DailyResult.guild_id == GUILD_ID))
-    ).all()
-    week_daily = [dr for dr in daily_rows if week_start_for(dr.result_date) == week_start]
+    refreshed = await _series(db_session, SUNDAY_APR_12)
+    assert (refreshed.status, refreshed.wins, refreshed.losses) == ("won", 4, 2)
 
-    series = await db_session.scalar(
-        select(PlayoffSeries).where(
-            PlayoffSeries.guild_id == GUILD_ID,
-            PlayoffSeries.week_start == week_start,
-        )
-    )
-    series.wins = sum(1 for dr in week_daily if dr.won)
-    series.losses = sum(1 for dr in week_daily if not dr.won)
-    series.status = finalize_series_status(week_daily)
+
+@pytest.mark.asyncio
+async def test_stale_series_without_results_reconciled_as_lost(db_session):
+    """A past week with no settled days at all still finalizes, 0–0 lost."""
+    await _add_stale_series(db_session, SUNDAY_APR_12, wins=0, losses=0)
+
+    await reconcile_stale_series(db_session, SUNDAY_APR_19 + timedelta(days=3))
+
+    refreshed = await _series(db_session, SUNDAY_APR_12)
+    assert (refreshed.status, refreshed.wins, refreshed.losses) == ("lost", 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_current_week_ongoing_not_reconciled(db_session):
+    """A series for the current (in-progress) week stays 'ongoing' — only past weeks are finalized."""
+    await _add_stale_series(db_session, SUNDAY_APR_19, wins=4, losses=0)
+
+    # Saturday is still part of the week
+    assert await reconcile_stale_series(db_session, SUNDAY_APR_19 + timedelta(days=6)) == 0
+
+    assert (await _series(db_session, SUNDAY_APR_19)).status == "ongoing"
+
+
+@pytest.mark.asyncio
+async def test_reconcile_updates_series_totals(db_session):
+    """Finalized series are counted in the household playoff_stats row."""
+    await _add_stale_series(db_session, SUNDAY_APR_12, wins=4, losses=1)
+    await _add_stale_series(db_session, SUNDAY_APR_12 - timedelta(weeks=1), wins=1, losses=4)
+
+    await reconcile_stale_series(db_session, SUNDAY_APR_19)
+
+    row = await stats_row(db_session, GUILD_ID)
+    assert (row.series_won, row.series_lost) == (1, 1)
+
+
+# ---------------------------------------------------------------------------
+# daily_ping — who still needs a reminder
+# ---------------------------------------------------------------------------
+
+OTHER_GUILD_ID = GUILD_ID + 1
+
+
+@pytest.mark.asyncio
+async def test_missing_checkins_spans_households(db_session):
+    """One query finds every member without a check-in, grouped by guild."""
+    for guild_id in (GUILD_ID, OTHER_GUILD_ID):
+        await add_household_member(db_session, guild_id, DAVID_ID)
+        await add_household_member(db_session, guild_id, STEPH_ID)
+    (await guild_settings_row(db_session, OTHER_GUILD_ID)).checkin_channel_id = 555
     await db_session.commit()
+    await _add_checkin(db_session, DAVID_ID, SUNDAY_APR_19, complete=False)
+    # A check-in on another day doesn't count
+    await _add_checkin(db_session, STEPH_ID, SUNDAY_APR_12, complete=True)
 
-    refreshed = await db_session.scalar(
-        select(PlayoffSeries).where(
-            PlayoffSeries.guild_id == GUILD_ID,
-            PlayoffSeries.week_start == week_start,
-        )
-    )
-    assert refreshed.status == "won"  # 4 wins → won
+    missing = await missing_checkins(db_session, SUNDAY_APR_19)
+
+    assert missing == {
+        GUILD_ID: (None, [STEPH_ID]),
+        OTHER_GUILD_ID: (555, [DAVID_ID, STEPH_ID]),
+    }
 
 
 @pytest.mark.asyncio
-async def test_current_week_ongoing_not_healed(db_session):
-    """A series for the current (in-progress) week stays 'ongoing' — only past weeks are healed."""
-    from datetime import date as date_type
-    import datetime as dt_module
+async def test_missing_checkins_empty_when_everyone_checked_in(db_session):
+    await add_household_member(db_session, GUILD_ID, DAVID_ID)
+    await _add_checkin(db_session, DAVID_ID, SUNDAY_APR_19, complete=True)
+
+    assert await missing_checkins(db_session, SUNDAY_APR_19) == {}
+
+
+@pytest.mark.asyncio
+async def test_missing_checkins_limited_to_due_guilds(db_session):
+    for guild_id in (GUILD_ID, OTHER_GUILD_ID):
+        await add_household_member(db_session, guild_id, DAVID_ID)
+
+    missing = await missing_checkins(db_session, SUNDAY_APR_19, [OTHER_GUILD_ID])
+
+    assert list(missing) == [OTHER_GUILD_ID]
 
-    # Use a future week to simulate "current" in the test
-    future_sunday = date_type(2099, 1, 5)  # far future, always current
-    now = datetime.now(timezone.utc)
 
+def test_ping_message_lists_each_member_once():
+    text = ping_message([DAVID_ID, STEPH_ID], {STEPH_ID: ("Some form of movement",)})
+    assert text.count(f"<@{DAVID_ID}>") == 1
+    assert text.count(f"<@{STEPH_ID}>") == 1
+    assert "Some form of movement" in text
+    # Members without their own list get the generic pillars
+    assert "Pillar 1 · Pillar 2 · Pillar 3" in text
+    assert "/checkin" in text
+
+
+@pytest.mark.asyncio
+async def test_checkin_buttons_carry_their_state():
+    day = date(2026, 4, 21)
+    view = checkin_view(
+        [(DAVID_ID, ("Read", "Walk"), 0b10, day), (STEPH_ID, DEFAULT_NAMES, 0, day)], ROSTER
+    )
+
+    ids = [item.item.custom_id for item in view.children]
+    assert ids[:4] == [
+        f"checkin:all:{DAVID_ID}:2:{day.toordinal()}",
+        f"checkin:p0:{DAVID_ID}:2:{day.toordinal()}",
+        f"checkin:p1:{DAVID_ID}:2:{day.toordinal()}",
+        f"checkin:log:{DAVID_ID}:2:{day.toordinal()}",
+    ]
+    assert [item.item.row for item in view.children] == [0] * 4 + [1] * 5
+    assert view.children[2].item.label.startswith("✅")
+    assert view.children[0].item.label == "All done — David"
+
+    match = view.children[1].template.fullmatch(ids[1])
+    button = await CheckinButton.from_custom_id(None, None, match)
+    assert (button.action, button.user_id, button.mask, button.day) == ("p0", DAVID_ID, 2, day)
+
+
+def test_checkin_rows_read_back_from_the_message():
+    day = date(2026, 4, 21)
+    view = checkin_view([(DAVID_ID, ("Read",), 1, day), (STEPH_ID, DEFAULT_NAMES, 0, day)], ROSTER)
+    # Only the custom IDs matter; group them into rows like a sent message
+    rows: dict[int, list] = {}
+    for item in view.children:
+        rows.setdefault(item.item.row, []).append(SimpleNamespace(custom_id=item.item.custom_id))
+    message = SimpleNamespace(components=[SimpleNamespace(children=c) for c in rows.values()])
+
+    assert checkin_rows_of(message) == [(DAVID_ID, 1, day), (STEPH_ID, 0, day)]
+
+
+# ---------------------------------------------------------------------------
+# /playoff_status — cached dashboard snapshots
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_status_snapshots_load_several_guilds_at_once(db_session):
+    day = date(2026, 4, 21)
+    await _add_checkin(db_session, DAVID_ID, day, complete=True)
+    await _add_checkin(db_session, STEPH_ID, day, complete=False)
+    await settle_day(db_session, GUILD_ID, day, [DAVID_ID, STEPH_ID])
     db_session.add(
         PlayoffSeries(
-            guild_id=GUILD_ID,
-            week_start=future_sunday,
-            wins=2,
-            losses=1,
-            status="ongoing",
-            created_at=now,
+            guild_id=GUILD_ID, week_start=SUNDAY_APR_19, wins=2, losses=1, status="ongoing"
         )
     )
     await db_session.commit()
 
-    series = await db_session.scalar(
-        select(PlayoffSeries).where(
-            PlayoffSeries.guild_id == GUILD_ID,
-            PlayoffSeries.week_start == future_sunday,
-        )
+    snaps = await load_status_snapshots(
+        db_session,
+        {GUILD_ID: (day, SUNDAY_APR_19), OTHER_GUILD_ID: (day, SUNDAY_APR_19)},
+    )
+
+    mine = snaps[GUILD_ID]
+    assert (mine.wins, mine.losses) == (2, 1)
+    assert mine.result == DaySummary(day, False, frozenset({DAVID_ID}))
+    assert mine.checked_in == {DAVID_ID, STEPH_ID}
+    assert snaps[OTHER_GUILD_ID] == StatusSnapshot(OTHER_GUILD_ID, day, SUNDAY_APR_19)
+
+
+def test_status_embed_shows_waiting_members():
+    snap = StatusSnapshot(
+        GUILD_ID, date(2026, 4, 21), SUNDAY_APR_19, 1, 0, None, frozenset({DAVID_ID})
     )
-    # week_end is in the future — auto-heal condition (week_end < today) is False
-    week_end = future_sunday + timedelta(days=6)
-    today = date_type.today()
-    assert week_end >= today, "test setup: future_sunday must be in the future"
-    # Status should remain "ongoing" — no healing applied
-    assert series.status == "ongoing"
+    embed = status_embed(snap, PLAYERS)
+    assert embed.fields[0].name == "Stavid Series — 1W 0L"
+    assert "David: ✅ checked in" in embed.fields[1].value
+    assert "Steph: ⏳ not yet" in embed.fields[1].value
+
+
+def test_status_embed_shows_series_odds():
+    # Tuesday, today unsettled: five days left, both members at 50%
+    snap = StatusSnapshot(
+        GUILD_ID,
+        date(2026, 4, 21),
+        SUNDAY_APR_19,
+        1,
+        1,
+        rates={DAVID_ID: (0.5,) * 7, STEPH_ID: (0.5,) * 7},
+    )
+    assert snap.days_left()[0] == date(2026, 4, 21)
+    assert len(snap.days_left()) == 5
+    assert "to win the series" in status_embed(snap, PLAYERS).fields[0].value
+    assert "if you win Tuesday" in status_embed(snap, PLAYERS).fields[0].value
+
+
+def test_series_message_without_odds_once_won():
+    odds = StatusSnapshot(GUILD_ID, date(2026, 4, 21), SUNDAY_APR_19, 3, 0).odds(PLAYERS)
+    assert odds is not None
+    assert "to win the series" not in series_message(4, 0, odds)
+
+
+def test_status_cache_misses_on_a_new_week_start():
+    cache = StatusCache()
+    day = date(2026, 4, 21)
+    snap = StatusSnapshot(GUILD_ID, day, SUNDAY_APR_19)
+    cache.put(snap)
+    cache.put(StatusSnapshot(OTHER_GUILD_ID, day, SUNDAY_APR_19))
+
+    assert cache.get(GUILD_ID, day, SUNDAY_APR_19) is snap
+    assert cache.get(GUILD_ID, day, date(2026, 4, 20)) is None
+
+    cache.invalidate(GUILD_ID)
+    assert cache.get(GUILD_ID, day, SUNDAY_APR_19) is None
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_reconcile_bumps_series_version(db_session):
+    """Finalizing a week changes its version, so cached weekly embeds go stale."""
+    await _add_stale_series(db_session, SUNDAY_APR_12, wins=4, losses=1)
+    before = (await _series(db_session, SUNDAY_APR_12)).version
+
+    await reconcile_stale_series(db_session, SUNDAY_APR_19)
+
+    assert (await _series(db_session, SUNDAY_APR_12)).version == before + 1
+
+
+def test_weekly_embed_cache_evicts_oldest():
+    cache = WeeklyEmbedCache(maxsize=2)
+    cache.put((GUILD_ID, SUNDAY_APR_12, 1), {"title": "a"})
+    cache.put((GUILD_ID, SUNDAY_APR_19, 1), {"title": "b"})
+    assert cache.get((GUILD_ID, SUNDAY_APR_12, 1)) == {"title": "a"}
+    cache.put((GUILD_ID, SUNDAY_APR_19, 2), {"title": "c"})
+
+    assert cache.get((GUILD_ID, SUNDAY_APR_19, 1)) is None
+    assert cache.get((GUILD_ID, SUNDAY_APR_12, 1)) == {"title": "a"}
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_weekly_embed_only_stores_when_asked(db_session):
+    """``/playoff week`` renders without writing; the Sunday review persists."""
+    await _add_stale_series(db_session, SUNDAY_APR_12, wins=4, losses=1)
+    cog = Playoff.__new__(Playoff)
+    cog.bot = SimpleNamespace(db=async_sessionmaker(db_session.bind, expire_on_commit=False))
+    cog._weekly = WeeklyEmbedCache()
+
+    await cog.weekly_embed(GUILD_ID, SUNDAY_APR_12)
+    assert await db_session.scalar(select(WeeklySummary)) is None
+
+    embed = await cog.weekly_embed(GUILD_ID, SUNDAY_APR_12, persist=True)
+    stored = await db_session.scalar(select(WeeklySummary))
+    assert stored.week_start == SUNDAY_APR_12
+    assert json.loads(stored.embed) == embed.to_dict()
+
+
+def test_weekly_embed_survives_json_round_trip():
+    """Persisted summaries are ``to_dict()`` JSON; reloading gives the same embed."""
+    days = [_make_result(i, david=True, steph=i % 2 == 0) for i in range(5)]
+    embed = build_weekly_embed(days, WEEK_SUN, players=PLAYERS)
+
+    restored = discord.Embed.from_dict(json.loads(json.dumps(embed.to_dict())))
+
+    assert restored.to_dict() == embed.to_dict()
 
 
 # ---------------------------------------------------------------------------
@@ -1566,7 +1656,7 @@ def test_embed_per_pillar_stats_with_checkin_rows():
         _make_checkin(STEPH_ID, 0, p1=True, p2=True, p3=True),
         _make_checkin(STEPH_ID, 1, p1=False, p2=True, p3=True),
     ]
-    embed = build_weekly_embed(results, WEEK_SUN, checkins)
+    embed = build_weekly_embed(results, WEEK_SUN, checkins, PLAYERS)
     # David field should show 2/2 for all pillars
     david_field = next(f for f in embed.fields if "David" in f.name)
     assert "2/2" in david_field.value
@@ -1575,12 +1665,24 @@ def test_embed_per_pillar_stats_with_checkin_rows():
     assert "1/2" in steph_field.value
 
 
+def test_embed_has_a_field_per_member():
+    third = 111222333444555888
+    results = [
+        DaySummary(WEEK_SUN, won=False, completed=frozenset({DAVID_ID, third})),
+    ]
+    embed = build_weekly_embed(results, WEEK_SUN, players=PLAYERS + [(third, "Sam")])
+    sam_field = next(f for f in embed.fields if "Sam" in f.name)
+    assert "1/7" in sam_field.name
+    day_field = next(f for f in embed.fields if f.name == "Day-by-Day")
+    assert "D:✅ S:❌ S:✅" in day_field.value
+
+
 def test_embed_no_checkin_rows_still_shows_day_counts():
     results = [
         _make_result(0, david=True, steph=True),
         _make_result(1, david=True, steph=False),
     ]
-    embed = build_weekly_embed(results, WEEK_SUN)
+    embed = build_weekly_embed(results, WEEK_SUN, players=PLAYERS)
     david_field = next(f for f in embed.fields if "David" in f.name)
     assert "2/7" in david_field.value
     steph_field = next(f for f in embed.fields if "Steph" in f.name)
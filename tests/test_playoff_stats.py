@@ -0,0 +1,184 @@
+"""Tests for incremental playoff_stats upkeep and series history paging."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.checkin_bits import record_checkin_bits
+from src.cogs.playoff import format_all_time, series_page, settle_day
+from src.db import PlayoffCheckin, PlayoffSeries
+from src.playoff_stats import (
+    HOUSEHOLD,
+    advance_streak,
+    current_streak,
+    pillar_rates,
+    record_member_checkin,
+    record_series_status,
+    stats_row,
+)
+
+GUILD_ID = 999_000_000_000_000_012
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+
+JAN_1 = date(2026, 1, 1)
+ALL = (True, True, True)
+
+
+async def _checkin(db_session, user_id: int, day: date, flags, old=None) -> None:
+    """Apply a check-in the way _process_checkin does: bitmap first, then stats."""
+    await record_checkin_bits(db_session, GUILD_ID, user_id, day, *flags)
+    await record_member_checkin(db_session, GUILD_ID, user_id, day, old, flags)
+    await db_session.commit()
+
+
+# ---------------------------------------------------------------------------
+# Streak deltas
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_streak_grows_and_resets(db_session):
+    for i in range(3):
+        await _checkin(db_session, DAVID_ID, JAN_1 + timedelta(days=i), ALL)
+    await _checkin(db_session, DAVID_ID, JAN_1 + timedelta(days=3), (True, False, True))
+    await _checkin(db_session, DAVID_ID, JAN_1 + timedelta(days=4), ALL)
+
+    row = await stats_row(db_session, GUILD_ID, DAVID_ID)
+    assert (row.current_streak, row.longest_streak) == (1, 3)
+    assert row.streak_through == JAN_1 + timedelta(days=4)
+    assert row.days_checked == 5
+    assert (row.pillar1_done, row.pillar2_done, row.pillar3_done) == (5, 4, 5)
+
+
+@pytest.mark.asyncio
+async def test_recheckin_breaking_counted_day_rebuilds_streak(db_session):
+    for i in range(3):
+        await _checkin(db_session, DAVID_ID, JAN_1 + timedelta(days=i), ALL)
+    await _checkin(
+        db_session, DAVID_ID, JAN_1 + timedelta(days=2), (False, True, True), old=ALL
+    )
+
+    row = await stats_row(db_session, GUILD_ID, DAVID_ID)
+    assert (row.current_streak, row.longest_streak) == (2, 2)
+    assert row.streak_through == JAN_1 + timedelta(days=1)
+    assert row.days_checked == 3
+    assert row.pillar1_done == 2
+
+
+@pytest.mark.asyncio
+async def test_late_checkin_into_past_day_keeps_live_streak(db_session):
+    await _checkin(db_session, DAVID_ID, JAN_1, ALL)
+    await _checkin(db_session, DAVID_ID, JAN_1 + timedelta(days=2), ALL)
+    await _checkin(db_session, DAVID_ID, JAN_1 + timedelta(days=1), ALL)
+
+    row = await stats_row(db_session, GUILD_ID, DAVID_ID)
+    assert (row.current_streak, row.longest_streak) == (3, 3)
+    assert row.streak_through == JAN_1 + timedelta(days=2)
+
+
+def test_current_streak_expires_after_a_missed_day():
+    row = type("Row", (), {"current_streak": 4, "streak_through": JAN_1})()
+    assert current_streak(row, JAN_1 + timedelta(days=1)) == 4
+    assert current_streak(row, JAN_1 + timedelta(days=2)) == 0
+    assert current_streak(None, JAN_1) == 0
+
+
+def test_advance_streak_refuses_to_undo_a_counted_day():
+    row = type("Row", (), {"current_streak": 2, "longest_streak": 2, "streak_through": JAN_1})()
+    assert advance_streak(row, JAN_1, False) is False
+    assert advance_streak(row, JAN_1 + timedelta(days=1), False) is True
+
+
+# ---------------------------------------------------------------------------
+# Household row
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_settlement_tracks_shared_win_streak(db_session):
+    for i, steph_done in enumerate((True, True, False)):
+        day = JAN_1 + timedelta(days=i)
+        for uid, done in ((DAVID_ID, True), (STEPH_ID, steph_done)):
+            db_session.add(
+                PlayoffCheckin(
+                    guild_id=GUILD_ID,
+                    user_id=uid,
+                    checkin_date=day,
+                    pillar1=True,
+                    pillar2=True,
+                    pillar3=done,
+                )
+            )
+        await db_session.commit()
+        await settle_day(db_session, GUILD_ID, day, [DAVID_ID, STEPH_ID])
+
+    row = await stats_row(db_session, GUILD_ID, HOUSEHOLD)
+    assert (row.current_streak, row.longest_streak) == (2, 2)
+    assert row.streak_through == JAN_1 + timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_series_status_moves_between_totals(db_session):
+    await record_series_status(db_session, GUILD_ID, None, "ongoing")
+    await record_series_status(db_session, GUILD_ID, "ongoing", "won")
+    await record_series_status(db_session, GUILD_ID, None, "lost")
+    await record_series_status(db_session, GUILD_ID, "lost", "won")
+    await db_session.commit()
+
+    row = await stats_row(db_session, GUILD_ID)
+    assert (row.series_won, row.series_lost) == (2, 0)
+
+
+def test_pillar_rates_without_checkins():
+    assert pillar_rates(None) == (0.0, 0.0, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_format_all_time_lists_every_member(db_session):
+    await _checkin(db_session, DAVID_ID, JAN_1, ALL)
+    await record_series_status(db_session, GUILD_ID, None, "won")
+    await db_session.commit()
+    stats = {
+        HOUSEHOLD: await stats_row(db_session, GUILD_ID),
+        DAVID_ID: await stats_row(db_session, GUILD_ID, DAVID_ID),
+    }
+
+    text = format_all_time(stats, [(DAVID_ID, "David"), (STEPH_ID, "Steph")], JAN_1)
+    assert "Series **1W 0L**" in text
+    assert "David: streak 1 (best 1) · pillars 100% / 100% / 100%" in text
+    assert "Steph: streak 0 (best 0) · pillars 0% / 0% / 0%" in text
+
+
+# ---------------------------------------------------------------------------
+# Series paging
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_series_page_walks_all_history(db_session):
+    sunday = date(2025, 1, 5)
+    db_session.add_all(
+        PlayoffSeries(
+            guild_id=GUILD_ID,
+            week_start=sunday + timedelta(weeks=i),
+            wins=4,
+            losses=0,
+            status="won",
+        )
+        for i in range(20)
+    )
+    await db_session.commit()
+
+    first, more = await series_page(db_session, GUILD_ID)
+    assert more and len(first) == 8
+    assert first[0].week_start == sunday + timedelta(weeks=19)
+
+    second, more = await series_page(db_session, GUILD_ID, older_than=first[-1].week_start)
+    third, more_after_third = await series_page(
+        db_session, GUILD_ID, older_than=second[-1].week_start
+    )
+    assert len(third) == 4 and not more_after_third
+    assert third[-1].week_start == sunday
+
+    back, more = await series_page(db_session, GUILD_ID, newer_than=second[0].week_start)
+    assert [r.week_start for r in back] == [r.week_start for r in first]
+    assert not more
@@ -0,0 +1,115 @@
+"""Tests for series-outcome odds from check-in history."""
+from __future__ import annotations
+
+import itertools
+from datetime import date, timedelta
+
+import pytest
+
+from src.db import PlayoffCheckin
+from src.projection import (
+    DEFAULT_RATE,
+    day_win_probability,
+    load_weekday_rates,
+    series_odds,
+    series_win_probability,
+    weekday_rates,
+)
+
+GUILD_ID = 999_000_000_000_000_014
+OTHER_GUILD_ID = GUILD_ID + 1
+
+MONDAY = date(2026, 4, 20)
+
+
+def _brute_force(wins: int, probs: list[float]) -> float:
+    total = 0.0
+    for outcome in itertools.product((False, True), repeat=len(probs)):
+        p = 1.0
+        for won, q in zip(outcome, probs):
+            p *= q if won else 1 - q
+        if wins + sum(outcome) >= 4:
+            total += p
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Rates
+# ---------------------------------------------------------------------------
+
+def test_weekday_rates_shrink_toward_the_overall_rate():
+    # Mondays always complete, Tuesdays never: overall 50%
+    checkins = [(MONDAY - timedelta(weeks=i), True) for i in range(4)]
+    checkins += [(MONDAY + timedelta(days=1) - timedelta(weeks=i), False) for i in range(4)]
+    rates = weekday_rates(checkins)
+
+    assert rates[0] == pytest.approx((4 + 2 * 0.5) / 6)
+    assert rates[1] == pytest.approx((0 + 2 * 0.5) / 6)
+    # Unseen weekdays take the overall rate
+    assert rates[5] == pytest.approx(0.5)
+
+
+def test_weekday_rates_without_history():
+    assert weekday_rates([]) == (DEFAULT_RATE,) * 7
+
+
+def test_day_needs_every_member():
+    rates = {1: (0.8,) * 7, 2: (0.5,) * 7}
+    assert day_win_probability(rates, [1, 2], MONDAY) == pytest.approx(0.4)
+    # Members without history use the default rate
+    assert day_win_probability(rates, [1, 3], MONDAY) == pytest.approx(0.8 * DEFAULT_RATE)
+
+
+# ---------------------------------------------------------------------------
+# Series odds
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("wins", range(5))
+def test_series_probability_matches_enumeration(wins):
+    probs = [0.9, 0.2, 0.55, 0.7, 0.35]
+    assert series_win_probability(wins, probs) == pytest.approx(_brute_force(wins, probs))
+
+
+def test_series_out_of_reach():
+    assert series_win_probability(1, [0.9, 0.9]) == 0.0
+
+
+def test_series_odds_condition_on_the_next_day():
+    days = [MONDAY + timedelta(days=i) for i in range(3)]
+    odds = series_odds(2, 2, days, {1: (0.5,) * 7}, [1])
+
+    assert odds.win == pytest.approx(0.5)
+    assert odds.next_day == MONDAY
+    assert odds.if_next_won == pytest.approx(0.75)
+
+
+def test_no_odds_once_decided():
+    assert series_odds(4, 1, [MONDAY], {}, [1]) is None
+    assert series_odds(2, 2, [], {}, [1]) is None
+
+
+@pytest.mark.asyncio
+async def test_load_weekday_rates_per_guild_window(db_session):
+    rows = [
+        (GUILD_ID, 1, MONDAY, True),
+        (GUILD_ID, 1, MONDAY - timedelta(weeks=20), False),  # outside the window
+        (GUILD_ID, 1, MONDAY + timedelta(days=1), False),  # after the guild's day
+        (OTHER_GUILD_ID, 2, MONDAY, False),
+    ]
+    for guild_id, user_id, day, complete in rows:
+        db_session.add(
+            PlayoffCheckin(
+                guild_id=guild_id,
+                user_id=user_id,
+                checkin_date=day,
+                pillar1=True,
+                pillar2=True,
+                pillar3=complete,
+            )
+        )
+    await db_session.commit()
+
+    rates = await load_weekday_rates(db_session, {GUILD_ID: MONDAY, OTHER_GUILD_ID: MONDAY})
+
+    assert rates[GUILD_ID] == {1: weekday_rates([(MONDAY, True)])}
+    assert rates[OTHER_GUILD_ID] == {2: weekday_rates([(MONDAY, False)])}
@@ -0,0 +1,166 @@
+"""Tests for recurring charges — split math, cadence, and idempotent posting."""
+from __future__ import annotations
+
+import datetime
+from fractions import Fraction
+
+import pytest
+from sqlalchemy import select
+
+from src.cogs.budget import MONTHLY_RENT, _rollup_totals, close_ledger_month
+from src.cogs.recurring import (
+    _advance,
+    _idempotency_key,
+    _parse_ratio,
+    _share_cents,
+    post_due_charges,
+)
+from src.db import LedgerEntry, RecurringCharge
+
+GUILD_ID = 999_000_000_000_000_008
+OTHER_GUILD_ID = 999_000_000_000_000_009
+DAVID_ID = 240608458888445953
+STEPH_ID = 694650702466908160
+
+
+def _charge(guild_id: int = GUILD_ID, **kw) -> RecurringCharge:
+    defaults = dict(
+        guild_id=guild_id,
+        name="rent",
+        amount_cents=MONTHLY_RENT,
+        split_ratio="1/3",
+        creditor_id=DAVID_ID,
+        debtor_id=STEPH_ID,
+        cadence="monthly",
+        next_due=datetime.date(2026, 5, 1),
+    )
+    defaults.update(kw)
+    return RecurringCharge(**defaults)
+
+
+# ---------------------------------------------------------------------------
+# Pure-unit helpers
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("raw,expected", [
+    ("1/3", Fraction(1, 3)),
+    ("0.5", Fraction(1, 2)),
+    ("25%", Fraction(1, 4)),
+    ("1", Fraction(1)),
+])
+def test_parse_ratio_valid(raw, expected):
+    assert _parse_ratio(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["0", "3/2", "abc", "1/0", "-1/3"])
+def test_parse_ratio_invalid(raw):
+    assert _parse_ratio(raw) is None
+
+
+def test_share_matches_rent_command_rounding():
+    assert _share_cents(MONTHLY_RENT, "1/3") == MONTHLY_RENT // 3
+    assert _share_cents(8000, "1/3") == 8000 // 3
+
+
+def test_advance_monthly_wraps_year():
+    assert _advance(datetime.date(2026, 12, 15), "monthly") == datetime.date(2027, 1, 15)
+
+
+def test_advance_weekly():
+    assert _advance(datetime.date(2026, 5, 1), "weekly") == datetime.date(2026, 5, 8)
+
+
+def test_idempotency_key_is_per_period():
+    assert _idempotency_key(7, datetime.date(2026, 5, 1)) != _idempotency_key(7, datetime.date(2026, 6, 1))
+
+
+# ---------------------------------------------------------------------------
+# Posting
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_post_due_charges_posts_all_guilds(db_session):
+    db_session.add(_charge())
+    db_session.add(_charge(OTHER_GUILD_ID, name="wifi", amount_cents=8000))
+    db_session.add(_charge(name="later", next_due=datetime.date(2026, 6, 1)))
+    await db_session.commit()
+
+    posted = await post_due_charges(db_session, datetime.date(2026, 5, 1))
+    assert posted == 2
+
+    rows = (await db_session.scalars(select(LedgerEntry).order_by(LedgerEntry.guild_id))).all()
+    assert [(r.guild_id, r.note, r.amount_cents) for r in rows] == [
+        (GUILD_ID, "rent", MONTHLY_RENT // 3),
+        (OTHER_GUILD_ID, "wifi", 8000 // 3),
+    ]
+    assert all(r.creditor_id == DAVID_ID and r.debtor_id == STEPH_ID for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_post_due_charges_advances_next_due(db_session):
+    charge = _charge()
+    db_session.add(charge)
+    await db_session.commit()
+
+    await post_due_charges(db_session, datetime.date(2026, 5, 1))
+    await db_session.refresh(charge)
+    assert charge.next_due == datetime.date(2026, 6, 1)
+
+
+@pytest.mark.asyncio
+async def test_post_due_charges_catches_up_missed_periods(db_session):
+    db_session.add(_charge(cadence="weekly"))
+    await db_session.commit()
+
+    posted = await post_due_charges(db_session, datetime.date(2026, 5, 20))
+    assert posted == 3  # May 1, 8, 15
+
+
+@pytest.mark.asyncio
+async def test_backdated_posting_rerolls_its_closed_month(db_session):
+    march = datetime.date(2026, 3, 1)
+    db_session.add(
+        LedgerEntry(
+            guild_id=GUILD_ID,
+            creditor_id=DAVID_ID,
+            debtor_id=STEPH_ID,
+            amount_cents=500,
+            note="groceries",
+            created_at=datetime.datetime(2026, 3, 2, tzinfo=datetime.timezone.utc),
+        )
+    )
+    db_session.add(_charge(next_due=datetime.date(2026, 3, 15)))
+    await db_session.commit()
+    await close_ledger_month(db_session, march)
+
+    # The bot was down from March to April; the March period is caught up late
+    await post_due_charges(db_session, datetime.date(2026, 4, 20))
+
+    owed_to_me, _, count = await _rollup_totals(db_session, GUILD_ID, march, DAVID_ID, STEPH_ID)
+    assert (owed_to_me, count) == (500 + MONTHLY_RENT // 3, 2)
+
+
+@pytest.mark.asyncio
+async def test_retried_job_never_double_charges(db_session):
+    """Even if next_due was not advanced, the (charge, period) key blocks a repost."""
+    charge = _charge()
+    db_session.add(charge)
+    await db_session.commit()
+
+    assert await post_due_charges(db_session, datetime.date(2026, 5, 1)) == 1
+
+    # Simulate a crash that lost the next_due advance
+    charge.next_due = datetime.date(2026, 5, 1)
+    await db_session.commit()
+
+    assert await post_due_charges(db_session, datetime.date(2026, 5, 1)) == 0
+    total = len((await db_session.scalars(select(LedgerEntry))).all())
+    assert total == 1
+
+
+@pytest.mark.asyncio
+async def test_inactive_charges_are_skipped(db_session):
+    db_session.add(_charge(active=False))
+    await db_session.commit()
+
+    assert await post_due_charges(db_session, datetime.date(2026, 5, 1)) == 0
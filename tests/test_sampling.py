@@ -0,0 +1,79 @@
+"""Tests for weighted picks made by the database."""
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import case, select
+
+from src.db import WatchlistItem
+from src.sampling import weighted_choice
+
+GUILD_ID = 999_000_000_000_000_016
+OTHER_GUILD_ID = GUILD_ID + 1
+
+
+def _draw(value: float) -> SimpleNamespace:
+    """An rng whose single draw is *value*."""
+    return SimpleNamespace(random=lambda: value)
+
+
+async def _add(db_session, guild_id: int, titles: list[str]) -> None:
+    for title in titles:
+        db_session.add(
+            WatchlistItem(guild_id=guild_id, title=title, media_type="movie", added_by=1)
+        )
+    await db_session.commit()
+
+
+def _candidates(guild_id: int = GUILD_ID):
+    return select(WatchlistItem).where(WatchlistItem.guild_id == guild_id)
+
+
+# Weights 1, 2, 1 split the draw into [0, .25) [.25, .75) [.75, 1)
+_WEIGHT = case((WatchlistItem.title == "b", 2), else_=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "draw, expected",
+    [(0.0, "a"), (0.24, "a"), (0.25, "b"), (0.74, "b"), (0.75, "c"), (0.999, "c")],
+)
+async def test_draw_lands_in_weighted_slice(db_session, draw, expected):
+    await _add(db_session, GUILD_ID, ["a", "b", "c"])
+
+    pick, count = await weighted_choice(db_session, _candidates(), _WEIGHT, _draw(draw))
+
+    assert (pick.title, count) == (expected, 3)
+
+
+@pytest.mark.asyncio
+async def test_only_candidates_are_picked(db_session):
+    await _add(db_session, GUILD_ID, ["a"])
+    await _add(db_session, OTHER_GUILD_ID, ["x", "y"])
+
+    pick, count = await weighted_choice(db_session, _candidates(), _WEIGHT, _draw(0.9))
+
+    assert (pick.title, count) == ("a", 1)
+
+
+@pytest.mark.asyncio
+async def test_no_candidates(db_session):
+    await _add(db_session, OTHER_GUILD_ID, ["x"])
+    assert await weighted_choice(db_session, _candidates(), _WEIGHT) == (None, 0)
+
+
+@pytest.mark.asyncio
+async def test_picks_follow_weights(db_session):
+    await _add(db_session, GUILD_ID, ["a", "b", "c"])
+    rng = random.Random(42)
+
+    picks = [
+        (await weighted_choice(db_session, _candidates(), _WEIGHT, rng))[0].title
+        for _ in range(300)
+    ]
+
+    # "b" carries half the weight
+    assert picks.count("b") > picks.count("a")
+    assert picks.count("b") > picks.count("c")
@@ -0,0 +1,136 @@
+"""Tests for per-guild job schedules and the fire-time heap."""
+from __future__ import annotations
+
+from datetime import datetime, time, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.cogs.schedule import parse_time
+from src.scheduler import (
+    CHECKIN_PING,
+    SUPPLY_CHECK,
+    WEEKLY_REVIEW,
+    FireQueue,
+    JobSpec,
+    guild_settings_row,
+    job_specs,
+    load_settings,
+    next_fire,
+    zone,
+)
+
+GUILD_ID = 999_000_000_000_000_012
+OTHER_GUILD_ID = GUILD_ID + 1
+
+ET = ZoneInfo("America/New_York")
+UTC = timezone.utc
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+# ---------------------------------------------------------------------------
+# Fire times
+# ---------------------------------------------------------------------------
+
+def test_daily_job_fires_later_today_or_tomorrow():
+    spec = JobSpec(None, None, time(22, 0), ET)
+    # 21:00 ET on Apr 20 (EDT, UTC-4)
+    assert next_fire(spec, _utc(2026, 4, 21, 1, 0)) == _utc(2026, 4, 21, 2, 0)
+    # Exactly at the fire time: the next one is tomorrow
+    assert next_fire(spec, _utc(2026, 4, 21, 2, 0)) == _utc(2026, 4, 22, 2, 0)
+
+
+def test_weekly_job_waits_for_its_weekday():
+    spec = JobSpec(None, 6, time(10, 0), ET)  # Sundays
+    # Monday Apr 20 → Sunday Apr 26, 10:00 EDT
+    assert next_fire(spec, _utc(2026, 4, 20, 12, 0)) == _utc(2026, 4, 26, 14, 0)
+
+
+def test_fire_time_follows_dst():
+    spec = JobSpec(None, None, time(22, 0), ET)
+    # 22:00 EST is 03:00 UTC; after the March change it is 02:00 UTC
+    assert next_fire(spec, _utc(2026, 3, 7, 12, 0)) == _utc(2026, 3, 8, 3, 0)
+    assert next_fire(spec, _utc(2026, 3, 8, 12, 0)) == _utc(2026, 3, 9, 2, 0)
+
+
+def test_unknown_zone_falls_back_to_default():
+    assert zone("Not/AZone").key == "America/New_York"
+    assert zone(None).key == "America/New_York"
+
+
+def test_parse_time():
+    assert parse_time("21:30") == time(21, 30)
+    assert parse_time(" 7:05 ") == time(7, 5)
+    assert parse_time("25:00") is None
+    assert parse_time("9pm") is None
+
+
+# ---------------------------------------------------------------------------
+# Heap
+# ---------------------------------------------------------------------------
+
+def test_queue_pops_due_jobs_in_order():
+    q = FireQueue()
+    q.schedule(1, CHECKIN_PING, _utc(2026, 1, 1, 3))
+    q.schedule(2, CHECKIN_PING, _utc(2026, 1, 1, 1))
+    q.schedule(3, CHECKIN_PING, _utc(2026, 1, 1, 5))
+
+    assert q.next_fire_at() == _utc(2026, 1, 1, 1)
+    due = q.pop_due(_utc(2026, 1, 1, 4))
+    assert [guild for _, guild, _ in due] == [2, 1]
+    assert len(q) == 1 and q.next_fire_at() == _utc(2026, 1, 1, 5)
+
+
+def test_rescheduling_replaces_the_old_entry():
+    q = FireQueue()
+    q.schedule(1, WEEKLY_REVIEW, _utc(2026, 1, 1, 1))
+    q.schedule(1, WEEKLY_REVIEW, _utc(2026, 1, 2, 1))
+
+    assert q.pop_due(_utc(2026, 1, 1, 12)) == []
+    assert q.next_fire_at() == _utc(2026, 1, 2, 1)
+    assert len(q) == 1
+
+
+def test_cancel_drops_every_job_for_a_guild():
+    q = FireQueue()
+    for job in (CHECKIN_PING, WEEKLY_REVIEW, SUPPLY_CHECK):
+        q.schedule(1, job, _utc(2026, 1, 1, 1))
+    q.schedule(2, CHECKIN_PING, _utc(2026, 1, 1, 2))
+    q.cancel(1)
+
+    assert [guild for _, guild, _ in q.pop_due(_utc(2026, 1, 2))] == [2]
+    assert q.next_fire_at() is None
+
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+def test_defaults_without_a_settings_row():
+    specs = job_specs(None, fallback_channel_id=42)
+    assert specs[CHECKIN_PING] == JobSpec(42, None, time(22, 0), ET)
+    assert specs[WEEKLY_REVIEW] == JobSpec(42, 6, time(10, 0), ET)
+    assert specs[SUPPLY_CHECK] == JobSpec(42, 6, time(10, 0), ET)
+
+
+@pytest.mark.asyncio
+async def test_weekly_jobs_use_the_checkin_channel_unless_set(db_session):
+    row = await guild_settings_row(db_session, GUILD_ID)
+    row.timezone = "Europe/London"
+    row.checkin_channel_id = 100
+    row.supply_channel_id = 200
+    row.review_weekday = 0
+    row.ping_time = time(21, 15)
+    await db_session.commit()
+
+    settings = await load_settings(db_session, [GUILD_ID, OTHER_GUILD_ID])
+    assert list(settings) == [GUILD_ID]
+
+    specs = job_specs(settings[GUILD_ID], fallback_channel_id=42)
+    assert specs[CHECKIN_PING] == JobSpec(100, None, time(21, 15), ZoneInfo("Europe/London"))
+    assert specs[WEEKLY_REVIEW].channel_id == 100
+    assert specs[WEEKLY_REVIEW].weekday == 0
+    assert specs[SUPPLY_CHECK].channel_id == 200
@@ -0,0 +1,177 @@
+"""Tests for the unified full-text search index."""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import insert, select
+
+from src.cogs.search import search_embed
+from src.db import (
+    BucketListItem,
+    DateNightLog,
+    LedgerEntry,
+    OutingWishlistItem,
+    SearchDocument,
+    ShoppingItem,
+    SpecialDate,
+    WatchlistItem,
+)
+from src.paging import FIELD_MAX_CHARS
+from src.search import SearchHit, query_terms, search
+
+GUILD_ID = 999_000_000_000_000_017
+OTHER_GUILD_ID = GUILD_ID + 1
+USER_ID = 240608458888445953
+
+
+async def _docs(db_session) -> set[tuple[str, str, str]]:
+    rows = await db_session.execute(
+        select(SearchDocument.kind, SearchDocument.title, SearchDocument.body)
+    )
+    return set(rows.all())
+
+
+# ---------------------------------------------------------------------------
+# Index maintenance (triggers)
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_orm_writes_are_indexed(db_session):
+    db_session.add_all([
+        ShoppingItem(guild_id=GUILD_ID, name="Pasta maker", added_by=USER_ID, og_title="KitchenAid"),
+        WatchlistItem(guild_id=GUILD_ID, title="Big Night", media_type="movie", added_by=USER_ID),
+        SpecialDate(guild_id=GUILD_ID, label="Anniversary", month=6, day=1, gift_ideas="pasta class"),
+    ])
+    await db_session.commit()
+
+    assert await _docs(db_session) == {
+        ("shopping", "Pasta maker", "KitchenAid"),
+        ("watch", "Big Night", ""),
+        ("special", "Anniversary", "pasta class"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_updates_and_deletes_follow_the_source(db_session):
+    item = BucketListItem(guild_id=GUILD_ID, title="See Rome", added_by=USER_ID)
+    db_session.add(item)
+    await db_session.commit()
+
+    item.completed_notes = "ate too much gelato"
+    await db_session.commit()
+    assert await _docs(db_session) == {("bucket", "See Rome", "ate too much gelato")}
+
+    await db_session.delete(item)
+    await db_session.commit()
+    assert await _docs(db_session) == set()
+
+
+@pytest.mark.asyncio
+async def test_bulk_inserts_are_indexed(db_session):
+    """Core inserts (the ledger import path) bypass the ORM but not the triggers."""
+    now = datetime.now(timezone.utc)
+    await db_session.execute(
+        insert(LedgerEntry),
+        [
+            dict(guild_id=GUILD_ID, creditor_id=1, debtor_id=2, amount_cents=100,
+                 note="pasta dinner", category="dining", created_at=now),
+            dict(guild_id=GUILD_ID, creditor_id=1, debtor_id=2, amount_cents=200,
+                 note="groceries", category="", created_at=now),
+        ],
+    )
+    await db_session.commit()
+
+    assert await _docs(db_session) == {
+        ("ledger", "pasta dinner", "dining"),
+        ("ledger", "groceries", ""),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+async def _seed(db_session) -> None:
+    db_session.add_all([
+        ShoppingItem(guild_id=GUILD_ID, name="Pasta maker", added_by=USER_ID),
+        OutingWishlistItem(guild_id=GUILD_ID, name="Flour + Water", added_by=USER_ID,
+                           note="best pasta in the Mission"),
+        OutingWishlistItem(guild_id=GUILD_ID, name="Pasta Supply Co", added_by=USER_ID),
+        DateNightLog(guild_id=GUILD_ID, planned_by=USER_ID, date=date(2026, 3, 1),
+                     place="Cooking class", notes="made fresh pasta"),
+        ShoppingItem(guild_id=OTHER_GUILD_ID, name="Pasta pot", added_by=USER_ID),
+    ])
+    await db_session.commit()
+
+
+def test_query_terms_drop_punctuation():
+    assert query_terms('  "Pasta" OR -water*') == ["pasta", "or", "water"]
+    assert query_terms("!!") == []
+
+
+@pytest.mark.asyncio
+async def test_search_groups_by_kind_within_guild(db_session):
+    await _seed(db_session)
+
+    hits = await search(db_session, GUILD_ID, "pas")
+
+    assert {kind: [h.title for h in kind_hits] for kind, kind_hits in hits.items()} == {
+        "shopping": ["Pasta maker"],
+        # A title match outranks a match in the notes
+        "outing": ["Pasta Supply Co", "Flour + Water"],
+        "datelog": ["Cooking class"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_every_word_must_match(db_session):
+    await _seed(db_session)
+
+    hits = await search(db_session, GUILD_ID, "pasta mission")
+
+    assert [h.title for kind_hits in hits.values() for h in kind_hits] == ["Flour + Water"]
+
+
+@pytest.mark.asyncio
+async def test_per_kind_limit(db_session):
+    await _seed(db_session)
+
+    hits = await search(db_session, GUILD_ID, "pasta", per_kind=1)
+
+    assert [h.title for h in hits["outing"]] == ["Pasta Supply Co"]
+
+
+@pytest.mark.asyncio
+async def test_fts_syntax_in_query_is_literal(db_session):
+    await _seed(db_session)
+    # Quotes, parentheses and wildcards are not query syntax
+    assert await search(db_session, GUILD_ID, '("pasta*') != {}
+    assert await search(db_session, GUILD_ID, "***") == {}
+
+
+@pytest.mark.asyncio
+async def test_search_embed_has_a_field_per_kind(db_session):
+    await _seed(db_session)
+    hits = await search(db_session, GUILD_ID, "pasta")
+
+    embed = search_embed("pasta", hits)
+
+    assert len(embed.fields) == len(hits)
+    assert "Pasta maker" in embed.fields[[*hits].index("shopping")].value
+
+
+def test_search_embed_keeps_whole_lines_within_the_field_limit():
+    hits = {
+        "watch": [
+            SearchHit("watch", i, f"{'Long title ' * 30}{i}", "plot " * 40) for i in range(5)
+        ]
+    }
+
+    embed = search_embed("long", hits)
+
+    value = embed.fields[0].value
+    assert len(value) <= FIELD_MAX_CHARS
+    lines = value.split("\n")
+    assert 0 < len(lines) < 5
+    assert all(line.startswith("• **") and line.endswith("…") for line in lines)
@@ -6,7 +6,8 @@ from datetime import date, timedelta
 import pytest
 from sqlalchemy import select
 
-from src.cogs.supplies import _this_sunday, seed_supply_items
+from src.clock import week_start_for
+from src.cogs.supplies import seed_supply_items
 from src.db import SupplyCheckResult, SupplyItem
 
 GUILD_ID = 999_000_000_000_000_001
@@ -14,31 +15,31 @@ USER_A = 240608458888445953
 USER_B = 694650702466908160
 
 # ---------------------------------------------------------------------------
-# _this_sunday — week boundary helper
+# week_start_for — week boundary helper (default Sunday start)
 # ---------------------------------------------------------------------------
 
 SUNDAY_APR_20 = date(2026, 4, 19)  # confirmed Sunday
 
 
 @pytest.mark.parametrize("offset", range(7))
-def test_this_sunday_all_days_in_week(offset):
+def test_week_start_all_days_in_week(offset):
     """Every day in a Sun–Sat week maps to the same Sunday."""
     day = SUNDAY_APR_20 + timedelta(days=offset)
-    assert _this_sunday(day) == SUNDAY_APR_20
+    assert week_start_for(day) == SUNDAY_APR_20
 
 
-def test_this_sunday_is_itself():
-    assert _this_sunday(SUNDAY_APR_20) == SUNDAY_APR_20
+def test_week_start_is_itself():
+    assert week_start_for(SUNDAY_APR_20) == SUNDAY_APR_20
 
 
-def test_this_sunday_saturday():
+def test_week_start_saturday():
     sat = date(2026, 4, 25)
-    assert _this_sunday(sat) == SUNDAY_APR_20
+    assert week_start_for(sat) == SUNDAY_APR_20
 
 
-def test_this_sunday_crosses_month():
+def test_week_start_crosses_month():
     """Tue Mar 31 2026 → week started Sun Mar 29."""
-    assert _this_sunday(date(2026, 3, 31)) == date(2026, 3, 29)
+    assert week_start_for(date(2026, 3, 31)) == date(2026, 3, 29)
 
 
 # ---------------------------------------------------------------------------
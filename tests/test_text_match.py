@@ -0,0 +1,32 @@
+"""Tests for database-side text matching."""
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.db import OutingWishlistItem
+from src.text_match import matches, normalize
+
+
+def test_normalize_folds_case_and_whitespace():
+    assert normalize("  The   MISSION\t") == "the mission"
+    assert normalize(None) == ""
+
+
+def _sql(dialect_name: str, dialect) -> str:
+    q = select(OutingWishlistItem.id).where(
+        matches(OutingWishlistItem.neighborhood_key, " Mission ", dialect_name)
+    )
+    return str(q.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+def test_sqlite_matches_substring_of_key():
+    sql = _sql("sqlite", sqlite.dialect())
+    assert "neighborhood_key LIKE '%' || 'mission' || '%'" in sql
+    assert " % " not in sql
+
+
+def test_postgres_also_matches_by_similarity():
+    sql = _sql("postgresql", postgresql.dialect())
+    # pg_trgm's similarity operator, %-escaped for the driver's paramstyle
+    assert "neighborhood_key %% 'mission'" in sql
@@ -5,8 +5,10 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import select
 
-from src.cogs.watchlist import _stars, _user_label
-from src.db import WatchlistItem
+from src.cogs.watchlist import _ratings_by_item, _save_rating, _stars, _tonight_weight
+from src.db import WatchlistItem, WatchlistRating
+from src.sampling import weighted_choice
+from src.utils import HouseholdRoster, member_label
 
 GUILD_ID = 999_000_000_000_000_003
 DAVID_ID = 240608458888445953
@@ -37,15 +39,17 @@ def test_stars_three():
 
 
 def test_user_label_david():
-    assert _user_label(DAVID_ID) == "David"
+    roster = HouseholdRoster(GUILD_ID, member_ids=(DAVID_ID,), names={DAVID_ID: "David"})
+    assert member_label(roster, DAVID_ID) == "David"
 
 
 def test_user_label_steph():
-    assert _user_label(STEPH_ID) == "Steph"
+    roster = HouseholdRoster(GUILD_ID, member_ids=(STEPH_ID,), names={STEPH_ID: "Steph"})
+    assert member_label(roster, STEPH_ID) == "Steph"
 
 
 def test_user_label_unknown():
-    label = _user_label(OTHER_ID)
+    label = member_label(HouseholdRoster(GUILD_ID), OTHER_ID)
     assert str(OTHER_ID) in label
 
 
@@ -74,8 +78,6 @@ async def test_add_movie(db_session):
     assert row is not None
     assert row.media_type == "movie"
     assert row.watched is False
-    assert row.david_rating is None
-    assert row.steph_rating is None
     assert row.note == "mind-bending"
 
 
@@ -128,14 +130,13 @@ async def test_david_rates(db_session):
     db_session.add(item)
     await db_session.commit()
 
-    item.david_rating = 5
-    item.david_notes = "Masterpiece"
+    await _save_rating(db_session, item.id, DAVID_ID, 5, "Masterpiece")
     await db_session.commit()
 
-    row = await db_session.get(WatchlistItem, item.id)
-    assert row.david_rating == 5
-    assert row.david_notes == "Masterpiece"
-    assert row.steph_rating is None  # Steph hasn't rated yet
+    ratings = (await _ratings_by_item(db_session, [item.id]))[item.id]
+    assert ratings[DAVID_ID].rating == 5
+    assert ratings[DAVID_ID].notes == "Masterpiece"
+    assert STEPH_ID not in ratings  # Steph hasn't rated yet
 
 
 @pytest.mark.asyncio
@@ -147,17 +148,35 @@ async def test_both_rate_independently(db_session):
     db_session.add(item)
     await db_session.commit()
 
-    item.david_rating = 4
-    item.david_notes = "Too long but great"
-    item.steph_rating = 5
-    item.steph_notes = "Cillian Murphy"
+    await _save_rating(db_session, item.id, DAVID_ID, 4, "Too long but great")
+    await _save_rating(db_session, item.id, STEPH_ID, 5, "Cillian Murphy")
     await db_session.commit()
 
-    row = await db_session.get(WatchlistItem, item.id)
-    assert row.david_rating == 4
-    assert row.steph_rating == 5
-    assert row.david_notes == "Too long but great"
-    assert row.steph_notes == "Cillian Murphy"
+    ratings = (await _ratings_by_item(db_session, [item.id]))[item.id]
+    assert ratings[DAVID_ID].rating == 4
+    assert ratings[STEPH_ID].rating == 5
+    assert ratings[DAVID_ID].notes == "Too long but great"
+    assert ratings[STEPH_ID].notes == "Cillian Murphy"
+
+
+@pytest.mark.asyncio
+async def test_rerating_keeps_notes_when_review_blank(db_session):
+    item = WatchlistItem(
+        guild_id=GUILD_ID, title="Arrival", media_type="movie", added_by=DAVID_ID,
+        watched=True,
+    )
+    db_session.add(item)
+    await db_session.commit()
+
+    await _save_rating(db_session, item.id, DAVID_ID, 3, "Slow start")
+    await db_session.commit()
+    await _save_rating(db_session, item.id, DAVID_ID, 4, "")
+    await db_session.commit()
+
+    rows = (
+        await db_session.scalars(select(WatchlistRating).where(WatchlistRating.item_id == item.id))
+    ).all()
+    assert [(r.user_id, r.rating, r.notes) for r in rows] == [(DAVID_ID, 4, "Slow start")]
 
 
 # ---------------------------------------------------------------------------
@@ -237,28 +256,26 @@ async def test_remove_item(db_session):
 # Randomizer weighting logic (unit test — no Discord)
 # ---------------------------------------------------------------------------
 
-def test_tonight_weighting():
+@pytest.mark.asyncio
+async def test_tonight_weighting(db_session):
     """Partner-added items get 2× weight; self-added get 1×."""
     import random as _random
 
-    # Simulate: caller is David, one item added by Steph, one by David
-    class _FakeItem:
-        def __init__(self, title, added_by):
-            self.title = title
-            self.added_by = added_by
-
-    items = [
-        _FakeItem("Steph's pick", STEPH_ID),
-        _FakeItem("David's pick", DAVID_ID),
-    ]
-    caller_id = DAVID_ID
-    weights = [2 if r.added_by != caller_id else 1 for r in items]
+    db_session.add(WatchlistItem(guild_id=GUILD_ID, title="Steph's pick", media_type="movie", added_by=STEPH_ID))
+    db_session.add(WatchlistItem(guild_id=GUILD_ID, title="David's pick", media_type="movie", added_by=DAVID_ID))
+    await db_session.commit()
 
-    assert weights == [2, 1]  # Steph's item has double weight
+    # Caller is David
+    weight = _tonight_weight(DAVID_ID)
+    weights = dict(
+        (await db_session.execute(select(WatchlistItem.title, weight).order_by(WatchlistItem.id))).all()
+    )
+    assert weights == {"Steph's pick": 2, "David's pick": 1}  # Steph's item has double weight
 
-    # With seed, confirm random.choices respects weights
-    _random.seed(42)
-    picks = [_random.choices(items, weights=weights, k=1)[0].title for _ in range(300)]
+    # With seed, confirm the database-side pick respects weights
+    rng = _random.Random(42)
+    candidates = select(WatchlistItem).where(WatchlistItem.guild_id == GUILD_ID)
+    picks = [(await weighted_choice(db_session, candidates, weight, rng))[0].title for _ in range(300)]
     steph_count = picks.count("Steph's pick")
     david_count = picks.count("David's pick")
     # Steph's pick should appear roughly twice as often